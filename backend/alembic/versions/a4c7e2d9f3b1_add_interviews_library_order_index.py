@@ -0,0 +1,29 @@
+"""Add index for the default interview library ordering
+
+Revision ID: a4c7e2d9f3b1
+Revises: d8b3f1a6c2e7
+Create Date: 2026-10-19 18:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a4c7e2d9f3b1"
+down_revision: Union[str, None] = "d8b3f1a6c2e7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_interviews_user_updated_at",
+        "interviews",
+        ["user_id", "updated_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_interviews_user_updated_at", table_name="interviews")
@@ -0,0 +1,29 @@
+"""Add workspaces.signals_consistent_version
+
+Revision ID: a7d2e4c9f1b3
+Revises: e5a9c3f7b2d1
+Create Date: 2026-10-19 23:30:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7d2e4c9f1b3"
+down_revision: Union[str, None] = "e5a9c3f7b2d1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "workspaces",
+        sa.Column("signals_consistent_version", sa.BigInteger(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("workspaces", "signals_consistent_version")
@@ -0,0 +1,27 @@
+"""Add deferred status to sync_run_status enum
+
+Revision ID: b3f5d7e9a2c4
+Revises: a4b8c2d9e1f7
+Create Date: 2026-10-19 12:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b3f5d7e9a2c4"
+down_revision: Union[str, None] = "a4b8c2d9e1f7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Rate-limited runs are deferred and re-enqueued instead of failed.
+    op.execute("ALTER TYPE sync_run_status ADD VALUE 'deferred'")
+
+
+def downgrade() -> None:
+    # PostgreSQL doesn't support removing values from an ENUM type.
+    pass
@@ -0,0 +1,64 @@
+"""Add generated full-text search vectors with GIN indexes
+
+Revision ID: b9e4d2a7c1f5
+Revises: a4c7e2d9f3b1
+Create Date: 2026-10-19 19:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b9e4d2a7c1f5"
+down_revision: Union[str, None] = "a4c7e2d9f3b1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_VECTORS = {
+    "signals": (
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(author_or_speaker, '')), 'B') || "
+        "setweight(to_tsvector('english', left(coalesce(content_text, ''), 500000)), 'C')"
+    ),
+    "interviews": (
+        "setweight(to_tsvector('english', coalesce(filename, '')), 'A') || "
+        "setweight(to_tsvector('english', left(coalesce(transcript, ''), 500000)), 'C')"
+    ),
+    "speakers": (
+        "to_tsvector('english', coalesce(name, '') || ' ' || coalesce(speaker_label, ''))"
+    ),
+    "insights": (
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(quote, '')), 'B')"
+    ),
+}
+
+
+def upgrade() -> None:
+    for table, expression in SEARCH_VECTORS.items():
+        op.add_column(
+            table,
+            sa.Column(
+                "search_vector",
+                postgresql.TSVECTOR(),
+                sa.Computed(expression, persisted=True),
+                nullable=True,
+            ),
+        )
+        op.create_index(
+            f"ix_{table}_search_vector",
+            table,
+            ["search_vector"],
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(list(SEARCH_VECTORS)):
+        op.drop_index(f"ix_{table}_search_vector", table_name=table)
+        op.drop_column(table, "search_vector")
@@ -0,0 +1,29 @@
+"""Add workspaces.data_version for ETag-based conditional GETs
+
+Revision ID: c3f7a1e5d9b2
+Revises: b9e4d2a7c1f5
+Create Date: 2026-10-19 21:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3f7a1e5d9b2"
+down_revision: Union[str, None] = "b9e4d2a7c1f5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "workspaces",
+        sa.Column("data_version", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("workspaces", "data_version")
@@ -0,0 +1,26 @@
+"""Add per-phase telemetry column to sync_runs
+
+Revision ID: c6a2e8f4b1d9
+Revises: b3f5d7e9a2c4
+Create Date: 2026-10-19 15:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c6a2e8f4b1d9"
+down_revision: Union[str, None] = "b3f5d7e9a2c4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("sync_runs", sa.Column("telemetry", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("sync_runs", "telemetry")
@@ -0,0 +1,29 @@
+"""Add keyset index for feed pagination on signals
+
+Revision ID: d8b3f1a6c2e7
+Revises: c6a2e8f4b1d9
+Create Date: 2026-10-19 17:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d8b3f1a6c2e7"
+down_revision: Union[str, None] = "c6a2e8f4b1d9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_signals_workspace_feed_order",
+        "signals",
+        ["workspace_id", "occurred_at", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_signals_workspace_feed_order", table_name="signals")
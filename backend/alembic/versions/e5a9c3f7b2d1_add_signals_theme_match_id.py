@@ -0,0 +1,40 @@
+"""Add generated signals.theme_match_id with a theme-scoped keyset index
+
+Revision ID: e5a9c3f7b2d1
+Revises: c3f7a1e5d9b2
+Create Date: 2026-10-19 23:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a9c3f7b2d1"
+down_revision: Union[str, None] = "c3f7a1e5d9b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "signals",
+        sa.Column(
+            "theme_match_id",
+            sa.Text(),
+            sa.Computed("metadata_json #>> '{theme_match,theme_id}'", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_signals_workspace_theme_match_order",
+        "signals",
+        ["workspace_id", "theme_match_id", "occurred_at", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_signals_workspace_theme_match_order", table_name="signals")
+    op.drop_column("signals", "theme_match_id")
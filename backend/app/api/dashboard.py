@@ -1,40 +1,47 @@
 """
 Home dashboard summary API.
+
+Everything here is built from aggregate queries (counts with ``FILTER``,
+per-theme window stats, ``date_trunc`` buckets and ``LIMIT``-ed activity
+lists), so the cost does not grow with the number of signals. The signal
+consistency pass never reads signal content, and is skipped entirely while
+the workspace's data version has not moved since it last settled.
 """
 
 from __future__ import annotations
 
 import uuid
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, time, timedelta, timezone
 from typing import Iterable
 
 from fastapi import APIRouter, Depends
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy import distinct, func, select
+from sqlalchemy.orm import load_only, selectinload
 
-from app.core.auth import get_scoped_user
-from app.core.database import get_db
+from app.core.data_version import conditional_get, data_pool_cache_key
+from app.core.response_cache import response_cache
 from app.models import (
     Interview,
     InterviewStatus,
     Signal,
+    SignalStatus,
     SourceConnection,
     Spec,
     SyncRun,
     SyncRunStatus,
     Theme,
     ThemeStatus,
-    User,
 )
 from app.schemas import HomeDashboardResponse
 from app.services.signals import (
-    _parse_theme_match_id,
-    build_source_breakdown,
-    build_theme_score_map,
+    ThemeSignalStats,
+    aggregate_theme_signal_stats,
+    build_source_breakdown_from_counts,
+    count_theme_signals_by_bucket,
     ensure_signal_consistency,
-    get_workspace_signals,
+    impact_score_from_stats,
 )
+from app.services.workspace_data import WorkspaceDataLoader, get_workspace_loader
 
 router = APIRouter(prefix="/api/dashboard", tags=["Dashboard"])
 
@@ -45,6 +52,11 @@ SOURCE_TYPE_COUNT_LABELS = {
     "survey": ("survey response", "survey responses"),
     "analytics": ("analytics signal", "analytics signals"),
 }
+RECENT_ACTIVITY_LIMIT = 6
+ACTIVE_PRIORITIES_LIMIT = 5
+EMERGING_TRENDS_LIMIT = 3
+SPARKLINE_DAYS = 7
+DASHBOARD_CACHE_TTL_SECONDS = 300
 
 
 def _now_utc() -> datetime:
@@ -59,29 +71,9 @@ def _as_utc(value: datetime | None) -> datetime:
     return value
 
 
-def _theme_signals(*, theme_id: uuid.UUID, signals: Iterable[Signal]) -> list[Signal]:
-    return [
-        signal
-        for signal in signals
-        if _parse_theme_match_id(signal.metadata_json) == theme_id
-    ]
-
-
-def _signals_in_window(
-    signals: Iterable[Signal],
-    *,
-    window_start: datetime,
-    window_end: datetime | None = None,
-) -> list[Signal]:
-    items: list[Signal] = []
-    for signal in signals:
-        occurred_at = _as_utc(signal.occurred_at)
-        if occurred_at < window_start:
-            continue
-        if window_end is not None and occurred_at >= window_end:
-            continue
-        items.append(signal)
-    return items
+def _window_count(stats: dict[uuid.UUID, ThemeSignalStats], theme_id: uuid.UUID) -> int:
+    theme_stats = stats.get(theme_id)
+    return theme_stats.signal_count if theme_stats else 0
 
 
 def _format_count_label(source_type: str, count: int) -> str:
@@ -90,8 +82,7 @@ def _format_count_label(source_type: str, count: int) -> str:
     return f"{count} {noun}"
 
 
-def _source_summary_label(theme_signals: list[Signal]) -> str:
-    breakdown = build_source_breakdown(theme_signals)
+def _source_summary_label(breakdown: list[dict]) -> str:
     if not breakdown:
         return "No sources"
     if len(breakdown) == 1:
@@ -123,16 +114,12 @@ def _velocity_delta(*, current_count: int, previous_count: int) -> int | None:
     return round(((current_count - previous_count) / previous_count) * 100)
 
 
-def _sparkline_points(*, theme_id: uuid.UUID, signals: list[Signal], now: datetime) -> list[int]:
-    start_date = (now - timedelta(days=6)).date()
-    counts = [0] * 7
-    for signal in signals:
-        if _parse_theme_match_id(signal.metadata_json) != theme_id:
-            continue
-        day_index = (_as_utc(signal.occurred_at).date() - start_date).days
-        if 0 <= day_index < 7:
-            counts[day_index] += 1
-    return counts
+def _sparkline_points(*, daily_counts: dict, now: datetime) -> list[int]:
+    start_date = (now - timedelta(days=SPARKLINE_DAYS - 1)).date()
+    return [
+        daily_counts.get(start_date + timedelta(days=offset), 0)
+        for offset in range(SPARKLINE_DAYS)
+    ]
 
 
 def _average_nonzero_scores(score_map: dict[uuid.UUID, object], theme_ids: Iterable[uuid.UUID]) -> float | None:
@@ -201,38 +188,115 @@ def _build_sync_activity(sync_run: SyncRun) -> dict:
     }
 
 
-@router.get("/home", response_model=HomeDashboardResponse)
+@router.get(
+    "/home",
+    response_model=HomeDashboardResponse,
+    dependencies=[Depends(conditional_get)],
+)
 async def get_home_dashboard(
-    current_user: User = Depends(get_scoped_user),
-    db: AsyncSession = Depends(get_db),
+    loader: WorkspaceDataLoader = Depends(get_workspace_loader),
+    cache_key: str = Depends(data_pool_cache_key),
 ):
-    workspace = await ensure_signal_consistency(db, user_id=current_user.id)
+    return await response_cache.get_or_compute(
+        "dashboard_home",
+        cache_key,
+        ttl_seconds=DASHBOARD_CACHE_TTL_SECONDS,
+        compute=lambda: _build_home_dashboard(loader),
+    )
+
+
+async def _build_home_dashboard(loader: WorkspaceDataLoader) -> dict:
+    db = loader.db
+    user_id = loader.user_id
+    workspace = await ensure_signal_consistency(db, user_id=user_id, loader=loader)
     now = _now_utc()
     current_window_start = now - timedelta(days=7)
     previous_window_start = now - timedelta(days=14)
 
-    interviews_result = await db.execute(
+    interviews_total, interviews_this_week = (
+        await db.execute(
+            select(
+                func.count(),
+                func.count().filter(Interview.created_at >= current_window_start),
+            ).where(Interview.user_id == user_id)
+        )
+    ).one()
+
+    recent_interviews_result = await db.execute(
         select(Interview)
-        .where(Interview.user_id == current_user.id)
+        .where(Interview.user_id == user_id)
+        .options(
+            load_only(
+                Interview.id,
+                Interview.filename,
+                Interview.status,
+                Interview.created_at,
+                Interview.updated_at,
+            )
+        )
         .order_by(Interview.updated_at.desc(), Interview.created_at.desc())
+        .limit(RECENT_ACTIVITY_LIMIT)
     )
-    interviews = list(interviews_result.scalars().all())
+    recent_interviews = list(recent_interviews_result.scalars().all())
 
     themes_result = await db.execute(
         select(Theme)
         .where(
-            Theme.user_id == current_user.id,
+            Theme.user_id == user_id,
             Theme.status == ThemeStatus.active,
         )
+        .options(
+            load_only(
+                Theme.id,
+                Theme.name,
+                Theme.is_new,
+                Theme.last_new_activity,
+                Theme.created_at,
+                Theme.updated_at,
+            )
+        )
         .order_by(Theme.created_at.desc())
     )
     active_themes = list(themes_result.scalars().all())
 
-    workspace_signals = await get_workspace_signals(
+    (
+        signals_total,
+        active_source_type_count,
+        current_window_signal_count,
+        previous_window_signal_count,
+    ) = (
+        await db.execute(
+            select(
+                func.count(),
+                func.count(distinct(Signal.source_type)),
+                func.count().filter(Signal.occurred_at >= current_window_start),
+                func.count().filter(
+                    Signal.occurred_at >= previous_window_start,
+                    Signal.occurred_at < current_window_start,
+                ),
+            ).where(
+                Signal.workspace_id == workspace.id,
+                Signal.status == SignalStatus.active,
+            )
+        )
+    ).one()
+
+    window_stats = await aggregate_theme_signal_stats(
         db,
         workspace_id=workspace.id,
+        windows={
+            "all": (None, None),
+            "current": (current_window_start, None),
+            "previous": (previous_window_start, current_window_start),
+        },
     )
-    score_map = build_theme_score_map(themes=active_themes, signals=workspace_signals)
+    all_stats = window_stats["all"]
+    current_stats = window_stats["current"]
+    previous_stats = window_stats["previous"]
+    score_map = {
+        theme.id: impact_score_from_stats(all_stats.get(theme.id) or ThemeSignalStats(), now=now)
+        for theme in active_themes
+    }
 
     sync_runs_result = await db.execute(
         select(SyncRun)
@@ -242,22 +306,15 @@ async def get_home_dashboard(
             selectinload(SyncRun.source_connection).selectinload(SourceConnection.data_source)
         )
         .order_by(SyncRun.finished_at.desc(), SyncRun.started_at.desc())
+        .limit(RECENT_ACTIVITY_LIMIT)
     )
     sync_runs = list(sync_runs_result.scalars().all())
 
-    interviews_total = len(interviews)
-    interviews_this_week = sum(
-        1
-        for interview in interviews
-        if _as_utc(interview.created_at) >= current_window_start
-    )
     new_themes_this_week = sum(
         1
         for theme in active_themes
         if theme.is_new and _as_utc(theme.last_new_activity or theme.created_at) >= current_window_start
     )
-    signals_total = len(workspace_signals)
-    active_source_type_count = len({signal.source_type for signal in workspace_signals})
     average_impact_score = (
         round(
             sum(float(score_map[theme.id].total) for theme in active_themes) / len(active_themes),
@@ -267,25 +324,20 @@ async def get_home_dashboard(
         else 0.0
     )
 
-    current_window_signals = _signals_in_window(
-        workspace_signals,
-        window_start=current_window_start,
-    )
-    previous_window_signals = _signals_in_window(
-        workspace_signals,
-        window_start=previous_window_start,
-        window_end=current_window_start,
-    )
     average_impact_delta = None
-    if len(current_window_signals) >= 3 and len(previous_window_signals) >= 3 and active_themes:
-        current_score_map = build_theme_score_map(
-            themes=active_themes,
-            signals=current_window_signals,
-        )
-        previous_score_map = build_theme_score_map(
-            themes=active_themes,
-            signals=previous_window_signals,
-        )
+    if current_window_signal_count >= 3 and previous_window_signal_count >= 3 and active_themes:
+        current_score_map = {
+            theme.id: impact_score_from_stats(
+                current_stats.get(theme.id) or ThemeSignalStats(), now=now
+            )
+            for theme in active_themes
+        }
+        previous_score_map = {
+            theme.id: impact_score_from_stats(
+                previous_stats.get(theme.id) or ThemeSignalStats(), now=now
+            )
+            for theme in active_themes
+        }
         theme_ids = [theme.id for theme in active_themes]
         current_average = _average_nonzero_scores(current_score_map, theme_ids)
         previous_average = _average_nonzero_scores(previous_score_map, theme_ids)
@@ -301,19 +353,13 @@ async def get_home_dashboard(
             _as_utc(item.created_at),
         ),
         reverse=True,
-    )[:5]:
-        theme_signal_rows = _theme_signals(theme_id=theme.id, signals=workspace_signals)
-        current_count = len(
-            _signals_in_window(theme_signal_rows, window_start=current_window_start)
-        )
-        previous_count = len(
-            _signals_in_window(
-                theme_signal_rows,
-                window_start=previous_window_start,
-                window_end=current_window_start,
-            )
+    )[:ACTIVE_PRIORITIES_LIMIT]:
+        current_count = _window_count(current_stats, theme.id)
+        previous_count = _window_count(previous_stats, theme.id)
+        theme_stats = all_stats.get(theme.id)
+        breakdown = build_source_breakdown_from_counts(
+            theme_stats.source_counts if theme_stats else {}
         )
-        breakdown = build_source_breakdown(theme_signal_rows)
         if breakdown:
             primary_source = max(
                 breakdown,
@@ -339,14 +385,14 @@ async def get_home_dashboard(
                     previous_count=previous_count,
                 ),
                 "primary_count_label": primary_count_label,
-                "source_summary_label": _source_summary_label(theme_signal_rows),
+                "source_summary_label": _source_summary_label(breakdown),
                 "priority_band": _priority_band(impact_score),
             }
         )
 
     recent_activity = [
         _build_interview_activity(interview)
-        for interview in interviews[:6]
+        for interview in recent_interviews
     ]
     recent_activity.extend(
         _build_theme_activity(theme)
@@ -355,64 +401,69 @@ async def get_home_dashboard(
     )
     recent_activity.extend(
         _build_sync_activity(sync_run)
-        for sync_run in sync_runs[:6]
+        for sync_run in sync_runs
     )
     recent_activity.sort(
         key=lambda item: _as_utc(item["occurred_at"]),
         reverse=True,
     )
-    recent_activity = recent_activity[:6]
+    recent_activity = recent_activity[:RECENT_ACTIVITY_LIMIT]
 
-    emerging_trends: list[dict] = []
+    emerging_candidates: list[tuple[tuple[int, datetime], Theme, int, int]] = []
     for theme in active_themes:
         reference_time = _as_utc(theme.last_new_activity or theme.created_at)
         if not theme.is_new or reference_time < current_window_start:
             continue
-        theme_signal_rows = _theme_signals(theme_id=theme.id, signals=workspace_signals)
-        current_count = len(
-            _signals_in_window(theme_signal_rows, window_start=current_window_start)
-        )
+        current_count = _window_count(current_stats, theme.id)
         if current_count == 0:
             continue
-        previous_count = len(
-            _signals_in_window(
-                theme_signal_rows,
-                window_start=previous_window_start,
-                window_end=current_window_start,
-            )
+        previous_count = _window_count(previous_stats, theme.id)
+        emerging_candidates.append(
+            ((current_count, reference_time), theme, current_count, previous_count)
         )
-        emerging_trends.append(
-            {
-                "id": theme.id,
-                "name": theme.name,
-                "velocity_delta": _velocity_delta(
-                    current_count=current_count,
-                    previous_count=previous_count,
-                ),
-                "sparkline_points": _sparkline_points(
-                    theme_id=theme.id,
-                    signals=theme_signal_rows,
-                    now=now,
-                ),
-                "href": f"/insights?theme={theme.id}",
-                "_sort_key": (current_count, reference_time),
-            }
+    emerging_candidates.sort(key=lambda item: item[0], reverse=True)
+    emerging_candidates = emerging_candidates[:EMERGING_TRENDS_LIMIT]
+
+    daily_counts: dict[uuid.UUID, dict] = {}
+    if emerging_candidates:
+        sparkline_start = datetime.combine(
+            (now - timedelta(days=SPARKLINE_DAYS - 1)).date(),
+            time.min,
+            tzinfo=timezone.utc,
         )
+        daily_counts = await count_theme_signals_by_bucket(
+            db,
+            workspace_id=workspace.id,
+            unit="day",
+            start=sparkline_start,
+            end=sparkline_start + timedelta(days=SPARKLINE_DAYS),
+        )
+    emerging_trends = [
+        {
+            "id": theme.id,
+            "name": theme.name,
+            "velocity_delta": _velocity_delta(
+                current_count=current_count,
+                previous_count=previous_count,
+            ),
+            "sparkline_points": _sparkline_points(
+                daily_counts=daily_counts.get(theme.id, {}),
+                now=now,
+            ),
+            "href": f"/insights?theme={theme.id}",
+        }
+        for _, theme, current_count, previous_count in emerging_candidates
+    ]
 
-    emerging_trends.sort(
-        key=lambda item: item["_sort_key"],
-        reverse=True,
+    spec_status_result = await db.execute(
+        select(Spec.status, func.count())
+        .where(Spec.user_id == user_id)
+        .group_by(Spec.status)
     )
-    for item in emerging_trends:
-        item.pop("_sort_key", None)
-    emerging_trends = emerging_trends[:3]
-
-    specs_result = await db.execute(select(Spec).where(Spec.user_id == current_user.id))
-    specs = list(specs_result.scalars().all())
-    spec_pipeline = {"total": len(specs)}
-    for spec in specs:
-        key = spec.status.value
-        spec_pipeline[key] = spec_pipeline.get(key, 0) + 1
+    spec_status_counts = spec_status_result.all()
+    spec_pipeline = {"total": sum(count for _, count in spec_status_counts)}
+    for status, count in spec_status_counts:
+        spec_pipeline[status.value] = count
 
     has_data = bool(interviews_total or signals_total or active_themes)
     return {
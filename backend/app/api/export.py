@@ -12,7 +12,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import PlainTextResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer
 
 from app.core.auth import get_scoped_user
 from app.core.database import get_db
@@ -128,6 +128,7 @@ async def export_interview(
             Interview.user_id == current_user.id,
         )
         .options(
+            undefer(Interview.transcript),
             selectinload(Interview.speakers),
             selectinload(Interview.insights),
         )
@@ -204,6 +205,7 @@ async def export_feed(
         sentiment=sentiment,
         date_from=date_from,
         date_to=date_to,
+        full_content=True,
     )
 
     serialized_signals = [
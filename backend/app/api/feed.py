@@ -7,49 +7,101 @@ from __future__ import annotations
 import uuid
 from datetime import date
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from app.core.auth import get_scoped_user
+from app.core.data_version import conditional_get
 from app.core.database import get_db
-from app.models import Signal, Theme, User, SourceType, SignalStatus
+from app.models import Signal, User, SourceType, SignalStatus
 from app.schemas import FeedSignalDetailResponse, FeedSignalResponse
+from app.services.search import load_search_snippets, normalize_search_query
 from app.services.signals import (
+    FEED_MAX_PAGE_SIZE,
+    FEED_PAGE_SIZE,
+    InvalidFeedCursor,
     ensure_signal_consistency,
-    get_workspace_signals,
+    get_signal_theme_lookup,
+    get_workspace_signals_page,
     serialize_feed_signal,
 )
+from app.services.workspace_data import WorkspaceDataLoader, get_workspace_loader
 
 router = APIRouter(prefix="/api/feed", tags=["Feed"])
 
+# Keeps the list body backward compatible; clients follow this header to
+# load the next page.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
 
-@router.get("", response_model=list[FeedSignalResponse])
+
+@router.get(
+    "",
+    response_model=list[FeedSignalResponse],
+    dependencies=[Depends(conditional_get)],
+)
 async def list_feed(
+    response: Response,
     source: SourceType | None = Query(None),
     sentiment: str | None = Query(None),
     date_from: date | None = Query(None),
     date_to: date | None = Query(None),
+    q: str | None = Query(None, max_length=200),
+    limit: int = Query(FEED_PAGE_SIZE, ge=1, le=FEED_MAX_PAGE_SIZE),
+    cursor: str | None = Query(None),
     current_user: User = Depends(get_scoped_user),
     db: AsyncSession = Depends(get_db),
+    loader: WorkspaceDataLoader = Depends(get_workspace_loader),
 ):
+    """One page of feed signals, newest first — or most relevant first when
+    searching with ``q``.
+
+    When more signals match, the ``X-Next-Cursor`` response header carries
+    the cursor for the next page.
+    """
     workspace = await ensure_signal_consistency(
         db,
         user_id=current_user.id,
+        loader=loader,
     )
-    themes_result = await db.execute(select(Theme).where(Theme.user_id == current_user.id))
-    theme_lookup = {theme.id: theme for theme in themes_result.scalars().all()}
+    try:
+        signals, next_cursor = await get_workspace_signals_page(
+            db,
+            workspace_id=workspace.id,
+            source_filter=source,
+            sentiment=sentiment,
+            date_from=date_from,
+            date_to=date_to,
+            q=q,
+            limit=limit,
+            cursor=cursor,
+        )
+    except InvalidFeedCursor as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    signals = await get_workspace_signals(
-        db,
-        workspace_id=workspace.id,
-        source_filter=source,
-        sentiment=sentiment,
-        date_from=date_from,
-        date_to=date_to,
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    theme_lookup = await get_signal_theme_lookup(
+        db, user_id=current_user.id, signals=signals
+    )
+    snippets = (
+        await load_search_snippets(
+            db,
+            id_column=Signal.id,
+            document=Signal.content_text,
+            ids=[signal.id for signal in signals],
+            q=q,
+        )
+        if normalize_search_query(q)
+        else {}
     )
     return [
-        serialize_feed_signal(signal, theme_lookup=theme_lookup)
+        serialize_feed_signal(
+            signal,
+            theme_lookup=theme_lookup,
+            search_snippet=snippets.get(signal.id),
+        )
         for signal in signals
     ]
 
@@ -59,23 +111,30 @@ async def get_feed_signal(
     signal_id: uuid.UUID,
     current_user: User = Depends(get_scoped_user),
     db: AsyncSession = Depends(get_db),
+    loader: WorkspaceDataLoader = Depends(get_workspace_loader),
 ):
     workspace = await ensure_signal_consistency(
         db,
         user_id=current_user.id,
+        loader=loader,
     )
-    stmt = select(Signal).where(
-        Signal.id == signal_id,
-        Signal.workspace_id == workspace.id,
-        Signal.status == SignalStatus.active,
+    stmt = (
+        select(Signal)
+        .where(
+            Signal.id == signal_id,
+            Signal.workspace_id == workspace.id,
+            Signal.status == SignalStatus.active,
+        )
+        .options(undefer(Signal.content_text))
     )
     result = await db.execute(stmt)
     signal = result.scalar_one_or_none()
     if signal is None:
         raise HTTPException(status_code=404, detail="Feed signal not found")
 
-    themes_result = await db.execute(select(Theme).where(Theme.user_id == current_user.id))
-    theme_lookup = {theme.id: theme for theme in themes_result.scalars().all()}
+    theme_lookup = await get_signal_theme_lookup(
+        db, user_id=current_user.id, signals=[signal]
+    )
     return serialize_feed_signal(
         signal,
         theme_lookup=theme_lookup,
@@ -8,13 +8,11 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-from arq import create_pool
-from arq.connections import RedisSettings
+from sqlalchemy.orm import load_only, selectinload, undefer
 
 from app.core.auth import get_scoped_user
-from app.core.config import get_settings
 from app.core.database import get_db
+from app.core.jobs import enqueue_interview_processing
 from app.core.storage import generate_upload_url
 from app.models import (
     User,
@@ -38,7 +36,11 @@ from app.schemas import (
     SpeakerUpdate,
     SpeakerResponse,
 )
-from app.services.interview_library import build_interview_library
+from app.services.interview_library import (
+    LIBRARY_MAX_PAGE_SIZE,
+    LIBRARY_PAGE_SIZE,
+    build_interview_library,
+)
 from app.services.signals import (
     cleanup_interview_native_signals,
     refresh_external_signal_theme_matches,
@@ -47,28 +49,19 @@ from app.services.synthesis import synthesize_themes
 
 router = APIRouter(prefix="/api/interviews", tags=["Interviews"])
 
-settings = get_settings()
-
-# Lazy arq pool
-_arq_pool = None
-
-
-async def _get_arq_pool():
-    """Get or create the arq Redis pool for enqueuing jobs."""
-    global _arq_pool
-    if _arq_pool is not None:
-        # Check if the pool's connection is still usable (event loop may have changed in tests)
-        try:
-            import asyncio
-            asyncio.get_running_loop()
-        except RuntimeError:
-            _arq_pool = None
-    if _arq_pool is None:
-        _arq_pool = await create_pool(
-            RedisSettings.from_dsn(settings.redis_url),
-        )
-    return _arq_pool
-
+# Columns behind ``InterviewResponse``, for list queries.
+INTERVIEW_RESPONSE_COLUMNS = (
+    Interview.id,
+    Interview.filename,
+    Interview.file_type,
+    Interview.file_size_bytes,
+    Interview.status,
+    Interview.duration_seconds,
+    Interview.error_message,
+    Interview.comment,
+    Interview.created_at,
+    Interview.updated_at,
+)
 
 async def _load_owned_interview(
     db: AsyncSession,
@@ -205,12 +198,7 @@ async def create_interview(
     await db.flush()
 
     # Enqueue processing job
-    pool = await _get_arq_pool()
-    await pool.enqueue_job(
-        "process_interview_job",
-        str(interview.id),
-        _queue_name="spec10x:jobs",
-    )
+    await enqueue_interview_processing([interview.id])
 
     return interview
 
@@ -223,7 +211,11 @@ async def list_interviews(
     db: AsyncSession = Depends(get_db),
 ):
     """List all interviews for the current user."""
-    stmt = select(Interview).where(Interview.user_id == current_user.id)
+    stmt = (
+        select(Interview)
+        .where(Interview.user_id == current_user.id)
+        .options(load_only(*INTERVIEW_RESPONSE_COLUMNS))
+    )
 
     if status_filter:
         stmt = stmt.where(Interview.status == status_filter)
@@ -240,13 +232,18 @@ async def list_interviews(
 @router.get("/library", response_model=InterviewLibraryResponse)
 async def get_interview_library(
     q: Optional[str] = Query(None),
-    sort: str = Query("recent", pattern="^(recent|oldest|name|insights|themes)$"),
+    sort: Optional[str] = Query(
+        None,
+        pattern="^(relevance|recent|oldest|name|insights|themes)$",
+    ),
     status_filter: Optional[str] = Query(
         None,
         alias="status",
         pattern="^(done|processing|error|low_insight)$",
     ),
     source: Optional[str] = Query(None),
+    limit: int = Query(LIBRARY_PAGE_SIZE, ge=1, le=LIBRARY_MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
     current_user: User = Depends(get_scoped_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -257,6 +254,8 @@ async def get_interview_library(
         sort=sort,
         status_filter=status_filter,
         source_filter=source,
+        limit=limit,
+        offset=offset,
     )
 
 
@@ -300,13 +299,7 @@ async def bulk_reanalyze_interviews(
 
     if succeeded_ids:
         await _refresh_after_interview_mutation(db, user_id=current_user.id)
-        pool = await _get_arq_pool()
-        for interview_id in succeeded_ids:
-            await pool.enqueue_job(
-                "process_interview_job",
-                str(interview_id),
-                _queue_name="spec10x:jobs",
-            )
+        await enqueue_interview_processing(succeeded_ids)
 
     return {
         "requested_count": len(request.interview_ids),
@@ -376,6 +369,7 @@ async def get_interview(
             Interview.user_id == current_user.id,
         )
         .options(
+            undefer(Interview.transcript),
             selectinload(Interview.speakers),
             selectinload(Interview.insights),
         )
@@ -458,12 +452,7 @@ async def reanalyze_interview(
     await _refresh_after_interview_mutation(db, user_id=current_user.id)
     await db.refresh(interview)
 
-    pool = await _get_arq_pool()
-    await pool.enqueue_job(
-        "process_interview_job",
-        str(interview.id),
-        _queue_name="spec10x:jobs",
-    )
+    await enqueue_interview_processing([interview.id])
 
     return interview
 
@@ -36,14 +36,21 @@ async def get_notifications(
     db: AsyncSession = Depends(get_db),
 ):
     """Get the current user's notifications, ordered by newest first."""
+    return await _get_recent_notifications(db, current_user.id)
+
+
+async def _get_recent_notifications(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+) -> List[Notification]:
     stmt = (
         select(Notification)
-        .where(Notification.user_id == current_user.id)
+        .where(Notification.user_id == user_id)
         .order_by(Notification.created_at.desc())
         .limit(50)
     )
     result = await db.execute(stmt)
-    return result.scalars().all()
+    return list(result.scalars().all())
 
 
 @router.patch("/{notification_id}/read", response_model=NotificationResponse)
@@ -0,0 +1,112 @@
+"""
+Spec10x Backend — App shell API
+
+The first page after login needs the home dashboard, the priority board,
+notifications, the active workspace and this month's usage. ``GET
+/api/shell`` returns all of them from one request: authentication and data
+owner resolution happen once, and the dashboard and board share one
+``WorkspaceDataLoader``, so the signal consistency pass runs a single time.
+The dashboard and board parts are cached under data-pool keys that leave
+out the path, so they share entries with their standalone endpoints.
+
+The shell is ETagged like the standalone endpoints, with the requester's
+notifications, workspace and usage folded in since ``data_version`` does
+not cover them. Those parts are cheap and load first; an unchanged poll
+gets a 304 before the dashboard or board is built.
+"""
+
+import hashlib
+import json
+from typing import List
+
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.billing import _get_or_create_usage
+from app.api.dashboard import DASHBOARD_CACHE_TTL_SECONDS, _build_home_dashboard
+from app.api.notifications import NotificationResponse, _get_recent_notifications
+from app.api.themes import BOARD_CACHE_TTL_SECONDS, _build_theme_board
+from app.api.workspace import WorkspaceResponse, _build_workspace_response
+from app.core.auth import get_current_user
+from app.core.data_version import (
+    build_data_version_etag,
+    check_not_modified,
+    current_data_version,
+    data_pool_cache_key,
+)
+from app.core.database import get_db
+from app.core.response_cache import response_cache
+from app.models import User
+from app.schemas import BoardThemeCardResponse, HomeDashboardResponse, UsageResponse
+from app.services.workspace_data import WorkspaceDataLoader, get_workspace_loader
+
+router = APIRouter(prefix="/api/shell", tags=["Shell"])
+
+
+class AppShellResponse(BaseModel):
+    dashboard: HomeDashboardResponse
+    board: List[BoardThemeCardResponse]
+    notifications: List[NotificationResponse]
+    workspace: WorkspaceResponse
+    usage: UsageResponse
+
+
+@router.get("", response_model=AppShellResponse)
+async def get_app_shell(
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    loader: WorkspaceDataLoader = Depends(get_workspace_loader),
+    data_version: int = Depends(current_data_version),
+    cache_key: str = Depends(data_pool_cache_key),
+):
+    """Dashboard, board, notifications, workspace and usage in one round trip.
+
+    Notifications and usage belong to the requester; the dashboard and board
+    cover the data pool of their active workspace, as on the standalone
+    endpoints.
+    """
+    notifications = [
+        NotificationResponse.model_validate(notification)
+        for notification in await _get_recent_notifications(db, current_user.id)
+    ]
+    workspace = await _build_workspace_response(db, current_user)
+    usage = UsageResponse.model_validate(await _get_or_create_usage(db, current_user.id))
+    await db.commit()
+
+    personal_state = json.dumps(
+        jsonable_encoder([notifications, workspace, usage]), sort_keys=True
+    )
+    check_not_modified(
+        request,
+        response,
+        build_data_version_etag(
+            owner_user_id=loader.user_id,
+            data_version=data_version,
+            request=request,
+            extra=hashlib.sha256(personal_state.encode()).hexdigest(),
+        ),
+    )
+
+    dashboard = await response_cache.get_or_compute(
+        "dashboard_home",
+        cache_key,
+        ttl_seconds=DASHBOARD_CACHE_TTL_SECONDS,
+        compute=lambda: _build_home_dashboard(loader),
+    )
+    board = await response_cache.get_or_compute(
+        "theme_board",
+        cache_key,
+        ttl_seconds=BOARD_CACHE_TTL_SECONDS,
+        compute=lambda: _build_theme_board(loader),
+    )
+    return {
+        "dashboard": dashboard,
+        "board": board,
+        "notifications": notifications,
+        "workspace": workspace,
+        "usage": usage,
+    }
@@ -18,6 +18,7 @@ from app.schemas import (
     SourceConnectionCreate,
     SourceConnectionDetailResponse,
     SourceConnectionResponse,
+    SyncRunDetailResponse,
     SyncRunResponse,
 )
 from app.services.sources import (
@@ -337,7 +338,7 @@ async def list_sync_runs(
 
 @router.get(
     "/source-connections/{connection_id}/sync-runs/{sync_run_id}",
-    response_model=SyncRunResponse,
+    response_model=SyncRunDetailResponse,
 )
 async def get_sync_run(
     connection_id: uuid.UUID,
@@ -20,7 +20,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm.attributes import flag_modified
 
 from app.core.auth import get_scoped_user
+from app.core.data_version import data_version_etag
 from app.core.database import get_db
+from app.core.response_cache import etag_cache_key, response_cache
 from app.models import Signal, Spec, SpecGenerationStatus, SpecStatus, Theme, User
 from app.schemas import (
     GitHubExportRequest,
@@ -33,20 +35,19 @@ from app.schemas import (
 )
 from app.services.github_export import GitHubExportError, export_tasks_to_github
 from app.services.outcomes import OUTCOME_WINDOW_WEEKS, compute_spec_outcomes
-from app.services.signals import (
-    _parse_theme_match_id,
-    ensure_signal_consistency,
-    get_workspace_signals,
-)
+from app.services.signals import ensure_signal_consistency, get_workspace_signals
 from app.services.spec_generation import generate_spec_for_theme
 from app.services.task_breakdown import (
     TaskGenerationError,
     generate_tasks_for_spec,
     render_spec_export,
 )
+from app.services.workspace_data import WorkspaceDataLoader, get_workspace_loader
 
 router = APIRouter(prefix="/api/specs", tags=["Specs"])
 
+OUTCOMES_CACHE_TTL_SECONDS = 900
+
 # Validated review-workflow transitions (PRD-08-01). Small backward moves are
 # allowed for correction; anything else is rejected.
 ALLOWED_TRANSITIONS: dict[SpecStatus, set[SpecStatus]] = {
@@ -103,18 +104,16 @@ async def _get_owned_theme(
 
 
 async def _get_theme_signals(
-    db: AsyncSession,
+    loader: WorkspaceDataLoader,
     *,
-    user_id: uuid.UUID,
     theme: Theme,
 ) -> tuple[uuid.UUID, list[Signal]]:
-    workspace = await ensure_signal_consistency(db, user_id=user_id)
-    workspace_signals = await get_workspace_signals(db, workspace_id=workspace.id)
-    theme_signals = [
-        signal
-        for signal in workspace_signals
-        if _parse_theme_match_id(signal.metadata_json) == theme.id
-    ]
+    workspace = await ensure_signal_consistency(
+        loader.db, user_id=loader.user_id, loader=loader
+    )
+    theme_signals = await get_workspace_signals(
+        loader.db, workspace_id=workspace.id, theme_id=theme.id
+    )
     return workspace.id, theme_signals
 
 
@@ -153,12 +152,11 @@ async def create_spec(
     body: SpecCreate,
     current_user: User = Depends(get_scoped_user),
     db: AsyncSession = Depends(get_db),
+    loader: WorkspaceDataLoader = Depends(get_workspace_loader),
 ):
     """Generate a new spec from a theme's evidence."""
     theme = await _get_owned_theme(db, theme_id=body.theme_id, user_id=current_user.id)
-    workspace_id, theme_signals = await _get_theme_signals(
-        db, user_id=current_user.id, theme=theme
-    )
+    workspace_id, theme_signals = await _get_theme_signals(loader, theme=theme)
     if not theme_signals:
         raise HTTPException(
             status_code=422,
@@ -201,6 +199,8 @@ async def list_specs(
 async def list_spec_outcomes(
     current_user: User = Depends(get_scoped_user),
     db: AsyncSession = Depends(get_db),
+    loader: WorkspaceDataLoader = Depends(get_workspace_loader),
+    etag: str = Depends(data_version_etag),
 ):
     """Post-ship outcomes for every shipped spec (v1.0 Full Loop, D-10-06).
 
@@ -211,12 +211,19 @@ async def list_spec_outcomes(
     The computation lives in services/outcomes.py, shared with the v1.1
     auto-close notifier.
     """
-    outcomes = await compute_spec_outcomes(db, user_id=current_user.id)
+    async def _compute() -> SpecOutcomesPageResponse:
+        outcomes = await compute_spec_outcomes(db, user_id=current_user.id, loader=loader)
+        return SpecOutcomesPageResponse(
+            window_weeks=OUTCOME_WINDOW_WEEKS,
+            specs=outcomes,
+            has_data=bool(outcomes),
+        )
 
-    return SpecOutcomesPageResponse(
-        window_weeks=OUTCOME_WINDOW_WEEKS,
-        specs=outcomes,
-        has_data=bool(outcomes),
+    return await response_cache.get_or_compute(
+        "spec_outcomes",
+        etag_cache_key(etag),
+        ttl_seconds=OUTCOMES_CACHE_TTL_SECONDS,
+        compute=_compute,
     )
 
 
@@ -283,6 +290,7 @@ async def regenerate_spec(
     spec_id: uuid.UUID,
     current_user: User = Depends(get_scoped_user),
     db: AsyncSession = Depends(get_db),
+    loader: WorkspaceDataLoader = Depends(get_workspace_loader),
 ):
     """Re-run generation, replacing sections and evidence. Pre-approval only."""
     spec = await _get_owned_spec(db, spec_id=spec_id, user_id=current_user.id)
@@ -298,9 +306,7 @@ async def regenerate_spec(
         )
 
     theme = await _get_owned_theme(db, theme_id=spec.theme_id, user_id=current_user.id)
-    _, theme_signals = await _get_theme_signals(
-        db, user_id=current_user.id, theme=theme
-    )
+    _, theme_signals = await _get_theme_signals(loader, theme=theme)
     if not theme_signals:
         raise HTTPException(
             status_code=422,
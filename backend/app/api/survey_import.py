@@ -3,23 +3,27 @@ Survey and NPS CSV import API routes.
 
 Sprint 2: template download + CSV validation.
 Sprint 3: preview confirm, import execution, and import history.
+Uploads are validated and imported as streams; large files import in the worker.
 """
 
+import asyncio
 import io
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Response, UploadFile, File
 from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.core.auth import get_scoped_user
+from app.core.config import get_settings
 from app.core.database import get_db
+from app.core.jobs import job_dispatcher
+from app.core.storage import upload_fileobj
 from app.connectors.csv_import import (
     TEMPLATE_CSV,
-    validate_csv_bytes,
-    CSVImportConnector,
+    validate_csv_stream,
 )
 from app.models import (
     DataSource,
@@ -30,7 +34,6 @@ from app.models import (
     SyncRunType,
     User,
 )
-from app.services.signals import upsert_external_signals
 from app.services.sources import (
     create_source_connection,
     get_or_create_default_workspace,
@@ -39,9 +42,12 @@ from app.services.sources import (
     complete_sync_run,
     fail_sync_run,
 )
+from app.services.survey_import import import_csv_stream, survey_import_storage_path
 
 router = APIRouter(prefix="/api/survey-import", tags=["Survey Import"])
 
+settings = get_settings()
+
 
 @router.get("/template")
 async def download_template(
@@ -57,17 +63,15 @@ async def download_template(
     )
 
 
-@router.post("/validate")
-async def validate_csv(
-    file: UploadFile = File(...),
-    current_user: User = Depends(get_scoped_user),
-    db: AsyncSession = Depends(get_db),
-):
-    """Validate an uploaded survey/NPS CSV file.
+def _upload_size(file: UploadFile) -> int:
+    """Size of the spooled upload without reading it into memory."""
+    file.file.seek(0, io.SEEK_END)
+    size = file.file.tell()
+    file.file.seek(0)
+    return size
 
-    Returns validation results including errors, warnings,
-    preview rows, and column info.
-    """
+
+def _check_upload(file: UploadFile) -> int:
     if not file.filename:
         raise HTTPException(status_code=400, detail="No file provided")
 
@@ -77,54 +81,57 @@ async def validate_csv(
             detail="File must be a CSV (.csv) file",
         )
 
-    contents = await file.read()
+    size = _upload_size(file)
 
-    if len(contents) == 0:
+    if size == 0:
         raise HTTPException(status_code=400, detail="File is empty")
 
-    if len(contents) > 10 * 1024 * 1024:  # 10MB limit
+    if size > settings.survey_import_max_bytes:
+        max_mb = settings.survey_import_max_bytes // (1024 * 1024)
         raise HTTPException(
             status_code=400,
-            detail="File is too large — maximum size is 10MB",
+            detail=f"File is too large — maximum size is {max_mb}MB",
         )
 
-    result = validate_csv_bytes(contents)
-    return result
+    return size
 
 
-@router.post("/confirm")
-async def confirm_import(
+@router.post("/validate")
+async def validate_csv(
     file: UploadFile = File(...),
     current_user: User = Depends(get_scoped_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """Confirm and execute a survey/NPS CSV import.
+    """Validate an uploaded survey/NPS CSV file.
 
-    Re-validates the file, then normalizes rows into signals.
-    Creates source_connection, sync_run, and source_items.
+    Returns validation results including errors, warnings,
+    preview rows, and column info.
     """
-    if not file.filename:
-        raise HTTPException(status_code=400, detail="No file provided")
+    _check_upload(file)
+    return await asyncio.to_thread(validate_csv_stream, file.file)
 
-    if not file.filename.lower().endswith(".csv"):
-        raise HTTPException(
-            status_code=400,
-            detail="File must be a CSV (.csv) file",
-        )
 
-    contents = await file.read()
+@router.post("/confirm")
+async def confirm_import(
+    response: Response,
+    file: UploadFile = File(...),
+    current_user: User = Depends(get_scoped_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Confirm and execute a survey/NPS CSV import.
 
-    if len(contents) == 0:
-        raise HTTPException(status_code=400, detail="File is empty")
+    Re-validates the file, then normalizes rows into signals chunk by
+    chunk. Creates source_connection, sync_run, and source_items.
 
-    if len(contents) > 10 * 1024 * 1024:
-        raise HTTPException(
-            status_code=400,
-            detail="File is too large — maximum size is 10MB",
-        )
+    Files up to ``survey_import_inline_max_bytes`` import in the request.
+    Larger files are staged in storage and imported by a background job;
+    the response is ``202`` with ``status: "queued"`` and progress arrives
+    over ``/ws/processing`` as ``type: "survey_import"`` messages.
+    """
+    size = _check_upload(file)
 
     # Re-validate
-    validation = validate_csv_bytes(contents)
+    validation = await asyncio.to_thread(validate_csv_stream, file.file)
     if not validation["valid"]:
         raise HTTPException(
             status_code=400,
@@ -156,7 +163,8 @@ async def confirm_import(
         data_source=data_source,
         config_json={
             "import_name": file.filename,
-            "file_size_bytes": len(contents),
+            "file_size_bytes": size,
+            "total_rows": validation["total_rows"],
         },
     )
 
@@ -169,36 +177,34 @@ async def confirm_import(
         connection=connection,
         run_type=SyncRunType.backfill,
     )
+    # Chunks commit as they go, so the run must exist on its own first.
+    await db.commit()
 
-    try:
-        # Normalize CSV rows into signals
-        connector = CSVImportConnector(db=db, connection=connection)
-        # Pass all validated rows to normalize
-        all_rows = validation.get("preview_rows", [])
-
-        # If there are more rows than preview (preview is capped at 10),
-        # re-parse the full CSV for all rows
-        import csv as csv_module
-        text = contents.decode("utf-8-sig")
-        reader = csv_module.DictReader(io.StringIO(text))
-        all_rows = list(reader)
-
-        signals = await connector.normalize(all_rows)
+    if size > settings.survey_import_inline_max_bytes:
+        return await _queue_background_import(
+            db,
+            response=response,
+            file=file,
+            size=size,
+            workspace_id=workspace.id,
+            connection=connection,
+            sync_run=sync_run,
+            user_id=current_user.id,
+        )
 
-        records_created, records_updated, records_unchanged = await upsert_external_signals(
+    try:
+        counts = await import_csv_stream(
             db,
             connection=connection,
             data_source=data_source,
-            signals=signals,
+            sync_run=sync_run,
+            stream=file.file,
         )
 
         complete_sync_run(
             sync_run,
             connection=connection,
-            records_seen=len(all_rows),
-            records_created=records_created,
-            records_updated=records_updated,
-            records_unchanged=records_unchanged,
+            **counts.as_dict(),
         )
 
         await db.commit()
@@ -208,17 +214,21 @@ async def confirm_import(
             "import_name": file.filename,
             "connection_id": str(connection.id),
             "sync_run_id": str(sync_run.id),
-            "records_seen": len(all_rows),
-            "records_created": records_created,
-            "records_updated": records_updated,
-            "records_unchanged": records_unchanged,
+            **counts.as_dict(),
         }
 
     except Exception as exc:
+        await db.rollback()
+        await db.refresh(sync_run)
+        await db.refresh(connection)
         fail_sync_run(
             sync_run,
             connection=connection,
             error_summary=str(exc),
+            records_seen=sync_run.records_seen or 0,
+            records_created=sync_run.records_created or 0,
+            records_updated=sync_run.records_updated or 0,
+            records_unchanged=sync_run.records_unchanged or 0,
         )
         await db.commit()
         raise HTTPException(
@@ -227,6 +237,53 @@ async def confirm_import(
         )
 
 
+async def _queue_background_import(
+    db: AsyncSession,
+    *,
+    response: Response,
+    file: UploadFile,
+    size: int,
+    workspace_id: uuid.UUID,
+    connection: SourceConnection,
+    sync_run: SyncRun,
+    user_id: uuid.UUID,
+) -> dict:
+    """Stage the upload in storage and hand it to ``import_survey_csv_job``."""
+    storage_path = survey_import_storage_path(workspace_id, sync_run.id)
+    try:
+        await asyncio.to_thread(upload_fileobj, storage_path, file.file, size)
+        await job_dispatcher.enqueue(
+            "import_survey_csv_job",
+            str(sync_run.id),
+            storage_path,
+            str(user_id),
+            job_id=f"survey-import:{sync_run.id}",
+        )
+    except Exception as exc:
+        fail_sync_run(
+            sync_run,
+            connection=connection,
+            error_summary=f"Could not queue import: {exc}",
+        )
+        await db.commit()
+        raise HTTPException(
+            status_code=500,
+            detail=f"Import failed: {exc}",
+        )
+
+    response.status_code = 202
+    return {
+        "status": "queued",
+        "import_name": file.filename,
+        "connection_id": str(connection.id),
+        "sync_run_id": str(sync_run.id),
+        "records_seen": 0,
+        "records_created": 0,
+        "records_updated": 0,
+        "records_unchanged": 0,
+    }
+
+
 @router.get("/history")
 async def import_history(
     current_user: User = Depends(get_scoped_user),
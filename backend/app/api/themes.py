@@ -2,20 +2,23 @@
 Spec10x Backend - Themes API routes.
 """
 
-from collections import defaultdict
 import uuid
 from datetime import date, datetime, timedelta, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.api.feed import NEXT_CURSOR_HEADER
 from app.core.auth import get_scoped_user
+from app.core.data_version import conditional_get, data_pool_cache_key, data_version_etag
 from app.core.database import get_db
+from app.core.response_cache import etag_cache_key, response_cache
 from app.models import Interview, Signal, SourceType, Theme, ThemeStatus, User
 from app.schemas import (
     BoardThemeCardResponse,
+    FeedSignalResponse,
     ThemeExplorerCardResponse,
     ThemeDetailResponse,
     ThemeExplorerFiltersResponse,
@@ -31,21 +34,35 @@ from app.schemas import (
     ThemeUpdate,
 )
 from app.services.signals import (
+    FEED_MAX_PAGE_SIZE,
     TREND_WINDOW_DAYS,
+    InvalidFeedCursor,
+    ThemeSignalStats,
     _parse_theme_match_id,
+    aggregate_theme_signal_stats,
     build_source_breakdown,
+    build_source_breakdown_from_counts,
     build_theme_score_map,
     calculate_score_change,
     calculate_theme_trend,
+    count_theme_signal_interviews,
+    count_theme_voice_signals_by_day,
     ensure_signal_consistency,
-    get_workspace_signals,
-    is_voice_signal,
+    get_theme_preview_signals,
+    get_workspace_signals_page,
+    get_workspace_source_types,
+    impact_score_from_stats,
     refresh_external_signal_theme_matches,
     serialize_feed_signal,
     serialize_impact_breakdown,
     serialize_score_change,
     serialize_theme_trend,
+    signal_filter_conditions,
+    summarize_theme_signals,
+    theme_trend_from_counts,
+    workspace_has_signals,
 )
+from app.services.workspace_data import WorkspaceDataLoader, get_workspace_loader
 
 router = APIRouter(prefix="/api/themes", tags=["Themes"])
 
@@ -55,7 +72,9 @@ SOURCE_TYPE_ENUM_ORDER = (
     SourceType.survey,
     SourceType.analytics,
 )
-SOURCE_TYPE_ORDER = ("interview", "support", "survey", "analytics")
+BOARD_CACHE_TTL_SECONDS = 300
+THEME_EVIDENCE_PAGE_SIZE = 10
+EXPLORER_QUOTE_PREVIEWS = 2
 
 
 def _sort_themes(
@@ -107,107 +126,89 @@ def _get_theme_signals(
     ]
 
 
-def _serialize_supporting_evidence(
+async def _load_supporting_evidence(
+    db: AsyncSession,
     *,
+    workspace_id: uuid.UUID,
     theme: Theme,
-    theme_signals: list,
+    source_counts: dict[SourceType, int],
 ) -> list[dict]:
+    """The newest evidence page per source type; each group's ``next_cursor``
+    continues through ``GET /api/themes/{theme_id}/evidence``."""
     theme_lookup = {theme.id: theme}
     grouped_signals: list[dict] = []
-    for source_type in SOURCE_TYPE_ORDER:
-        source_items = [
-            serialize_feed_signal(
-                signal,
-                theme_lookup=theme_lookup,
-            )
-            for signal in sorted(
-                theme_signals,
-                key=lambda item: item.occurred_at,
-                reverse=True,
-            )
-            if signal.source_type.value == source_type
-        ]
-        if not source_items:
+    for source_type in SOURCE_TYPE_ENUM_ORDER:
+        count = source_counts.get(source_type, 0)
+        if not count:
             continue
+        signals, next_cursor = await get_workspace_signals_page(
+            db,
+            workspace_id=workspace_id,
+            theme_id=theme.id,
+            source_filter=source_type,
+            limit=THEME_EVIDENCE_PAGE_SIZE,
+        )
         grouped_signals.append(
             {
-                "source_type": source_type,
-                "label": source_type.title(),
-                "count": len(source_items),
-                "items": source_items,
+                "source_type": source_type.value,
+                "label": source_type.value.title(),
+                "count": count,
+                "items": [
+                    serialize_feed_signal(signal, theme_lookup=theme_lookup)
+                    for signal in signals
+                ],
+                "next_cursor": next_cursor,
             }
         )
     return grouped_signals
 
 
-def _filter_explorer_signals(
+async def _build_theme_detail(
+    db: AsyncSession,
     *,
-    workspace_signals: list[Signal],
-    selected_sources: set[SourceType],
-    date_from: date | None,
-    date_to: date | None,
-) -> list[Signal]:
-    filtered_signals: list[Signal] = []
-    for signal in workspace_signals:
-        if selected_sources and signal.source_type not in selected_sources:
-            continue
-        signal_date = signal.occurred_at.date()
-        if date_from is not None and signal_date < date_from:
-            continue
-        if date_to is not None and signal_date > date_to:
-            continue
-        filtered_signals.append(signal)
-    return filtered_signals
-
-
-def _build_theme_signal_map(
-    *,
-    themes: list[Theme],
-    signals: list[Signal],
-) -> dict[uuid.UUID, list[Signal]]:
-    theme_ids = {theme.id for theme in themes}
-    theme_signals: dict[uuid.UUID, list[Signal]] = defaultdict(list)
-    for signal in signals:
-        theme_id = _parse_theme_match_id(signal.metadata_json)
-        if theme_id is None or theme_id not in theme_ids:
-            continue
-        theme_signals[theme_id].append(signal)
-    return theme_signals
-
-
-def _get_dominant_sentiment(theme: Theme) -> str:
-    sentiment_pairs = (
-        ("negative", theme.sentiment_negative),
-        ("neutral", theme.sentiment_neutral),
-        ("positive", theme.sentiment_positive),
+    workspace_id: uuid.UUID,
+    theme: Theme,
+) -> dict:
+    """Theme detail payload from queries scoped to the theme's own signals,
+    so its cost does not grow with the rest of the workspace."""
+    summary = await summarize_theme_signals(db, workspace_id=workspace_id, theme_id=theme.id)
+    payload = ThemeDetailResponse.model_validate(
+        theme,
+        from_attributes=True,
+    ).model_dump()
+    payload["impact_score"] = summary.score.total
+    payload["impact_breakdown"] = serialize_impact_breakdown(summary.score)
+    payload["source_breakdown"] = build_source_breakdown_from_counts(summary.source_counts)
+    payload["supporting_evidence"] = await _load_supporting_evidence(
+        db,
+        workspace_id=workspace_id,
+        theme=theme,
+        source_counts=summary.source_counts,
     )
-    return max(sentiment_pairs, key=lambda item: item[1])[0]
+    payload["trend"] = serialize_theme_trend(summary.trend)
+    payload["score_change"] = serialize_score_change(summary.score_change)
+    return payload
 
 
-def _theme_matches_explorer_filters(
-    *,
-    theme: Theme,
-    theme_signals: list[Signal],
-    sentiment_filter: str | None,
-    has_signal_filters: bool,
-) -> bool:
-    if sentiment_filter and _get_dominant_sentiment(theme) != sentiment_filter:
-        return False
-    if has_signal_filters and not theme_signals:
-        return False
-    return True
+def _dominant_sentiment_condition(sentiment: str):
+    """SQL for ``theme``'s dominant sentiment being ``sentiment``; ties go to
+    negative, then neutral, as on the cards."""
+    negative = Theme.sentiment_negative
+    neutral = Theme.sentiment_neutral
+    positive = Theme.sentiment_positive
+    if sentiment == "negative":
+        return and_(negative >= neutral, negative >= positive)
+    if sentiment == "neutral":
+        return and_(neutral > negative, neutral >= positive)
+    return and_(positive > negative, positive > neutral)
 
 
 def _serialize_quote_previews(
     *,
-    theme_signals: list[Signal],
+    preview_signals: list[Signal],
 ) -> list[ThemeExplorerQuotePreviewResponse]:
     previews: list[ThemeExplorerQuotePreviewResponse] = []
-    for signal in sorted(
-        theme_signals,
-        key=lambda item: (item.occurred_at, item.created_at),
-        reverse=True,
-    )[:2]:
+    for signal in preview_signals:
         serialized_signal = serialize_feed_signal(signal, theme_lookup={})
         previews.append(
             ThemeExplorerQuotePreviewResponse(
@@ -224,15 +225,21 @@ def _serialize_quote_previews(
 def _serialize_theme_explorer_card(
     *,
     theme: Theme,
-    theme_signals: list[Signal],
+    stats: ThemeSignalStats | None,
+    daily_counts: list[int],
+    preview_signals: list[Signal],
     score: float,
 ) -> ThemeExplorerCardResponse:
+    trend = theme_trend_from_counts(
+        recent_count=sum(daily_counts[:TREND_WINDOW_DAYS]),
+        previous_count=sum(daily_counts[TREND_WINDOW_DAYS:2 * TREND_WINDOW_DAYS]),
+    )
     return ThemeExplorerCardResponse(
         id=theme.id,
         name=theme.name,
         is_new=theme.is_new,
         impact_score=score,
-        mention_count=len(theme_signals) if theme_signals else theme.mention_count,
+        mention_count=stats.signal_count if stats else theme.mention_count,
         sentiment=ThemeExplorerSentimentResponse(
             positive=theme.sentiment_positive,
             neutral=theme.sentiment_neutral,
@@ -240,12 +247,12 @@ def _serialize_theme_explorer_card(
         ),
         source_chips=[
             ThemeExplorerSourceChipResponse(**source_chip)
-            for source_chip in build_source_breakdown(theme_signals)
+            for source_chip in build_source_breakdown_from_counts(
+                stats.source_counts if stats else {}
+            )
         ],
-        quote_previews=_serialize_quote_previews(theme_signals=theme_signals),
-        trend=serialize_theme_trend(
-            calculate_theme_trend(theme_id=theme.id, signals=theme_signals)
-        ),
+        quote_previews=_serialize_quote_previews(preview_signals=preview_signals),
+        trend=serialize_theme_trend(trend),
     )
 
 
@@ -255,12 +262,10 @@ async def list_themes(
     status_filter: str = Query("active", alias="status"),
     current_user: User = Depends(get_scoped_user),
     db: AsyncSession = Depends(get_db),
+    loader: WorkspaceDataLoader = Depends(get_workspace_loader),
 ):
     """List all themes for the current user."""
-    workspace = await ensure_signal_consistency(
-        db,
-        user_id=current_user.id,
-    )
+    await ensure_signal_consistency(db, user_id=current_user.id, loader=loader)
 
     stmt = select(Theme).where(Theme.user_id == current_user.id)
     if status_filter:
@@ -271,10 +276,7 @@ async def list_themes(
     if not themes:
         return []
 
-    workspace_signals = await get_workspace_signals(
-        db,
-        workspace_id=workspace.id,
-    )
+    workspace_signals = await loader.signals()
     score_map = build_theme_score_map(themes=themes, signals=workspace_signals)
 
     for theme in themes:
@@ -287,30 +289,31 @@ async def list_themes(
     )
 
 
-@router.get("/board", response_model=list[BoardThemeCardResponse])
+@router.get(
+    "/board",
+    response_model=list[BoardThemeCardResponse],
+    dependencies=[Depends(conditional_get)],
+)
 async def get_theme_board(
-    current_user: User = Depends(get_scoped_user),
-    db: AsyncSession = Depends(get_db),
+    loader: WorkspaceDataLoader = Depends(get_workspace_loader),
+    cache_key: str = Depends(data_pool_cache_key),
 ):
     """Return ranked theme cards for the Sprint 6 priority board."""
-    workspace = await ensure_signal_consistency(
-        db,
-        user_id=current_user.id,
+    return await response_cache.get_or_compute(
+        "theme_board",
+        cache_key,
+        ttl_seconds=BOARD_CACHE_TTL_SECONDS,
+        compute=lambda: _build_theme_board(loader),
     )
-    result = await db.execute(
-        select(Theme).where(
-            Theme.user_id == current_user.id,
-            Theme.status == ThemeStatus.active,
-        )
-    )
-    themes = list(result.scalars().all())
+
+
+async def _build_theme_board(loader: WorkspaceDataLoader) -> list[dict]:
+    await ensure_signal_consistency(loader.db, user_id=loader.user_id, loader=loader)
+    themes = await loader.active_themes()
     if not themes:
         return []
 
-    workspace_signals = await get_workspace_signals(
-        db,
-        workspace_id=workspace.id,
-    )
+    workspace_signals = await loader.signals()
     score_map = build_theme_score_map(themes=themes, signals=workspace_signals)
     ordered_themes = _sort_themes(
         themes=themes,
@@ -352,7 +355,11 @@ async def get_theme_board(
     return payload
 
 
-@router.get("/explorer", response_model=ThemeExplorerResponse)
+@router.get(
+    "/explorer",
+    response_model=ThemeExplorerResponse,
+    dependencies=[Depends(conditional_get)],
+)
 async def get_theme_explorer(
     sort: str = Query("urgency", pattern="^(urgency|frequency|sentiment|recency)$"),
     source: list[SourceType] = Query(default=[]),
@@ -362,118 +369,125 @@ async def get_theme_explorer(
     selected_theme_id: uuid.UUID | None = Query(default=None),
     current_user: User = Depends(get_scoped_user),
     db: AsyncSession = Depends(get_db),
+    loader: WorkspaceDataLoader = Depends(get_workspace_loader),
 ):
-    """Return a filter-aware theme explorer payload for the redesigned Insights page."""
-    workspace = await ensure_signal_consistency(
-        db,
-        user_id=current_user.id,
-    )
+    """Return a filter-aware theme explorer payload for the redesigned Insights page.
 
-    themes_result = await db.execute(select(Theme).where(Theme.user_id == current_user.id))
-    all_themes = list(themes_result.scalars().all())
-
-    interviews_result = await db.execute(
-        select(Interview).where(Interview.user_id == current_user.id)
-    )
-    interviews = list(interviews_result.scalars().all())
+    Source and date filters are applied in the signal queries, and every
+    per-theme figure on the cards comes from grouped queries, so the cost of
+    a filter change does not grow with the number of signals. The
+    consistency pass never loads signal content and is skipped while the
+    workspace's data version is unchanged.
+    """
+    workspace = await ensure_signal_consistency(db, user_id=current_user.id, loader=loader)
+
+    themes_stmt = select(Theme).where(
+        Theme.user_id == current_user.id,
+        Theme.status.in_((ThemeStatus.active, ThemeStatus.previous)),
+    )
+    if sentiment:
+        themes_stmt = themes_stmt.where(_dominant_sentiment_condition(sentiment))
+    themes = list((await db.execute(themes_stmt)).scalars().all())
+
+    has_themes = bool(themes) or (
+        await db.execute(select(Theme.id).where(Theme.user_id == current_user.id).limit(1))
+    ).first() is not None
+    has_interviews = (
+        await db.execute(
+            select(Interview.id).where(Interview.user_id == current_user.id).limit(1)
+        )
+    ).first() is not None
 
-    workspace_signals = await get_workspace_signals(
-        db,
-        workspace_id=workspace.id,
-    )
+    workspace_source_types = await get_workspace_source_types(db, workspace_id=workspace.id)
     available_source_types = [
         source_type.value
         for source_type in SOURCE_TYPE_ENUM_ORDER
-        if any(signal.source_type == source_type for signal in workspace_signals)
+        if source_type in workspace_source_types
     ]
 
     selected_sources = set(source)
-    filtered_signals = _filter_explorer_signals(
-        workspace_signals=workspace_signals,
-        selected_sources=selected_sources,
+    filters = signal_filter_conditions(
+        source_types=selected_sources,
         date_from=date_from,
         date_to=date_to,
     )
-    theme_signal_map = _build_theme_signal_map(
-        themes=all_themes,
-        signals=filtered_signals,
-    )
-    score_map = build_theme_score_map(
-        themes=all_themes,
-        signals=filtered_signals,
-    )
+    stats_by_theme = (
+        await aggregate_theme_signal_stats(
+            db,
+            workspace_id=workspace.id,
+            windows={"all": (None, None)},
+            filters=filters,
+        )
+    )["all"]
+    score_map = {
+        theme.id: impact_score_from_stats(stats_by_theme.get(theme.id) or ThemeSignalStats())
+        for theme in themes
+    }
     has_signal_filters = bool(selected_sources or date_from is not None or date_to is not None)
+    if has_signal_filters:
+        themes = [theme for theme in themes if theme.id in stats_by_theme]
 
     active_themes = _sort_themes(
-        themes=[
-            theme
-            for theme in all_themes
-            if theme.status == ThemeStatus.active
-            and _theme_matches_explorer_filters(
-                theme=theme,
-                theme_signals=theme_signal_map.get(theme.id, []),
-                sentiment_filter=sentiment,
-                has_signal_filters=has_signal_filters,
-            )
-        ],
+        themes=[theme for theme in themes if theme.status == ThemeStatus.active],
         sort=sort,
         score_map=score_map,
     )
     previous_themes = _sort_themes(
-        themes=[
-            theme
-            for theme in all_themes
-            if theme.status == ThemeStatus.previous
-            and _theme_matches_explorer_filters(
-                theme=theme,
-                theme_signals=theme_signal_map.get(theme.id, []),
-                sentiment_filter=sentiment,
-                has_signal_filters=has_signal_filters,
-            )
-        ],
+        themes=[theme for theme in themes if theme.status == ThemeStatus.previous],
         sort=sort,
         score_map=score_map,
     )
 
-    serialized_active_themes = [
-        _serialize_theme_explorer_card(
-            theme=theme,
-            theme_signals=theme_signal_map.get(theme.id, []),
-            score=score_map[theme.id].total,
-        )
-        for theme in active_themes
-    ]
-    serialized_previous_themes = [
-        _serialize_theme_explorer_card(
+    visible_theme_ids = {theme.id for theme in [*active_themes, *previous_themes]}
+    trend_days = 2 * TREND_WINDOW_DAYS
+    daily_counts_by_theme = await count_theme_voice_signals_by_day(
+        db,
+        workspace_id=workspace.id,
+        now=datetime.now(timezone.utc),
+        days=trend_days,
+        filters=filters,
+    )
+    preview_signals_by_theme = await get_theme_preview_signals(
+        db,
+        workspace_id=workspace.id,
+        theme_ids=visible_theme_ids,
+        per_theme=EXPLORER_QUOTE_PREVIEWS,
+        filters=filters,
+    )
+
+    def _card(theme: Theme) -> ThemeExplorerCardResponse:
+        return _serialize_theme_explorer_card(
             theme=theme,
-            theme_signals=theme_signal_map.get(theme.id, []),
+            stats=stats_by_theme.get(theme.id),
+            daily_counts=daily_counts_by_theme.get(theme.id, [0] * trend_days),
+            preview_signals=preview_signals_by_theme.get(theme.id, []),
             score=score_map[theme.id].total,
         )
-        for theme in previous_themes
-    ]
+
+    serialized_active_themes = [_card(theme) for theme in active_themes]
+    serialized_previous_themes = [_card(theme) for theme in previous_themes]
 
     default_theme_id = None
-    available_theme_ids = {theme.id for theme in [*active_themes, *previous_themes]}
-    if selected_theme_id and selected_theme_id in available_theme_ids:
+    if selected_theme_id and selected_theme_id in visible_theme_ids:
         default_theme_id = selected_theme_id
     elif active_themes:
         default_theme_id = active_themes[0].id
     elif previous_themes:
         default_theme_id = previous_themes[0].id
 
-    visible_theme_ids = {theme.id for theme in [*active_themes, *previous_themes]}
-    visible_signals = [
-        signal
-        for signal in filtered_signals
-        if _parse_theme_match_id(signal.metadata_json) in visible_theme_ids
-    ]
-    interview_ids = {
-        str((signal.metadata_json or {}).get("interview_id"))
-        for signal in visible_signals
-        if (signal.metadata_json or {}).get("interview_id")
-    }
+    signals_count = sum(
+        stats_by_theme[theme_id].signal_count
+        for theme_id in visible_theme_ids
+        if theme_id in stats_by_theme
+    )
+    interviews_count = await count_theme_signal_interviews(
+        db,
+        workspace_id=workspace.id,
+        theme_ids=visible_theme_ids,
+        filters=filters,
+    )
 
-    has_any_data = bool(all_themes or workspace_signals or interviews)
+    has_any_data = bool(has_themes or workspace_source_types or has_interviews)
     empty_reason = None
     if not has_any_data:
         empty_reason = "no_data"
@@ -482,8 +496,8 @@ async def get_theme_explorer(
 
     return ThemeExplorerResponse(
         summary=ThemeExplorerSummaryResponse(
-            interviews_count=len(interview_ids),
-            signals_count=len(visible_signals),
+            interviews_count=interviews_count,
+            signals_count=signals_count,
             active_themes_count=len(serialized_active_themes),
         ),
         filters=ThemeExplorerFiltersResponse(
@@ -503,55 +517,77 @@ async def get_theme_explorer(
 
 
 TRENDS_WEEKS = 8
+TRENDS_MAX_WEEKS = 52
+TRENDS_CACHE_TTL_SECONDS = 900
 
 
-@router.get("/trends", response_model=ThemeTrendsPageResponse)
+@router.get(
+    "/trends",
+    response_model=ThemeTrendsPageResponse,
+    dependencies=[Depends(conditional_get)],
+)
 async def get_theme_trends(
-    current_user: User = Depends(get_scoped_user),
-    db: AsyncSession = Depends(get_db),
+    weeks: int = Query(TRENDS_WEEKS, ge=1, le=TRENDS_MAX_WEEKS),
+    loader: WorkspaceDataLoader = Depends(get_workspace_loader),
+    etag: str = Depends(data_version_etag),
 ):
     """Weekly voice-signal volume per active theme for the /trends page (v0.8).
 
     Reuses the v0.52 trend definition: direction comes from
     `calculate_theme_trend`'s 14-day windows, and metric windows never count
-    toward volume (`is_voice_signal`).
+    toward volume (`is_voice_signal`). ``weeks`` sets how many rolling weekly
+    buckets are returned.
     """
-    workspace = await ensure_signal_consistency(db, user_id=current_user.id)
-    result = await db.execute(
-        select(Theme).where(
-            Theme.user_id == current_user.id,
-            Theme.status == ThemeStatus.active,
-        )
+    return await response_cache.get_or_compute(
+        "theme_trends",
+        etag_cache_key(etag),
+        ttl_seconds=TRENDS_CACHE_TTL_SECONDS,
+        compute=lambda: _build_theme_trends(loader, weeks=weeks),
     )
-    themes = list(result.scalars().all())
-    workspace_signals = await get_workspace_signals(db, workspace_id=workspace.id)
+
+
+async def _build_theme_trends(
+    loader: WorkspaceDataLoader,
+    *,
+    weeks: int = TRENDS_WEEKS,
+) -> ThemeTrendsPageResponse:
+    workspace = await ensure_signal_consistency(loader.db, user_id=loader.user_id, loader=loader)
+    themes = await loader.active_themes()
 
     now = datetime.now(timezone.utc)
     week = timedelta(days=7)
     # Rolling 7-day buckets ending now; oldest first
-    bucket_starts = [now - week * (TRENDS_WEEKS - i) for i in range(TRENDS_WEEKS)]
-
-    voice_signals_by_theme: dict[uuid.UUID, list] = defaultdict(list)
-    for signal in workspace_signals:
-        theme_id = _parse_theme_match_id(signal.metadata_json)
-        if theme_id is not None and is_voice_signal(signal):
-            voice_signals_by_theme[theme_id].append(signal)
+    bucket_starts = [now - week * (weeks - i) for i in range(weeks)]
 
-    score_map = build_theme_score_map(themes=themes, signals=workspace_signals)
+    # Day offsets back from now cover both the weekly buckets and the two
+    # trend windows, so every count comes from one grouped query.
+    tracked_days = max(weeks * week.days, 2 * TREND_WINDOW_DAYS)
+    daily_counts_by_theme = await count_theme_voice_signals_by_day(
+        loader.db,
+        workspace_id=workspace.id,
+        now=now,
+        days=tracked_days,
+    )
+    all_stats = (
+        await aggregate_theme_signal_stats(
+            loader.db,
+            workspace_id=workspace.id,
+            windows={"all": (None, None)},
+        )
+    )["all"]
 
     trend_themes = []
     for theme in themes:
-        weekly_counts = [0] * TRENDS_WEEKS
-        for signal in voice_signals_by_theme.get(theme.id, []):
-            occurred_at = signal.occurred_at
-            if occurred_at.tzinfo is None:
-                occurred_at = occurred_at.replace(tzinfo=timezone.utc)
-            for index, bucket_start in enumerate(bucket_starts):
-                if bucket_start < occurred_at <= bucket_start + week:
-                    weekly_counts[index] += 1
-                    break
-
-        trend = calculate_theme_trend(theme_id=theme.id, signals=workspace_signals)
+        daily_counts = daily_counts_by_theme.get(theme.id, [0] * tracked_days)
+        weekly_counts = [
+            sum(daily_counts[(weeks - 1 - index) * week.days:(weeks - index) * week.days])
+            for index in range(weeks)
+        ]
+        trend = theme_trend_from_counts(
+            recent_count=sum(daily_counts[:TREND_WINDOW_DAYS]),
+            previous_count=sum(daily_counts[TREND_WINDOW_DAYS:2 * TREND_WINDOW_DAYS]),
+        )
+        score = impact_score_from_stats(all_stats.get(theme.id) or ThemeSignalStats())
         trend_themes.append(
             {
                 "id": theme.id,
@@ -559,7 +595,7 @@ async def get_theme_trends(
                 "direction": trend.direction,
                 "recent_count": trend.recent_count,
                 "previous_count": trend.previous_count,
-                "impact_score": score_map[theme.id].total,
+                "impact_score": score.total,
                 "priority_state": theme.priority_state,
                 "weekly_counts": weekly_counts,
             }
@@ -571,7 +607,7 @@ async def get_theme_trends(
         window_days=TREND_WINDOW_DAYS,
         weeks=[bucket_start.date() for bucket_start in bucket_starts],
         themes=trend_themes,
-        has_data=bool(themes and workspace_signals),
+        has_data=bool(themes) and await workspace_has_signals(loader.db, workspace_id=workspace.id),
     )
 
 
@@ -580,12 +616,10 @@ async def get_theme(
     theme_id: uuid.UUID,
     current_user: User = Depends(get_scoped_user),
     db: AsyncSession = Depends(get_db),
+    loader: WorkspaceDataLoader = Depends(get_workspace_loader),
 ):
     """Get theme detail with source-aware evidence and score breakdown."""
-    workspace = await ensure_signal_consistency(
-        db,
-        user_id=current_user.id,
-    )
+    workspace = await ensure_signal_consistency(db, user_id=current_user.id, loader=loader)
     stmt = (
         select(Theme)
         .where(
@@ -603,37 +637,51 @@ async def get_theme(
     if not theme:
         raise HTTPException(status_code=404, detail="Theme not found")
 
-    workspace_signals = await get_workspace_signals(
-        db,
-        workspace_id=workspace.id,
-    )
-    theme_signals = _get_theme_signals(
-        theme=theme,
-        workspace_signals=workspace_signals,
-    )
-    score_result = build_theme_score_map(
-        themes=[theme],
-        signals=workspace_signals,
-    )[theme.id]
+    return await _build_theme_detail(db, workspace_id=workspace.id, theme=theme)
 
-    payload = ThemeDetailResponse.model_validate(
-        theme,
-        from_attributes=True,
-    ).model_dump()
-    payload["impact_score"] = score_result.total
-    payload["impact_breakdown"] = serialize_impact_breakdown(score_result)
-    payload["source_breakdown"] = build_source_breakdown(theme_signals)
-    payload["supporting_evidence"] = _serialize_supporting_evidence(
-        theme=theme,
-        theme_signals=theme_signals,
-    )
-    payload["trend"] = serialize_theme_trend(
-        calculate_theme_trend(theme_id=theme.id, signals=workspace_signals)
-    )
-    payload["score_change"] = serialize_score_change(
-        calculate_score_change(theme_id=theme.id, signals=workspace_signals)
-    )
-    return payload
+
+@router.get("/{theme_id}/evidence", response_model=list[FeedSignalResponse])
+async def list_theme_evidence(
+    theme_id: uuid.UUID,
+    response: Response,
+    source: SourceType | None = Query(None),
+    limit: int = Query(THEME_EVIDENCE_PAGE_SIZE, ge=1, le=FEED_MAX_PAGE_SIZE),
+    cursor: str | None = Query(None),
+    current_user: User = Depends(get_scoped_user),
+    db: AsyncSession = Depends(get_db),
+    loader: WorkspaceDataLoader = Depends(get_workspace_loader),
+):
+    """One page of a theme's supporting evidence, newest first.
+
+    Continues a theme detail evidence group from its ``next_cursor``; when
+    more evidence remains, the ``X-Next-Cursor`` response header carries the
+    cursor for the following page, as on the feed.
+    """
+    workspace = await ensure_signal_consistency(db, user_id=current_user.id, loader=loader)
+    theme = (
+        await db.execute(
+            select(Theme).where(Theme.id == theme_id, Theme.user_id == current_user.id)
+        )
+    ).scalar_one_or_none()
+    if not theme:
+        raise HTTPException(status_code=404, detail="Theme not found")
+
+    try:
+        signals, next_cursor = await get_workspace_signals_page(
+            db,
+            workspace_id=workspace.id,
+            theme_id=theme.id,
+            source_filter=source,
+            limit=limit,
+            cursor=cursor,
+        )
+    except InvalidFeedCursor as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    theme_lookup = {theme.id: theme}
+    return [serialize_feed_signal(signal, theme_lookup=theme_lookup) for signal in signals]
 
 
 @router.patch("/{theme_id}", response_model=ThemeResponse)
@@ -642,6 +690,7 @@ async def update_theme(
     update: ThemeUpdate,
     current_user: User = Depends(get_scoped_user),
     db: AsyncSession = Depends(get_db),
+    loader: WorkspaceDataLoader = Depends(get_workspace_loader),
 ):
     """Rename a theme or update its priority state."""
     stmt = (
@@ -676,6 +725,7 @@ async def update_theme(
         await refresh_external_signal_theme_matches(
             db,
             user_id=current_user.id,
+            loader=loader,
         )
     return theme
 
@@ -686,6 +736,7 @@ async def merge_theme(
     body: ThemeMergeRequest,
     current_user: User = Depends(get_scoped_user),
     db: AsyncSession = Depends(get_db),
+    loader: WorkspaceDataLoader = Depends(get_workspace_loader),
 ):
     """Merge `source_theme_id` into `theme_id`, preserving all evidence and insight history."""
     if theme_id == body.source_theme_id:
@@ -743,33 +794,11 @@ async def merge_theme(
         ],
     )
 
-    await refresh_external_signal_theme_matches(db, user_id=current_user.id)
-
-    workspace = await ensure_signal_consistency(db, user_id=current_user.id)
-    workspace_signals = await get_workspace_signals(db, workspace_id=workspace.id)
-    theme_signals = _get_theme_signals(theme=target_theme, workspace_signals=workspace_signals)
-    score_result = build_theme_score_map(
-        themes=[target_theme],
-        signals=workspace_signals,
-    )[target_theme.id]
-
-    payload = ThemeDetailResponse.model_validate(
-        target_theme,
-        from_attributes=True,
-    ).model_dump()
-    payload["impact_score"] = score_result.total
-    payload["impact_breakdown"] = serialize_impact_breakdown(score_result)
-    payload["source_breakdown"] = build_source_breakdown(theme_signals)
-    payload["supporting_evidence"] = _serialize_supporting_evidence(
-        theme=target_theme,
-        theme_signals=theme_signals,
-    )
-    payload["trend"] = serialize_theme_trend(
-        calculate_theme_trend(theme_id=target_theme.id, signals=workspace_signals)
-    )
-    payload["score_change"] = serialize_score_change(
-        calculate_score_change(theme_id=target_theme.id, signals=workspace_signals)
-    )
+    # Re-match external signals against the merged theme set; nothing is
+    # loaded before the merge has been flushed.
+    workspace = await ensure_signal_consistency(db, user_id=current_user.id, loader=loader)
+    await refresh_external_signal_theme_matches(db, user_id=current_user.id, loader=loader)
+    payload = await _build_theme_detail(db, workspace_id=workspace.id, theme=target_theme)
 
     return ThemeMergeResultResponse(
         target_theme=payload,
@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from firebase_admin import auth as firebase_auth
 
 from app.core.auth import get_current_user
+from app.core.data_version import bump_data_version
 from app.core.database import get_db
 from app.models import (
     User, Interview, Theme, Insight, AskConversation, Usage,
@@ -168,6 +169,7 @@ async def delete_my_data(
         await db.execute(delete(Insight).where(Insight.user_id == current_user.id))
         await db.execute(delete(AskConversation).where(AskConversation.user_id == current_user.id))
         # Usage records are left intact for billing history.
+        bump_data_version(db, owner_user_id=current_user.id)
 
         await db.commit()
     except Exception as e:
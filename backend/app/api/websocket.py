@@ -10,6 +10,7 @@ import json
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
 from sqlalchemy import select
+from sqlalchemy.orm import load_only
 
 from app.core.auth import verify_firebase_token, resolve_data_owner
 from app.core.database import get_session_factory
@@ -81,6 +82,7 @@ async def processing_updates(
             stmt = (
                 select(Interview)
                 .where(Interview.user_id == user.id)
+                .options(load_only(Interview.id, Interview.status))
                 .order_by(Interview.updated_at.desc())
                 .limit(20)
             )
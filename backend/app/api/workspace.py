@@ -246,6 +246,14 @@ async def _serialize_workspace(
     )
 
 
+async def _build_workspace_response(
+    db: AsyncSession, current_user: User
+) -> WorkspaceResponse:
+    workspace = await _resolve_active_workspace(db, current_user)
+    await _ensure_owner_member_row(db, workspace)
+    return await _serialize_workspace(db, workspace, current_user)
+
+
 # ─── Routes ──────────────────────────────────────────────
 
 @router.get("", response_model=WorkspaceResponse)
@@ -254,9 +262,7 @@ async def get_workspace(
     db: AsyncSession = Depends(get_db),
 ):
     """The requester's active workspace with its full member list."""
-    workspace = await _resolve_active_workspace(db, current_user)
-    await _ensure_owner_member_row(db, workspace)
-    response = await _serialize_workspace(db, workspace, current_user)
+    response = await _build_workspace_response(db, current_user)
     await db.commit()
     return response
 
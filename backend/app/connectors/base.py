@@ -13,14 +13,23 @@ The platform orchestrates these methods; the connector itself should
 
 from __future__ import annotations
 
+import asyncio
+import math
 import uuid
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any
 
+import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.http_clients import HttpClientRegistry, http_clients
+from app.core.rate_limits import ProviderRateLimiter, provider_rate_limiter
+from app.core.sync_telemetry import record_page, timed
 from app.models import SourceConnection, SyncRun
 
 
@@ -60,12 +69,103 @@ class SyncResult:
         return self.error_summary is None
 
 
+@dataclass
+class SyncPage:
+    """One upstream page of normalized records yielded by a streaming connector.
+
+    ``cursor_out`` is the cursor that resumes *after* this page; the
+    orchestrator checkpoints it once the page's signals are persisted.
+    """
+
+    signals: list[NormalizedSignal] = field(default_factory=list)
+    cursor_out: dict[str, Any] | None = None
+    records_seen: int = 0
+
+
 class ConnectorError(Exception):
-    """Raised when a connector operation fails in a recoverable way."""
+    """Raised when a connector operation fails in a recoverable way.
+
+    ``retry_after`` (seconds) is set when the provider rate-limited the
+    request; the orchestrator then defers the sync instead of failing it.
+    """
 
-    def __init__(self, message: str, *, retryable: bool = False) -> None:
+    def __init__(
+        self,
+        message: str,
+        *,
+        retryable: bool = False,
+        retry_after: float | None = None,
+    ) -> None:
         super().__init__(message)
         self.retryable = retryable
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: str | None, *, default: float = 60.0) -> float:
+    """Seconds to wait from a ``Retry-After`` header (delta or HTTP date)."""
+    if not value:
+        return default
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def rate_limited_error(provider_label: str, response: httpx.Response) -> ConnectorError:
+    """Retryable ``ConnectorError`` for a 429, carrying its ``Retry-After``."""
+    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+    return ConnectorError(
+        f"{provider_label} rate limited — retry after {math.ceil(retry_after)}s",
+        retryable=True,
+        retry_after=retry_after,
+    )
+
+
+async def iter_offset_pages(
+    fetch_page: Callable[[int], Awaitable[list[dict[str, Any]]]],
+    *,
+    page_size: int,
+    max_pages: int,
+    prefetch: int = 2,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Yield ``skip``/``limit`` pages in order, fetching ahead of the caller.
+
+    ``fetch_page(skip)`` returns one page. The first page is fetched alone;
+    once a full page arrives, up to ``prefetch`` following pages are
+    requested while the caller processes it. Stops after the first short
+    page or ``max_pages``, cancelling any fetches still in flight.
+    """
+    pending: deque[asyncio.Task] = deque()
+    next_page = 0
+
+    def _schedule(depth: int) -> None:
+        nonlocal next_page
+        while len(pending) < depth and next_page < max_pages:
+            pending.append(asyncio.ensure_future(fetch_page(next_page * page_size)))
+            next_page += 1
+
+    try:
+        _schedule(1)
+        while pending:
+            batch = await pending.popleft()
+            if len(batch) < page_size:
+                record_page()
+                yield batch
+                return
+            _schedule(max(prefetch, 1))
+            record_page()
+            yield batch
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
 
 
 # ── Abstract base class ──────────────────────────────────
@@ -74,18 +174,68 @@ class BaseConnector(ABC):
     """Abstract base for all Spec10x data-source connectors.
 
     Constructor receives the DB session and current connection record.
-    Subclasses should store any provider-specific helpers (HTTP clients,
-    parsed config, etc.) as instance attributes initialised in
-    ``__init__``.
+    Subclasses should store any provider-specific helpers (parsed config,
+    etc.) as instance attributes initialised in ``__init__``. Outbound HTTP
+    goes through ``http_client()``, which hands out the process-wide pooled
+    client for a host; pass ``http_client_registry`` to inject another pool.
     """
 
+    http_client_registry: HttpClientRegistry = http_clients
+    rate_limiter: ProviderRateLimiter = provider_rate_limiter
+
+    # Longest a request waits for the shared provider budget in-process;
+    # beyond this the sync is deferred rather than holding a worker slot.
+    max_throttle_wait_seconds: float = 15.0
+
     def __init__(
         self,
         db: AsyncSession,
         connection: SourceConnection,
+        *,
+        http_client_registry: HttpClientRegistry | None = None,
     ) -> None:
         self.db = db
         self.connection = connection
+        if http_client_registry is not None:
+            self.http_client_registry = http_client_registry
+
+    def http_client(
+        self,
+        base_url: str,
+        *,
+        timeout: httpx.Timeout | float,
+    ) -> httpx.AsyncClient:
+        """Shared, keep-alive client for ``base_url``'s host — never close it."""
+        return self.http_client_registry.get(base_url, timeout=timeout)
+
+    @property
+    def rate_limit_account(self) -> str:
+        """The upstream account whose request budget this connection draws on.
+
+        Defaults to the connection itself; connectors whose provider limits
+        a wider account (a Zendesk subdomain, a PostHog project) override it
+        so every connection to that account shares one budget.
+        """
+        return str(self.connection.id)
+
+    async def throttle(self, provider: str) -> None:
+        """Wait for a request token from the account's shared ``provider`` budget.
+
+        Raises a rate-limited ``ConnectorError`` when the budget is paused
+        or exhausted for longer than ``max_throttle_wait_seconds``.
+        """
+        while True:
+            wait = await self.rate_limiter.reserve(provider, self.rate_limit_account)
+            if wait <= 0:
+                return
+            if wait > self.max_throttle_wait_seconds:
+                raise ConnectorError(
+                    f"{provider} request budget exhausted — retry after {math.ceil(wait)}s",
+                    retryable=True,
+                    retry_after=wait,
+                )
+            with timed("throttle_wait"):
+                await asyncio.sleep(wait)
 
     # ── Lifecycle methods ─────────────────────────────────
 
@@ -149,3 +299,68 @@ class BaseConnector(ABC):
         After this call the connection status should be ``disconnected``
         and ``secret_ref`` should be ``None``.
         """
+
+
+class StreamingConnector(BaseConnector):
+    """Connector that yields normalized pages instead of one ``SyncResult``.
+
+    The sync orchestrator persists each ``SyncPage`` as it arrives and
+    commits its cursor, so memory stays flat for large backfills and an
+    interrupted run resumes from the last committed page. ``backfill`` and
+    ``sync_incremental`` drain the page iterators for callers that still
+    want a single ``SyncResult``.
+    """
+
+    @abstractmethod
+    def iter_backfill_pages(
+        self,
+        sync_run: SyncRun,
+        *,
+        cursor_in: dict[str, Any] | None = None,
+    ) -> AsyncIterator[SyncPage]:
+        """Yield historical records page by page."""
+
+    @abstractmethod
+    def iter_incremental_pages(
+        self,
+        sync_run: SyncRun,
+        *,
+        cursor_in: dict[str, Any] | None = None,
+    ) -> AsyncIterator[SyncPage]:
+        """Yield new or changed records since ``cursor_in`` page by page."""
+
+    @staticmethod
+    async def _collect_pages(pages: AsyncIterator[SyncPage]) -> SyncResult:
+        signals: list[NormalizedSignal] = []
+        cursor_out: dict[str, Any] | None = None
+        records_seen = 0
+        async for page in pages:
+            signals.extend(page.signals)
+            cursor_out = page.cursor_out
+            records_seen += page.records_seen
+        return SyncResult(
+            signals=signals,
+            cursor_out=cursor_out,
+            records_seen=records_seen,
+            records_created=len(signals),  # actual count updated by orchestrator
+        )
+
+    async def backfill(
+        self,
+        sync_run: SyncRun,
+        *,
+        cursor_in: dict[str, Any] | None = None,
+    ) -> SyncResult:
+        return await self._collect_pages(
+            self.iter_backfill_pages(sync_run, cursor_in=cursor_in)
+        )
+
+    async def sync_incremental(
+        self,
+        sync_run: SyncRun,
+        *,
+        cursor_in: dict[str, Any] | None = None,
+    ) -> SyncResult:
+        return await self._collect_pages(
+            self.iter_incremental_pages(sync_run, cursor_in=cursor_in)
+        )
@@ -11,8 +11,10 @@ import csv
 import hashlib
 import io
 import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any
+from typing import Any, BinaryIO
 
 from app.connectors import register_connector
 from app.connectors.base import BaseConnector, ConnectorError, NormalizedSignal, SyncResult
@@ -50,11 +52,66 @@ TEMPLATE_EXAMPLE_ROW = (
 
 TEMPLATE_CSV = f"{TEMPLATE_HEADER}\n{TEMPLATE_EXAMPLE_ROW}\n"
 
+# Rows normalized and persisted per transaction by the streaming import.
+IMPORT_CHUNK_ROWS = 1000
+
+MAX_REPORTED_ERRORS = 20
+MAX_REPORTED_WARNINGS = 20
+
+
+# ── Streaming Reader ─────────────────────────────────────
+
+@contextmanager
+def open_csv_reader(stream: BinaryIO) -> Iterator[csv.DictReader]:
+    """Decode a binary CSV stream incrementally (UTF-8, optional BOM).
+
+    Rewinds the stream first and leaves it open afterwards, so the same
+    spooled upload can be validated and then imported.
+    """
+    stream.seek(0)
+    text_stream = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        yield csv.DictReader(text_stream)
+    finally:
+        text_stream.detach()
+
+
+def iter_csv_chunks(
+    stream: BinaryIO,
+    *,
+    chunk_size: int = IMPORT_CHUNK_ROWS,
+) -> Iterator[tuple[int, list[dict[str, str]]]]:
+    """Yield ``(first_row_index, rows)`` chunks of at most ``chunk_size`` rows.
+
+    Row indexes are 1-based data-row positions, matching what
+    ``CSVImportConnector.normalize`` uses for fingerprinted external ids.
+    """
+    with open_csv_reader(stream) as reader:
+        chunk: list[dict[str, str]] = []
+        start_index = 1
+        for row_index, row in enumerate(reader, start=1):
+            if not chunk:
+                start_index = row_index
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield start_index, chunk
+                chunk = []
+        if chunk:
+            yield start_index, chunk
+
 
 # ── Validation Logic ─────────────────────────────────────
 
 def validate_csv_bytes(file_bytes: bytes) -> dict:
-    """Parse and validate a CSV file.
+    """Validate an in-memory CSV file. See ``validate_csv_stream``."""
+    return validate_csv_stream(io.BytesIO(file_bytes))
+
+
+def validate_csv_stream(stream: BinaryIO) -> dict:
+    """Parse and validate a CSV file row by row.
+
+    Only the first rows and a bounded number of messages are kept, so
+    memory stays flat regardless of file size.
 
     Returns a dict with:
         - valid: bool
@@ -67,9 +124,77 @@ def validate_csv_bytes(file_bytes: bytes) -> dict:
     errors: list[str] = []
     warnings: list[str] = []
     preview_rows: list[dict[str, str]] = []
+    columns_found: list[str] = []
+    total_rows = 0
+    suppressed_warnings = 0
 
     try:
-        text = file_bytes.decode("utf-8-sig")  # Handle BOM
+        with open_csv_reader(stream) as reader:
+            columns_found = list(reader.fieldnames or [])
+
+            # Check required columns
+            missing = [col for col in REQUIRED_COLUMNS if col not in columns_found]
+            if missing:
+                errors.append(f"Missing required columns: {', '.join(missing)}")
+                return {
+                    "valid": False,
+                    "errors": errors,
+                    "warnings": [],
+                    "preview_rows": [],
+                    "total_rows": 0,
+                    "columns_found": columns_found,
+                }
+
+            # Check for unknown columns
+            known = set(ALL_COLUMNS)
+            unknown = [col for col in columns_found if col not in known]
+            if unknown:
+                warnings.append(f"Unknown columns will be ignored: {', '.join(unknown)}")
+
+            # Validate rows
+            for i, row in enumerate(reader, start=2):  # Row 1 is header
+                total_rows += 1
+
+                # Required field checks
+                if not (row.get("response_text") or "").strip():
+                    errors.append(f"Row {i}: 'response_text' is empty")
+
+                submitted_at = (row.get("submitted_at") or "").strip()
+                if not submitted_at:
+                    errors.append(f"Row {i}: 'submitted_at' is empty")
+                else:
+                    try:
+                        _parse_datetime(submitted_at)
+                    except ValueError:
+                        errors.append(
+                            f"Row {i}: 'submitted_at' is not a valid date/time "
+                            f"(got '{submitted_at}', expected ISO 8601 format)"
+                        )
+
+                # Optional field warnings
+                nps = (row.get("nps_score") or "").strip()
+                warning = None
+                if nps:
+                    try:
+                        score = int(nps)
+                        if score < 0 or score > 10:
+                            warning = f"Row {i}: 'nps_score' should be 0-10 (got {score})"
+                    except ValueError:
+                        warning = f"Row {i}: 'nps_score' is not a valid number (got '{nps}')"
+                if warning:
+                    if len(warnings) < MAX_REPORTED_WARNINGS:
+                        warnings.append(warning)
+                    else:
+                        suppressed_warnings += 1
+
+                # Collect preview (first 10 rows)
+                if len(preview_rows) < 10:
+                    preview_rows.append(dict(row))
+
+                # Stop early on too many errors
+                if len(errors) > MAX_REPORTED_ERRORS:
+                    errors.append("Too many errors — showing first 20 only")
+                    break
     except UnicodeDecodeError:
         return {
             "valid": False,
@@ -77,70 +202,11 @@ def validate_csv_bytes(file_bytes: bytes) -> dict:
             "warnings": [],
             "preview_rows": [],
             "total_rows": 0,
-            "columns_found": [],
-        }
-
-    reader = csv.DictReader(io.StringIO(text))
-    columns_found = reader.fieldnames or []
-
-    # Check required columns
-    missing = [col for col in REQUIRED_COLUMNS if col not in columns_found]
-    if missing:
-        errors.append(f"Missing required columns: {', '.join(missing)}")
-        return {
-            "valid": False,
-            "errors": errors,
-            "warnings": [],
-            "preview_rows": [],
-            "total_rows": 0,
-            "columns_found": list(columns_found),
+            "columns_found": columns_found,
         }
 
-    # Check for unknown columns
-    known = set(ALL_COLUMNS)
-    unknown = [col for col in columns_found if col not in known]
-    if unknown:
-        warnings.append(f"Unknown columns will be ignored: {', '.join(unknown)}")
-
-    # Validate rows
-    total_rows = 0
-    for i, row in enumerate(reader, start=2):  # Row 1 is header
-        total_rows += 1
-
-        # Required field checks
-        if not row.get("response_text", "").strip():
-            errors.append(f"Row {i}: 'response_text' is empty")
-
-        submitted_at = row.get("submitted_at", "").strip()
-        if not submitted_at:
-            errors.append(f"Row {i}: 'submitted_at' is empty")
-        else:
-            try:
-                _parse_datetime(submitted_at)
-            except ValueError:
-                errors.append(
-                    f"Row {i}: 'submitted_at' is not a valid date/time "
-                    f"(got '{submitted_at}', expected ISO 8601 format)"
-                )
-
-        # Optional field warnings
-        nps = row.get("nps_score", "").strip()
-        if nps:
-            try:
-                score = int(nps)
-                if score < 0 or score > 10:
-                    warnings.append(f"Row {i}: 'nps_score' should be 0-10 (got {score})")
-            except ValueError:
-                warnings.append(f"Row {i}: 'nps_score' is not a valid number (got '{nps}')")
-
-        # Collect preview (first 10 rows)
-        if len(preview_rows) < 10:
-            preview_rows.append(dict(row))
-
-        # Stop early on too many errors
-        if len(errors) > 20:
-            errors.append("Too many errors — showing first 20 only")
-            break
+    if suppressed_warnings:
+        warnings.append(f"{suppressed_warnings} more warnings not shown")
 
     if total_rows == 0:
         errors.append("CSV file has no data rows")
@@ -151,7 +217,7 @@ def validate_csv_bytes(file_bytes: bytes) -> dict:
         "warnings": warnings,
         "preview_rows": preview_rows,
         "total_rows": total_rows,
-        "columns_found": list(columns_found),
+        "columns_found": columns_found,
     }
 
 
@@ -251,10 +317,16 @@ class CSVImportConnector(BaseConnector):
     async def normalize(
         self,
         raw_records: list[dict[str, Any]],
+        *,
+        start_index: int = 1,
     ) -> list[NormalizedSignal]:
-        """Convert parsed CSV rows to NormalizedSignals."""
+        """Convert parsed CSV rows to NormalizedSignals.
+
+        ``start_index`` is the file position of the first row, so chunks of
+        a streamed import get the same external ids as a whole-file pass.
+        """
         signals: list[NormalizedSignal] = []
-        for row_index, row in enumerate(raw_records, start=1):
+        for row_index, row in enumerate(raw_records, start=start_index):
             submitted_at = row.get("submitted_at", "")
             try:
                 occurred_at = _parse_datetime(submitted_at)
@@ -13,13 +13,23 @@ signals. Idempotency lives in ``source_items``.
 from __future__ import annotations
 
 import logging
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from datetime import datetime, timezone, timedelta
 from typing import Any
 
 import httpx
 
 from app.connectors import register_connector
-from app.connectors.base import BaseConnector, ConnectorError, NormalizedSignal, SyncResult
+from app.connectors.base import (
+    BaseConnector,
+    ConnectorError,
+    NormalizedSignal,
+    SyncResult,
+    iter_offset_pages,
+    rate_limited_error,
+)
+from app.core.sync_telemetry import timed
 from app.models import SourceConnectionStatus, SyncRun
 from app.services.interview_materialization import (
     MaterializedMeeting,
@@ -141,6 +151,7 @@ class FirefliesConnector(BaseConnector):
         variables: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Execute one GraphQL request and surface errors as ConnectorErrors."""
+        await self.throttle("fireflies")
         response = await client.post(
             FIREFLIES_GRAPHQL_URL,
             headers=self._headers(),
@@ -148,11 +159,7 @@ class FirefliesConnector(BaseConnector):
         )
 
         if response.status_code == 429:
-            retry_after = int(response.headers.get("Retry-After", "60"))
-            raise ConnectorError(
-                f"Fireflies rate limited — retry after {retry_after}s",
-                retryable=True,
-            )
+            raise rate_limited_error("Fireflies", response)
         if response.status_code in (401, 403):
             raise ConnectorError(
                 "Invalid Fireflies API key — check the key in Fireflies → Integrations"
@@ -202,8 +209,8 @@ class FirefliesConnector(BaseConnector):
             return False
 
         try:
-            async with httpx.AsyncClient(timeout=_FIREFLIES_TIMEOUT) as client:
-                await self._graphql(client, _VALIDATE_QUERY)
+            client = self.http_client(FIREFLIES_GRAPHQL_URL, timeout=_FIREFLIES_TIMEOUT)
+            await self._graphql(client, _VALIDATE_QUERY)
 
             transition_source_connection(
                 self.connection,
@@ -236,40 +243,41 @@ class FirefliesConnector(BaseConnector):
 
     # ── data fetching ────────────────────────────────────
 
-    async def _fetch_transcripts(
+    def _iter_transcript_pages(
         self,
         client: httpx.AsyncClient,
         *,
         from_date: datetime,
-    ) -> list[dict[str, Any]]:
-        """Paginate through all transcripts since ``from_date``."""
-        all_transcripts: list[dict[str, Any]] = []
-        skip = 0
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Page through all transcripts since ``from_date``, prefetching ahead."""
+        to_date = datetime.now(timezone.utc).isoformat()
         pages = 0
 
-        while pages < _MAX_PAGES:
-            pages += 1
-            data = await self._graphql(
-                client,
-                _TRANSCRIPTS_QUERY,
-                {
-                    "limit": _PAGE_SIZE,
-                    "skip": skip,
-                    "fromDate": from_date.isoformat(),
-                    "toDate": datetime.now(timezone.utc).isoformat(),
-                },
-            )
+        async def _fetch_page(skip: int) -> list[dict[str, Any]]:
+            nonlocal pages
+            try:
+                data = await self._graphql(
+                    client,
+                    _TRANSCRIPTS_QUERY,
+                    {
+                        "limit": _PAGE_SIZE,
+                        "skip": skip,
+                        "fromDate": from_date.isoformat(),
+                        "toDate": to_date,
+                    },
+                )
+            except ConnectorError:
+                raise
+            except Exception as exc:
+                raise ConnectorError(f"Fireflies fetch error: {exc}") from exc
             batch = data.get("transcripts") or []
-            all_transcripts.extend(batch)
-
+            pages += 1
             logger.info(
                 "Fireflies page %d: fetched %d transcripts", pages, len(batch)
             )
-            if len(batch) < _PAGE_SIZE:
-                break
-            skip += _PAGE_SIZE
+            return batch
 
-        return all_transcripts
+        return iter_offset_pages(_fetch_page, page_size=_PAGE_SIZE, max_pages=_MAX_PAGES)
 
     def _to_meeting(self, record: dict[str, Any]) -> MaterializedMeeting | None:
         external_id = str(record.get("id") or "").strip()
@@ -303,33 +311,44 @@ class FirefliesConnector(BaseConnector):
         from_date: datetime,
         cursor_in: dict[str, Any] | None,
     ) -> SyncResult:
-        try:
-            async with httpx.AsyncClient(timeout=_FIREFLIES_TIMEOUT) as client:
-                raw_transcripts = await self._fetch_transcripts(
-                    client, from_date=from_date
-                )
-        except ConnectorError:
-            raise
-        except Exception as exc:
-            raise ConnectorError(f"Fireflies fetch error: {exc}") from exc
-
-        meetings = [
-            meeting
-            for meeting in (self._to_meeting(record) for record in raw_transcripts)
-            if meeting is not None
-        ]
-
-        created, updated, unchanged = await materialize_meetings(
-            self.db,
-            connection=self.connection,
-            meetings=meetings,
-        )
+        """Fetch and materialize page by page.
+
+        The next pages download while the current one materializes, so a
+        large backfill overlaps network and database time instead of
+        buffering every meeting first.
+        """
+        client = self.http_client(FIREFLIES_GRAPHQL_URL, timeout=_FIREFLIES_TIMEOUT)
+        records_seen = created = updated = unchanged = 0
+        latest_meeting_at: datetime | None = None
+
+        async with aclosing(self._iter_transcript_pages(client, from_date=from_date)) as pages:
+            async for batch in pages:
+                records_seen += len(batch)
+                with timed("normalize"):
+                    meetings = [
+                        meeting
+                        for meeting in (self._to_meeting(record) for record in batch)
+                        if meeting is not None
+                    ]
+                with timed("persist"):
+                    page_created, page_updated, page_unchanged = await materialize_meetings(
+                        self.db,
+                        connection=self.connection,
+                        meetings=meetings,
+                    )
+                created += page_created
+                updated += page_updated
+                unchanged += page_unchanged
+                for meeting in meetings:
+                    if meeting.occurred_at is not None and (
+                        latest_meeting_at is None or meeting.occurred_at > latest_meeting_at
+                    ):
+                        latest_meeting_at = meeting.occurred_at
 
         # Advance the cursor to the newest meeting seen; if nothing came
         # back, carry the previous cursor forward so no window is skipped.
-        meeting_dates = [m.occurred_at for m in meetings if m.occurred_at is not None]
-        if meeting_dates:
-            cursor_out = {"last_synced_at": max(meeting_dates).isoformat()}
+        if latest_meeting_at is not None:
+            cursor_out = {"last_synced_at": latest_meeting_at.isoformat()}
         elif cursor_in and cursor_in.get("last_synced_at"):
             cursor_out = {"last_synced_at": cursor_in["last_synced_at"]}
         else:
@@ -338,7 +357,7 @@ class FirefliesConnector(BaseConnector):
         return SyncResult(
             signals=[],
             cursor_out=cursor_out,
-            records_seen=len(raw_transcripts),
+            records_seen=records_seen,
             records_created=created,
             records_updated=updated,
             records_unchanged=unchanged,
@@ -9,13 +9,23 @@ through the standard processing pipeline. Idempotency lives in ``source_items``.
 from __future__ import annotations
 
 import logging
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from datetime import datetime, timezone, timedelta
 from typing import Any
 
 import httpx
 
 from app.connectors import register_connector
-from app.connectors.base import BaseConnector, ConnectorError, NormalizedSignal, SyncResult
+from app.connectors.base import (
+    BaseConnector,
+    ConnectorError,
+    NormalizedSignal,
+    SyncResult,
+    iter_offset_pages,
+    rate_limited_error,
+)
+from app.core.sync_telemetry import timed
 from app.models import SourceConnectionStatus, SyncRun
 from app.services.interview_materialization import (
     MaterializedMeeting,
@@ -110,6 +120,7 @@ class OtterConnector(BaseConnector):
     ) -> dict[str, Any]:
         """Execute one REST API request and surface errors as ConnectorErrors."""
         url = f"{OTTER_API_BASE_URL.rstrip('/')}/{path.lstrip('/')}"
+        await self.throttle("otter")
         response = await client.request(
             method,
             url,
@@ -119,11 +130,7 @@ class OtterConnector(BaseConnector):
         )
 
         if response.status_code == 429:
-            retry_after = int(response.headers.get("Retry-After", "60"))
-            raise ConnectorError(
-                f"Otter.ai rate limited — retry after {retry_after}s",
-                retryable=True,
-            )
+            raise rate_limited_error("Otter.ai", response)
         if response.status_code in (401, 403):
             raise ConnectorError(
                 "Invalid Otter.ai API key — check your key in Otter.ai account settings"
@@ -173,8 +180,8 @@ class OtterConnector(BaseConnector):
             return False
 
         try:
-            async with httpx.AsyncClient(timeout=_OTTER_TIMEOUT) as client:
-                await self._request(client, "GET", "/me")
+            client = self.http_client(OTTER_API_BASE_URL, timeout=_OTTER_TIMEOUT)
+            await self._request(client, "GET", "/me")
 
             transition_source_connection(
                 self.connection,
@@ -207,41 +214,42 @@ class OtterConnector(BaseConnector):
 
     # ── data fetching ────────────────────────────────────
 
-    async def _fetch_speeches(
+    def _iter_speech_pages(
         self,
         client: httpx.AsyncClient,
         *,
         from_date: datetime,
-    ) -> list[dict[str, Any]]:
-        """Paginate through all speeches since ``from_date``."""
-        all_speeches: list[dict[str, Any]] = []
-        skip = 0
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Page through all speeches since ``from_date``, prefetching ahead."""
+        to_date = datetime.now(timezone.utc).isoformat()
         pages = 0
 
-        while pages < _MAX_PAGES:
+        async def _fetch_page(skip: int) -> list[dict[str, Any]]:
+            nonlocal pages
+            try:
+                data = await self._request(
+                    client,
+                    "GET",
+                    "/speeches",
+                    params={
+                        "limit": _PAGE_SIZE,
+                        "skip": skip,
+                        "from_date": from_date.isoformat(),
+                        "to_date": to_date,
+                    },
+                )
+            except ConnectorError:
+                raise
+            except Exception as exc:
+                raise ConnectorError(f"Otter.ai fetch error: {exc}") from exc
+            batch = data.get("speeches") or []
             pages += 1
-            payload = await self._request(
-                client,
-                "GET",
-                "/speeches",
-                params={
-                    "limit": _PAGE_SIZE,
-                    "skip": skip,
-                    "from_date": from_date.isoformat(),
-                    "to_date": datetime.now(timezone.utc).isoformat(),
-                },
-            )
-            batch = payload.get("speeches") or []
-            all_speeches.extend(batch)
-
             logger.info(
                 "Otter.ai page %d: fetched %d speeches", pages, len(batch)
             )
-            if len(batch) < _PAGE_SIZE:
-                break
-            skip += _PAGE_SIZE
+            return batch
 
-        return all_speeches
+        return iter_offset_pages(_fetch_page, page_size=_PAGE_SIZE, max_pages=_MAX_PAGES)
 
     def _to_meeting(self, record: dict[str, Any]) -> MaterializedMeeting | None:
         external_id = str(record.get("id") or "").strip()
@@ -274,32 +282,43 @@ class OtterConnector(BaseConnector):
         from_date: datetime,
         cursor_in: dict[str, Any] | None,
     ) -> SyncResult:
-        try:
-            async with httpx.AsyncClient(timeout=_OTTER_TIMEOUT) as client:
-                raw_speeches = await self._fetch_speeches(
-                    client, from_date=from_date
-                )
-        except ConnectorError:
-            raise
-        except Exception as exc:
-            raise ConnectorError(f"Otter.ai fetch error: {exc}") from exc
-
-        meetings = [
-            meeting
-            for meeting in (self._to_meeting(record) for record in raw_speeches)
-            if meeting is not None
-        ]
-
-        created, updated, unchanged = await materialize_meetings(
-            self.db,
-            connection=self.connection,
-            meetings=meetings,
-        )
+        """Fetch and materialize page by page.
+
+        The next pages download while the current one materializes, so a
+        large backfill overlaps network and database time instead of
+        buffering every meeting first.
+        """
+        client = self.http_client(OTTER_API_BASE_URL, timeout=_OTTER_TIMEOUT)
+        records_seen = created = updated = unchanged = 0
+        latest_meeting_at: datetime | None = None
+
+        async with aclosing(self._iter_speech_pages(client, from_date=from_date)) as pages:
+            async for batch in pages:
+                records_seen += len(batch)
+                with timed("normalize"):
+                    meetings = [
+                        meeting
+                        for meeting in (self._to_meeting(record) for record in batch)
+                        if meeting is not None
+                    ]
+                with timed("persist"):
+                    page_created, page_updated, page_unchanged = await materialize_meetings(
+                        self.db,
+                        connection=self.connection,
+                        meetings=meetings,
+                    )
+                created += page_created
+                updated += page_updated
+                unchanged += page_unchanged
+                for meeting in meetings:
+                    if meeting.occurred_at is not None and (
+                        latest_meeting_at is None or meeting.occurred_at > latest_meeting_at
+                    ):
+                        latest_meeting_at = meeting.occurred_at
 
         # Advance cursor
-        meeting_dates = [m.occurred_at for m in meetings if m.occurred_at is not None]
-        if meeting_dates:
-            cursor_out = {"last_synced_at": max(meeting_dates).isoformat()}
+        if latest_meeting_at is not None:
+            cursor_out = {"last_synced_at": latest_meeting_at.isoformat()}
         elif cursor_in and cursor_in.get("last_synced_at"):
             cursor_out = {"last_synced_at": cursor_in["last_synced_at"]}
         else:
@@ -308,7 +327,7 @@ class OtterConnector(BaseConnector):
         return SyncResult(
             signals=[],
             cursor_out=cursor_out,
-            records_seen=len(raw_speeches),
+            records_seen=records_seen,
             records_created=created,
             records_updated=updated,
             records_unchanged=unchanged,
@@ -10,6 +10,11 @@ Guardrails (PRD-052-01):
 - top ``max_events`` events by volume only, to avoid metric spam
 - signals carry no sentiment; analytics is treated as related evidence,
   not customer voice
+
+Only the open week and a short late-data window can still change. Older
+weeks are finalized: emitted once with a ``final:`` checksum and never
+re-queried, so incremental syncs read a few weeks instead of the whole
+backfill range.
 """
 
 from __future__ import annotations
@@ -17,11 +22,19 @@ from __future__ import annotations
 import logging
 from datetime import datetime, timedelta, timezone
 from typing import Any
+from urllib.parse import urlsplit
 
 import httpx
 
 from app.connectors import register_connector
-from app.connectors.base import BaseConnector, ConnectorError, NormalizedSignal, SyncResult
+from app.connectors.base import (
+    BaseConnector,
+    ConnectorError,
+    NormalizedSignal,
+    SyncResult,
+    rate_limited_error,
+)
+from app.core.sync_telemetry import record_page, timed
 from app.models import SourceConnectionStatus, SyncRun
 from app.services.sources import transition_source_connection
 
@@ -39,6 +52,10 @@ _MAX_BACKFILL_WEEKS = 26
 _DEFAULT_MAX_EVENTS = 20
 _MAX_EVENTS_CAP = 50
 
+# Closed weeks still accept late-arriving events for this many weeks
+_DEFAULT_LATE_DATA_WEEKS = 1
+_MAX_LATE_DATA_WEEKS = 4
+
 _WEEKLY_COUNTS_QUERY = """
 SELECT event, toStartOfWeek(timestamp) AS week_start, count() AS occurrences
 FROM events
@@ -73,12 +90,18 @@ def build_metric_windows(
     rows: list[list[Any]],
     *,
     max_events: int,
+    baseline_week: datetime | None = None,
+    baseline_counts: dict[str, int] | None = None,
 ) -> list[dict[str, Any]]:
     """Turn HogQL result rows into per-event weekly metric-window records.
 
     ``rows`` are ``[event, week_start, occurrences]`` triples. Only the top
     ``max_events`` events by total volume are kept, and each window carries
     the previous week's count so normalization can state a direction.
+
+    ``baseline_counts`` are the already-finalized counts of
+    ``baseline_week``, which precedes the queried range; they supply the
+    previous count of the first queried week without re-reading it.
     """
     series: dict[str, dict[datetime, int]] = {}
     for row in rows:
@@ -104,7 +127,10 @@ def build_metric_windows(
         weeks = sorted(series[event])
         for week in weeks:
             # "previous" only counts when the prior week is actually adjacent
-            previous_count = series[event].get(week - timedelta(weeks=1))
+            previous_week = week - timedelta(weeks=1)
+            previous_count = series[event].get(previous_week)
+            if previous_count is None and previous_week == baseline_week:
+                previous_count = (baseline_counts or {}).get(event)
             windows.append(
                 {
                     "event": event,
@@ -140,6 +166,8 @@ class PostHogConnector(BaseConnector):
         - ``host``: str (optional) — PostHog instance URL, defaults to US cloud
         - ``backfill_weeks``: int (optional) — weekly history to import
         - ``max_events``: int (optional) — top-events cap
+        - ``late_data_weeks``: int (optional) — closed weeks kept open for
+          late-arriving events before they are finalized
 
     Credential storage (``connection.secret_ref``):
         - A read-only personal API key (in production, a Secret Manager reference)
@@ -167,6 +195,10 @@ class PostHogConnector(BaseConnector):
             raise ConnectorError("Missing 'project_id' in connection config")
         return project_id
 
+    @property
+    def rate_limit_account(self) -> str:
+        return f"{urlsplit(self.host).netloc or self.host}/{self.project_id}"
+
     @property
     def backfill_weeks(self) -> int:
         config = self.connection.config_json or {}
@@ -179,6 +211,12 @@ class PostHogConnector(BaseConnector):
         cap = int(config.get("max_events", _DEFAULT_MAX_EVENTS))
         return max(1, min(cap, _MAX_EVENTS_CAP))
 
+    @property
+    def late_data_weeks(self) -> int:
+        config = self.connection.config_json or {}
+        weeks = int(config.get("late_data_weeks", _DEFAULT_LATE_DATA_WEEKS))
+        return max(0, min(weeks, _MAX_LATE_DATA_WEEKS))
+
     def _headers(self) -> dict[str, str]:
         return {
             "Authorization": f"Bearer {self.api_key}",
@@ -195,6 +233,7 @@ class PostHogConnector(BaseConnector):
         from_date: datetime,
     ) -> list[list[Any]]:
         """Run the weekly-counts HogQL query and return result rows."""
+        await self.throttle("posthog")
         response = await client.post(
             f"{self._project_url()}/query/",
             headers=self._headers(),
@@ -209,11 +248,7 @@ class PostHogConnector(BaseConnector):
         )
 
         if response.status_code == 429:
-            retry_after = int(response.headers.get("Retry-After", "60"))
-            raise ConnectorError(
-                f"PostHog rate limited — retry after {retry_after}s",
-                retryable=True,
-            )
+            raise rate_limited_error("PostHog", response)
         if response.status_code == 401:
             raise ConnectorError(
                 "Invalid PostHog API key — check the key in PostHog → Settings → Personal API keys"
@@ -268,11 +303,11 @@ class PostHogConnector(BaseConnector):
 
         try:
             self.project_id
-            async with httpx.AsyncClient(timeout=_POSTHOG_TIMEOUT) as client:
-                response = await client.get(
-                    f"{self._project_url()}/",
-                    headers=self._headers(),
-                )
+            client = self.http_client(self.host, timeout=_POSTHOG_TIMEOUT)
+            response = await client.get(
+                f"{self._project_url()}/",
+                headers=self._headers(),
+            )
 
             if response.status_code == 200:
                 transition_source_connection(
@@ -317,27 +352,59 @@ class PostHogConnector(BaseConnector):
 
     # ── data fetching ────────────────────────────────────
 
+    def _finalized_boundary(self) -> datetime:
+        """Start of the newest week that can no longer change."""
+        open_week = _week_start(datetime.now(timezone.utc))
+        return open_week - timedelta(weeks=self.late_data_weeks + 1)
+
     async def _run_sync(
         self,
         *,
         from_date: datetime,
+        baseline_week: datetime | None = None,
+        baseline_counts: dict[str, int] | None = None,
     ) -> SyncResult:
+        """Query weeks from ``from_date`` and emit their metric windows.
+
+        Weeks up to the finalized boundary are marked ``final``; the cursor
+        records the newest finalized week and its counts, so the next
+        incremental sync starts right after it.
+        """
         try:
-            async with httpx.AsyncClient(timeout=_POSTHOG_TIMEOUT) as client:
-                rows = await self._query(client, from_date=from_date)
+            client = self.http_client(self.host, timeout=_POSTHOG_TIMEOUT)
+            rows = await self._query(client, from_date=from_date)
         except ConnectorError:
             raise
         except Exception as exc:
             raise ConnectorError(f"PostHog fetch error: {exc}") from exc
 
-        windows = build_metric_windows(rows, max_events=self.max_events)
-        signals = await self.normalize(windows)
+        record_page()
+        boundary = self._finalized_boundary()
+        with timed("normalize"):
+            windows = build_metric_windows(
+                rows,
+                max_events=self.max_events,
+                baseline_week=baseline_week,
+                baseline_counts=baseline_counts,
+            )
+            for window in windows:
+                window["final"] = window["window_start"] <= boundary
+            signals = await self.normalize(windows)
 
         if windows:
             latest_window_start = max(w["window_start"] for w in windows)
-            cursor_out = {"last_window_start": latest_window_start.isoformat()}
         else:
-            cursor_out = {"last_window_start": _week_start(from_date).isoformat()}
+            latest_window_start = _week_start(from_date)
+        cursor_out: dict[str, Any] = {"last_window_start": latest_window_start.isoformat()}
+
+        if boundary >= _week_start(from_date):
+            cursor_out["finalized_through"] = boundary.isoformat()
+            cursor_out["finalized_counts"] = {
+                w["event"]: w["count"] for w in windows if w["window_start"] == boundary
+            }
+        elif baseline_week is not None:
+            cursor_out["finalized_through"] = baseline_week.isoformat()
+            cursor_out["finalized_counts"] = dict(baseline_counts or {})
 
         return SyncResult(
             signals=signals,
@@ -377,27 +444,41 @@ class PostHogConnector(BaseConnector):
         *,
         cursor_in: dict[str, Any] | None = None,
     ) -> SyncResult:
-        """Refresh the current and previous week's metric windows.
+        """Refresh the weeks that can still change.
 
-        Weekly windows keep changing while the week is in progress, so the
-        incremental sync re-reads from one week before the cursor — the
-        checksum on each window keeps re-reads idempotent.
+        Only the weeks after the cursor's ``finalized_through`` week are
+        queried: the late-data window plus the open week. The finalized
+        week's counts come from the cursor, so the first refreshed window
+        still states a direction. Cursors from before finalization was
+        tracked fall back to ``late_data_weeks`` before the last window.
         """
+        baseline_week = None
+        baseline_counts = None
         cursor_week = None
-        if cursor_in and cursor_in.get("last_window_start"):
-            cursor_week = _parse_week_start(cursor_in["last_window_start"])
-
-        if cursor_week is not None:
-            from_date = cursor_week - timedelta(weeks=1)
+        if cursor_in:
+            baseline_week = _parse_week_start(cursor_in.get("finalized_through"))
+            baseline_counts = cursor_in.get("finalized_counts") or {}
+            cursor_week = _parse_week_start(cursor_in.get("last_window_start"))
+
+        if baseline_week is not None:
+            from_date = baseline_week + timedelta(weeks=1)
+        elif cursor_week is not None:
+            from_date = cursor_week - timedelta(weeks=self.late_data_weeks)
         else:
-            from_date = _week_start(datetime.now(timezone.utc) - timedelta(weeks=2))
+            from_date = _week_start(
+                datetime.now(timezone.utc) - timedelta(weeks=self.late_data_weeks + 1)
+            )
 
         logger.info(
             "PostHog incremental sync for connection=%s, from=%s",
             self.connection.id,
             from_date.isoformat(),
         )
-        result = await self._run_sync(from_date=from_date)
+        result = await self._run_sync(
+            from_date=from_date,
+            baseline_week=baseline_week,
+            baseline_counts=baseline_counts,
+        )
         logger.info(
             "PostHog incremental sync complete: connection=%s windows=%d",
             self.connection.id,
@@ -427,6 +508,7 @@ class PostHogConnector(BaseConnector):
 
             count = int(record.get("count") or 0)
             previous_count = record.get("previous_count")
+            final = bool(record.get("final"))
             direction, change_pct = describe_change(count, previous_count)
 
             week_label = window_start.strftime("%b %d, %Y")
@@ -474,8 +556,11 @@ class PostHogConnector(BaseConnector):
                         "previous_value": previous_count,
                         "change_pct": change_pct,
                         "direction": direction,
+                        "final": final,
                     },
-                    checksum=str(count),
+                    # A finalized week never changes again; the prefix makes
+                    # its checksum differ from the provisional one exactly once.
+                    checksum=f"final:{count}" if final else str(count),
                 )
             )
         return signals
@@ -3,6 +3,8 @@ Spec10x — Zendesk Connector
 
 Sprint 2: real credential validation via Zendesk API.
 Sprint 3: real backfill and incremental sync via Incremental Cursor API.
+Pages are streamed to the orchestrator one at a time so large backfills
+never hold the whole ticket history in memory.
 """
 
 from __future__ import annotations
@@ -10,13 +12,21 @@ from __future__ import annotations
 import base64
 import logging
 import time
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone, timedelta
 from typing import Any
 
 import httpx
 
 from app.connectors import register_connector
-from app.connectors.base import BaseConnector, ConnectorError, NormalizedSignal, SyncResult
+from app.connectors.base import (
+    ConnectorError,
+    NormalizedSignal,
+    StreamingConnector,
+    SyncPage,
+    rate_limited_error,
+)
+from app.core.sync_telemetry import timed
 from app.models import SourceConnectionStatus, SyncRun
 from app.services.sources import transition_source_connection
 
@@ -33,7 +43,7 @@ _DEFAULT_BACKFILL_DAYS = 90
 
 
 @register_connector(source_type="support", provider="zendesk")
-class ZendeskConnector(BaseConnector):
+class ZendeskConnector(StreamingConnector):
     """Zendesk Support connector.
 
     Config expectations (stored in ``connection.config_json``):
@@ -65,6 +75,10 @@ class ZendeskConnector(BaseConnector):
             
         return subdomain
 
+    @property
+    def rate_limit_account(self) -> str:
+        return self.subdomain
+
     @property
     def email(self) -> str:
         config = self.connection.config_json or {}
@@ -126,11 +140,11 @@ class ZendeskConnector(BaseConnector):
         )
 
         try:
-            async with httpx.AsyncClient(timeout=_ZENDESK_TIMEOUT) as client:
-                response = await client.get(
-                    f"{self.base_url}/users/me.json",
-                    headers=self._auth_header(),
-                )
+            client = self.http_client(self.base_url, timeout=_ZENDESK_TIMEOUT)
+            response = await client.get(
+                f"{self.base_url}/users/me.json",
+                headers=self._auth_header(),
+            )
 
             if response.status_code == 200:
                 data = response.json()
@@ -203,15 +217,11 @@ class ZendeskConnector(BaseConnector):
         url: str,
     ) -> dict[str, Any]:
         """Fetch a single page from the Zendesk Incremental Cursor API."""
+        await self.throttle("zendesk")
         response = await client.get(url, headers=self._auth_header())
 
         if response.status_code == 429:
-            # Rate limited — respect Retry-After header
-            retry_after = int(response.headers.get("Retry-After", "60"))
-            raise ConnectorError(
-                f"Zendesk rate limited — retry after {retry_after}s",
-                retryable=True,
-            )
+            raise rate_limited_error("Zendesk", response)
 
         if response.status_code != 200:
             raise ConnectorError(
@@ -221,53 +231,69 @@ class ZendeskConnector(BaseConnector):
 
         return response.json()
 
-    async def _paginate_tickets(
+    async def _iter_ticket_pages(
         self,
-        client: httpx.AsyncClient,
         start_url: str,
-    ) -> tuple[list[dict[str, Any]], dict[str, Any] | None]:
-        """Paginate through all ticket pages.
+        *,
+        label: str,
+    ) -> AsyncIterator[SyncPage]:
+        """Walk the Incremental Cursor API, yielding one normalized page at a time.
 
-        Returns (all_tickets, cursor_out).
+        Each page carries the ``after_cursor`` that resumes after it, so the
+        orchestrator can checkpoint progress without buffering the stream.
         """
-        all_tickets: list[dict[str, Any]] = []
         url = start_url
         pages = 0
+        tickets_seen = 0
 
-        while url and pages < _MAX_PAGES:
-            pages += 1
-            data = await self._fetch_tickets_page(client, url)
-
-            tickets = data.get("tickets", [])
-            all_tickets.extend(tickets)
+        try:
+            client = self.http_client(self.base_url, timeout=_ZENDESK_TIMEOUT)
+            while url and pages < _MAX_PAGES:
+                pages += 1
+                data = await self._fetch_tickets_page(client, url)
 
-            end_of_stream = data.get("end_of_stream", False)
-            after_cursor = data.get("after_cursor")
+                tickets = data.get("tickets", [])
+                end_of_stream = data.get("end_of_stream", False)
+                after_cursor = data.get("after_cursor")
+                tickets_seen += len(tickets)
 
-            logger.info(
-                "Zendesk page %d: fetched %d tickets, end_of_stream=%s",
-                pages,
-                len(tickets),
-                end_of_stream,
-            )
+                logger.info(
+                    "Zendesk page %d: fetched %d tickets, end_of_stream=%s",
+                    pages,
+                    len(tickets),
+                    end_of_stream,
+                )
 
-            if end_of_stream or not data.get("after_url"):
-                cursor_out = {"after_cursor": after_cursor} if after_cursor else None
-                return all_tickets, cursor_out
+                with timed("normalize"):
+                    signals = await self.normalize(tickets)
+                yield SyncPage(
+                    signals=signals,
+                    cursor_out={"after_cursor": after_cursor} if after_cursor else None,
+                    records_seen=len(tickets),
+                )
 
-            url = data["after_url"]
+                if end_of_stream or not data.get("after_url"):
+                    break
+                url = data["after_url"]
+        except ConnectorError:
+            raise
+        except Exception as exc:
+            raise ConnectorError(f"Zendesk {label} fetch error: {exc}") from exc
 
-        # Hit max pages
-        after_cursor = None
-        cursor_out = {"after_cursor": after_cursor} if after_cursor else None
-        return all_tickets, cursor_out
+        logger.info(
+            "Zendesk %s complete: connection=%s, pages=%d, tickets=%d",
+            label,
+            self.connection.id,
+            pages,
+            tickets_seen,
+        )
 
-    async def backfill(
+    def iter_backfill_pages(
         self,
         sync_run: SyncRun,
         *,
         cursor_in: dict[str, Any] | None = None,
-    ) -> SyncResult:
+    ) -> AsyncIterator[SyncPage]:
         """Import historical Zendesk tickets via Incremental Cursor API.
 
         Bounded by backfill_days config (default 90 days).
@@ -296,40 +322,14 @@ class ZendeskConnector(BaseConnector):
                 f"?start_time={start_time}"
             )
 
-        try:
-            async with httpx.AsyncClient(timeout=_ZENDESK_TIMEOUT) as client:
-                raw_tickets, cursor_out = await self._paginate_tickets(
-                    client, start_url
-                )
-        except ConnectorError:
-            raise
-        except Exception as exc:
-            raise ConnectorError(f"Zendesk backfill fetch error: {exc}") from exc
-
-        # Normalize
-        signals = await self.normalize(raw_tickets)
+        return self._iter_ticket_pages(start_url, label="backfill")
 
-        logger.info(
-            "Zendesk backfill complete: connection=%s, tickets=%d, signals=%d",
-            self.connection.id,
-            len(raw_tickets),
-            len(signals),
-        )
-
-        return SyncResult(
-            signals=signals,
-            cursor_out=cursor_out,
-            records_seen=len(raw_tickets),
-            records_created=len(signals),  # actual count updated by orchestrator
-            records_updated=0,
-        )
-
-    async def sync_incremental(
+    def iter_incremental_pages(
         self,
         sync_run: SyncRun,
         *,
         cursor_in: dict[str, Any] | None = None,
-    ) -> SyncResult:
+    ) -> AsyncIterator[SyncPage]:
         """Fetch new/updated tickets since last cursor."""
         logger.info(
             "Zendesk incremental sync for connection=%s, cursor=%s",
@@ -352,34 +352,7 @@ class ZendeskConnector(BaseConnector):
                 f"?cursor={cursor_in['after_cursor']}"
             )
 
-        try:
-            async with httpx.AsyncClient(timeout=_ZENDESK_TIMEOUT) as client:
-                raw_tickets, cursor_out = await self._paginate_tickets(
-                    client, start_url
-                )
-        except ConnectorError:
-            raise
-        except Exception as exc:
-            raise ConnectorError(
-                f"Zendesk incremental sync fetch error: {exc}"
-            ) from exc
-
-        signals = await self.normalize(raw_tickets)
-
-        logger.info(
-            "Zendesk incremental sync complete: connection=%s, tickets=%d, signals=%d",
-            self.connection.id,
-            len(raw_tickets),
-            len(signals),
-        )
-
-        return SyncResult(
-            signals=signals,
-            cursor_out=cursor_out,
-            records_seen=len(raw_tickets),
-            records_created=len(signals),
-            records_updated=0,
-        )
+        return self._iter_ticket_pages(start_url, label="incremental sync")
 
     async def normalize(
         self,
@@ -24,6 +24,18 @@ class Settings(BaseSettings):
     # Redis
     redis_url: str = "redis://localhost:6379/0"
 
+    # Connector sync — max connections the hourly cron syncs at once per worker
+    connector_sync_concurrency: int = 8
+    # Shared per-provider request budgets in Redis (app/core/rate_limits.py)
+    connector_rate_limits_enabled: bool = True
+
+    # Shared computed-view cache in Redis (app/core/response_cache.py)
+    response_cache_enabled: bool = True
+
+    # Survey CSV import — files above the inline limit import in the worker
+    survey_import_max_bytes: int = 512 * 1024 * 1024
+    survey_import_inline_max_bytes: int = 10 * 1024 * 1024
+
     # Storage (MinIO for local, GCS for prod)
     storage_backend: str = "minio"
     minio_endpoint: str = "localhost:9000"
@@ -0,0 +1,292 @@
+"""
+Spec10x Backend — Workspace data versions & conditional GETs
+
+Every personal workspace carries a monotonically increasing
+``data_version``. It is bumped in the commit of any write to the evidence
+behind the heavy read endpoints — interviews, insights, themes, signals,
+specs and sync runs — so those endpoints can hand out ETags derived from
+it and answer a poll that finds nothing changed with ``304 Not Modified``
+after a single indexed lookup.
+
+Writes only record which workspaces they touched; the bump itself runs on
+the writer's own connection just before its COMMIT, locking the workspace
+rows in id order. The row lock is therefore held only for the commit
+itself rather than for the whole transaction, and the new version becomes
+visible atomically with the data it stands for.
+
+ORM flushes are tracked automatically by the ``after_flush`` listener
+below. Bulk ``insert()``/``update()``/``delete()`` statements bypass the
+unit of work and must call ``bump_data_version`` themselves.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import uuid
+from datetime import datetime, timezone
+from itertools import chain
+
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy import and_, event, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.auth import get_scoped_user
+from app.core.database import get_db
+from app.models import (
+    Insight,
+    Interview,
+    Signal,
+    SourceConnection,
+    Spec,
+    SyncRun,
+    Theme,
+    User,
+    Workspace,
+    WorkspaceKind,
+)
+
+# Owned through ``user_id``; signals and sync runs resolve to a workspace.
+_USER_SCOPED_MODELS = (Interview, Insight, Theme, Spec)
+
+# Responses also depend on the clock (7/14-day windows, recency points), so
+# an ETag only stays valid within one UTC hour even if no data changed.
+ETAG_FRESHNESS_FORMAT = "%Y-%m-%dT%H"
+
+# ``Session.info`` key for the scopes a transaction has changed so far.
+_PENDING_BUMPS_KEY = "data_version_pending_bumps"
+
+
+# ── Bumping ─────────────────────────────────────────────
+
+def _bump_statement(
+    *,
+    owner_user_ids: set[uuid.UUID] | None = None,
+    workspace_ids: set[uuid.UUID] | None = None,
+    source_connection_ids: set[uuid.UUID] | None = None,
+):
+    conditions = []
+    if owner_user_ids:
+        conditions.append(
+            and_(
+                Workspace.owner_user_id.in_(owner_user_ids),
+                Workspace.kind == WorkspaceKind.personal,
+            )
+        )
+    if workspace_ids:
+        conditions.append(Workspace.id.in_(workspace_ids))
+    if source_connection_ids:
+        conditions.append(
+            Workspace.id.in_(
+                select(SourceConnection.workspace_id).where(
+                    SourceConnection.id.in_(source_connection_ids)
+                )
+            )
+        )
+    if not conditions:
+        return None
+    # Rows are locked in id order so concurrent committers cannot deadlock.
+    locked_ids = (
+        select(Workspace.id)
+        .where(or_(*conditions))
+        .order_by(Workspace.id)
+        .with_for_update()
+    )
+    # ``updated_at`` is pinned so a data write does not read as a rename.
+    return (
+        update(Workspace)
+        .where(Workspace.id.in_(locked_ids))
+        .values(
+            data_version=Workspace.data_version + 1,
+            updated_at=Workspace.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def bump_data_version(
+    db: AsyncSession,
+    *,
+    owner_user_id: uuid.UUID | None = None,
+    workspace_id: uuid.UUID | None = None,
+) -> None:
+    """Bump after a bulk statement the ORM flush listener cannot see.
+
+    The bump is applied when the session's transaction commits.
+    """
+    _record_scopes(
+        db.sync_session,
+        {
+            "owner_user_ids": {owner_user_id} if owner_user_id else set(),
+            "workspace_ids": {workspace_id} if workspace_id else set(),
+        },
+    )
+
+
+def _changed_scopes(session: Session) -> dict[str, set[uuid.UUID]]:
+    scopes: dict[str, set[uuid.UUID]] = {
+        "owner_user_ids": set(),
+        "workspace_ids": set(),
+        "source_connection_ids": set(),
+    }
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if obj in session.dirty and not session.is_modified(obj):
+            # Re-assigning identical values (consistency passes do this on
+            # every read) is not a change.
+            continue
+        if isinstance(obj, Signal):
+            scopes["workspace_ids"].add(obj.workspace_id)
+        elif isinstance(obj, SyncRun):
+            scopes["source_connection_ids"].add(obj.source_connection_id)
+        elif isinstance(obj, _USER_SCOPED_MODELS):
+            scopes["owner_user_ids"].add(obj.user_id)
+    return {key: {value for value in values if value} for key, values in scopes.items()}
+
+
+def _record_scopes(session: Session, scopes: dict[str, set[uuid.UUID]]) -> None:
+    pending = session.info.setdefault(_PENDING_BUMPS_KEY, {})
+    for key, values in scopes.items():
+        pending.setdefault(key, set()).update(values)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_after_flush(session: Session, flush_context) -> None:
+    _record_scopes(session, _changed_scopes(session))
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_before_commit(session: Session) -> None:
+    # Commit flushes only after this hook; flush now so its scopes count.
+    session.flush()
+    pending = session.info.pop(_PENDING_BUMPS_KEY, None)
+    stmt = _bump_statement(**pending) if pending else None
+    if stmt is not None:
+        session.connection().execute(stmt)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_BUMPS_KEY, None)
+
+
+# ── Conditional GETs ────────────────────────────────────
+
+async def get_data_version(db: AsyncSession, *, owner_user_id: uuid.UUID) -> int:
+    result = await db.execute(
+        select(Workspace.data_version)
+        .where(
+            Workspace.owner_user_id == owner_user_id,
+            Workspace.kind == WorkspaceKind.personal,
+        )
+        .limit(1)
+    )
+    return result.scalar_one_or_none() or 0
+
+
+def build_data_version_etag(
+    *,
+    owner_user_id: uuid.UUID,
+    data_version: int,
+    request: Request,
+    now: datetime | None = None,
+    extra: str = "",
+) -> str:
+    """ETag of one data pool version at this path and query.
+
+    ``extra`` folds in state that ``data_version`` does not cover.
+    """
+    now = now or datetime.now(timezone.utc)
+    query = "&".join(f"{key}={value}" for key, value in sorted(request.query_params.multi_items()))
+    digest = hashlib.sha256(
+        "|".join(
+            (
+                str(owner_user_id),
+                request.url.path,
+                query,
+                now.strftime(ETAG_FRESHNESS_FORMAT),
+                extra,
+            )
+        ).encode()
+    ).hexdigest()[:16]
+    return f'W/"{data_version}-{digest}"'
+
+
+def build_data_pool_cache_key(
+    *,
+    owner_user_id: uuid.UUID,
+    data_version: int,
+    now: datetime | None = None,
+) -> str:
+    """Response cache key of a parameterless view of one data pool version.
+
+    Unlike the ETag it leaves out the path, so every endpoint that serves
+    the same view (the standalone route and the app shell) shares an entry.
+    """
+    now = now or datetime.now(timezone.utc)
+    return f"{owner_user_id}:{data_version}:{now.strftime(ETAG_FRESHNESS_FORMAT)}"
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+
+    def _opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    candidates = {_opaque(tag) for tag in if_none_match.split(",")}
+    return "*" in candidates or _opaque(etag) in candidates
+
+
+def check_not_modified(request: Request, response: Response, etag: str) -> None:
+    """ETag the response, or raise a 304 if the client already holds ``etag``."""
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(status_code=304, headers=headers)
+    response.headers.update(headers)
+
+
+async def current_data_version(
+    current_user: User = Depends(get_scoped_user),
+    db: AsyncSession = Depends(get_db),
+) -> int:
+    """Route dependency: the version of this request's data pool.
+
+    FastAPI caches it per request, so the ETag and the response cache key
+    share one version lookup.
+    """
+    return await get_data_version(db, owner_user_id=current_user.id)
+
+
+async def data_version_etag(
+    request: Request,
+    current_user: User = Depends(get_scoped_user),
+    data_version: int = Depends(current_data_version),
+) -> str:
+    """Route dependency: the ETag for this request's data pool and params."""
+    return build_data_version_etag(
+        owner_user_id=current_user.id,
+        data_version=data_version,
+        request=request,
+    )
+
+
+async def data_pool_cache_key(
+    current_user: User = Depends(get_scoped_user),
+    data_version: int = Depends(current_data_version),
+) -> str:
+    """Route dependency: the response cache key of a parameterless view."""
+    return build_data_pool_cache_key(owner_user_id=current_user.id, data_version=data_version)
+
+
+async def conditional_get(
+    request: Request,
+    response: Response,
+    etag: str = Depends(data_version_etag),
+) -> None:
+    """Route dependency: ETag the response, or short-circuit with a 304.
+
+    Runs before the endpoint body, so an unchanged poll never reaches the
+    signal consistency pass or any of the aggregate queries.
+    """
+    check_not_modified(request, response, etag)
@@ -0,0 +1,146 @@
+"""
+Spec10x Backend — Shared Outbound HTTP Clients
+
+Process-wide pool of ``httpx.AsyncClient`` instances keyed by upstream
+host and timeout, so connector syncs and exports reuse TLS sessions and keep-alive
+connections instead of paying a fresh handshake per call.
+
+Clients are created lazily on first use and closed by the API lifespan
+and the worker's shutdown hook. Tests can route every client through an
+``httpx.MockTransport`` with ``set_transport_override``.
+"""
+
+import asyncio
+import logging
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.core.sync_telemetry import record_http_request, record_http_response
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+# Per-host pool sizing. Keep-alive expiry stays below the idle timeouts of
+# the providers' load balancers so we never reuse a half-closed socket.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=20,
+    max_keepalive_connections=10,
+    keepalive_expiry=30.0,
+)
+
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - h2 ships with httpx[http2]
+    _HTTP2_AVAILABLE = False
+
+
+def _host_key(base_url: str) -> str:
+    parts = urlsplit(base_url if "://" in base_url else f"https://{base_url}")
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def _timeout_key(timeout: httpx.Timeout | float) -> tuple:
+    timeout = httpx.Timeout(timeout)
+    return (timeout.connect, timeout.read, timeout.write, timeout.pool)
+
+
+def _cookieless_jar() -> CookieJar:
+    # Clients are shared across tenants — never store or replay cookies.
+    return CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+
+
+class HttpClientRegistry:
+    """Lazily created ``httpx.AsyncClient`` pool keyed by host and timeout.
+
+    A client is bound to the event loop it was created on; asking for a
+    host from a different loop (a new worker loop or a test) transparently
+    builds a fresh client for that loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = _HTTP2_AVAILABLE,
+    ) -> None:
+        self._limits = limits
+        self._http2 = http2
+        self._clients: dict[tuple[str, tuple], tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+        self._transport_override: httpx.AsyncBaseTransport | None = None
+
+    def get(
+        self,
+        base_url: str,
+        *,
+        timeout: httpx.Timeout | float = DEFAULT_TIMEOUT,
+    ) -> httpx.AsyncClient:
+        """Return the shared client for ``base_url``'s host and ``timeout``.
+
+        Callers asking for different timeouts get separate clients, so a
+        timeout is never silently replaced by whichever caller came first.
+        Callers must not close the returned client or set per-tenant
+        state (auth headers, cookies) on it — pass credentials per request.
+        """
+        key = (_host_key(base_url), _timeout_key(timeout))
+        loop = asyncio.get_running_loop()
+        cached = self._clients.get(key)
+        if cached is not None:
+            cached_loop, client = cached
+            if cached_loop is loop and not client.is_closed:
+                return client
+
+        client_kwargs: dict = {
+            "timeout": timeout,
+            "limits": self._limits,
+            "cookies": _cookieless_jar(),
+            # Feed per-run sync telemetry; no-ops outside a sync.
+            "event_hooks": {
+                "request": [record_http_request],
+                "response": [record_http_response],
+            },
+        }
+        if self._transport_override is not None:
+            client_kwargs["transport"] = self._transport_override
+        elif self._http2:
+            client_kwargs["http2"] = True
+
+        client = httpx.AsyncClient(**client_kwargs)
+        self._clients[key] = (loop, client)
+        return client
+
+    def set_transport_override(self, transport: httpx.AsyncBaseTransport | None) -> None:
+        """Route every client through ``transport`` (tests); ``None`` resets."""
+        self._transport_override = transport
+        self._clients.clear()
+
+    async def aclose(self) -> None:
+        """Close every client owned by the running loop and forget the rest."""
+        loop = asyncio.get_running_loop()
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client_loop, client in clients:
+            if client_loop is loop and not client.is_closed:
+                await client.aclose()
+        logger.debug("Closed %d shared HTTP clients", len(clients))
+
+
+http_clients = HttpClientRegistry()
+
+
+def get_http_client(
+    base_url: str,
+    *,
+    timeout: httpx.Timeout | float = DEFAULT_TIMEOUT,
+) -> httpx.AsyncClient:
+    """Shortcut for ``http_clients.get``."""
+    return http_clients.get(base_url, timeout=timeout)
+
+
+async def close_http_clients() -> None:
+    """Lifecycle hook for API/worker shutdown."""
+    await http_clients.aclose()
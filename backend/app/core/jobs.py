@@ -0,0 +1,233 @@
+"""
+Spec10x Backend — Background Job Dispatch
+
+One persistent arq pool per process (per event loop) for every place that
+enqueues work: API routes, connector materialization and the sync
+orchestrator.
+
+Interview processing jobs get deterministic ids (``process_interview:<id>``),
+so enqueueing an interview that is already queued collapses into the
+queued job. ``enqueue_interview_processing`` writes a whole batch in one
+pipelined Redis round trip; ``enqueue_unique`` applies the same rules to a
+single job with any deterministic id.
+"""
+
+import asyncio
+import logging
+import uuid
+from collections.abc import Iterable
+from datetime import timedelta
+
+from arq import create_pool
+from arq.connections import ArqRedis, RedisSettings
+from arq.constants import (
+    expires_extra_ms,
+    in_progress_key_prefix,
+    job_key_prefix,
+    result_key_prefix,
+)
+from arq.jobs import serialize_job
+from arq.utils import timestamp_ms
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+QUEUE_NAME = "spec10x:jobs"
+PROCESS_INTERVIEW_JOB = "process_interview_job"
+
+# KEYS: job, in-progress, result, queue, follow-up job, follow-up result
+# ARGV: job id, payload, expires (ms), score, follow-up job id
+# Returns 1 when a job was queued, 0 when it collapsed into a queued one.
+# A job that is already running is not collapsed: its input changed after
+# it started, so one follow-up run is queued behind it. The follow-up has a
+# fixed id too, so a burst of triggers during a run queues it only once.
+_ENQUEUE_UNIQUE_SCRIPT = """
+local job_key, result_key, job_id = KEYS[1], KEYS[3], ARGV[1]
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    job_key, result_key, job_id = KEYS[5], KEYS[6], ARGV[5]
+end
+if redis.call('EXISTS', job_key) == 1 then
+    return 0
+end
+redis.call('DEL', result_key)
+redis.call('PSETEX', job_key, ARGV[3], ARGV[2])
+redis.call('ZADD', KEYS[4], ARGV[4], job_id)
+return 1
+"""
+
+
+def interview_job_id(interview_id: uuid.UUID | str) -> str:
+    return f"process_interview:{interview_id}"
+
+
+def follow_up_job_id(job_id: str) -> str:
+    return f"{job_id}:follow-up"
+
+
+def _unique_enqueue_call(
+    pool: ArqRedis,
+    function: str,
+    args: tuple,
+    *,
+    job_id: str,
+    enqueue_time_ms: int,
+    defer_ms: int = 0,
+) -> tuple:
+    """Arguments for one ``_ENQUEUE_UNIQUE_SCRIPT`` eval."""
+    follow_up_id = follow_up_job_id(job_id)
+    payload = serialize_job(
+        function,
+        args,
+        {},
+        None,
+        enqueue_time_ms,
+        serializer=pool.job_serializer,
+    )
+    return (
+        _ENQUEUE_UNIQUE_SCRIPT,
+        6,
+        job_key_prefix + job_id,
+        in_progress_key_prefix + job_id,
+        result_key_prefix + job_id,
+        QUEUE_NAME,
+        job_key_prefix + follow_up_id,
+        result_key_prefix + follow_up_id,
+        job_id,
+        payload,
+        defer_ms + expires_extra_ms,
+        enqueue_time_ms + defer_ms,
+        follow_up_id,
+    )
+
+
+class JobDispatcher:
+    """Lazily created, loop-bound arq pool with bulk enqueue helpers."""
+
+    def __init__(self) -> None:
+        self._pools: dict[asyncio.AbstractEventLoop, ArqRedis] = {}
+        self._locks: dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+
+    async def get_pool(self) -> ArqRedis:
+        """Return this event loop's pool, creating it once."""
+        loop = asyncio.get_running_loop()
+        pool = self._pools.get(loop)
+        if pool is not None:
+            return pool
+        lock = self._locks.setdefault(loop, asyncio.Lock())
+        async with lock:
+            pool = self._pools.get(loop)
+            if pool is None:
+                pool = await create_pool(
+                    RedisSettings.from_dsn(settings.redis_url),
+                    default_queue_name=QUEUE_NAME,
+                )
+                self._pools[loop] = pool
+        return pool
+
+    async def enqueue(
+        self,
+        function: str,
+        *args,
+        job_id: str | None = None,
+        defer_by: timedelta | None = None,
+    ) -> bool:
+        """Enqueue one job with arq's own uniqueness rules.
+
+        Returns ``False`` if a job with ``job_id`` already exists.
+        """
+        pool = await self.get_pool()
+        job = await pool.enqueue_job(
+            function,
+            *args,
+            _job_id=job_id,
+            _defer_by=defer_by,
+            _queue_name=QUEUE_NAME,
+        )
+        return job is not None
+
+    async def enqueue_unique(
+        self,
+        function: str,
+        *args,
+        job_id: str,
+        defer_by: timedelta | None = None,
+    ) -> bool:
+        """Enqueue one job under a deterministic id.
+
+        Collapses into a queued job with the same id; while that job runs,
+        at most one follow-up is queued behind it. Unlike ``enqueue``, a
+        finished job's kept result never blocks a new run. Returns
+        ``False`` when the call collapsed.
+        """
+        pool = await self.get_pool()
+        defer_ms = int(defer_by.total_seconds() * 1000) if defer_by else 0
+        queued = await pool.eval(
+            *_unique_enqueue_call(
+                pool,
+                function,
+                args,
+                job_id=job_id,
+                enqueue_time_ms=timestamp_ms(),
+                defer_ms=defer_ms,
+            )
+        )
+        return bool(queued)
+
+    async def enqueue_interview_processing(
+        self,
+        interview_ids: Iterable[uuid.UUID | str],
+    ) -> int:
+        """Queue ``process_interview_job`` for each interview in one round trip.
+
+        Safe to call repeatedly: an interview whose job is still queued is
+        skipped. Returns the number of jobs actually queued.
+        """
+        ids = list(dict.fromkeys(str(interview_id) for interview_id in interview_ids))
+        if not ids:
+            return 0
+
+        pool = await self.get_pool()
+        enqueue_time_ms = timestamp_ms()
+        async with pool.pipeline(transaction=False) as pipe:
+            for interview_id in ids:
+                pipe.eval(
+                    *_unique_enqueue_call(
+                        pool,
+                        PROCESS_INTERVIEW_JOB,
+                        (interview_id,),
+                        job_id=interview_job_id(interview_id),
+                        enqueue_time_ms=enqueue_time_ms,
+                    )
+                )
+            results = await pipe.execute()
+
+        queued = sum(int(result) for result in results)
+        logger.debug(
+            "Enqueued %d of %d interview processing jobs", queued, len(ids)
+        )
+        return queued
+
+    async def aclose(self) -> None:
+        """Close the pool owned by the running loop and forget the rest."""
+        loop = asyncio.get_running_loop()
+        pools = list(self._pools.items())
+        self._pools.clear()
+        self._locks.clear()
+        for pool_loop, pool in pools:
+            if pool_loop is loop:
+                await pool.aclose()
+
+
+job_dispatcher = JobDispatcher()
+
+
+async def enqueue_interview_processing(interview_ids: Iterable[uuid.UUID | str]) -> int:
+    """Shortcut for ``job_dispatcher.enqueue_interview_processing``."""
+    return await job_dispatcher.enqueue_interview_processing(interview_ids)
+
+
+async def close_job_dispatcher() -> None:
+    """Lifecycle hook for API shutdown."""
+    await job_dispatcher.aclose()
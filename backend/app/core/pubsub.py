@@ -54,6 +54,30 @@ async def publish_status(
     logger.debug(f"Published status: {status} for interview {interview_id}")
 
 
+async def publish_import_progress(
+    user_id: str,
+    sync_run_id: str,
+    status: str,
+    message: str,
+    extra: dict | None = None,
+) -> None:
+    """Publish survey import progress on the user's processing channel.
+
+    Messages carry ``type: "survey_import"`` and no ``interview_id``, so
+    interview status listeners ignore them.
+    """
+    r = _get_redis()
+    payload = {
+        "type": "survey_import",
+        "sync_run_id": str(sync_run_id),
+        "status": status,
+        "message": message,
+    }
+    if extra:
+        payload.update(extra)
+    await r.publish(_channel_name(str(user_id)), json.dumps(payload))
+
+
 async def subscribe_user(user_id: str) -> AsyncGenerator[dict, None]:
     """
     Async generator that yields processing status messages for a user.
@@ -0,0 +1,139 @@
+"""
+Spec10x Backend — Shared Provider Rate Limits
+
+Token buckets kept in Redis, one per provider account (a Zendesk
+subdomain, a PostHog project, a Fireflies or Otter connection), so every
+API process and worker draws from the same request budget that the
+upstream enforces instead of each discovering the limit through a 429.
+
+A 429's ``Retry-After`` pauses that account's bucket for every process;
+other accounts on the same provider keep syncing. The limiter fails open: if Redis is unreachable, requests go straight through
+and the provider's own 429 handling still applies.
+"""
+
+import asyncio
+import logging
+import time
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Requests per minute and burst size per provider account, kept below the
+# published limits so retries and validation calls still fit.
+PROVIDER_RATE_LIMITS: dict[str, tuple[float, int]] = {
+    "zendesk": (9.0, 3),  # Incremental Export API: 10 requests/minute
+    "fireflies": (50.0, 10),
+    "otter": (50.0, 10),
+    "posthog": (100.0, 10),  # Query API: 120 requests/minute
+}
+
+# How long to stop trying Redis after it fails before retrying it.
+_REDIS_RETRY_AFTER_SECONDS = 30.0
+
+# KEYS[1] bucket hash, KEYS[2] pause key; ARGV rate/sec, burst, now (ms).
+# Returns 0 when a token was taken, otherwise the wait in milliseconds.
+_TOKEN_BUCKET_SCRIPT = """
+local paused = redis.call('PTTL', KEYS[2])
+if paused > 0 then
+    return paused
+end
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(now - ts, 0) * rate / 1000)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = math.ceil((1 - tokens) * 1000 / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst * 1000 / rate) + 1000)
+return wait
+"""
+
+
+def _bucket_key(provider: str, account: str) -> str:
+    return f"spec10x:ratelimit:{provider}:{account}"
+
+
+def _pause_key(provider: str, account: str) -> str:
+    return f"spec10x:ratelimit:{provider}:{account}:paused"
+
+
+class ProviderRateLimiter:
+    """Redis token buckets shared by every process calling a provider account."""
+
+    def __init__(
+        self,
+        limits: dict[str, tuple[float, int]] = PROVIDER_RATE_LIMITS,
+        *,
+        enabled: bool = True,
+    ) -> None:
+        self.limits = limits
+        self.enabled = enabled
+        self._clients: dict[asyncio.AbstractEventLoop, aioredis.Redis] = {}
+        self._redis_down_until = 0.0
+
+    def _redis(self) -> aioredis.Redis:
+        # redis.asyncio connections are bound to their event loop.
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = aioredis.from_url(settings.redis_url)
+            self._clients[loop] = client
+        return client
+
+    def _available(self) -> bool:
+        return self.enabled and time.monotonic() >= self._redis_down_until
+
+    def _redis_failed(self, exc: Exception) -> None:
+        self._redis_down_until = time.monotonic() + _REDIS_RETRY_AFTER_SECONDS
+        logger.warning("Provider rate limiter unavailable, failing open: %s", exc)
+
+    async def reserve(self, provider: str, account: str) -> float:
+        """Take one request token from ``account``'s budget on ``provider``.
+
+        Returns the seconds to wait first (0 if none).
+        """
+        limit = self.limits.get(provider)
+        if limit is None or not self._available():
+            return 0.0
+        per_minute, burst = limit
+        try:
+            redis = self._redis()
+            wait_ms = await redis.eval(
+                _TOKEN_BUCKET_SCRIPT,
+                2,
+                _bucket_key(provider, account),
+                _pause_key(provider, account),
+                per_minute / 60.0,
+                burst,
+                int(time.time() * 1000),
+            )
+        except (RedisError, OSError) as exc:
+            self._redis_failed(exc)
+            return 0.0
+        return int(wait_ms) / 1000.0
+
+    async def pause(self, provider: str, account: str, seconds: float) -> None:
+        """Hold every caller off ``account`` on ``provider`` for ``seconds`` (after a 429)."""
+        if seconds <= 0 or not self._available():
+            return
+        try:
+            await self._redis().set(
+                _pause_key(provider, account), "1", px=int(seconds * 1000)
+            )
+        except (RedisError, OSError) as exc:
+            self._redis_failed(exc)
+
+
+provider_rate_limiter = ProviderRateLimiter(enabled=settings.connector_rate_limits_enabled)
@@ -0,0 +1,247 @@
+"""
+Spec10x Backend — Shared Response Cache
+
+Computed views (theme board, trends, home dashboard, spec outcomes) are
+identical for every member of a workspace, so their serialized payloads
+are kept in Redis and shared across members and API processes.
+
+Keys embed the data-pool ETag from ``app.core.data_version`` — workspace
+owner, ``data_version``, path, query params and the UTC hour; views that
+take no parameters use a key without the path, so every route serving the
+view shares one entry. Every
+committed write that changes the underlying data bumps ``data_version``,
+which retires all of the workspace's keys at once; TTLs only reclaim
+memory.
+
+Stampedes are collapsed twice: concurrent requests in one process share a
+single computation, and across processes a short Redis lock lets one
+computation run while the others wait for its result. Like the provider
+rate limiter, the cache fails open — if Redis is unreachable, views are
+computed directly.
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import redis.asyncio as aioredis
+from fastapi.encoders import jsonable_encoder
+from redis.exceptions import RedisError
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_KEY_PREFIX = "spec10x:cache"
+_STATS_KEY = f"{_KEY_PREFIX}:stats"
+OUTCOMES = ("hit", "miss", "coalesced")
+
+# How long one computation may hold a view's lock, and how often waiters
+# check whether it has finished.
+_LOCK_TTL_SECONDS = 30.0
+_WAIT_POLL_SECONDS = 0.05
+
+# How long to stop trying Redis after it fails before retrying it.
+_REDIS_RETRY_AFTER_SECONDS = 30.0
+
+# KEYS[1] lock key; ARGV[1] owner token. Deletes the lock only if we hold it.
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def _cache_key(view: str, key: str) -> str:
+    return f"{_KEY_PREFIX}:{view}:{key}"
+
+
+def etag_cache_key(etag: str) -> str:
+    """Cache key fragment from a data-version ETag (``W/"<v>-<digest>"``)."""
+    return etag.removeprefix("W/").strip('"')
+
+
+class ResponseCache:
+    """Redis cache of serialized view payloads with stampede protection."""
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = True,
+        lock_ttl_seconds: float = _LOCK_TTL_SECONDS,
+        wait_poll_seconds: float = _WAIT_POLL_SECONDS,
+    ) -> None:
+        self.enabled = enabled
+        self.lock_ttl_seconds = lock_ttl_seconds
+        self.wait_poll_seconds = wait_poll_seconds
+        self._clients: dict[asyncio.AbstractEventLoop, aioredis.Redis] = {}
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._redis_down_until = 0.0
+
+    def _redis(self) -> aioredis.Redis:
+        # redis.asyncio connections are bound to their event loop.
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = aioredis.from_url(settings.redis_url)
+            self._clients[loop] = client
+        return client
+
+    def _available(self) -> bool:
+        return self.enabled and time.monotonic() >= self._redis_down_until
+
+    def _redis_failed(self, exc: Exception) -> None:
+        self._redis_down_until = time.monotonic() + _REDIS_RETRY_AFTER_SECONDS
+        logger.warning("Response cache unavailable, computing directly: %s", exc)
+
+    async def _record(self, view: str, outcome: str) -> None:
+        if not self._available():
+            return
+        try:
+            await self._redis().hincrby(_STATS_KEY, f"{view}:{outcome}", 1)
+        except (RedisError, OSError) as exc:
+            self._redis_failed(exc)
+
+    async def _read(self, cache_key: str) -> Any | None:
+        raw = await self._redis().get(cache_key)
+        return json.loads(raw) if raw is not None else None
+
+    async def get_or_compute(
+        self,
+        view: str,
+        key: str,
+        *,
+        ttl_seconds: int,
+        compute: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """The cached payload for ``view``/``key``, computing it at most once.
+
+        Payloads are returned in their JSON-decoded form on hits and misses
+        alike, so callers see the same shape either way.
+        """
+        if not self._available():
+            return jsonable_encoder(await compute())
+
+        cache_key = _cache_key(view, key)
+        try:
+            cached = await self._read(cache_key)
+        except (RedisError, OSError) as exc:
+            self._redis_failed(exc)
+            return jsonable_encoder(await compute())
+        if cached is not None:
+            await self._record(view, "hit")
+            return cached
+
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            payload = await asyncio.shield(inflight)
+            if payload is None:
+                # The leading computation failed; this request computes its own.
+                return jsonable_encoder(await compute())
+            await self._record(view, "coalesced")
+            return payload
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            payload = await self._compute_once(view, cache_key, ttl_seconds, compute)
+        except BaseException:
+            future.set_result(None)
+            raise
+        else:
+            future.set_result(payload)
+            return payload
+        finally:
+            self._inflight.pop(cache_key, None)
+
+    async def _compute_once(
+        self,
+        view: str,
+        cache_key: str,
+        ttl_seconds: int,
+        compute: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        lock_key = f"{cache_key}:lock"
+        token = uuid.uuid4().hex
+        acquired = False
+        try:
+            acquired = bool(
+                await self._redis().set(
+                    lock_key, token, nx=True, px=int(self.lock_ttl_seconds * 1000)
+                )
+            )
+            if not acquired:
+                payload = await self._wait_for_payload(cache_key)
+                if payload is not None:
+                    await self._record(view, "coalesced")
+                    return payload
+        except (RedisError, OSError) as exc:
+            self._redis_failed(exc)
+            return jsonable_encoder(await compute())
+
+        # Holding the lock — or the holder outlived it, so compute anyway.
+        try:
+            payload = jsonable_encoder(await compute())
+            try:
+                await self._redis().set(cache_key, json.dumps(payload), ex=ttl_seconds)
+            except (RedisError, OSError) as exc:
+                self._redis_failed(exc)
+        finally:
+            if acquired:
+                await self._release_lock(lock_key, token)
+        await self._record(view, "miss")
+        return payload
+
+    async def _release_lock(self, lock_key: str, token: str) -> None:
+        try:
+            await self._redis().eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+        except (RedisError, OSError) as exc:
+            self._redis_failed(exc)
+
+    async def _wait_for_payload(self, cache_key: str) -> Any | None:
+        deadline = time.monotonic() + self.lock_ttl_seconds
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.wait_poll_seconds)
+            payload = await self._read(cache_key)
+            if payload is not None:
+                return payload
+            if not await self._redis().exists(f"{cache_key}:lock"):
+                # The holder gave up without storing a payload.
+                return None
+        return None
+
+    async def ping(self) -> bool:
+        """Whether the cache is enabled and Redis answers."""
+        if not self.enabled:
+            return False
+        try:
+            return bool(await self._redis().ping())
+        except (RedisError, OSError) as exc:
+            self._redis_failed(exc)
+            return False
+
+    async def stats(self) -> dict[str, dict[str, int]]:
+        """Hit/miss/coalesced counts per view since the counters were created."""
+        if not self.enabled:
+            return {}
+        try:
+            raw = await self._redis().hgetall(_STATS_KEY)
+        except (RedisError, OSError) as exc:
+            self._redis_failed(exc)
+            return {}
+        counts: dict[str, dict[str, int]] = {}
+        for field, value in raw.items():
+            view, _, outcome = (
+                field.decode() if isinstance(field, bytes) else field
+            ).rpartition(":")
+            counts.setdefault(view, dict.fromkeys(OUTCOMES, 0))[outcome] = int(value)
+        return counts
+
+
+response_cache = ResponseCache(enabled=settings.response_cache_enabled)
@@ -7,6 +7,7 @@ Provides signed URL generation for direct browser uploads.
 
 import logging
 from datetime import timedelta
+from typing import BinaryIO
 
 from app.core.config import get_settings
 
@@ -191,6 +192,40 @@ def download_file(object_name: str, local_path: str) -> str:
         raise ValueError(f"Unknown storage backend: {settings.storage_backend}")
 
 
+def upload_fileobj(object_name: str, fileobj: BinaryIO, length: int) -> str:
+    """
+    Upload a server-side file object to storage, streaming from disk.
+
+    Args:
+        object_name: The storage path/key
+        fileobj: Readable binary file object, read from its start
+        length: Size of the file in bytes
+
+    Returns:
+        The storage path
+    """
+    fileobj.seek(0)
+    if settings.storage_backend == "minio":
+        client = _get_minio_client()
+        client.put_object(
+            bucket_name=settings.minio_bucket,
+            object_name=object_name,
+            data=fileobj,
+            length=length,
+        )
+        return object_name
+
+    elif settings.storage_backend == "gcs":
+        client = _get_gcs_client()
+        bucket = client.bucket(settings.gcs_bucket)
+        blob = bucket.blob(object_name)
+        blob.upload_from_file(fileobj, size=length)
+        return object_name
+
+    else:
+        raise ValueError(f"Unknown storage backend: {settings.storage_backend}")
+
+
 def delete_file(object_name: str) -> None:
     """Delete a file from storage."""
     if settings.storage_backend == "minio":
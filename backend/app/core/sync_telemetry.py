@@ -0,0 +1,143 @@
+"""
+Spec10x Backend — Per-phase Sync Telemetry
+
+The sync orchestrator opens a ``SyncTelemetry`` collector for each run;
+connectors, the shared HTTP clients and the persistence layer record into
+whichever collector is active in the current context. Outside a sync
+every helper here is a no-op.
+
+Phase times are exclusive: a phase nested inside another (theme matching
+inside persist, rate-limit waits inside fetch) is not counted twice.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+import httpx
+
+PHASES = ("fetch", "throttle_wait", "normalize", "persist", "theme_match")
+
+
+@dataclass
+class SyncTelemetry:
+    phase_ms: dict[str, float] = field(default_factory=lambda: dict.fromkeys(PHASES, 0.0))
+    pages_fetched: int = 0
+    http_requests: int = 0
+    http_retries: int = 0
+    bytes_received: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        payload = {f"{phase}_ms": round(ms) for phase, ms in self.phase_ms.items()}
+        payload.update(
+            pages_fetched=self.pages_fetched,
+            http_requests=self.http_requests,
+            http_retries=self.http_retries,
+            bytes_received=self.bytes_received,
+        )
+        return payload
+
+
+@dataclass
+class _PhaseFrame:
+    child_ms: float = 0.0
+
+
+_current_telemetry: ContextVar[SyncTelemetry | None] = ContextVar(
+    "sync_telemetry", default=None
+)
+_current_frame: ContextVar[_PhaseFrame | None] = ContextVar(
+    "sync_telemetry_frame", default=None
+)
+
+
+def current_telemetry() -> SyncTelemetry | None:
+    return _current_telemetry.get()
+
+
+@contextmanager
+def collect_sync_telemetry() -> Iterator[SyncTelemetry]:
+    """Make a fresh collector active for the enclosed sync run."""
+    telemetry = SyncTelemetry()
+    token = _current_telemetry.set(telemetry)
+    frame_token = _current_frame.set(None)
+    try:
+        yield telemetry
+    finally:
+        _current_frame.reset(frame_token)
+        _current_telemetry.reset(token)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """Add the enclosed block's exclusive wall time to ``phase``."""
+    telemetry = _current_telemetry.get()
+    if telemetry is None:
+        yield
+        return
+
+    parent = _current_frame.get()
+    frame = _PhaseFrame()
+    token = _current_frame.set(frame)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        _current_frame.reset(token)
+        telemetry.phase_ms[phase] = telemetry.phase_ms.get(phase, 0.0) + max(
+            elapsed_ms - frame.child_ms, 0.0
+        )
+        if parent is not None:
+            parent.child_ms += elapsed_ms
+
+
+def record_page() -> None:
+    telemetry = _current_telemetry.get()
+    if telemetry is not None:
+        telemetry.pages_fetched += 1
+
+
+async def record_http_request(request: httpx.Request) -> None:
+    """``httpx`` request event hook."""
+    telemetry = _current_telemetry.get()
+    if telemetry is not None:
+        telemetry.http_requests += 1
+
+
+class _CountingByteStream(httpx.AsyncByteStream):
+    """Adds a response body's bytes to a run's telemetry as they are read."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, telemetry: SyncTelemetry) -> None:
+        self._stream = stream
+        self._telemetry = telemetry
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            self._telemetry.bytes_received += len(chunk)
+            yield chunk
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+
+
+async def record_http_response(response: httpx.Response) -> None:
+    """``httpx`` response event hook — body size and retryable statuses.
+
+    Rate-limited and 5xx responses count as retries: the request is
+    repeated by a deferred run or the next scheduled sync. The body size
+    comes from ``Content-Length``; without one, bytes are counted as the
+    caller consumes the body, so the hook never buffers a streamed response.
+    """
+    telemetry = _current_telemetry.get()
+    if telemetry is None:
+        return
+    if response.status_code == 429 or response.status_code >= 500:
+        telemetry.http_retries += 1
+    content_length = response.headers.get("content-length", "")
+    if content_length.isdigit():
+        telemetry.bytes_received += int(content_length)
+    elif isinstance(response.stream, httpx.AsyncByteStream):
+        response.stream = _CountingByteStream(response.stream, telemetry)
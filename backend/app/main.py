@@ -5,10 +5,14 @@ Spec10x Backend — FastAPI Application Entry Point
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.core.auth import get_current_user
 from app.core.config import get_settings
+from app.core.http_clients import close_http_clients
+from app.core.jobs import close_job_dispatcher
+from app.core.response_cache import response_cache
 from app.api import (
     auth,
     users,
@@ -29,6 +33,7 @@ from app.api import (
     collections,
     specs,
     workspace,
+    shell,
 )
 
 settings = get_settings()
@@ -49,6 +54,8 @@ async def lifespan(app: FastAPI):
     logger.info(f"Database: {settings.database_url.split('@')[-1]}")
     yield
     logger.info("👋 Spec10x Backend shutting down...")
+    await close_http_clients()
+    await close_job_dispatcher()
 
 
 # Create FastAPI app
@@ -68,6 +75,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
 # Register API routers
@@ -90,6 +98,7 @@ app.include_router(saved_views.router)
 app.include_router(collections.router)
 app.include_router(specs.router)
 app.include_router(workspace.router)
+app.include_router(shell.router)
 
 
 @app.get("/health")
@@ -98,6 +107,22 @@ async def health_check():
     return {"status": "healthy", "version": "0.1.0"}
 
 
+@app.get("/health/cache")
+async def cache_health():
+    """Shared response cache liveness.
+
+    Unauthenticated, so it reports reachability only; the per-view counters
+    are served by ``/health/cache/stats``.
+    """
+    return {"enabled": response_cache.enabled, "reachable": await response_cache.ping()}
+
+
+@app.get("/health/cache/stats", dependencies=[Depends(get_current_user)])
+async def cache_stats():
+    """Shared response cache hit/miss/coalesced counters per view."""
+    return {"enabled": response_cache.enabled, "views": await response_cache.stats()}
+
+
 @app.get("/")
 async def root():
     """Root endpoint — API information."""
@@ -18,6 +18,7 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     Date,
+    Computed,
     Enum,
     ForeignKey,
     Index,
@@ -25,8 +26,8 @@ from sqlalchemy import (
     UniqueConstraint,
     func,
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from pgvector.sqlalchemy import Vector
 
 from app.core.database import Base
@@ -120,6 +121,7 @@ class SyncRunStatus(str, enum.Enum):
     running = "running"
     succeeded = "succeeded"
     failed = "failed"
+    deferred = "deferred"  # rate-limited; re-enqueued from its checkpoint
 
 
 class SignalKind(str, enum.Enum):
@@ -249,6 +251,12 @@ class Workspace(Base):
     kind: Mapped[WorkspaceKind] = mapped_column(
         Enum(WorkspaceKind, name="workspace_kind"), default=WorkspaceKind.personal
     )
+    # Bumped on every evidence write; heavy GETs derive their ETags from it
+    # (see app/core/data_version.py).
+    data_version: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    # The data_version at which native signals were last found complete;
+    # reads skip the signal consistency pass while it still matches.
+    signals_consistent_version: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -447,6 +455,8 @@ class SyncRun(Base):
     records_created: Mapped[int] = mapped_column(Integer, default=0)
     records_updated: Mapped[int] = mapped_column(Integer, default=0)
     records_unchanged: Mapped[int] = mapped_column(Integer, default=0)
+    # Per-phase timings (ms), pages, HTTP requests/retries and bytes received
+    telemetry: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     error_summary: Mapped[str | None] = mapped_column(Text, nullable=True)
     retry_of_run_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("sync_runs.id", ondelete="SET NULL"), nullable=True
@@ -512,6 +522,39 @@ class SourceItem(Base):
     )
 
 
+# Leading characters of ``Signal.content_text`` loaded for list excerpts;
+# one more is fetched so callers can tell whether the text was cut.
+SIGNAL_PREVIEW_CHARS = 280
+
+# ─── Full-text search ────────────────────────────────────
+# Generated ``search_vector`` columns, kept in sync by Postgres and served by
+# GIN indexes (see app/services/search.py). Long bodies are truncated so a
+# huge transcript can never exceed the tsvector size limit on write.
+
+SEARCH_TEXT_LIMIT = 500_000
+
+SIGNAL_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(author_or_speaker, '')), 'B') || "
+    f"setweight(to_tsvector('english', left(coalesce(content_text, ''), {SEARCH_TEXT_LIMIT})), 'C')"
+)
+INTERVIEW_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(filename, '')), 'A') || "
+    f"setweight(to_tsvector('english', left(coalesce(transcript, ''), {SEARCH_TEXT_LIMIT})), 'C')"
+)
+SPEAKER_SEARCH_VECTOR = (
+    "to_tsvector('english', coalesce(name, '') || ' ' || coalesce(speaker_label, ''))"
+)
+INSIGHT_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(quote, '')), 'B')"
+)
+
+# ``metadata_json.theme_match.theme_id`` as a generated column, so one
+# theme's evidence is an index range rather than a scan of the workspace.
+SIGNAL_THEME_MATCH_ID = "metadata_json #>> '{theme_match,theme_id}'"
+
+
 class Signal(Base):
     __tablename__ = "signals"
 
@@ -539,7 +582,12 @@ class Signal(Base):
     )
     occurred_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
     title: Mapped[str | None] = mapped_column(String(512), nullable=True)
-    content_text: Mapped[str] = mapped_column(Text)
+    # Heavy: load with ``undefer(Signal.content_text)`` where the full text
+    # is needed; lists read ``content_preview`` instead.
+    content_text: Mapped[str] = mapped_column(Text, deferred=True, deferred_raiseload=True)
+    content_preview: Mapped[str | None] = column_property(
+        func.left(content_text, SIGNAL_PREVIEW_CHARS + 1)
+    )
     author_or_speaker: Mapped[str | None] = mapped_column(String(255), nullable=True)
     sentiment: Mapped[str | None] = mapped_column(String(20), nullable=True)
     source_url: Mapped[str | None] = mapped_column(String(1024), nullable=True)
@@ -558,6 +606,13 @@ class Signal(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR, Computed(SIGNAL_SEARCH_VECTOR, persisted=True), deferred=True
+    )
+    theme_match_id: Mapped[str | None] = mapped_column(
+        Text, Computed(SIGNAL_THEME_MATCH_ID, persisted=True), nullable=True
+    )
+
     workspace: Mapped["Workspace"] = relationship(back_populates="signals")
     source_connection: Mapped["SourceConnection | None"] = relationship(
         back_populates="signals"
@@ -567,6 +622,22 @@ class Signal(Base):
     __table_args__ = (
         Index("ix_signals_workspace_source_type", "workspace_id", "source_type"),
         Index("ix_signals_workspace_occurred_at", "workspace_id", "occurred_at"),
+        Index("ix_signals_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_signals_workspace_feed_order",
+            "workspace_id",
+            "occurred_at",
+            "created_at",
+            "id",
+        ),
+        Index(
+            "ix_signals_workspace_theme_match_order",
+            "workspace_id",
+            "theme_match_id",
+            "occurred_at",
+            "created_at",
+            "id",
+        ),
     )
 
 
@@ -591,7 +662,10 @@ class Interview(Base):
         Enum(InterviewStatus, name="interview_status"),
         default=InterviewStatus.queued,
     )
-    transcript: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Heavy: load with ``undefer(Interview.transcript)`` where it is read.
+    transcript: Mapped[str | None] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_raiseload=True
+    )
     duration_seconds: Mapped[int | None] = mapped_column(Integer, nullable=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     metadata_json: Mapped[dict | None] = mapped_column(
@@ -606,6 +680,10 @@ class Interview(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR, Computed(INTERVIEW_SEARCH_VECTOR, persisted=True), deferred=True
+    )
+
     # Relationships
     user: Mapped["User"] = relationship(back_populates="interviews")
     workspace: Mapped["Workspace | None"] = relationship()
@@ -625,7 +703,9 @@ class Interview(Base):
     # Indexes
     __table_args__ = (
         Index("ix_interviews_user_status", "user_id", "status"),
+        Index("ix_interviews_user_updated_at", "user_id", "updated_at"),
         Index("ix_interviews_file_hash", "file_hash"),
+        Index("ix_interviews_search_vector", "search_vector", postgresql_using="gin"),
     )
 
 
@@ -645,6 +725,10 @@ class Speaker(Base):
     is_interviewer: Mapped[bool] = mapped_column(Boolean, default=False)
     auto_detected: Mapped[bool] = mapped_column(Boolean, default=False)
 
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR, Computed(SPEAKER_SEARCH_VECTOR, persisted=True), deferred=True
+    )
+
     # Relationships
     interview: Mapped["Interview"] = relationship(back_populates="speakers")
     insights: Mapped[list["Insight"]] = relationship(back_populates="speaker")
@@ -652,6 +736,11 @@ class Speaker(Base):
         back_populates="speaker"
     )
 
+    # Indexes
+    __table_args__ = (
+        Index("ix_speakers_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
 
 class Theme(Base):
     __tablename__ = "themes"
@@ -768,6 +857,10 @@ class Insight(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR, Computed(INSIGHT_SEARCH_VECTOR, persisted=True), deferred=True
+    )
+
     # Relationships
     user: Mapped["User"] = relationship(back_populates="insights")
     interview: Mapped["Interview"] = relationship(back_populates="insights")
@@ -778,6 +871,7 @@ class Insight(Base):
     __table_args__ = (
         Index("ix_insights_user_theme", "user_id", "theme_id"),
         Index("ix_insights_interview", "interview_id"),
+        Index("ix_insights_search_vector", "search_vector", postgresql_using="gin"),
     )
 
 
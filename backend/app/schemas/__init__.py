@@ -150,11 +150,13 @@ class InterviewLibraryItemResponse(BaseModel):
     insights_count: int
     themes_count: int
     theme_chips: list[InterviewThemeChipResponse] = []
+    search_snippet: Optional[str] = None
 
 
 class InterviewLibraryResponse(BaseModel):
     summary: InterviewLibrarySummaryResponse
     items: list[InterviewLibraryItemResponse] = []
+    next_offset: Optional[int] = None
 
 
 class InterviewBulkRequest(BaseModel):
@@ -262,6 +264,7 @@ class FeedSignalResponse(BaseModel):
     occurred_at: datetime
     title: Optional[str] = None
     excerpt: str
+    search_snippet: Optional[str] = None
     author_or_speaker: Optional[str] = None
     sentiment: Optional[str] = None
     theme_chip: Optional[ThemeChipResponse] = None
@@ -284,6 +287,7 @@ class SupportingEvidenceGroupResponse(BaseModel):
     label: str
     count: int
     items: list[FeedSignalResponse] = []
+    next_cursor: Optional[str] = None
 
 
 class ThemeDetailResponse(ThemeResponse):
@@ -500,6 +504,12 @@ class SyncRunResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class SyncRunDetailResponse(SyncRunResponse):
+    """Single run, with per-phase timings and HTTP counters."""
+
+    telemetry: Optional[dict] = None
+
+
 class SourceConnectionResponse(BaseModel):
     id: uuid.UUID
     workspace_id: uuid.UUID
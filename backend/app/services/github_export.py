@@ -14,6 +14,7 @@ import re
 
 import httpx
 
+from app.core.http_clients import get_http_client
 from app.models import Spec
 
 logger = logging.getLogger(__name__)
@@ -79,67 +80,64 @@ async def export_tasks_to_github(
         "X-GitHub-Api-Version": "2022-11-28",
     }
 
-    owns_client = client is None
-    if owns_client:
-        client = httpx.AsyncClient(timeout=20.0)
+    if client is None:
+        # Process-wide pooled client — shared, so never closed here. The
+        # token only ever travels in per-request headers.
+        client = get_http_client(GITHUB_API_BASE, timeout=20.0)
 
     fatal_error: str | None = None
-    try:
-        for task in tasks:
-            result = {
-                "number": task.get("number"),
-                "title": task.get("title", ""),
-                "status": "not_attempted",
-                "issue_url": task.get("issue_url"),
-                "error": None,
-            }
-            if task.get("issue_url"):
-                result["status"] = "already_exported"
-                results.append(result)
-                continue
-            if fatal_error is not None:
-                result["error"] = fatal_error
-                results.append(result)
-                continue
-
-            try:
-                response = await client.post(
-                    f"{GITHUB_API_BASE}/repos/{repo}/issues",
-                    headers=headers,
-                    json={
-                        "title": f"[Spec10x] {task.get('title', 'Untitled task')}",
-                        "body": _issue_body(spec, task),
-                    },
-                )
-            except httpx.HTTPError as exc:
-                # Never include headers/token in the logged error.
-                logger.warning(f"GitHub export request failed: {type(exc).__name__}")
-                fatal_error = "Could not reach the GitHub API."
-                result["status"] = "failed"
-                result["error"] = fatal_error
-                results.append(result)
-                continue
-
-            if response.status_code == 201:
-                payload = response.json()
-                task["issue_url"] = payload.get("html_url")
-                task["issue_number"] = payload.get("number")
-                result["status"] = "created"
-                result["issue_url"] = task["issue_url"]
-            else:
-                if response.status_code in (401, 403):
-                    message = "GitHub rejected the token (check its repo/issues scope)."
-                elif response.status_code == 404:
-                    message = f'Repository "{repo}" was not found (or the token cannot see it).'
-                else:
-                    message = f"GitHub API error (HTTP {response.status_code})."
-                result["status"] = "failed"
-                result["error"] = message
-                if response.status_code in _FATAL_STATUS:
-                    fatal_error = message
+    for task in tasks:
+        result = {
+            "number": task.get("number"),
+            "title": task.get("title", ""),
+            "status": "not_attempted",
+            "issue_url": task.get("issue_url"),
+            "error": None,
+        }
+        if task.get("issue_url"):
+            result["status"] = "already_exported"
+            results.append(result)
+            continue
+        if fatal_error is not None:
+            result["error"] = fatal_error
             results.append(result)
-    finally:
-        if owns_client:
-            await client.aclose()
+            continue
+
+        try:
+            response = await client.post(
+                f"{GITHUB_API_BASE}/repos/{repo}/issues",
+                headers=headers,
+                json={
+                    "title": f"[Spec10x] {task.get('title', 'Untitled task')}",
+                    "body": _issue_body(spec, task),
+                },
+            )
+        except httpx.HTTPError as exc:
+            # Never include headers/token in the logged error.
+            logger.warning(f"GitHub export request failed: {type(exc).__name__}")
+            fatal_error = "Could not reach the GitHub API."
+            result["status"] = "failed"
+            result["error"] = fatal_error
+            results.append(result)
+            continue
+
+        if response.status_code == 201:
+            payload = response.json()
+            task["issue_url"] = payload.get("html_url")
+            task["issue_number"] = payload.get("number")
+            result["status"] = "created"
+            result["issue_url"] = task["issue_url"]
+        else:
+            if response.status_code in (401, 403):
+                message = "GitHub rejected the token (check its repo/issues scope)."
+            elif response.status_code == 404:
+                message = f'Repository "{repo}" was not found (or the token cannot see it).'
+            else:
+                message = f"GitHub API error (HTTP {response.status_code})."
+            result["status"] = "failed"
+            result["error"] = message
+            if response.status_code in _FATAL_STATUS:
+                fatal_error = message
+        results.append(result)
 
     return results
@@ -4,15 +4,22 @@ Interview library query and serialization helpers.
 
 from __future__ import annotations
 
-from collections import Counter
+from collections import defaultdict
 from dataclasses import dataclass
 
-from sqlalchemy import select
+from sqlalchemy import and_, case, distinct, exists, func, or_, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only
 
-from app.models import Insight, Interview, InterviewStatus, User
+from app.models import Insight, Interview, InterviewStatus, Speaker, Theme, User
 from app.services.billing_limits import get_plan_limits
+from app.services.search import (
+    load_search_snippets,
+    matches,
+    normalize_search_query,
+    search_rank,
+    websearch_query,
+)
 from app.services.signals import NATIVE_PROVIDER, PROVIDER_LABELS
 
 
@@ -21,6 +28,15 @@ DISPLAY_DONE = "done"
 DISPLAY_ERROR = "error"
 DISPLAY_LOW_INSIGHT = "low_insight"
 
+LIBRARY_PAGE_SIZE = 50
+LIBRARY_MAX_PAGE_SIZE = 200
+
+_PROCESSING_STATUSES = (
+    InterviewStatus.queued,
+    InterviewStatus.transcribing,
+    InterviewStatus.analyzing,
+)
+
 
 @dataclass(slots=True)
 class InterviewLibraryRow:
@@ -32,28 +48,14 @@ class InterviewLibraryRow:
     insights_count: int
     themes_count: int
     theme_chips: list[dict[str, str]]
-    search_text: str
-
+    search_snippet: str | None = None
 
-def _display_status(interview: Interview, insights_count: int) -> str:
-    if interview.status == InterviewStatus.error:
-        return DISPLAY_ERROR
-    if interview.status in {
-        InterviewStatus.queued,
-        InterviewStatus.transcribing,
-        InterviewStatus.analyzing,
-    }:
-        return DISPLAY_PROCESSING
-    if interview.status == InterviewStatus.done and insights_count == 0:
-        return DISPLAY_LOW_INSIGHT
-    return DISPLAY_DONE
 
-
-def _participant_summary(interview: Interview) -> str | None:
+def _participant_summary(speakers: list[Speaker]) -> str | None:
     preferred_labels: list[str] = []
     fallback_labels: list[str] = []
 
-    for speaker in interview.speakers:
+    for speaker in speakers:
         label = (speaker.name or speaker.speaker_label or "").strip()
         if not label:
             continue
@@ -81,12 +83,6 @@ def _participant_summary(interview: Interview) -> str | None:
     return f"{unique_labels[0]}, {unique_labels[1]} +{len(unique_labels) - 2} more"
 
 
-def _source_provider(interview: Interview) -> str:
-    metadata = interview.metadata_json or {}
-    value = metadata.get("source_provider")
-    return str(value) if value else NATIVE_PROVIDER
-
-
 def _source_label(interview: Interview, provider: str) -> str:
     metadata = interview.metadata_json or {}
     value = metadata.get("source_label")
@@ -95,43 +91,6 @@ def _source_label(interview: Interview, provider: str) -> str:
     return PROVIDER_LABELS.get(provider, provider.replace("_", " ").title())
 
 
-def _theme_data(interview: Interview) -> tuple[int, list[dict[str, str]]]:
-    theme_names: dict[str, str] = {}
-
-    for insight in interview.insights:
-        if insight.is_dismissed or insight.theme_id is None or insight.theme is None:
-            continue
-        theme_id = str(insight.theme.id)
-        if theme_id not in theme_names:
-            theme_names[theme_id] = insight.theme.name
-
-    sorted_theme_items = sorted(
-        theme_names.items(),
-        key=lambda item: item[1].lower(),
-    )
-    return len(sorted_theme_items), [
-        {"id": theme_id, "name": theme_name}
-        for theme_id, theme_name in sorted_theme_items
-    ]
-
-
-def _build_search_text(interview: Interview, participant_summary: str | None) -> str:
-    parts = [interview.filename]
-    if participant_summary:
-        parts.append(participant_summary)
-    for speaker in interview.speakers:
-        if speaker.name:
-            parts.append(speaker.name)
-        if speaker.speaker_label:
-            parts.append(speaker.speaker_label)
-    for insight in interview.insights:
-        if insight.is_dismissed:
-            continue
-        parts.append(insight.title)
-        parts.append(insight.quote)
-    return " ".join(part.lower() for part in parts if part)
-
-
 def _serialize_row(row: InterviewLibraryRow) -> dict:
     interview = row.interview
     return {
@@ -151,55 +110,163 @@ def _serialize_row(row: InterviewLibraryRow) -> dict:
         "insights_count": row.insights_count,
         "themes_count": row.themes_count,
         "theme_chips": row.theme_chips,
+        "search_snippet": row.search_snippet,
     }
 
 
-def _sort_rows(rows: list[InterviewLibraryRow], sort: str) -> list[InterviewLibraryRow]:
-    if sort == "oldest":
-        return sorted(
-            rows,
-            key=lambda row: (
-                row.interview.created_at,
-                row.interview.updated_at,
-            ),
+# ── SQL building blocks ─────────────────────────────────
+
+def _source_provider_expr():
+    return func.coalesce(
+        func.nullif(Interview.metadata_json["source_provider"].as_string(), ""),
+        NATIVE_PROVIDER,
+    )
+
+
+def _insight_stats():
+    """Per-interview active insight and theme counts, as a LATERAL subquery.
+
+    The aggregate always yields one row, so interviews without insights get
+    zeros rather than NULLs; ``ix_insights_interview`` serves each lookup.
+    """
+    return (
+        select(
+            func.count(Insight.id).label("insights_count"),
+            func.count(distinct(Insight.theme_id)).label("themes_count"),
         )
-    if sort == "name":
-        return sorted(
-            rows,
-            key=lambda row: (
-                row.interview.filename.lower(),
-                row.interview.created_at,
-            ),
+        .where(
+            Insight.interview_id == Interview.id,
+            Insight.is_dismissed.is_(False),
         )
+        .lateral("insight_stats")
+    )
+
+
+def _display_status_expr(insights_count):
+    return case(
+        (Interview.status == InterviewStatus.error, DISPLAY_ERROR),
+        (Interview.status.in_(_PROCESSING_STATUSES), DISPLAY_PROCESSING),
+        (
+            and_(Interview.status == InterviewStatus.done, insights_count == 0),
+            DISPLAY_LOW_INSIGHT,
+        ),
+        else_=DISPLAY_DONE,
+    )
+
+
+def _search_clause(tsquery):
+    """Full-text match over what the library row shows: the filename and
+    transcript, speaker names and labels, and active insight titles and
+    quotes — each served by its table's GIN index."""
+    return or_(
+        matches(Interview.search_vector, tsquery),
+        exists().where(
+            Speaker.interview_id == Interview.id,
+            matches(Speaker.search_vector, tsquery),
+        ),
+        exists().where(
+            Insight.interview_id == Interview.id,
+            Insight.is_dismissed.is_(False),
+            matches(Insight.search_vector, tsquery),
+        ),
+    )
+
+
+def _order_by(sort: str, insights_count, themes_count, rank=None) -> list:
+    # ``id`` breaks ties so offset pages never overlap or skip rows.
+    if sort == "relevance" and rank is not None:
+        return [rank.desc(), Interview.updated_at.desc(), Interview.created_at.desc(), Interview.id.desc()]
+    if sort == "oldest":
+        return [Interview.created_at.asc(), Interview.updated_at.asc(), Interview.id.asc()]
+    if sort == "name":
+        return [func.lower(Interview.filename).asc(), Interview.created_at.asc(), Interview.id.asc()]
     if sort == "insights":
-        return sorted(
-            rows,
-            key=lambda row: (
-                row.insights_count,
-                row.interview.updated_at,
-                row.interview.created_at,
-            ),
-            reverse=True,
-        )
+        return [
+            insights_count.desc(),
+            Interview.updated_at.desc(),
+            Interview.created_at.desc(),
+            Interview.id.desc(),
+        ]
     if sort == "themes":
-        return sorted(
-            rows,
-            key=lambda row: (
-                row.themes_count,
-                row.insights_count,
-                row.interview.updated_at,
-                row.interview.created_at,
-            ),
-            reverse=True,
+        return [
+            themes_count.desc(),
+            insights_count.desc(),
+            Interview.updated_at.desc(),
+            Interview.created_at.desc(),
+            Interview.id.desc(),
+        ]
+    return [Interview.updated_at.desc(), Interview.created_at.desc(), Interview.id.desc()]
+
+
+# ── Page assembly ───────────────────────────────────────
+
+async def _load_speakers(
+    db: AsyncSession,
+    interview_ids: list,
+) -> dict:
+    result = await db.execute(
+        select(Speaker).where(Speaker.interview_id.in_(interview_ids))
+    )
+    speakers: dict = defaultdict(list)
+    for speaker in result.scalars().all():
+        speakers[speaker.interview_id].append(speaker)
+    return speakers
+
+
+async def _load_theme_chips(
+    db: AsyncSession,
+    interview_ids: list,
+) -> dict:
+    result = await db.execute(
+        select(Insight.interview_id, Theme.id, Theme.name)
+        .join(Theme, Theme.id == Insight.theme_id)
+        .where(
+            Insight.interview_id.in_(interview_ids),
+            Insight.is_dismissed.is_(False),
         )
-    return sorted(
-        rows,
-        key=lambda row: (
-            row.interview.updated_at,
-            row.interview.created_at,
-        ),
-        reverse=True,
+        .distinct()
+    )
+    chips: dict = defaultdict(list)
+    for interview_id, theme_id, theme_name in result.all():
+        chips[interview_id].append({"id": str(theme_id), "name": theme_name})
+    for interview_chips in chips.values():
+        interview_chips.sort(key=lambda chip: chip["name"].lower())
+    return chips
+
+
+async def _library_summary(db: AsyncSession, *, user: User) -> tuple[int, int, list[dict]]:
+    """Total count, storage used and per-source counts in one aggregate query."""
+    per_interview = (
+        select(
+            _source_provider_expr().label("provider"),
+            Interview.file_size_bytes,
+        )
+        .where(Interview.user_id == user.id)
+        .subquery()
+    )
+    result = await db.execute(
+        select(
+            per_interview.c.provider,
+            func.count(),
+            func.coalesce(func.sum(per_interview.c.file_size_bytes), 0),
+        ).group_by(per_interview.c.provider)
     )
+    rows = result.all()
+
+    available_sources = [
+        {
+            "provider": provider,
+            "label": PROVIDER_LABELS.get(provider, provider.replace("_", " ").title()),
+            "count": count,
+        }
+        for provider, count, _ in sorted(
+            rows,
+            key=lambda row: (row[0] != NATIVE_PROVIDER, row[0]),
+        )
+    ]
+    total_count = sum(count for _, count, _ in rows)
+    storage_bytes_used = sum(int(size) for _, _, size in rows)
+    return total_count, storage_bytes_used, available_sources
 
 
 async def build_interview_library(
@@ -207,93 +274,125 @@ async def build_interview_library(
     *,
     user: User,
     q: str | None = None,
-    sort: str = "recent",
+    sort: str | None = None,
     status_filter: str | None = None,
     source_filter: str | None = None,
+    limit: int = LIBRARY_PAGE_SIZE,
+    offset: int = 0,
 ) -> dict:
-    result = await db.execute(
-        select(Interview)
-        .where(Interview.user_id == user.id)
+    """One page of the interview library.
+
+    Counts, display status, search, filters and every sort order run in
+    Postgres; speakers, theme chips and search snippets are then loaded for
+    the page's interviews only, and transcripts are never read. Searches
+    default to relevance order.
+    """
+    stats = _insight_stats()
+    display_status = _display_status_expr(stats.c.insights_count)
+    source_provider = _source_provider_expr()
+
+    conditions = [Interview.user_id == user.id]
+    query = normalize_search_query(q)
+    rank = None
+    if query:
+        tsquery = websearch_query(query)
+        conditions.append(_search_clause(tsquery))
+        rank = search_rank(Interview.search_vector, tsquery)
+    sort = sort or ("relevance" if query else "recent")
+    if status_filter:
+        conditions.append(display_status == status_filter)
+    if source_filter:
+        conditions.append(source_provider == source_filter)
+
+    page_stmt = (
+        select(
+            Interview,
+            stats.c.insights_count,
+            stats.c.themes_count,
+            display_status.label("display_status"),
+            source_provider.label("source_provider"),
+        )
+        .join(stats, true())
+        .where(*conditions)
         .options(
-            selectinload(Interview.speakers),
-            selectinload(Interview.insights).selectinload(Insight.theme),
+            load_only(
+                Interview.id,
+                Interview.filename,
+                Interview.file_type,
+                Interview.created_at,
+                Interview.updated_at,
+                Interview.duration_seconds,
+                Interview.file_size_bytes,
+                Interview.status,
+                Interview.error_message,
+                Interview.metadata_json,
+            )
         )
+        .order_by(*_order_by(sort, stats.c.insights_count, stats.c.themes_count, rank))
+        .limit(limit + 1)
+        .offset(offset)
     )
-    interviews = list(result.scalars().all())
-
-    all_rows: list[InterviewLibraryRow] = []
-    for interview in interviews:
-        active_insights = [
-            insight for insight in interview.insights
-            if not insight.is_dismissed
-        ]
-        insights_count = len(active_insights)
-        themes_count, theme_chips = _theme_data(interview)
-        participant_summary = _participant_summary(interview)
-        source_provider = _source_provider(interview)
-        source_label = _source_label(interview, source_provider)
-        all_rows.append(
-            InterviewLibraryRow(
-                interview=interview,
-                display_status=_display_status(interview, insights_count),
-                participant_summary=participant_summary,
-                source_provider=source_provider,
-                source_label=source_label,
-                insights_count=insights_count,
-                themes_count=themes_count,
-                theme_chips=theme_chips,
-                search_text=_build_search_text(interview, participant_summary),
+    page = (await db.execute(page_stmt)).all()
+    has_more = len(page) > limit
+    page = page[:limit]
+
+    total_count, storage_bytes_used, available_sources = await _library_summary(db, user=user)
+    if len(conditions) == 1:
+        filtered_count = total_count
+    elif offset == 0 and not has_more:
+        filtered_count = len(page)
+    else:
+        filtered_count = (
+            await db.execute(
+                select(func.count())
+                .select_from(Interview)
+                .join(stats, true())
+                .where(*conditions)
             )
+        ).scalar_one()
+
+    interview_ids = [row.Interview.id for row in page]
+    speakers = await _load_speakers(db, interview_ids) if interview_ids else {}
+    chips = await _load_theme_chips(db, interview_ids) if interview_ids else {}
+    snippets = (
+        await load_search_snippets(
+            db,
+            id_column=Interview.id,
+            document=Interview.transcript,
+            ids=interview_ids,
+            q=query,
         )
+        if query
+        else {}
+    )
 
-    filtered_rows = all_rows
-    if q:
-        query = q.strip().lower()
-        if query:
-            filtered_rows = [
-                row for row in filtered_rows
-                if query in row.search_text
-            ]
-
-    if status_filter:
-        filtered_rows = [
-            row for row in filtered_rows
-            if row.display_status == status_filter
-        ]
-
-    if source_filter:
-        filtered_rows = [
-            row for row in filtered_rows
-            if row.source_provider == source_filter
-        ]
-
-    sorted_rows = _sort_rows(filtered_rows, sort)
-
-    source_counts = Counter(row.source_provider for row in all_rows)
-    available_sources = [
-        {
-            "provider": provider,
-            "label": PROVIDER_LABELS.get(provider, provider.replace("_", " ").title()),
-            "count": count,
-        }
-        for provider, count in sorted(
-            source_counts.items(),
-            key=lambda item: (item[0] != NATIVE_PROVIDER, item[0]),
+    rows = [
+        InterviewLibraryRow(
+            interview=row.Interview,
+            display_status=row.display_status,
+            participant_summary=_participant_summary(speakers.get(row.Interview.id, [])),
+            source_provider=row.source_provider,
+            source_label=_source_label(row.Interview, row.source_provider),
+            insights_count=row.insights_count,
+            themes_count=row.themes_count,
+            theme_chips=chips.get(row.Interview.id, []),
+            search_snippet=snippets.get(row.Interview.id),
         )
+        for row in page
     ]
 
     limits = get_plan_limits(user.plan)
-    storage_bytes_used = sum(interview.file_size_bytes for interview in interviews)
 
     return {
         "summary": {
-            "total_count": len(all_rows),
-            "filtered_count": len(sorted_rows),
+            "total_count": total_count,
+            "filtered_count": filtered_count,
             "storage_bytes_used": storage_bytes_used,
             "storage_bytes_limit": limits["storage_bytes"],
             "plan": user.plan,
-            "has_data": bool(all_rows),
+            "has_data": bool(total_count),
             "available_sources": available_sources,
         },
-        "items": [_serialize_row(row) for row in sorted_rows],
+        "items": [_serialize_row(row) for row in rows],
+        "next_offset": offset + limit if has_more else None,
     }
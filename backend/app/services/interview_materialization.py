@@ -26,6 +26,8 @@ from datetime import datetime, timezone
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.data_version import bump_data_version
+from app.core.jobs import enqueue_interview_processing
 from app.models import (
     FileType,
     Insight,
@@ -38,7 +40,7 @@ from app.models import (
     TranscriptChunk,
     Workspace,
 )
-from app.services.sources import upsert_source_item
+from app.services.sources import bulk_upsert_source_items, touch_source_items
 
 logger = logging.getLogger(__name__)
 
@@ -64,21 +66,13 @@ def meeting_checksum(meeting: MaterializedMeeting) -> str:
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
-async def _enqueue_processing(interview_id: str) -> None:
-    """Enqueue the standard interview processing job.
+async def _enqueue_processing(interview_ids: list[str]) -> None:
+    """Enqueue the standard interview processing job for each interview.
 
-    Lazy import — ``app.api.interviews`` owns the shared arq pool, and this
-    module is imported during connector auto-discovery, before the API
-    modules finish loading.
+    One pipelined round trip for the whole list; an interview whose job is
+    still queued is skipped.
     """
-    from app.api.interviews import _get_arq_pool
-
-    pool = await _get_arq_pool()
-    await pool.enqueue_job(
-        "process_interview_job",
-        interview_id,
-        _queue_name="spec10x:jobs",
-    )
+    await enqueue_interview_processing(interview_ids)
 
 
 def _build_interview_metadata(meeting: MaterializedMeeting) -> dict:
@@ -95,73 +89,172 @@ def _build_interview_metadata(meeting: MaterializedMeeting) -> dict:
     return metadata
 
 
-async def _reset_interview_analysis(
+async def _reset_interviews_analysis(
     db: AsyncSession,
-    interview: Interview,
+    interview_ids: list[uuid.UUID],
 ) -> None:
-    """Clear derived analysis so a changed transcript can reprocess cleanly."""
+    """Clear derived analysis so changed transcripts can reprocess cleanly."""
+    if not interview_ids:
+        return
     # Lazy import: app.services.signals imports the connector package, which
     # imports this module during auto-discovery.
-    from app.services.signals import cleanup_interview_native_signals
+    from app.services.signals import cleanup_interviews_native_signals
 
-    await cleanup_interview_native_signals(db, interview_id=interview.id)
+    await cleanup_interviews_native_signals(db, interview_ids=interview_ids)
     await db.execute(
-        delete(TranscriptChunk).where(TranscriptChunk.interview_id == interview.id)
+        delete(TranscriptChunk).where(TranscriptChunk.interview_id.in_(interview_ids))
     )
-    await db.execute(delete(Insight).where(Insight.interview_id == interview.id))
-    await db.execute(delete(Speaker).where(Speaker.interview_id == interview.id))
+    await db.execute(delete(Insight).where(Insight.interview_id.in_(interview_ids)))
+    await db.execute(delete(Speaker).where(Speaker.interview_id.in_(interview_ids)))
 
 
-async def materialize_meeting(
+def _source_item_row(
+    meeting: MaterializedMeeting,
+    *,
+    checksum: str,
+    interview_id: uuid.UUID,
+) -> dict:
+    return {
+        "external_id": meeting.external_id,
+        "source_record_type": SOURCE_RECORD_TYPE,
+        "external_updated_at": meeting.occurred_at,
+        "native_entity_type": "interview",
+        "native_entity_id": interview_id,
+        "checksum": checksum,
+    }
+
+
+def _source_item_matches(item: SourceItem, row: dict) -> bool:
+    """Whether writing ``row`` would change anything but ``last_seen_at``."""
+    return all(getattr(item, key) == value for key, value in row.items())
+
+
+async def _preload_meeting_state(
+    db: AsyncSession,
+    *,
+    connection: SourceConnection,
+    external_ids: list[str],
+) -> tuple[dict[str, SourceItem], dict[uuid.UUID, Interview]]:
+    """Load a batch's existing source items and their interviews (two queries)."""
+    if not external_ids:
+        return {}, {}
+    items_result = await db.execute(
+        select(SourceItem)
+        .where(
+            SourceItem.source_connection_id == connection.id,
+            SourceItem.external_id.in_(external_ids),
+        )
+        # Earlier batches write source items in bulk, behind the identity map.
+        .execution_options(populate_existing=True)
+    )
+    items = {item.external_id: item for item in items_result.scalars().all()}
+
+    interview_ids = [
+        item.native_entity_id for item in items.values() if item.native_entity_id is not None
+    ]
+    interviews: dict[uuid.UUID, Interview] = {}
+    if interview_ids:
+        interviews_result = await db.execute(
+            select(Interview).where(Interview.id.in_(interview_ids))
+        )
+        interviews = {interview.id: interview for interview in interviews_result.scalars().all()}
+    return items, interviews
+
+
+async def _materialize_batch(
     db: AsyncSession,
     *,
     connection: SourceConnection,
     owner_user_id: uuid.UUID,
-    meeting: MaterializedMeeting,
-) -> str:
-    """Upsert one upstream meeting as a native interview.
+    meetings: list[MaterializedMeeting],
+) -> tuple[list[str], list[str]]:
+    """Upsert meetings as native interviews in a fixed number of round trips.
 
-    Returns one of ``"created"``, ``"updated"``, ``"unchanged"``.
-    """
-    checksum = meeting_checksum(meeting)
+    Every meeting is classified in memory against the preloaded state —
+    ``"created"``, ``"updated"`` or ``"unchanged"`` (which includes
+    tombstones: synced interviews the user deleted are not recreated).
+    The changes are then written together: one analysis reset for all
+    changed transcripts, one flush for new and edited interviews, a bulk
+    source-item upsert, and a bulk ``last_seen_at`` touch for the rest.
 
-    existing_stmt = select(SourceItem).where(
-        SourceItem.source_connection_id == connection.id,
-        SourceItem.external_id == meeting.external_id,
+    Returns each meeting's action and the interview ids to process.
+    """
+    items, interviews = await _preload_meeting_state(
+        db,
+        connection=connection,
+        external_ids=list({meeting.external_id for meeting in meetings}),
     )
-    existing_result = await db.execute(existing_stmt)
-    existing_item = existing_result.scalar_one_or_none()
-
-    if existing_item is not None:
-        interview = (
-            await db.get(Interview, existing_item.native_entity_id)
-            if existing_item.native_entity_id
-            else None
+    # external_id -> (checksum, interview); interview ``None`` is a tombstone.
+    state: dict[str, tuple[str | None, Interview | None]] = {
+        external_id: (
+            item.checksum,
+            interviews.get(item.native_entity_id) if item.native_entity_id else None,
         )
+        for external_id, item in items.items()
+    }
 
+    actions: list[str] = []
+    to_process: list[str] = []
+    new_interview_ids: set[uuid.UUID] = set()
+    reset_interview_ids: list[uuid.UUID] = []
+    item_rows: dict[str, dict] = {}
+    touched: list[str] = []
+
+    for meeting in meetings:
+        external_id = meeting.external_id
+        checksum = meeting_checksum(meeting)
+
+        if external_id not in state:
+            interview = Interview(
+                id=uuid.uuid4(),
+                user_id=owner_user_id,
+                filename=meeting.title or f"{meeting.provider} meeting",
+                file_type=FileType.txt,
+                file_size_bytes=len(meeting.transcript_text.encode("utf-8")),
+                storage_path="",
+                transcript=meeting.transcript_text,
+                duration_seconds=meeting.duration_seconds,
+                file_hash=checksum,
+                metadata_json=_build_interview_metadata(meeting),
+                status=InterviewStatus.queued,
+            )
+            db.add(interview)
+            new_interview_ids.add(interview.id)
+            state[external_id] = (checksum, interview)
+            item_rows[external_id] = _source_item_row(
+                meeting, checksum=checksum, interview_id=interview.id
+            )
+            actions.append("created")
+            to_process.append(str(interview.id))
+            logger.info(
+                "Materialized interview created: provider=%s external_id=%s interview=%s",
+                meeting.provider,
+                external_id,
+                interview.id,
+            )
+            continue
+
+        known_checksum, interview = state[external_id]
         if interview is None:
             # The user deleted this synced interview — respect that and
             # keep the tombstone so the meeting is not recreated.
-            existing_item.last_seen_at = datetime.now(timezone.utc)
-            await db.flush()
-            return "unchanged"
-
-        if existing_item.checksum == checksum:
-            await upsert_source_item(
-                db,
-                workspace_id=connection.workspace_id,
-                source_connection_id=connection.id,
-                external_id=meeting.external_id,
-                source_record_type=SOURCE_RECORD_TYPE,
-                external_updated_at=meeting.occurred_at,
-                native_entity_type="interview",
-                native_entity_id=interview.id,
-                checksum=checksum,
-            )
-            return "unchanged"
+            touched.append(external_id)
+            actions.append("unchanged")
+            continue
+
+        row = _source_item_row(meeting, checksum=checksum, interview_id=interview.id)
+        if known_checksum == checksum:
+            item = items.get(external_id)
+            if external_id in item_rows or item is None or not _source_item_matches(item, row):
+                item_rows[external_id] = row
+            else:
+                touched.append(external_id)
+            actions.append("unchanged")
+            continue
 
         # Transcript changed upstream — reset analysis and reprocess.
-        await _reset_interview_analysis(db, interview)
+        if interview.id not in new_interview_ids and interview.id not in reset_interview_ids:
+            reset_interview_ids.append(interview.id)
         interview.filename = meeting.title or interview.filename
         interview.transcript = meeting.transcript_text
         interview.file_size_bytes = len(meeting.transcript_text.encode("utf-8"))
@@ -170,61 +263,57 @@ async def materialize_meeting(
         interview.metadata_json = _build_interview_metadata(meeting)
         interview.status = InterviewStatus.queued
         interview.error_message = None
-        await upsert_source_item(
-            db,
-            workspace_id=connection.workspace_id,
-            source_connection_id=connection.id,
-            external_id=meeting.external_id,
-            source_record_type=SOURCE_RECORD_TYPE,
-            external_updated_at=meeting.occurred_at,
-            native_entity_type="interview",
-            native_entity_id=interview.id,
-            checksum=checksum,
-        )
-        await db.flush()
-        await _enqueue_processing(str(interview.id))
+        state[external_id] = (checksum, interview)
+        item_rows[external_id] = row
+        actions.append("updated")
+        to_process.append(str(interview.id))
         logger.info(
             "Materialized interview updated: provider=%s external_id=%s interview=%s",
             meeting.provider,
-            meeting.external_id,
+            external_id,
             interview.id,
         )
-        return "updated"
-
-    interview = Interview(
-        user_id=owner_user_id,
-        filename=meeting.title or f"{meeting.provider} meeting",
-        file_type=FileType.txt,
-        file_size_bytes=len(meeting.transcript_text.encode("utf-8")),
-        storage_path="",
-        transcript=meeting.transcript_text,
-        duration_seconds=meeting.duration_seconds,
-        file_hash=checksum,
-        metadata_json=_build_interview_metadata(meeting),
-        status=InterviewStatus.queued,
-    )
-    db.add(interview)
+
+    await _reset_interviews_analysis(db, reset_interview_ids)
     await db.flush()
+    if item_rows:
+        await bulk_upsert_source_items(
+            db,
+            workspace_id=connection.workspace_id,
+            source_connection_id=connection.id,
+            items=list(item_rows.values()),
+        )
+    # Rows rewritten above already got a fresh last_seen_at.
+    touched = [external_id for external_id in touched if external_id not in item_rows]
+    if touched:
+        await touch_source_items(
+            db,
+            source_connection_id=connection.id,
+            external_ids=touched,
+        )
+    return actions, to_process
+
+
+async def materialize_meeting(
+    db: AsyncSession,
+    *,
+    connection: SourceConnection,
+    owner_user_id: uuid.UUID,
+    meeting: MaterializedMeeting,
+) -> str:
+    """Upsert one upstream meeting as a native interview.
 
-    await upsert_source_item(
+    Returns one of ``"created"``, ``"updated"``, ``"unchanged"``.
+    """
+    actions, to_process = await _materialize_batch(
         db,
-        workspace_id=connection.workspace_id,
-        source_connection_id=connection.id,
-        external_id=meeting.external_id,
-        source_record_type=SOURCE_RECORD_TYPE,
-        external_updated_at=meeting.occurred_at,
-        native_entity_type="interview",
-        native_entity_id=interview.id,
-        checksum=checksum,
-    )
-    await _enqueue_processing(str(interview.id))
-    logger.info(
-        "Materialized interview created: provider=%s external_id=%s interview=%s",
-        meeting.provider,
-        meeting.external_id,
-        interview.id,
+        connection=connection,
+        owner_user_id=owner_user_id,
+        meetings=[meeting],
     )
-    return "created"
+    if to_process:
+        await _enqueue_processing(list(dict.fromkeys(to_process)))
+    return actions[0]
 
 
 async def materialize_meetings(
@@ -233,29 +322,30 @@ async def materialize_meetings(
     connection: SourceConnection,
     meetings: list[MaterializedMeeting],
 ) -> tuple[int, int, int]:
-    """Materialize a batch of meetings. Returns (created, updated, unchanged)."""
+    """Materialize a batch of meetings. Returns (created, updated, unchanged).
+
+    The batch is resolved against existing source items and interviews in
+    two queries and written in bulk; processing jobs are enqueued once the
+    batch is flushed.
+    """
     workspace = await db.get(Workspace, connection.workspace_id)
     if workspace is None:
         raise ValueError(f"Workspace {connection.workspace_id} not found")
 
-    created = updated = unchanged = 0
-    for meeting in meetings:
-        if not meeting.transcript_text.strip():
-            # Nothing to analyze — counted as seen by the caller, not stored.
-            continue
-        action = await materialize_meeting(
-            db,
-            connection=connection,
-            owner_user_id=workspace.owner_user_id,
-            meeting=meeting,
-        )
-        if action == "created":
-            created += 1
-        elif action == "updated":
-            updated += 1
-        else:
-            unchanged += 1
-    return created, updated, unchanged
+    # Nothing to analyze in an empty transcript — counted as seen by the
+    # caller, not stored.
+    meetings = [meeting for meeting in meetings if meeting.transcript_text.strip()]
+    actions, to_process = await _materialize_batch(
+        db,
+        connection=connection,
+        owner_user_id=workspace.owner_user_id,
+        meetings=meetings,
+    )
+
+    # One job per interview, queued in a single round trip.
+    if to_process:
+        await _enqueue_processing(list(dict.fromkeys(to_process)))
+    return actions.count("created"), actions.count("updated"), actions.count("unchanged")
 
 
 async def delete_imported_connection_data(
@@ -299,6 +389,8 @@ async def delete_imported_connection_data(
         .returning(Signal.id)
     )
     signals_deleted = len(signals_result.fetchall())
+    if signals_deleted:
+        bump_data_version(db, workspace_id=connection.workspace_id)
 
     await db.execute(
         delete(SourceItem).where(SourceItem.source_connection_id == connection.id)
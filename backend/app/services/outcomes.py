@@ -21,9 +21,9 @@ from app.models import Notification, Spec, Theme
 from app.services.signals import (
     _parse_theme_match_id,
     ensure_signal_consistency,
-    get_workspace_signals,
     is_voice_signal,
 )
+from app.services.workspace_data import WorkspaceDataLoader
 
 logger = logging.getLogger(__name__)
 
@@ -40,11 +40,15 @@ def _as_utc(value: datetime) -> datetime:
 
 
 async def compute_spec_outcomes(
-    db: AsyncSession, *, user_id: uuid.UUID
+    db: AsyncSession,
+    *,
+    user_id: uuid.UUID,
+    loader: WorkspaceDataLoader | None = None,
 ) -> list[dict]:
     """Outcome entries for every shipped spec in the user's pool,
     newest ship first. Exactly the computation behind GET /api/specs/outcomes."""
-    workspace = await ensure_signal_consistency(db, user_id=user_id)
+    loader = loader or WorkspaceDataLoader(db, user_id=user_id)
+    await ensure_signal_consistency(db, user_id=user_id, loader=loader)
     result = await db.execute(
         select(Spec)
         .where(Spec.user_id == user_id, Spec.shipped_at.is_not(None))
@@ -54,7 +58,7 @@ async def compute_spec_outcomes(
     if not shipped_specs:
         return []
 
-    workspace_signals = await get_workspace_signals(db, workspace_id=workspace.id)
+    workspace_signals = await loader.signals()
     voice_by_theme: dict[uuid.UUID, list[datetime]] = {}
     for signal in workspace_signals:
         theme_id = _parse_theme_match_id(signal.metadata_json)
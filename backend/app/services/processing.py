@@ -12,6 +12,7 @@ import uuid
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from app.core.config import get_settings
 from app.core.database import get_session_factory
@@ -41,8 +42,10 @@ async def process_interview(interview_id: str) -> dict:
     async with get_session_factory()() as db:
         try:
             # Load interview
-            stmt = select(Interview).where(
-                Interview.id == uuid.UUID(interview_id)
+            stmt = (
+                select(Interview)
+                .where(Interview.id == uuid.UUID(interview_id))
+                .options(undefer(Interview.transcript))
             )
             result = await db.execute(stmt)
             interview = result.scalar_one_or_none()
@@ -199,10 +199,12 @@ async def _real_answer(
         # Get interview filenames
         interview_names = {}
         if interview_ids:
-            stmt = select(Interview).where(Interview.id.in_(list(interview_ids)))
+            stmt = select(Interview.id, Interview.filename).where(
+                Interview.id.in_(list(interview_ids))
+            )
             res = await db.execute(stmt)
-            for interview in res.scalars().all():
-                interview_names[interview.id] = interview.filename
+            for interview_id, filename in res.all():
+                interview_names[interview_id] = filename
 
         # Step 4: Call Vertex AI for answer
         prompt = (
@@ -0,0 +1,75 @@
+"""
+Full-text search helpers shared by the feed and the interview library.
+
+Queries are parsed with ``websearch_to_tsquery`` (quoted phrases, ``or``,
+``-term``) against the generated ``search_vector`` columns, so matching
+is served by their GIN indexes instead of scanning text.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import Any
+
+from sqlalchemy import Float, func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+SEARCH_CONFIG = literal_column("'english'::regconfig")
+
+# ``<mark>`` delimiters are split out by the frontend, never rendered as HTML.
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+_HEADLINE_OPTIONS = (
+    f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, "
+    'MinWords=12, MaxWords=30, MaxFragments=2, FragmentDelimiter=" … "'
+)
+
+
+def normalize_search_query(q: str | None) -> str | None:
+    query = (q or "").strip()
+    return query or None
+
+
+def websearch_query(q: str):
+    return func.websearch_to_tsquery(SEARCH_CONFIG, q)
+
+
+def matches(search_vector, tsquery):
+    return search_vector.bool_op("@@")(tsquery)
+
+
+def search_rank(search_vector, tsquery):
+    return func.ts_rank_cd(search_vector, tsquery, type_=Float)
+
+
+def highlight(document, tsquery):
+    return func.ts_headline(SEARCH_CONFIG, document, tsquery, _HEADLINE_OPTIONS)
+
+
+async def load_search_snippets(
+    db: AsyncSession,
+    *,
+    id_column,
+    document,
+    ids: list[uuid.UUID],
+    q: str,
+) -> dict[Any, str]:
+    """Highlighted snippets of ``document`` for the given rows.
+
+    Runs only over the rows being returned, since ``ts_headline`` re-parses
+    the whole document. Rows whose document does not contain a match (the
+    hit was in another field) get no snippet.
+    """
+    if not ids:
+        return {}
+    result = await db.execute(
+        select(id_column, highlight(document, websearch_query(q))).where(
+            id_column.in_(ids)
+        )
+    )
+    return {
+        row_id: snippet
+        for row_id, snippet in result.all()
+        if snippet and HIGHLIGHT_START in snippet
+    }
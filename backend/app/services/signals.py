@@ -10,16 +10,36 @@ This module owns:
 
 from __future__ import annotations
 
+import base64
+import json
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime, time, timedelta, timezone
-from typing import Any
-
-from sqlalchemy import delete, select
+from collections.abc import Collection, Sequence
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import (
+    ColumnElement,
+    DateTime,
+    and_,
+    delete,
+    distinct,
+    extract,
+    func,
+    insert,
+    inspect,
+    literal,
+    select,
+    true,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer
 
 from app.connectors.base import NormalizedSignal
+from app.core.data_version import bump_data_version
+from app.core.sync_telemetry import timed
 from app.models import (
     DataSource,
     Insight,
@@ -35,9 +55,23 @@ from app.models import (
     User,
     Workspace,
 )
-from app.services.sources import get_or_create_default_workspace, upsert_source_item
+from app.services.search import (
+    matches,
+    normalize_search_query,
+    search_rank,
+    websearch_query,
+)
+from app.services.sources import (
+    SOURCE_ITEM_BULK_CHUNK_SIZE,
+    bulk_upsert_source_items,
+    get_or_create_default_workspace,
+    get_source_items_by_external_id,
+)
 from app.services.synthesis import _normalize_theme_name, _similarity
 
+if TYPE_CHECKING:
+    from app.services.workspace_data import WorkspaceDataLoader
+
 
 NATIVE_PROVIDER = "native_upload"
 THEME_MATCH_THRESHOLD = 0.82
@@ -47,6 +81,9 @@ IMPACT_NEGATIVE_WEIGHT = 25.0
 IMPACT_RECENCY_WEIGHT = 20.0
 IMPACT_SOURCE_DIVERSITY_WEIGHT = 15.0
 
+FEED_PAGE_SIZE = 50
+FEED_MAX_PAGE_SIZE = 200
+
 SOURCE_TYPE_LABELS = {
     SourceType.interview: "Interview",
     SourceType.support: "Support",
@@ -113,6 +150,17 @@ class ScoreChangeResult:
     explanation: str
 
 
+@dataclass(slots=True)
+class ThemeSignalStats:
+    """Everything the impact score needs from a theme's signals, as counts."""
+
+    signal_count: int = 0
+    voice_count: int = 0
+    negative_count: int = 0
+    newest_voice_at: datetime | None = None
+    source_counts: dict[SourceType, int] = field(default_factory=dict)
+
+
 async def _get_default_workspace_for_user_id(
     db: AsyncSession,
     user_id: uuid.UUID,
@@ -123,6 +171,13 @@ async def _get_default_workspace_for_user_id(
     return await get_or_create_default_workspace(db, user)
 
 
+def _workspace_loader(db: AsyncSession, user_id: uuid.UUID) -> WorkspaceDataLoader:
+    # Imported lazily: the loader module builds on this one.
+    from app.services.workspace_data import WorkspaceDataLoader
+
+    return WorkspaceDataLoader(db, user_id=user_id)
+
+
 async def _get_workspace_owner_user_id(
     db: AsyncSession,
     workspace_id: uuid.UUID,
@@ -139,7 +194,10 @@ def _parse_theme_match_id(metadata_json: dict[str, Any] | None) -> uuid.UUID | N
     theme_match = metadata_json.get("theme_match")
     if not isinstance(theme_match, dict):
         return None
-    theme_id = theme_match.get("theme_id")
+    return _parse_theme_id(theme_match.get("theme_id"))
+
+
+def _parse_theme_id(theme_id: Any) -> uuid.UUID | None:
     if not theme_id:
         return None
     try:
@@ -148,6 +206,17 @@ def _parse_theme_match_id(metadata_json: dict[str, Any] | None) -> uuid.UUID | N
         return None
 
 
+def signal_theme_match_key():
+    """``metadata_json.theme_match.theme_id`` as SQL text.
+
+    The SQL counterpart of ``_parse_theme_match_id``, served by the generated
+    ``Signal.theme_match_id`` column and its index. Values are parsed with
+    ``_parse_theme_id`` after grouping, so malformed ids are skipped rather
+    than failing a UUID cast.
+    """
+    return Signal.theme_match_id
+
+
 def _merge_theme_match_metadata(
     metadata_json: dict[str, Any] | None,
     match: ThemeMatchResult,
@@ -280,125 +349,219 @@ def match_signal_to_themes(
     )
 
 
-async def upsert_external_signals(
+# Signal columns compared by ``upsert_external_signals`` to decide whether a
+# re-imported record actually changed.
+_EXTERNAL_SIGNAL_COMPARE_COLUMNS = (
+    Signal.source_connection_id,
+    Signal.source_item_id,
+    Signal.source_type,
+    Signal.provider,
+    Signal.signal_kind,
+    Signal.occurred_at,
+    Signal.title,
+    Signal.content_text,
+    Signal.author_or_speaker,
+    Signal.sentiment,
+    Signal.source_url,
+    Signal.metadata_json,
+    Signal.status,
+)
+
+
+def _build_external_signal_values(
+    normalized: NormalizedSignal,
+    *,
+    connection: SourceConnection,
+    data_source: DataSource,
+    source_item_id: uuid.UUID | None,
+    metadata_json: dict[str, Any] | None,
+) -> dict[str, Any]:
+    return {
+        "source_connection_id": connection.id,
+        "source_item_id": source_item_id,
+        "source_type": data_source.source_type,
+        "provider": data_source.provider,
+        "signal_kind": _signal_kind_from_string(normalized.signal_kind),
+        "occurred_at": _parse_occurred_at(normalized.occurred_at),
+        "title": normalized.title,
+        "content_text": normalized.content_text or "",
+        "author_or_speaker": normalized.author_or_speaker,
+        "sentiment": normalized.sentiment,
+        "source_url": normalized.source_url,
+        "metadata_json": metadata_json,
+        "status": SignalStatus.active,
+    }
+
+
+async def _upsert_external_signal_chunk(
     db: AsyncSession,
     *,
     connection: SourceConnection,
     data_source: DataSource,
+    active_themes: list[Theme],
     signals: list[NormalizedSignal],
 ) -> tuple[int, int, int]:
-    owner_user_id = await _get_workspace_owner_user_id(db, connection.workspace_id)
-    themes_result = await db.execute(
-        select(Theme).where(
-            Theme.user_id == owner_user_id,
-            Theme.status == ThemeStatus.active,
-        )
+    external_ids = list(dict.fromkeys(normalized.external_id for normalized in signals))
+    existing_items = await get_source_items_by_external_id(
+        db,
+        source_connection_id=connection.id,
+        external_ids=external_ids,
     )
-    active_themes = list(themes_result.scalars().all())
+
+    # Current signal state per external id — seeded from the database and
+    # advanced in memory so repeated ids within a batch are counted exactly
+    # as sequential per-record upserts would count them.
+    current_signals: dict[str, dict[str, Any]] = {}
+    if existing_items:
+        external_id_by_item_id = {
+            item.id: external_id for external_id, item in existing_items.items()
+        }
+        signal_result = await db.execute(
+            select(Signal.id, *_EXTERNAL_SIGNAL_COMPARE_COLUMNS).where(
+                Signal.source_item_id.in_(tuple(external_id_by_item_id))
+            )
+        )
+        for row in signal_result.mappings().all():
+            external_id = external_id_by_item_id[row["source_item_id"]]
+            current_signals.setdefault(external_id, dict(row))
+    checksums = {
+        external_id: item.checksum for external_id, item in existing_items.items()
+    }
 
     created = 0
     updated = 0
     unchanged = 0
+    item_rows: list[dict[str, Any]] = []
+    pending: dict[str, dict[str, Any]] = {}
 
     for normalized in signals:
-        source_item, _, source_item_unchanged = await upsert_source_item(
-            db,
-            workspace_id=connection.workspace_id,
-            source_connection_id=connection.id,
-            external_id=normalized.external_id,
-            source_record_type=normalized.source_record_type,
-            external_updated_at=_parse_occurred_at(normalized.occurred_at),
-            checksum=normalized.checksum,
+        external_id = normalized.external_id
+        occurred_at = _parse_occurred_at(normalized.occurred_at)
+        item_rows.append(
+            {
+                "external_id": external_id,
+                "source_record_type": normalized.source_record_type,
+                "external_updated_at": occurred_at,
+                "checksum": normalized.checksum,
+            }
+        )
+        source_item_unchanged = (
+            external_id in checksums and checksums[external_id] == normalized.checksum
+        )
+        checksums[external_id] = normalized.checksum
+
+        current = current_signals.get(external_id)
+        source_item = existing_items.get(external_id)
+        with timed("theme_match"):
+            theme_match = match_signal_to_themes(normalized, active_themes)
+        values = _build_external_signal_values(
+            normalized,
+            connection=connection,
+            data_source=data_source,
+            source_item_id=source_item.id if source_item else None,
+            metadata_json=_merge_theme_match_metadata(normalized.metadata_json, theme_match),
         )
 
-        signal_stmt = select(Signal).where(Signal.source_item_id == source_item.id)
-        signal_result = await db.execute(signal_stmt)
-        signal_row = signal_result.scalar_one_or_none()
+        if current is None:
+            created += 1
+        elif source_item_unchanged and all(
+            current[key] == value for key, value in values.items()
+        ):
+            unchanged += 1
+            continue
+        else:
+            updated += 1
 
-        theme_match = match_signal_to_themes(normalized, active_themes)
-        metadata_json = _merge_theme_match_metadata(normalized.metadata_json, theme_match)
+        current_signals[external_id] = {**(current or {}), **values}
+        pending[external_id] = current_signals[external_id]
 
-        if signal_row is None:
-            created += 1
-            signal_row = Signal(
-                workspace_id=connection.workspace_id,
-                source_connection_id=connection.id,
-                source_item_id=source_item.id,
-                source_type=data_source.source_type,
-                provider=data_source.provider,
-                signal_kind=_signal_kind_from_string(normalized.signal_kind),
-                occurred_at=_parse_occurred_at(normalized.occurred_at),
-                title=normalized.title,
-                content_text=normalized.content_text or "",
-                author_or_speaker=normalized.author_or_speaker,
-                sentiment=normalized.sentiment,
-                source_url=normalized.source_url,
-                metadata_json=metadata_json,
-                status=SignalStatus.active,
-            )
-            db.add(signal_row)
+    item_ids = await bulk_upsert_source_items(
+        db,
+        workspace_id=connection.workspace_id,
+        source_connection_id=connection.id,
+        items=item_rows,
+    )
+
+    inserts: list[dict[str, Any]] = []
+    updates: list[dict[str, Any]] = []
+    for external_id, values in pending.items():
+        values["source_item_id"] = item_ids[external_id]
+        if "id" in values:
+            updates.append(values)
         else:
-            signal_is_unchanged = (
-                source_item_unchanged
-                and signal_row.source_connection_id == connection.id
-                and signal_row.source_item_id == source_item.id
-                and signal_row.source_type == data_source.source_type
-                and signal_row.provider == data_source.provider
-                and signal_row.signal_kind == _signal_kind_from_string(normalized.signal_kind)
-                and signal_row.occurred_at == _parse_occurred_at(normalized.occurred_at)
-                and signal_row.title == normalized.title
-                and signal_row.content_text == (normalized.content_text or "")
-                and signal_row.author_or_speaker == normalized.author_or_speaker
-                and signal_row.sentiment == normalized.sentiment
-                and signal_row.source_url == normalized.source_url
-                and signal_row.metadata_json == metadata_json
-                and signal_row.status == SignalStatus.active
+            inserts.append(
+                {"id": uuid.uuid4(), "workspace_id": connection.workspace_id, **values}
             )
-            if signal_is_unchanged:
-                unchanged += 1
-                continue
-
-            updated += 1
-            signal_row.source_connection_id = connection.id
-            signal_row.source_item_id = source_item.id
-            signal_row.source_type = data_source.source_type
-            signal_row.provider = data_source.provider
-            signal_row.signal_kind = _signal_kind_from_string(normalized.signal_kind)
-            signal_row.occurred_at = _parse_occurred_at(normalized.occurred_at)
-            signal_row.title = normalized.title
-            signal_row.content_text = normalized.content_text or ""
-            signal_row.author_or_speaker = normalized.author_or_speaker
-            signal_row.sentiment = normalized.sentiment
-            signal_row.source_url = normalized.source_url
-            signal_row.metadata_json = metadata_json
-            signal_row.status = SignalStatus.active
 
-    await db.flush()
+    if inserts:
+        await db.execute(insert(Signal), inserts)
+    if updates:
+        await db.execute(update(Signal), updates)
+    if inserts or updates:
+        bump_data_version(db, workspace_id=connection.workspace_id)
     return created, updated, unchanged
 
 
-async def refresh_external_signal_theme_matches(
+async def upsert_external_signals(
     db: AsyncSession,
     *,
-    user_id: uuid.UUID,
-) -> int:
-    workspace = await _get_default_workspace_for_user_id(db, user_id)
+    connection: SourceConnection,
+    data_source: DataSource,
+    signals: list[NormalizedSignal],
+) -> tuple[int, int, int]:
+    """Persist normalized external records as source items plus signals.
+
+    Works set-based in chunks: existing source items and signals for a
+    chunk are pre-loaded in one query each, source items are written with
+    a single ``INSERT ... ON CONFLICT DO UPDATE``, and signal rows with one
+    bulk insert and one bulk update. Returns ``(created, updated, unchanged)``.
+    """
+    owner_user_id = await _get_workspace_owner_user_id(db, connection.workspace_id)
     themes_result = await db.execute(
         select(Theme).where(
-            Theme.user_id == user_id,
+            Theme.user_id == owner_user_id,
             Theme.status == ThemeStatus.active,
         )
     )
     active_themes = list(themes_result.scalars().all())
 
-    signals_result = await db.execute(
-        select(Signal).where(
-            Signal.workspace_id == workspace.id,
-            Signal.status == SignalStatus.active,
-            Signal.provider != NATIVE_PROVIDER,
+    created = 0
+    updated = 0
+    unchanged = 0
+    for start in range(0, len(signals), SOURCE_ITEM_BULK_CHUNK_SIZE):
+        chunk_created, chunk_updated, chunk_unchanged = await _upsert_external_signal_chunk(
+            db,
+            connection=connection,
+            data_source=data_source,
+            active_themes=active_themes,
+            signals=signals[start:start + SOURCE_ITEM_BULK_CHUNK_SIZE],
         )
-    )
-    signals = list(signals_result.scalars().all())
+        created += chunk_created
+        updated += chunk_updated
+        unchanged += chunk_unchanged
+
+    await db.flush()
+    return created, updated, unchanged
+
+
+async def refresh_external_signal_theme_matches(
+    db: AsyncSession,
+    *,
+    user_id: uuid.UUID,
+    loader: WorkspaceDataLoader | None = None,
+) -> int:
+    """Re-match every active external signal against the active themes.
+
+    Works on the ``loader``'s workspace signal set, so a request that reads
+    signals afterwards reuses the rows this pass loaded.
+    """
+    loader = loader or _workspace_loader(db, user_id)
+    active_themes = await loader.active_themes()
+    signals = [
+        signal
+        for signal in await loader.signals(full_content=True)
+        if signal.provider != NATIVE_PROVIDER
+    ]
 
     changed = 0
     for signal in signals:
@@ -522,6 +685,7 @@ async def sync_interview_signals_for_interview(
                 Signal.native_entity_id.in_(tuple(stale_ids)),
             )
         )
+        bump_data_version(db, workspace_id=workspace.id)
 
     await db.flush()
     return len(active_insights)
@@ -531,8 +695,13 @@ async def ensure_native_interview_signals(
     db: AsyncSession,
     *,
     user_id: uuid.UUID,
-) -> None:
-    workspace = await _get_default_workspace_for_user_id(db, user_id)
+    loader: WorkspaceDataLoader | None = None,
+) -> bool:
+    """Materialize missing native signals and drop stale ones.
+
+    Returns whether any native signal was written or deleted.
+    """
+    workspace = await (loader or _workspace_loader(db, user_id)).workspace()
 
     insights_result = await db.execute(
         select(Insight.id, Insight.interview_id)
@@ -569,23 +738,56 @@ async def ensure_native_interview_signals(
                 Signal.native_entity_id.in_(tuple(existing_native_ids - active_insight_ids)),
             )
         )
+        bump_data_version(db, workspace_id=workspace.id)
 
     missing_insight_ids = active_insight_ids - existing_native_ids
     if not missing_insight_ids and not (existing_native_ids - active_insight_ids):
-        return
+        return False
 
     for interview_id in interview_ids:
         await sync_interview_signals_for_interview(db, interview_id=interview_id)
+    return True
 
 
 async def ensure_signal_consistency(
     db: AsyncSession,
     *,
     user_id: uuid.UUID,
+    loader: WorkspaceDataLoader | None = None,
 ) -> Workspace:
-    workspace = await _get_default_workspace_for_user_id(db, user_id)
-    await ensure_native_interview_signals(db, user_id=user_id)
-    await refresh_external_signal_theme_matches(db, user_id=user_id)
+    """Bring native interview signals up to date before a read.
+
+    The pass is skipped while the workspace's ``signals_consistent_version``
+    still equals its ``data_version``, so steady reads cost one lookup.
+    External theme matches are not touched here: ingest matches new signals,
+    and theme writes call ``refresh_external_signal_theme_matches``.
+    With a request ``loader`` the check runs once per request.
+    """
+    loader = loader or _workspace_loader(db, user_id)
+    workspace = await loader.workspace()
+    if loader.consistent:
+        return workspace
+    versions = (
+        await db.execute(
+            select(Workspace.data_version, Workspace.signals_consistent_version).where(
+                Workspace.id == workspace.id
+            )
+        )
+    ).one()
+    if versions.signals_consistent_version != versions.data_version:
+        if await ensure_native_interview_signals(db, user_id=user_id, loader=loader):
+            # The writes bump data_version; the next read records the marker.
+            loader.invalidate()
+        else:
+            await db.execute(
+                update(Workspace)
+                .where(Workspace.id == workspace.id)
+                .values(
+                    signals_consistent_version=versions.data_version,
+                    updated_at=Workspace.updated_at,
+                )
+            )
+    loader.consistent = True
     return workspace
 
 
@@ -595,31 +797,55 @@ async def cleanup_interview_native_signals(
     interview_id: uuid.UUID,
     workspace_id: uuid.UUID | None = None,
 ) -> None:
+    await cleanup_interviews_native_signals(
+        db,
+        interview_ids=[interview_id],
+        workspace_id=workspace_id,
+    )
+
+
+async def cleanup_interviews_native_signals(
+    db: AsyncSession,
+    *,
+    interview_ids: list[uuid.UUID],
+    workspace_id: uuid.UUID | None = None,
+) -> None:
+    """Delete the native insight signals of several interviews at once.
+
+    Without ``workspace_id`` each insight owner's default workspace is
+    used, as for a single interview.
+    """
+    if not interview_ids:
+        return
     insights_result = await db.execute(
-        select(Insight.id, Insight.user_id).where(Insight.interview_id == interview_id)
+        select(Insight.id, Insight.user_id).where(Insight.interview_id.in_(interview_ids))
     )
-    insight_rows = insights_result.all()
-    insight_ids = [row.id for row in insight_rows]
-    if not insight_ids:
+    insight_ids_by_user: dict[uuid.UUID, list[uuid.UUID]] = {}
+    for row in insights_result.all():
+        insight_ids_by_user.setdefault(row.user_id, []).append(row.id)
+    if not insight_ids_by_user:
         return
 
-    resolved_workspace_id = workspace_id
-    if resolved_workspace_id is None:
-        resolved_workspace_id = await _get_default_workspace_for_user_id(
-            db,
-            insight_rows[0].user_id,
-        )
-        resolved_workspace_id = resolved_workspace_id.id
+    insight_ids_by_workspace: dict[uuid.UUID, list[uuid.UUID]] = {}
+    for user_id, insight_ids in insight_ids_by_user.items():
+        resolved_workspace_id = workspace_id
+        if resolved_workspace_id is None:
+            resolved_workspace_id = (
+                await _get_default_workspace_for_user_id(db, user_id)
+            ).id
+        insight_ids_by_workspace.setdefault(resolved_workspace_id, []).extend(insight_ids)
 
-    await db.execute(
-        delete(Signal).where(
-            Signal.workspace_id == resolved_workspace_id,
-            Signal.provider == NATIVE_PROVIDER,
-            Signal.source_type == SourceType.interview,
-            Signal.native_entity_type == "insight",
-            Signal.native_entity_id.in_(tuple(insight_ids)),
+    for resolved_workspace_id, insight_ids in insight_ids_by_workspace.items():
+        await db.execute(
+            delete(Signal).where(
+                Signal.workspace_id == resolved_workspace_id,
+                Signal.provider == NATIVE_PROVIDER,
+                Signal.source_type == SourceType.interview,
+                Signal.native_entity_type == "insight",
+                Signal.native_entity_id.in_(tuple(insight_ids)),
+            )
         )
-    )
+        bump_data_version(db, workspace_id=resolved_workspace_id)
     await db.flush()
 
 
@@ -674,32 +900,52 @@ def calculate_impact_score(
     ``as_of`` recomputes the score as it stood at a past moment (used for
     score-change explanations) by ignoring newer signals.
     """
-    now = as_of or datetime.now(timezone.utc)
     themed_signals = [
         signal
         for signal in signals
         if _parse_theme_match_id(signal.metadata_json) == theme_id
         and (as_of is None or _ensure_aware(signal.occurred_at) <= as_of)
     ]
-    if not themed_signals:
-        return ImpactScoreResult(0.0, 0.0, 0.0, 0.0, 0.0)
+    return impact_score_from_stats(build_theme_signal_stats(themed_signals), now=as_of)
+
 
-    voice_signals = [signal for signal in themed_signals if is_voice_signal(signal)]
+def build_theme_signal_stats(signals: list[Signal]) -> ThemeSignalStats:
+    stats = ThemeSignalStats()
+    for signal in signals:
+        stats.signal_count += 1
+        stats.source_counts[signal.source_type] = stats.source_counts.get(signal.source_type, 0) + 1
+        if not is_voice_signal(signal):
+            continue
+        stats.voice_count += 1
+        if signal.sentiment == "negative":
+            stats.negative_count += 1
+        if stats.newest_voice_at is None or signal.occurred_at > stats.newest_voice_at:
+            stats.newest_voice_at = signal.occurred_at
+    return stats
 
-    voice_count = len(voice_signals)
+
+def impact_score_from_stats(
+    stats: ThemeSignalStats,
+    *,
+    now: datetime | None = None,
+) -> ImpactScoreResult:
+    """Score v2 from pre-aggregated counts (see ``calculate_impact_score``)."""
+    if not stats.signal_count:
+        return ImpactScoreResult(0.0, 0.0, 0.0, 0.0, 0.0)
+
+    now = now or datetime.now(timezone.utc)
+    voice_count = stats.voice_count
     frequency_score = min(voice_count, 10) / 10 * IMPACT_FREQUENCY_WEIGHT
 
-    negative_count = sum(1 for signal in voice_signals if signal.sentiment == "negative")
-    negative_ratio = negative_count / voice_count if voice_count else 0.0
+    negative_ratio = stats.negative_count / voice_count if voice_count else 0.0
     negative_score = negative_ratio * IMPACT_NEGATIVE_WEIGHT
 
-    if voice_signals:
-        newest_occurred_at = max(signal.occurred_at for signal in voice_signals)
-        recency_score = _signal_recency_points(newest_occurred_at, now=now)
+    if voice_count:
+        recency_score = _signal_recency_points(stats.newest_voice_at, now=now)
     else:
         recency_score = 0.0
 
-    distinct_source_types = len({signal.source_type for signal in themed_signals})
+    distinct_source_types = sum(1 for count in stats.source_counts.values() if count > 0)
     source_diversity_score = distinct_source_types / 3 * IMPACT_SOURCE_DIVERSITY_WEIGHT
 
     total = round(
@@ -746,6 +992,11 @@ def calculate_theme_trend(
         elif now - 2 * window < occurred_at <= now - window:
             previous_count += 1
 
+    return theme_trend_from_counts(recent_count=recent_count, previous_count=previous_count)
+
+
+def theme_trend_from_counts(*, recent_count: int, previous_count: int) -> ThemeTrendResult:
+    """Trend direction from voice counts in the recent and previous windows."""
     if recent_count > previous_count:
         direction = "rising"
     elif recent_count < previous_count:
@@ -779,7 +1030,15 @@ def calculate_score_change(
         signals=signals,
         as_of=now - timedelta(days=TREND_WINDOW_DAYS),
     )
+    return score_change_from_scores(current=current, previous=previous)
+
 
+def score_change_from_scores(
+    *,
+    current: ImpactScoreResult,
+    previous: ImpactScoreResult,
+) -> ScoreChangeResult:
+    """Explain the move from ``previous`` to ``current`` (see ``calculate_score_change``)."""
     delta = round(current.total - previous.total, 1)
     component_deltas = [
         ("frequency", round(current.frequency - previous.frequency, 1)),
@@ -908,14 +1167,27 @@ def build_signal_link(signal: Signal) -> dict[str, str] | None:
     return None
 
 
+def signal_preview_text(signal: Signal) -> str:
+    """Leading text of ``signal`` for excerpts.
+
+    Uses the full ``content_text`` when it is already loaded (new rows,
+    detail queries) and the ``content_preview`` column otherwise, so list
+    queries never pull whole bodies.
+    """
+    if "content_text" not in inspect(signal).unloaded:
+        return signal.content_text or ""
+    return signal.content_preview or ""
+
+
 def serialize_feed_signal(
     signal: Signal,
     *,
     theme_lookup: dict[uuid.UUID, Theme],
     include_full_content: bool = False,
+    search_snippet: str | None = None,
 ) -> dict[str, Any]:
-    content_text = signal.content_text or ""
-    excerpt = content_text if len(content_text) <= 180 else f"{content_text[:177]}..."
+    preview = signal_preview_text(signal)
+    excerpt = preview if len(preview) <= 180 else f"{preview[:177]}..."
     metadata = dict(signal.metadata_json or {})
 
     return {
@@ -929,7 +1201,8 @@ def serialize_feed_signal(
         "occurred_at": signal.occurred_at,
         "title": signal.title,
         "excerpt": excerpt,
-        "content_text": content_text if include_full_content else None,
+        "search_snippet": search_snippet,
+        "content_text": (signal.content_text or "") if include_full_content else None,
         "author_or_speaker": signal.author_or_speaker,
         "sentiment": signal.sentiment,
         "theme_chip": _build_signal_theme_chip(signal, theme_lookup),
@@ -942,7 +1215,10 @@ def build_source_breakdown(signals: list[Signal]) -> list[dict[str, Any]]:
     counts: dict[SourceType, int] = {}
     for signal in signals:
         counts[signal.source_type] = counts.get(signal.source_type, 0) + 1
+    return build_source_breakdown_from_counts(counts)
+
 
+def build_source_breakdown_from_counts(counts: dict[SourceType, int]) -> list[dict[str, Any]]:
     ordered_types = [SourceType.interview, SourceType.support, SourceType.survey, SourceType.analytics]
     return [
         {
@@ -955,32 +1231,519 @@ def build_source_breakdown(signals: list[Signal]) -> list[dict[str, Any]]:
     ]
 
 
-async def get_workspace_signals(
+def _occurred_in_window(occurred_at, start: datetime | None, end: datetime | None):
+    conditions = []
+    if start is not None:
+        conditions.append(occurred_at >= start)
+    if end is not None:
+        conditions.append(occurred_at < end)
+    return and_(*conditions) if conditions else true()
+
+
+async def aggregate_theme_signal_stats(
     db: AsyncSession,
     *,
     workspace_id: uuid.UUID,
-    source_filter: SourceType | None = None,
+    windows: dict[str, tuple[datetime | None, datetime | None]],
+    theme_id: uuid.UUID | None = None,
+    filters: Sequence[ColumnElement[bool]] = (),
+) -> dict[str, dict[uuid.UUID, ThemeSignalStats]]:
+    """Per-theme ``ThemeSignalStats`` for each ``[start, end)`` window.
+
+    One grouped pass over the workspace's active signals — or, with
+    ``theme_id``, over that theme's index range only — narrowed by any
+    ``signal_filter_conditions``: every window is a set of ``FILTER``
+    aggregates, grouped by theme and source type so source diversity falls
+    out of the non-zero groups. Themes with no signals in a window are
+    absent from that window's map.
+    """
+    # The theme key is computed once in a subquery; repeating the JSON path
+    # expression in GROUP BY would bind its path as a separate parameter.
+    themed = (
+        select(
+            signal_theme_match_key().label("theme_key"),
+            Signal.source_type,
+            Signal.signal_kind,
+            Signal.sentiment,
+            Signal.occurred_at,
+        )
+        .where(
+            Signal.workspace_id == workspace_id,
+            Signal.status == SignalStatus.active,
+            *([signal_theme_match_key() == str(theme_id)] if theme_id else []),
+            *filters,
+        )
+        .subquery()
+    )
+    voice = themed.c.signal_kind != SignalKind.metric_window
+    aggregates = []
+    for start, end in windows.values():
+        in_window = _occurred_in_window(themed.c.occurred_at, start, end)
+        aggregates.extend(
+            [
+                func.count().filter(in_window),
+                func.count().filter(and_(in_window, voice)),
+                func.count().filter(and_(in_window, voice, themed.c.sentiment == "negative")),
+                func.max(themed.c.occurred_at).filter(and_(in_window, voice)),
+            ]
+        )
+    result = await db.execute(
+        select(themed.c.theme_key, themed.c.source_type, *aggregates)
+        .where(themed.c.theme_key.is_not(None))
+        .group_by(themed.c.theme_key, themed.c.source_type)
+    )
+
+    stats_by_window: dict[str, dict[uuid.UUID, ThemeSignalStats]] = {name: {} for name in windows}
+    for theme_key, source_type, *values in result.all():
+        theme_id = _parse_theme_id(theme_key)
+        if theme_id is None:
+            continue
+        for index, name in enumerate(windows):
+            signal_count, voice_count, negative_count, newest_voice_at = values[4 * index : 4 * index + 4]
+            if not signal_count:
+                continue
+            stats = stats_by_window[name].setdefault(theme_id, ThemeSignalStats())
+            stats.signal_count += signal_count
+            stats.voice_count += voice_count
+            stats.negative_count += negative_count
+            stats.source_counts[source_type] = stats.source_counts.get(source_type, 0) + signal_count
+            if newest_voice_at is not None and (
+                stats.newest_voice_at is None or newest_voice_at > stats.newest_voice_at
+            ):
+                stats.newest_voice_at = newest_voice_at
+    return stats_by_window
+
+
+@dataclass(slots=True)
+class ThemeSignalSummary:
+    """Score, trend and source mix of one theme, from aggregate queries."""
+
+    score: ImpactScoreResult
+    trend: ThemeTrendResult
+    score_change: ScoreChangeResult
+    source_counts: dict[SourceType, int]
+
+
+async def summarize_theme_signals(
+    db: AsyncSession,
+    *,
+    workspace_id: uuid.UUID,
+    theme_id: uuid.UUID,
+    now: datetime | None = None,
+) -> ThemeSignalSummary:
+    """Everything theme detail shows about a theme's signals except the
+    evidence itself, in one query over the theme's index range.
+
+    Matches ``calculate_impact_score``, ``calculate_theme_trend`` and
+    ``calculate_score_change`` on the same signals.
+    """
+    now = now or datetime.now(timezone.utc)
+    window = timedelta(days=TREND_WINDOW_DAYS)
+    window_stats = await aggregate_theme_signal_stats(
+        db,
+        workspace_id=workspace_id,
+        theme_id=theme_id,
+        windows={
+            "all": (None, None),
+            "as_of_previous": (None, now - window),
+            "recent": (now - window, now),
+            "previous": (now - 2 * window, now - window),
+        },
+    )
+    empty = ThemeSignalStats()
+    all_stats = window_stats["all"].get(theme_id, empty)
+    score = impact_score_from_stats(all_stats, now=now)
+    previous_score = impact_score_from_stats(
+        window_stats["as_of_previous"].get(theme_id, empty),
+        now=now - window,
+    )
+    return ThemeSignalSummary(
+        score=score,
+        trend=theme_trend_from_counts(
+            recent_count=window_stats["recent"].get(theme_id, empty).voice_count,
+            previous_count=window_stats["previous"].get(theme_id, empty).voice_count,
+        ),
+        score_change=score_change_from_scores(current=score, previous=previous_score),
+        source_counts=all_stats.source_counts,
+    )
+
+
+async def count_theme_signals_by_bucket(
+    db: AsyncSession,
+    *,
+    workspace_id: uuid.UUID,
+    unit: str,
+    start: datetime,
+    end: datetime,
+) -> dict[uuid.UUID, dict[date, int]]:
+    """Per-theme signal counts in UTC ``date_trunc(unit)`` buckets over ``[start, end)``."""
+    bucketed = (
+        select(
+            signal_theme_match_key().label("theme_key"),
+            func.date_trunc(unit, func.timezone("UTC", Signal.occurred_at)).label("bucket"),
+        )
+        .where(
+            Signal.workspace_id == workspace_id,
+            Signal.status == SignalStatus.active,
+            _occurred_in_window(Signal.occurred_at, start, end),
+        )
+        .subquery()
+    )
+    result = await db.execute(
+        select(bucketed.c.theme_key, bucketed.c.bucket, func.count())
+        .where(bucketed.c.theme_key.is_not(None))
+        .group_by(bucketed.c.theme_key, bucketed.c.bucket)
+    )
+
+    counts: dict[uuid.UUID, dict[date, int]] = {}
+    for theme_key, bucket, count in result.all():
+        theme_id = _parse_theme_id(theme_key)
+        if theme_id is None:
+            continue
+        theme_counts = counts.setdefault(theme_id, {})
+        theme_counts[bucket.date()] = theme_counts.get(bucket.date(), 0) + count
+    return counts
+
+
+async def count_theme_voice_signals_by_day(
+    db: AsyncSession,
+    *,
+    workspace_id: uuid.UUID,
+    now: datetime,
+    days: int,
+    filters: Sequence[ColumnElement[bool]] = (),
+) -> dict[uuid.UUID, list[int]]:
+    """Per-theme voice-signal counts for each of the ``days`` days before ``now``.
+
+    Entry ``k`` counts signals with ``occurred_at`` in
+    ``(now - (k + 1) days, now - k days]``, so any rolling window ending at
+    ``now`` is a sum of consecutive entries with the same boundaries as
+    ``calculate_theme_trend``. One grouped query, theme × day offset.
+    """
+    day = timedelta(days=1)
+    age = literal(now, DateTime(timezone=True)) - Signal.occurred_at
+    offsets = (
+        select(
+            signal_theme_match_key().label("theme_key"),
+            func.floor(extract("epoch", age) / day.total_seconds()).label("day_offset"),
+        )
+        .where(
+            Signal.workspace_id == workspace_id,
+            Signal.status == SignalStatus.active,
+            Signal.signal_kind != SignalKind.metric_window,
+            Signal.occurred_at <= now,
+            Signal.occurred_at > now - day * days,
+            *filters,
+        )
+        .subquery()
+    )
+    result = await db.execute(
+        select(offsets.c.theme_key, offsets.c.day_offset, func.count())
+        .where(offsets.c.theme_key.is_not(None))
+        .group_by(offsets.c.theme_key, offsets.c.day_offset)
+    )
+
+    counts: dict[uuid.UUID, list[int]] = {}
+    for theme_key, day_offset, count in result.all():
+        theme_id = _parse_theme_id(theme_key)
+        if theme_id is None:
+            continue
+        counts.setdefault(theme_id, [0] * days)[int(day_offset)] += count
+    return counts
+
+
+async def workspace_has_signals(db: AsyncSession, *, workspace_id: uuid.UUID) -> bool:
+    result = await db.execute(
+        select(Signal.id)
+        .where(
+            Signal.workspace_id == workspace_id,
+            Signal.status == SignalStatus.active,
+        )
+        .limit(1)
+    )
+    return result.first() is not None
+
+
+def signal_filter_conditions(
+    *,
+    source_types: Collection[SourceType] = (),
     sentiment: str | None = None,
     date_from: date | None = None,
     date_to: date | None = None,
-) -> list[Signal]:
-    stmt = select(Signal).where(
-        Signal.workspace_id == workspace_id,
-        Signal.status == SignalStatus.active,
-    )
-    if source_filter is not None:
-        stmt = stmt.where(Signal.source_type == source_filter)
+) -> list[ColumnElement[bool]]:
+    """Feed and explorer signal filters as SQL; dates are whole UTC days."""
+    conditions: list[ColumnElement[bool]] = []
+    if source_types:
+        conditions.append(Signal.source_type.in_(tuple(source_types)))
     if sentiment:
-        stmt = stmt.where(Signal.sentiment == sentiment)
+        conditions.append(Signal.sentiment == sentiment)
     if date_from is not None:
-        stmt = stmt.where(
+        conditions.append(
             Signal.occurred_at >= datetime.combine(date_from, time.min, tzinfo=timezone.utc)
         )
     if date_to is not None:
-        stmt = stmt.where(
+        conditions.append(
             Signal.occurred_at <= datetime.combine(date_to, time.max, tzinfo=timezone.utc)
         )
+    return conditions
+
+
+async def get_workspace_source_types(
+    db: AsyncSession,
+    *,
+    workspace_id: uuid.UUID,
+) -> set[SourceType]:
+    """Source types with at least one active signal in the workspace."""
+    result = await db.execute(
+        select(distinct(Signal.source_type)).where(
+            Signal.workspace_id == workspace_id,
+            Signal.status == SignalStatus.active,
+        )
+    )
+    return set(result.scalars().all())
+
+
+async def get_theme_preview_signals(
+    db: AsyncSession,
+    *,
+    workspace_id: uuid.UUID,
+    theme_ids: Collection[uuid.UUID],
+    per_theme: int,
+    filters: Sequence[ColumnElement[bool]] = (),
+) -> dict[uuid.UUID, list[Signal]]:
+    """The newest ``per_theme`` signals of each theme, newest first.
+
+    Ranked per theme in SQL, so only the preview rows are loaded.
+    """
+    if not theme_ids:
+        return {}
+    ranked = (
+        select(
+            Signal.id,
+            func.row_number()
+            .over(
+                partition_by=signal_theme_match_key(),
+                order_by=(
+                    Signal.occurred_at.desc(),
+                    Signal.created_at.desc(),
+                    Signal.id.desc(),
+                ),
+            )
+            .label("theme_rank"),
+        )
+        .where(
+            Signal.workspace_id == workspace_id,
+            Signal.status == SignalStatus.active,
+            signal_theme_match_key().in_([str(theme_id) for theme_id in theme_ids]),
+            *filters,
+        )
+        .subquery()
+    )
+    result = await db.execute(
+        select(Signal)
+        .where(Signal.id.in_(select(ranked.c.id).where(ranked.c.theme_rank <= per_theme)))
+        .order_by(Signal.occurred_at.desc(), Signal.created_at.desc(), Signal.id.desc())
+    )
+    previews: dict[uuid.UUID, list[Signal]] = {}
+    for signal in result.scalars().all():
+        theme_id = _parse_theme_match_id(signal.metadata_json)
+        if theme_id is not None:
+            previews.setdefault(theme_id, []).append(signal)
+    return previews
+
 
-    stmt = stmt.order_by(Signal.occurred_at.desc(), Signal.created_at.desc())
+async def count_theme_signal_interviews(
+    db: AsyncSession,
+    *,
+    workspace_id: uuid.UUID,
+    theme_ids: Collection[uuid.UUID],
+    filters: Sequence[ColumnElement[bool]] = (),
+) -> int:
+    """Distinct ``metadata_json.interview_id`` values among the themes' signals."""
+    if not theme_ids:
+        return 0
+    interview_id = Signal.metadata_json["interview_id"].as_string()
+    result = await db.execute(
+        select(func.count(distinct(interview_id))).where(
+            Signal.workspace_id == workspace_id,
+            Signal.status == SignalStatus.active,
+            signal_theme_match_key().in_([str(theme_id) for theme_id in theme_ids]),
+            interview_id.is_not(None),
+            interview_id != "",
+            *filters,
+        )
+    )
+    return result.scalar_one()
+
+
+def _workspace_signals_stmt(
+    *,
+    workspace_id: uuid.UUID,
+    source_filter: SourceType | None = None,
+    sentiment: str | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    theme_id: uuid.UUID | None = None,
+):
+    stmt = select(Signal).where(
+        Signal.workspace_id == workspace_id,
+        Signal.status == SignalStatus.active,
+        *signal_filter_conditions(
+            source_types=(source_filter,) if source_filter is not None else (),
+            sentiment=sentiment,
+            date_from=date_from,
+            date_to=date_to,
+        ),
+    )
+    if theme_id is not None:
+        stmt = stmt.where(signal_theme_match_key() == str(theme_id))
+    return stmt.order_by(
+        Signal.occurred_at.desc(),
+        Signal.created_at.desc(),
+        Signal.id.desc(),
+    )
+
+
+async def get_workspace_signals(
+    db: AsyncSession,
+    *,
+    workspace_id: uuid.UUID,
+    source_filter: SourceType | None = None,
+    sentiment: str | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    theme_id: uuid.UUID | None = None,
+    full_content: bool = False,
+) -> list[Signal]:
+    """Active workspace signals, newest first; ``theme_id`` narrows them to
+    one theme's matched evidence through the theme-match index."""
+    stmt = _workspace_signals_stmt(
+        workspace_id=workspace_id,
+        source_filter=source_filter,
+        sentiment=sentiment,
+        date_from=date_from,
+        date_to=date_to,
+        theme_id=theme_id,
+    )
+    if full_content:
+        stmt = stmt.options(undefer(Signal.content_text))
     result = await db.execute(stmt)
     return list(result.scalars().all())
+
+
+class InvalidFeedCursor(ValueError):
+    pass
+
+
+def encode_feed_cursor(signal: Signal, *, rank: float | None = None) -> str:
+    """Opaque keyset cursor pointing just past ``signal`` in feed order.
+
+    Search pages are ordered by relevance first, so their cursors also
+    carry the signal's ``rank``.
+    """
+    values = [signal.occurred_at.isoformat(), signal.created_at.isoformat(), str(signal.id)]
+    if rank is not None:
+        values.insert(0, rank)
+    payload = json.dumps(values, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_feed_cursor(cursor: str, *, ranked: bool = False) -> tuple:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+        rank = None
+        if ranked:
+            rank, *values = values
+            if isinstance(rank, bool) or not isinstance(rank, (int, float)):
+                raise ValueError("cursor rank must be a number")
+        occurred_at, created_at, signal_id = values
+        keys = (
+            datetime.fromisoformat(occurred_at),
+            datetime.fromisoformat(created_at),
+            uuid.UUID(signal_id),
+        )
+        return (float(rank), *keys) if ranked else keys
+    except (TypeError, ValueError) as exc:
+        raise InvalidFeedCursor("Invalid feed cursor") from exc
+
+
+async def get_workspace_signals_page(
+    db: AsyncSession,
+    *,
+    workspace_id: uuid.UUID,
+    source_filter: SourceType | None = None,
+    sentiment: str | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    q: str | None = None,
+    theme_id: uuid.UUID | None = None,
+    limit: int = FEED_PAGE_SIZE,
+    cursor: str | None = None,
+) -> tuple[list[Signal], str | None]:
+    """One keyset page of the feed, newest first.
+
+    Pages are ordered by ``(occurred_at, created_at, id)`` descending and
+    resumed from an opaque ``cursor``, so deep pages cost the same as the
+    first one. With a search query ``q`` only matching signals are returned,
+    most relevant first; with ``theme_id`` only that theme's evidence.
+    Returns the page and the next page's cursor (``None`` on the last page).
+    """
+    stmt = _workspace_signals_stmt(
+        workspace_id=workspace_id,
+        source_filter=source_filter,
+        sentiment=sentiment,
+        date_from=date_from,
+        date_to=date_to,
+        theme_id=theme_id,
+    )
+    feed_order = (Signal.occurred_at, Signal.created_at, Signal.id)
+
+    q = normalize_search_query(q)
+    if q is None:
+        if cursor:
+            stmt = stmt.where(tuple_(*feed_order) < tuple_(*decode_feed_cursor(cursor)))
+        result = await db.execute(stmt.limit(limit + 1))
+        signals = list(result.scalars().all())
+        if len(signals) <= limit:
+            return signals, None
+        signals = signals[:limit]
+        return signals, encode_feed_cursor(signals[-1])
+
+    tsquery = websearch_query(q)
+    rank = search_rank(Signal.search_vector, tsquery)
+    stmt = (
+        stmt.add_columns(rank.label("search_rank"))
+        .where(matches(Signal.search_vector, tsquery))
+        .order_by(None)
+        .order_by(rank.desc(), *(column.desc() for column in feed_order))
+    )
+    if cursor:
+        stmt = stmt.where(
+            tuple_(rank, *feed_order) < tuple_(*decode_feed_cursor(cursor, ranked=True))
+        )
+    rows = (await db.execute(stmt.limit(limit + 1))).all()
+    signals = [row.Signal for row in rows[:limit]]
+    if len(rows) <= limit:
+        return signals, None
+    return signals, encode_feed_cursor(signals[-1], rank=rows[limit - 1].search_rank)
+
+
+async def get_signal_theme_lookup(
+    db: AsyncSession,
+    *,
+    user_id: uuid.UUID,
+    signals: list[Signal],
+) -> dict[uuid.UUID, Theme]:
+    """Load only the themes that ``signals`` are matched to, for theme chips."""
+    theme_ids = {
+        theme_id
+        for theme_id in (_parse_theme_match_id(signal.metadata_json) for signal in signals)
+        if theme_id is not None
+    }
+    if not theme_ids:
+        return {}
+    result = await db.execute(
+        select(Theme).where(Theme.user_id == user_id, Theme.id.in_(theme_ids))
+    )
+    return {theme.id: theme for theme in result.scalars().all()}
@@ -6,7 +6,9 @@ sync-run bookkeeping, and idempotent source-item upserts.
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import (
@@ -105,6 +107,11 @@ ALLOWED_CONNECTION_TRANSITIONS: dict[
 }
 
 
+# Rows per statement for set-based source-item writes. Keeps each statement
+# well under asyncpg's 32,767 bind-parameter ceiling.
+SOURCE_ITEM_BULK_CHUNK_SIZE = 1000
+
+
 class InvalidSourceConnectionTransition(ValueError):
     """Raised when a caller attempts an invalid connection status change."""
 
@@ -303,6 +310,35 @@ def fail_sync_run(
     return sync_run
 
 
+def defer_sync_run(
+    sync_run: SyncRun,
+    *,
+    connection: SourceConnection,
+    error_summary: str,
+    cursor_out: dict | None = None,
+    records_seen: int = 0,
+    records_created: int = 0,
+    records_updated: int = 0,
+    records_unchanged: int = 0,
+) -> SyncRun:
+    """Close a rate-limited run without counting it as a failure.
+
+    The run keeps its checkpoint for the deferred retry, and the connection
+    returns to ``connected`` rather than ``error``.
+    """
+    sync_run.status = SyncRunStatus.deferred
+    sync_run.finished_at = datetime.now(timezone.utc)
+    sync_run.cursor_out = cursor_out
+    sync_run.records_seen = records_seen
+    sync_run.records_created = records_created
+    sync_run.records_updated = records_updated
+    sync_run.records_unchanged = records_unchanged
+    sync_run.error_summary = error_summary
+
+    transition_source_connection(connection, SourceConnectionStatus.connected)
+    return sync_run
+
+
 async def upsert_source_item(
     db: AsyncSession,
     *,
@@ -350,6 +386,117 @@ async def upsert_source_item(
     return source_item, False, is_unchanged
 
 
+async def get_source_items_by_external_id(
+    db: AsyncSession,
+    *,
+    source_connection_id: uuid.UUID,
+    external_ids: list[str],
+) -> dict[str, Row]:
+    """Load ``(id, external_id, checksum)`` for existing items in one query."""
+    if not external_ids:
+        return {}
+    stmt = select(
+        SourceItem.id,
+        SourceItem.external_id,
+        SourceItem.checksum,
+    ).where(
+        SourceItem.source_connection_id == source_connection_id,
+        SourceItem.external_id.in_(external_ids),
+    )
+    result = await db.execute(stmt)
+    return {row.external_id: row for row in result.all()}
+
+
+async def get_source_item_checksums(
+    db: AsyncSession,
+    *,
+    source_connection_id: uuid.UUID,
+) -> dict[str, str]:
+    """Load ``{external_id: checksum}`` for every checksummed item of a connection."""
+    stmt = select(SourceItem.external_id, SourceItem.checksum).where(
+        SourceItem.source_connection_id == source_connection_id,
+        SourceItem.checksum.is_not(None),
+    )
+    result = await db.execute(stmt)
+    return {row.external_id: row.checksum for row in result.all()}
+
+
+async def touch_source_items(
+    db: AsyncSession,
+    *,
+    source_connection_id: uuid.UUID,
+    external_ids: list[str],
+) -> None:
+    """Bump ``last_seen_at`` for items that were re-read without changes."""
+    now = datetime.now(timezone.utc)
+    external_ids = list(dict.fromkeys(external_ids))
+    for start in range(0, len(external_ids), SOURCE_ITEM_BULK_CHUNK_SIZE):
+        await db.execute(
+            update(SourceItem)
+            .where(
+                SourceItem.source_connection_id == source_connection_id,
+                SourceItem.external_id.in_(
+                    external_ids[start:start + SOURCE_ITEM_BULK_CHUNK_SIZE]
+                ),
+            )
+            .values(last_seen_at=now)
+            .execution_options(synchronize_session=False)
+        )
+
+
+async def bulk_upsert_source_items(
+    db: AsyncSession,
+    *,
+    workspace_id: uuid.UUID,
+    source_connection_id: uuid.UUID,
+    items: list[dict],
+) -> dict[str, uuid.UUID]:
+    """Set-based counterpart of ``upsert_source_item``.
+
+    Each item dict carries ``external_id``, ``source_record_type`` and
+    optionally ``external_updated_at``, ``native_entity_type``,
+    ``native_entity_id`` and ``checksum``. Rows are written with
+    ``INSERT ... ON CONFLICT (source_connection_id, external_id) DO UPDATE``
+    and the method returns ``{external_id: source_item_id}``. Duplicate
+    external ids in ``items`` collapse to the last occurrence.
+    """
+    now = datetime.now(timezone.utc)
+    rows_by_external_id: dict[str, dict] = {}
+    for item in items:
+        rows_by_external_id[item["external_id"]] = {
+            "id": uuid.uuid4(),
+            "workspace_id": workspace_id,
+            "source_connection_id": source_connection_id,
+            "external_id": item["external_id"],
+            "source_record_type": item["source_record_type"],
+            "external_updated_at": item.get("external_updated_at"),
+            "native_entity_type": item.get("native_entity_type"),
+            "native_entity_id": item.get("native_entity_id"),
+            "checksum": item.get("checksum"),
+            "last_seen_at": now,
+        }
+
+    rows = list(rows_by_external_id.values())
+    item_ids: dict[str, uuid.UUID] = {}
+    for start in range(0, len(rows), SOURCE_ITEM_BULK_CHUNK_SIZE):
+        chunk = rows[start:start + SOURCE_ITEM_BULK_CHUNK_SIZE]
+        stmt = pg_insert(SourceItem).values(chunk)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_source_items_connection_external_id",
+            set_={
+                "source_record_type": stmt.excluded.source_record_type,
+                "external_updated_at": stmt.excluded.external_updated_at,
+                "native_entity_type": stmt.excluded.native_entity_type,
+                "native_entity_id": stmt.excluded.native_entity_id,
+                "checksum": stmt.excluded.checksum,
+                "last_seen_at": stmt.excluded.last_seen_at,
+            },
+        ).returning(SourceItem.external_id, SourceItem.id)
+        result = await db.execute(stmt)
+        item_ids.update({row.external_id: row.id for row in result.all()})
+    return item_ids
+
+
 async def rotate_credentials(
     db: AsyncSession,
     *,
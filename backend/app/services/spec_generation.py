@@ -37,6 +37,7 @@ from app.services.signals import (
     build_source_breakdown,
     calculate_impact_score,
     is_voice_signal,
+    signal_preview_text,
 )
 
 logger = logging.getLogger(__name__)
@@ -61,11 +62,11 @@ def build_spec_evidence(theme_signals: list[Signal]) -> list[dict]:
 
     evidence: list[dict] = []
     for ref, signal in enumerate([*voice, *metric], start=1):
-        content_text = signal.content_text or ""
+        preview = signal_preview_text(signal)
         excerpt = (
-            content_text
-            if len(content_text) <= EVIDENCE_EXCERPT_CHARS
-            else f"{content_text[:EVIDENCE_EXCERPT_CHARS - 3]}..."
+            preview
+            if len(preview) <= EVIDENCE_EXCERPT_CHARS
+            else f"{preview[:EVIDENCE_EXCERPT_CHARS - 3]}..."
         )
         evidence.append(
             {
@@ -0,0 +1,210 @@
+"""
+Spec10x — Streaming survey/NPS CSV import
+
+Rows are read incrementally from the uploaded file and normalized and
+persisted in fixed-size chunks (``IMPORT_CHUNK_ROWS``), one transaction
+per chunk, so memory stays bounded for multi-hundred-MB exports.
+
+Small uploads import inline in the confirm request; larger ones are staged
+in object storage and imported by ``import_survey_csv_job`` in the worker,
+which reports progress over the WebSocket processing channel.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import tempfile
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import BinaryIO
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.connectors.csv_import import IMPORT_CHUNK_ROWS, CSVImportConnector, iter_csv_chunks
+from app.core.pubsub import publish_import_progress
+from app.core.storage import delete_file, download_file
+from app.models import DataSource, SourceConnection, SyncRun, SyncRunStatus
+from app.services.signals import upsert_external_signals
+from app.services.sources import complete_sync_run, fail_sync_run
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CSVImportCounts:
+    records_seen: int = 0
+    records_created: int = 0
+    records_updated: int = 0
+    records_unchanged: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "records_seen": self.records_seen,
+            "records_created": self.records_created,
+            "records_updated": self.records_updated,
+            "records_unchanged": self.records_unchanged,
+        }
+
+
+ProgressCallback = Callable[[CSVImportCounts], Awaitable[None]]
+
+
+def survey_import_storage_path(workspace_id: uuid.UUID, sync_run_id: uuid.UUID) -> str:
+    return f"survey-imports/{workspace_id}/{sync_run_id}.csv"
+
+
+async def import_csv_stream(
+    db: AsyncSession,
+    *,
+    connection: SourceConnection,
+    data_source: DataSource,
+    sync_run: SyncRun,
+    stream: BinaryIO,
+    chunk_size: int | None = None,
+    on_progress: ProgressCallback | None = None,
+) -> CSVImportCounts:
+    """Normalize and upsert a validated CSV chunk by chunk.
+
+    Commits after every chunk with the running counts on ``sync_run``, so
+    import history shows progress and a failure keeps the rows already
+    persisted (re-importing the same file is idempotent by external id).
+    """
+    connector = CSVImportConnector(db=db, connection=connection)
+    counts = CSVImportCounts()
+
+    chunk_size = chunk_size or IMPORT_CHUNK_ROWS
+    for start_index, rows in iter_csv_chunks(stream, chunk_size=chunk_size):
+        signals = await connector.normalize(rows, start_index=start_index)
+        created, updated, unchanged = await upsert_external_signals(
+            db,
+            connection=connection,
+            data_source=data_source,
+            signals=signals,
+        )
+        counts.records_seen += len(rows)
+        counts.records_created += created
+        counts.records_updated += updated
+        counts.records_unchanged += unchanged
+
+        sync_run.records_seen = counts.records_seen
+        sync_run.records_created = counts.records_created
+        sync_run.records_updated = counts.records_updated
+        sync_run.records_unchanged = counts.records_unchanged
+        await db.commit()
+
+        if on_progress is not None:
+            await on_progress(counts)
+
+    return counts
+
+
+async def run_survey_import(
+    db: AsyncSession,
+    *,
+    sync_run_id: uuid.UUID,
+    storage_path: str,
+    user_id: str,
+    final_attempt: bool = True,
+) -> SyncRunStatus | None:
+    """Import a staged CSV for a queued sync run (worker side).
+
+    Downloads the file to a temp path, streams it through
+    ``import_csv_stream`` and deletes the temp copy afterwards. The staged
+    upload is deleted once the run has succeeded or failed; an attempt cut
+    short by the job timeout keeps it for the worker's retry unless it was
+    the ``final_attempt``.
+    """
+    result = await db.execute(
+        select(SyncRun)
+        .where(SyncRun.id == sync_run_id)
+        .options(
+            selectinload(SyncRun.source_connection).selectinload(
+                SourceConnection.data_source
+            )
+        )
+    )
+    sync_run = result.scalar_one_or_none()
+    if sync_run is None or sync_run.status != SyncRunStatus.running:
+        logger.warning("Survey import: sync run %s is not pending, skipping", sync_run_id)
+        return sync_run.status if sync_run else None
+
+    connection = sync_run.source_connection
+    import_name = (connection.config_json or {}).get("import_name", "CSV import")
+
+    async def _report(counts: CSVImportCounts) -> None:
+        await publish_import_progress(
+            user_id,
+            str(sync_run.id),
+            "running",
+            f"Imported {counts.records_seen} rows from {import_name}",
+            counts.as_dict(),
+        )
+
+    async def _fail(error_summary: str) -> None:
+        await db.rollback()
+        # Chunks committed before the failure stay; report their counts.
+        await db.refresh(sync_run)
+        await db.refresh(connection)
+        fail_sync_run(
+            sync_run,
+            connection=connection,
+            error_summary=error_summary,
+            records_seen=sync_run.records_seen or 0,
+            records_created=sync_run.records_created or 0,
+            records_updated=sync_run.records_updated or 0,
+            records_unchanged=sync_run.records_unchanged or 0,
+        )
+        await db.commit()
+        await publish_import_progress(
+            user_id,
+            str(sync_run.id),
+            "failed",
+            f"Import failed: {error_summary}",
+        )
+
+    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".csv")
+    tmp.close()
+    try:
+        await asyncio.to_thread(download_file, storage_path, tmp.name)
+        with open(tmp.name, "rb") as stream:
+            counts = await import_csv_stream(
+                db,
+                connection=connection,
+                data_source=connection.data_source,
+                sync_run=sync_run,
+                stream=stream,
+                on_progress=_report,
+            )
+        complete_sync_run(sync_run, connection=connection, **counts.as_dict())
+        await db.commit()
+        await publish_import_progress(
+            user_id,
+            str(sync_run.id),
+            "succeeded",
+            f"Imported {counts.records_seen} rows from {import_name}",
+            counts.as_dict(),
+        )
+    except asyncio.CancelledError:
+        # The job timeout cancels the attempt. A retry resumes the run;
+        # without one it would sit in running until the recovery sweep.
+        if final_attempt:
+            logger.warning("Survey import timed out for sync run %s", sync_run_id)
+            await _fail("Import timed out")
+        raise
+    except Exception as exc:
+        logger.exception("Survey import failed for sync run %s", sync_run_id)
+        await _fail(str(exc))
+    finally:
+        os.unlink(tmp.name)
+        if sync_run.status != SyncRunStatus.running or final_attempt:
+            try:
+                await asyncio.to_thread(delete_file, storage_path)
+            except Exception:
+                logger.warning("Could not delete staged import %s", storage_path, exc_info=True)
+
+    return sync_run.status
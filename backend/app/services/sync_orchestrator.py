@@ -10,15 +10,34 @@ the database bookkeeping so connectors stay lean.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import math
+import uuid
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import selectinload
 
 from app.connectors import get_connector
-from app.connectors.base import BaseConnector, ConnectorError, NormalizedSignal, SyncResult
+from app.connectors.base import (
+    BaseConnector,
+    ConnectorError,
+    NormalizedSignal,
+    StreamingConnector,
+    SyncResult,
+)
+from app.core.jobs import job_dispatcher
+from app.core.rate_limits import provider_rate_limiter
+from app.core.sync_telemetry import (
+    collect_sync_telemetry,
+    current_telemetry,
+    record_page,
+    timed,
+)
 from app.models import (
     DataSource,
     SourceConnection,
@@ -30,8 +49,11 @@ from app.models import (
 from app.services.signals import upsert_external_signals
 from app.services.sources import (
     complete_sync_run,
+    defer_sync_run,
     fail_sync_run,
+    get_source_item_checksums,
     start_sync_run,
+    touch_source_items,
     transition_source_connection,
 )
 
@@ -40,6 +62,26 @@ logger = logging.getLogger(__name__)
 # After this many consecutive failed syncs, the connection is auto-suspended.
 CONSECUTIVE_FAILURE_THRESHOLD = 5
 
+# A run still ``running`` after this long was interrupted (worker crash or
+# redeploy). Kept above the worker's one-hour job timeout so live runs are
+# never touched.
+INTERRUPTED_RUN_AFTER = timedelta(hours=2)
+
+# Concurrent scheduled syncs allowed per provider, so fanning out across
+# tenants never trips an upstream rate limit. Unlisted providers get the
+# default.
+PROVIDER_SYNC_CONCURRENCY = {
+    "zendesk": 4,
+    "fireflies": 2,
+    "otter": 2,
+    "posthog": 2,
+}
+DEFAULT_PROVIDER_SYNC_CONCURRENCY = 2
+
+# Floor for a rate-limit deferral, so a zero or missing Retry-After never
+# re-enqueues a sync straight back into the limit.
+MIN_SYNC_DEFER_SECONDS = 5
+
 
 async def _persist_signals(
     db: AsyncSession,
@@ -47,14 +89,47 @@ async def _persist_signals(
     connection: SourceConnection,
     data_source: DataSource,
     signals: list[NormalizedSignal],
+    known_checksums: dict[str, str],
 ) -> tuple[int, int, int]:
-    """Upsert source items and normalized signals for a source connection."""
-    return await upsert_external_signals(
-        db,
-        connection=connection,
-        data_source=data_source,
-        signals=signals,
-    )
+    """Upsert source items and normalized signals for a source connection.
+
+    Records whose checksum matches ``known_checksums`` (the connection's
+    stored checksums, loaded once per run) skip theme matching and signal
+    comparison entirely; they only get one bulk ``last_seen_at`` update.
+    ``known_checksums`` is advanced with the records written here.
+    """
+    changed: list[NormalizedSignal] = []
+    unchanged_ids: list[str] = []
+    for normalized in signals:
+        if (
+            normalized.checksum is not None
+            and known_checksums.get(normalized.external_id) == normalized.checksum
+        ):
+            unchanged_ids.append(normalized.external_id)
+        else:
+            changed.append(normalized)
+
+    with timed("persist"):
+        if unchanged_ids:
+            await touch_source_items(
+                db,
+                source_connection_id=connection.id,
+                external_ids=unchanged_ids,
+            )
+        if not changed:
+            return 0, 0, len(unchanged_ids)
+
+        created, updated, unchanged = await upsert_external_signals(
+            db,
+            connection=connection,
+            data_source=data_source,
+            signals=changed,
+        )
+
+    for normalized in changed:
+        if normalized.checksum is not None:
+            known_checksums[normalized.external_id] = normalized.checksum
+    return created, updated, unchanged + len(unchanged_ids)
 
 
 def _calculate_duration_ms(sync_run: SyncRun) -> int | None:
@@ -102,6 +177,7 @@ def _log_sync_event(
         ),
         "duration_ms": duration_ms,
         "time_to_first_insight_ms": time_to_first_insight_ms,
+        "telemetry": sync_run.telemetry,
         "error_summary": sync_run.error_summary,
     }
     logger.info(json.dumps(payload, default=str))
@@ -114,11 +190,15 @@ async def _count_consecutive_failures(
     """Count the number of consecutive failed sync runs for this connection.
 
     Walks backward from the most recent run and stops at the first non-failed
-    run (or the end of history).
+    run (or the end of history). Deferred runs are skipped.
     """
     stmt = (
         select(SyncRun.status)
-        .where(SyncRun.source_connection_id == connection.id)
+        .where(
+            SyncRun.source_connection_id == connection.id,
+            # Rate-limit deferrals are neither failures nor successes.
+            SyncRun.status != SyncRunStatus.deferred,
+        )
         .order_by(SyncRun.started_at.desc())
         .limit(CONSECUTIVE_FAILURE_THRESHOLD + 1)
     )
@@ -160,6 +240,304 @@ async def _maybe_suspend_connection(
     return False
 
 
+async def _resolve_cursor_in(
+    db: AsyncSession,
+    connection: SourceConnection,
+    *,
+    run_type: SyncRunType | None = None,
+) -> tuple[SyncRun | None, dict[str, Any] | None]:
+    """Return the last successful run and the cursor the next run starts from.
+
+    Normally that is the last successful run's ``cursor_out``. If a newer
+    run failed or was deferred after checkpointing pages (streaming
+    connectors), its checkpoint wins so the sync resumes from the last
+    committed page.
+    """
+    filters = [SyncRun.source_connection_id == connection.id]
+    if run_type is not None:
+        filters.append(SyncRun.run_type == run_type)
+
+    last_run_stmt = (
+        select(SyncRun)
+        .where(*filters, SyncRun.status == SyncRunStatus.succeeded)
+        .order_by(SyncRun.started_at.desc())
+        .limit(1)
+    )
+    last_run_result = await db.execute(last_run_stmt)
+    last_run = last_run_result.scalar_one_or_none()
+    cursor_in = last_run.cursor_out if last_run else None
+
+    checkpoint_stmt = select(SyncRun.cursor_out).where(
+        *filters,
+        SyncRun.status.in_([SyncRunStatus.failed, SyncRunStatus.deferred]),
+    )
+    if last_run is not None:
+        checkpoint_stmt = checkpoint_stmt.where(SyncRun.started_at > last_run.started_at)
+    checkpoint_result = await db.execute(
+        checkpoint_stmt.order_by(SyncRun.started_at.desc()).limit(1)
+    )
+    checkpoint = checkpoint_result.scalar_one_or_none()
+    if checkpoint:
+        cursor_in = checkpoint
+
+    return last_run, cursor_in
+
+
+async def _run_connector(
+    db: AsyncSession,
+    *,
+    connector: BaseConnector,
+    sync_run: SyncRun,
+    connection: SourceConnection,
+    data_source: DataSource,
+    cursor_in: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """Fetch and persist one run's records; return the completion kwargs.
+
+    Per-phase timings and HTTP counters are collected into
+    ``sync_run.telemetry`` whether the run succeeds or fails.
+    """
+    with collect_sync_telemetry() as telemetry:
+        try:
+            return await _fetch_and_persist(
+                db,
+                connector=connector,
+                sync_run=sync_run,
+                connection=connection,
+                data_source=data_source,
+                cursor_in=cursor_in,
+            )
+        finally:
+            sync_run.telemetry = telemetry.as_dict()
+
+
+async def _fetch_and_persist(
+    db: AsyncSession,
+    *,
+    connector: BaseConnector,
+    sync_run: SyncRun,
+    connection: SourceConnection,
+    data_source: DataSource,
+    cursor_in: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """Streaming connectors are persisted page by page: after each page the
+    run's counts and ``cursor_out`` checkpoint are committed, so peak memory
+    is one page and a crash resumes from the last committed page.
+    """
+    is_backfill = sync_run.run_type == SyncRunType.backfill
+    known_checksums: dict[str, str] | None = None
+
+    async def _persist(signals: list[NormalizedSignal]) -> tuple[int, int, int]:
+        nonlocal known_checksums
+        if known_checksums is None:
+            with timed("persist"):
+                known_checksums = await get_source_item_checksums(
+                    db, source_connection_id=connection.id
+                )
+        return await _persist_signals(
+            db,
+            connection=connection,
+            data_source=data_source,
+            signals=signals,
+            known_checksums=known_checksums,
+        )
+
+    if isinstance(connector, StreamingConnector):
+        pages = (
+            connector.iter_backfill_pages(sync_run, cursor_in=cursor_in)
+            if is_backfill
+            else connector.iter_incremental_pages(sync_run, cursor_in=cursor_in)
+        )
+        sync_run.cursor_out = cursor_in
+        sync_run.records_seen = 0
+        sync_run.records_created = 0
+        sync_run.records_updated = 0
+        sync_run.records_unchanged = 0
+        telemetry = current_telemetry()
+        while True:
+            with timed("fetch"):
+                page = await anext(pages, None)
+            if page is None:
+                break
+            record_page()
+            if page.signals:
+                records_created, records_updated, records_unchanged = await _persist(
+                    page.signals
+                )
+                sync_run.records_created += records_created
+                sync_run.records_updated += records_updated
+                sync_run.records_unchanged += records_unchanged
+            sync_run.records_seen += page.records_seen
+            if page.cursor_out:
+                sync_run.cursor_out = page.cursor_out
+            if telemetry is not None:
+                sync_run.telemetry = telemetry.as_dict()
+            await db.commit()
+
+        return {
+            "cursor_out": sync_run.cursor_out,
+            "records_seen": sync_run.records_seen,
+            "records_created": sync_run.records_created,
+            "records_updated": sync_run.records_updated,
+            "records_unchanged": sync_run.records_unchanged,
+        }
+
+    with timed("fetch"):
+        if is_backfill:
+            result: SyncResult = await connector.backfill(sync_run, cursor_in=cursor_in)
+        else:
+            result = await connector.sync_incremental(sync_run, cursor_in=cursor_in)
+
+    if result.signals:
+        records_created, records_updated, records_unchanged = await _persist(result.signals)
+    else:
+        # Materializing connectors (e.g. Fireflies) persist their own
+        # records and report counts directly.
+        records_created = result.records_created
+        records_updated = result.records_updated
+        records_unchanged = result.records_unchanged
+
+    return {
+        "cursor_out": result.cursor_out,
+        "records_seen": result.records_seen,
+        "records_created": records_created,
+        "records_updated": records_updated,
+        "records_unchanged": records_unchanged,
+    }
+
+
+def _checkpoint_kwargs(sync_run: SyncRun) -> dict[str, Any]:
+    """Progress to keep on a failed run so the next run can resume from it."""
+    return {
+        "cursor_out": sync_run.cursor_out,
+        "records_seen": sync_run.records_seen or 0,
+        "records_created": sync_run.records_created or 0,
+        "records_updated": sync_run.records_updated or 0,
+        "records_unchanged": sync_run.records_unchanged or 0,
+    }
+
+
+async def _enqueue_deferred_sync(
+    connection_id: uuid.UUID,
+    *,
+    run_type: SyncRunType,
+    defer_seconds: int,
+) -> bool:
+    """Schedule ``deferred_connector_sync`` to resume this connection later.
+
+    The job id is per connection and run type, so overlapping deferrals
+    collapse into one queued resume (plus at most one follow-up while a
+    resume is running) instead of stacking duplicate syncs. The resume
+    picks up from the connection's latest checkpoint, whichever run left it.
+    Returns ``False`` if Redis is unreachable — the hourly cron then picks
+    the connection up from its checkpoint.
+    """
+    try:
+        await job_dispatcher.enqueue_unique(
+            "deferred_connector_sync",
+            str(connection_id),
+            run_type.value,
+            job_id=f"connector-sync:{connection_id}:{run_type.value}",
+            defer_by=timedelta(seconds=defer_seconds),
+        )
+    except Exception:
+        logger.warning(
+            "Could not enqueue deferred sync for connection=%s", connection_id, exc_info=True
+        )
+        return False
+    return True
+
+
+async def _defer_rate_limited_run(
+    *,
+    exc: ConnectorError,
+    connector: BaseConnector,
+    sync_run: SyncRun,
+    connection: SourceConnection,
+    data_source: DataSource,
+) -> None:
+    """Checkpoint a rate-limited run and re-enqueue it after ``Retry-After``.
+
+    The upstream account's shared budget is paused for the same window so
+    no other worker walks into the limit meanwhile; other accounts on the
+    provider are unaffected.
+    """
+    retry_after = exc.retry_after or 0.0
+    defer_seconds = max(math.ceil(retry_after), MIN_SYNC_DEFER_SECONDS)
+    defer_sync_run(
+        sync_run,
+        connection=connection,
+        error_summary=str(exc),
+        **_checkpoint_kwargs(sync_run),
+    )
+    await provider_rate_limiter.pause(
+        data_source.provider,
+        connector.rate_limit_account,
+        retry_after,
+    )
+    _log_sync_event(
+        event="sync_run_deferred",
+        sync_run=sync_run,
+        connection=connection,
+        data_source=data_source,
+        status="deferred",
+        duration_ms=_calculate_duration_ms(sync_run),
+    )
+    logger.info(
+        "Sync rate limited for connection=%s; resuming in %ds",
+        connection.id,
+        defer_seconds,
+    )
+    await _enqueue_deferred_sync(
+        connection.id,
+        run_type=sync_run.run_type,
+        defer_seconds=defer_seconds,
+    )
+
+
+async def recover_interrupted_sync_runs(db: AsyncSession) -> int:
+    """Fail runs left ``running`` by a dead worker so their connections can sync again.
+
+    Streaming runs commit page checkpoints while the connection is
+    ``syncing``; a crash would otherwise leave the connection stuck there.
+    The failed run keeps its checkpoint, which the next run resumes from.
+    """
+    cutoff = datetime.now(timezone.utc) - INTERRUPTED_RUN_AFTER
+    stmt = (
+        select(SyncRun)
+        .where(
+            SyncRun.status == SyncRunStatus.running,
+            SyncRun.started_at < cutoff,
+        )
+        .options(selectinload(SyncRun.source_connection))
+    )
+    result = await db.execute(stmt)
+    recovered = 0
+    for sync_run in result.scalars().all():
+        connection = sync_run.source_connection
+        error_summary = "Sync interrupted before completion; the next run resumes from its last checkpoint"
+        if connection.status == SourceConnectionStatus.syncing:
+            fail_sync_run(
+                sync_run,
+                connection=connection,
+                error_summary=error_summary,
+                **_checkpoint_kwargs(sync_run),
+            )
+        else:
+            sync_run.status = SyncRunStatus.failed
+            sync_run.finished_at = datetime.now(timezone.utc)
+            sync_run.error_summary = error_summary
+        recovered += 1
+        logger.warning(
+            "Recovered interrupted sync run %s for connection %s",
+            sync_run.id,
+            connection.id,
+        )
+
+    await db.flush()
+    return recovered
+
+
 async def run_backfill(
     db: AsyncSession,
     *,
@@ -179,20 +557,11 @@ async def run_backfill(
 
     connector: BaseConnector = connector_cls(db=db, connection=connection)
 
-    # Determine cursor_in from last successful backfill (for resumability)
-    last_run_stmt = (
-        select(SyncRun)
-        .where(
-            SyncRun.source_connection_id == connection.id,
-            SyncRun.run_type == SyncRunType.backfill,
-            SyncRun.status == SyncRunStatus.succeeded,
-        )
-        .order_by(SyncRun.started_at.desc())
-        .limit(1)
+    # Resume from the last successful backfill, or from the checkpoint of
+    # an interrupted one.
+    last_run, cursor_in = await _resolve_cursor_in(
+        db, connection, run_type=SyncRunType.backfill
     )
-    last_run_result = await db.execute(last_run_stmt)
-    last_run = last_run_result.scalar_one_or_none()
-    cursor_in = last_run.cursor_out if last_run else None
 
     sync_run = await start_sync_run(
         db,
@@ -209,33 +578,16 @@ async def run_backfill(
     )
 
     try:
-        result: SyncResult = await connector.backfill(
-            sync_run, cursor_in=cursor_in
-        )
-
-        if result.signals:
-            records_created, records_updated, records_unchanged = await _persist_signals(
-                db,
-                connection=connection,
-                data_source=data_source,
-                signals=result.signals,
-            )
-        else:
-            # Materializing connectors (e.g. Fireflies) persist their own
-            # records and report counts directly.
-            records_created = result.records_created
-            records_updated = result.records_updated
-            records_unchanged = result.records_unchanged
-
-        complete_sync_run(
-            sync_run,
+        outcome = await _run_connector(
+            db,
+            connector=connector,
+            sync_run=sync_run,
             connection=connection,
-            cursor_out=result.cursor_out,
-            records_seen=result.records_seen,
-            records_created=records_created,
-            records_updated=records_updated,
-            records_unchanged=records_unchanged,
+            data_source=data_source,
+            cursor_in=cursor_in,
         )
+        records_created = outcome["records_created"]
+        complete_sync_run(sync_run, connection=connection, **outcome)
         duration_ms = _calculate_duration_ms(sync_run)
         _log_sync_event(
             event="sync_run_succeeded",
@@ -248,27 +600,38 @@ async def run_backfill(
         )
 
     except ConnectorError as exc:
-        fail_sync_run(
-            sync_run,
-            connection=connection,
-            error_summary=str(exc),
-        )
-        _log_sync_event(
-            event="sync_run_failed",
-            sync_run=sync_run,
-            connection=connection,
-            data_source=data_source,
-            status="failed",
-            duration_ms=_calculate_duration_ms(sync_run),
-        )
-        logger.error("Backfill failed for connection=%s: %s", connection.id, exc)
-        await _maybe_suspend_connection(db, connection)
+        if exc.retry_after is not None:
+            await _defer_rate_limited_run(
+                exc=exc,
+                connector=connector,
+                sync_run=sync_run,
+                connection=connection,
+                data_source=data_source,
+            )
+        else:
+            fail_sync_run(
+                sync_run,
+                connection=connection,
+                error_summary=str(exc),
+                **_checkpoint_kwargs(sync_run),
+            )
+            _log_sync_event(
+                event="sync_run_failed",
+                sync_run=sync_run,
+                connection=connection,
+                data_source=data_source,
+                status="failed",
+                duration_ms=_calculate_duration_ms(sync_run),
+            )
+            logger.error("Backfill failed for connection=%s: %s", connection.id, exc)
+            await _maybe_suspend_connection(db, connection)
 
     except Exception as exc:
         fail_sync_run(
             sync_run,
             connection=connection,
             error_summary=f"Unexpected error: {exc}",
+            **_checkpoint_kwargs(sync_run),
         )
         _log_sync_event(
             event="sync_run_failed",
@@ -304,19 +667,9 @@ async def run_incremental_sync(
 
     connector: BaseConnector = connector_cls(db=db, connection=connection)
 
-    # Grab cursor from last successful sync (backfill or incremental)
-    last_run_stmt = (
-        select(SyncRun)
-        .where(
-            SyncRun.source_connection_id == connection.id,
-            SyncRun.status == SyncRunStatus.succeeded,
-        )
-        .order_by(SyncRun.started_at.desc())
-        .limit(1)
-    )
-    last_run_result = await db.execute(last_run_stmt)
-    last_run = last_run_result.scalar_one_or_none()
-    cursor_in = last_run.cursor_out if last_run else None
+    # Grab cursor from last successful sync (backfill or incremental), or
+    # from the checkpoint of an interrupted one.
+    last_run, cursor_in = await _resolve_cursor_in(db, connection)
 
     sync_run = await start_sync_run(
         db,
@@ -333,31 +686,16 @@ async def run_incremental_sync(
     )
 
     try:
-        result: SyncResult = await connector.sync_incremental(
-            sync_run, cursor_in=cursor_in
-        )
-
-        if result.signals:
-            records_created, records_updated, records_unchanged = await _persist_signals(
-                db,
-                connection=connection,
-                data_source=data_source,
-                signals=result.signals,
-            )
-        else:
-            records_created = result.records_created
-            records_updated = result.records_updated
-            records_unchanged = result.records_unchanged
-
-        complete_sync_run(
-            sync_run,
+        outcome = await _run_connector(
+            db,
+            connector=connector,
+            sync_run=sync_run,
             connection=connection,
-            cursor_out=result.cursor_out,
-            records_seen=result.records_seen,
-            records_created=records_created,
-            records_updated=records_updated,
-            records_unchanged=records_unchanged,
+            data_source=data_source,
+            cursor_in=cursor_in,
         )
+        records_created = outcome["records_created"]
+        complete_sync_run(sync_run, connection=connection, **outcome)
         duration_ms = _calculate_duration_ms(sync_run)
         _log_sync_event(
             event="sync_run_succeeded",
@@ -370,27 +708,38 @@ async def run_incremental_sync(
         )
 
     except ConnectorError as exc:
-        fail_sync_run(
-            sync_run,
-            connection=connection,
-            error_summary=str(exc),
-        )
-        _log_sync_event(
-            event="sync_run_failed",
-            sync_run=sync_run,
-            connection=connection,
-            data_source=data_source,
-            status="failed",
-            duration_ms=_calculate_duration_ms(sync_run),
-        )
-        logger.error("Incremental sync failed for connection=%s: %s", connection.id, exc)
-        await _maybe_suspend_connection(db, connection)
+        if exc.retry_after is not None:
+            await _defer_rate_limited_run(
+                exc=exc,
+                connector=connector,
+                sync_run=sync_run,
+                connection=connection,
+                data_source=data_source,
+            )
+        else:
+            fail_sync_run(
+                sync_run,
+                connection=connection,
+                error_summary=str(exc),
+                **_checkpoint_kwargs(sync_run),
+            )
+            _log_sync_event(
+                event="sync_run_failed",
+                sync_run=sync_run,
+                connection=connection,
+                data_source=data_source,
+                status="failed",
+                duration_ms=_calculate_duration_ms(sync_run),
+            )
+            logger.error("Incremental sync failed for connection=%s: %s", connection.id, exc)
+            await _maybe_suspend_connection(db, connection)
 
     except Exception as exc:
         fail_sync_run(
             sync_run,
             connection=connection,
             error_summary=f"Unexpected error: {exc}",
+            **_checkpoint_kwargs(sync_run),
         )
         _log_sync_event(
             event="sync_run_failed",
@@ -407,3 +756,81 @@ async def run_incremental_sync(
 
     await db.flush()
     return sync_run
+
+
+async def sync_connection_in_new_session(
+    session_factory: async_sessionmaker[AsyncSession],
+    connection_id: uuid.UUID,
+    *,
+    run_type: SyncRunType = SyncRunType.incremental,
+) -> SyncRunStatus | None:
+    """Run one sync in its own session and transaction.
+
+    Returns the run's final status, or ``None`` if no run happened or it
+    crashed. Errors are contained so one tenant's failure never rolls back
+    another tenant's sync.
+    """
+    async with session_factory() as db:
+        try:
+            stmt = (
+                select(SourceConnection)
+                .where(SourceConnection.id == connection_id)
+                .options(selectinload(SourceConnection.data_source))
+            )
+            result = await db.execute(stmt)
+            connection = result.scalar_one_or_none()
+            if connection is None or connection.status not in {
+                SourceConnectionStatus.connected,
+                SourceConnectionStatus.error,
+            }:
+                return None
+
+            run = run_backfill if run_type == SyncRunType.backfill else run_incremental_sync
+            sync_run = await run(
+                db,
+                connection=connection,
+                data_source=connection.data_source,
+            )
+            await db.commit()
+            return sync_run.status
+        except Exception:
+            await db.rollback()
+            logger.exception("Scheduled sync failed for connection %s", connection_id)
+            return None
+
+
+async def run_scheduled_incremental_syncs(
+    session_factory: async_sessionmaker[AsyncSession],
+    connections: list[tuple[uuid.UUID, str]],
+    *,
+    max_concurrency: int,
+) -> tuple[int, int]:
+    """Sync ``(connection_id, provider)`` pairs concurrently.
+
+    At most ``max_concurrency`` syncs run at once, and each provider is
+    further capped by ``PROVIDER_SYNC_CONCURRENCY``. Returns
+    ``(succeeded, failed)``; rate-limited runs that were deferred count as
+    neither.
+    """
+    overall_limit = asyncio.Semaphore(max(max_concurrency, 1))
+    provider_limits: dict[str, asyncio.Semaphore] = {}
+
+    async def _sync(connection_id: uuid.UUID, provider: str) -> SyncRunStatus | None:
+        provider_limit = provider_limits.setdefault(
+            provider,
+            asyncio.Semaphore(
+                PROVIDER_SYNC_CONCURRENCY.get(provider, DEFAULT_PROVIDER_SYNC_CONCURRENCY)
+            ),
+        )
+        # Take the provider slot first so a saturated provider never holds
+        # an overall slot another provider could use.
+        async with provider_limit:
+            async with overall_limit:
+                return await sync_connection_in_new_session(session_factory, connection_id)
+
+    outcomes = await asyncio.gather(
+        *(_sync(connection_id, provider) for connection_id, provider in connections)
+    )
+    succeeded = sum(1 for outcome in outcomes if outcome == SyncRunStatus.succeeded)
+    deferred = sum(1 for outcome in outcomes if outcome == SyncRunStatus.deferred)
+    return succeeded, len(outcomes) - succeeded - deferred
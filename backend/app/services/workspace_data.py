@@ -0,0 +1,96 @@
+"""
+Spec10x Backend — Request-scoped workspace data loader
+
+Theme, spec and outcome endpoints all resolve the data owner's personal
+workspace, run the signal consistency pass, and then read the active themes
+and the workspace's signals — often through several helpers in a row.
+``WorkspaceDataLoader`` memoizes each of those datasets for one request, so
+every helper that accepts it shares a single fetch. Routes get one shared
+instance per request through the ``get_workspace_loader`` dependency.
+"""
+
+from __future__ import annotations
+
+import uuid
+
+from fastapi import Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.auth import get_scoped_user
+from app.core.database import get_db
+from app.models import Signal, Theme, ThemeStatus, User, Workspace
+from app.services.signals import get_workspace_signals
+from app.services.sources import get_or_create_default_workspace
+
+
+class WorkspaceDataLoader:
+    """Memoized workspace, active themes and signal set of one data pool.
+
+    Lists are handed out as copies, so callers may sort or filter them
+    freely. After a write that changes themes or signals, call
+    ``invalidate`` so the next read fetches them again.
+    """
+
+    def __init__(self, db: AsyncSession, *, user_id: uuid.UUID) -> None:
+        self.db = db
+        self.user_id = user_id
+        # Set by ``ensure_signal_consistency`` once the pass has run.
+        self.consistent = False
+        self._workspace: Workspace | None = None
+        self._active_themes: list[Theme] | None = None
+        self._signals: list[Signal] | None = None
+        self._signals_full_content = False
+
+    async def workspace(self) -> Workspace:
+        if self._workspace is None:
+            user = await self.db.get(User, self.user_id)
+            if user is None:
+                raise ValueError(f"User {self.user_id} not found")
+            self._workspace = await get_or_create_default_workspace(self.db, user)
+        return self._workspace
+
+    async def active_themes(self) -> list[Theme]:
+        if self._active_themes is None:
+            result = await self.db.execute(
+                select(Theme).where(
+                    Theme.user_id == self.user_id,
+                    Theme.status == ThemeStatus.active,
+                )
+            )
+            self._active_themes = list(result.scalars().all())
+        return list(self._active_themes)
+
+    async def signals(self, *, full_content: bool = False) -> list[Signal]:
+        """Active workspace signals, newest first.
+
+        A set loaded with ``full_content`` also serves later plain reads.
+        """
+        if self._signals is None or (full_content and not self._signals_full_content):
+            workspace = await self.workspace()
+            self._signals = await get_workspace_signals(
+                self.db,
+                workspace_id=workspace.id,
+                full_content=full_content,
+            )
+            self._signals_full_content = full_content
+        return list(self._signals)
+
+    def invalidate(self) -> None:
+        """Forget the memoized themes and signals after a write."""
+        self.consistent = False
+        self._active_themes = None
+        self._signals = None
+        self._signals_full_content = False
+
+
+async def get_workspace_loader(
+    current_user: User = Depends(get_scoped_user),
+    db: AsyncSession = Depends(get_db),
+) -> WorkspaceDataLoader:
+    """Route dependency: the request's loader for the scoped data pool.
+
+    FastAPI caches it per request, so every dependency and helper that asks
+    for it shares the same memoized datasets.
+    """
+    return WorkspaceDataLoader(db, user_id=current_user.id)
@@ -38,35 +38,47 @@ async def scheduled_connector_sync(ctx: dict) -> dict:
     """Hourly cron — run an incremental sync for every connected
     API-token source (Fireflies, Zendesk). Keeps synced libraries
     current without user action (US-051-03-01).
+
+    Connections sync concurrently, each in its own session, bounded by
+    ``connector_sync_concurrency`` and per-provider caps so one slow
+    tenant no longer delays the rest.
     """
     from sqlalchemy import func, select
-    from sqlalchemy.orm import selectinload
 
     from app.core.database import get_session_factory
     from app.models import (
         ConnectionMethod,
+        DataSource,
         SourceConnection,
         SourceConnectionStatus,
     )
-    from app.services.sync_orchestrator import run_incremental_sync
+    from app.services.sync_orchestrator import (
+        recover_interrupted_sync_runs,
+        run_scheduled_incremental_syncs,
+    )
+
+    session_factory = get_session_factory()
+    async with session_factory() as db:
+        # Streaming syncs commit page checkpoints mid-run; release any
+        # connection a crashed worker left in `syncing` so it resumes below.
+        recovered = await recover_interrupted_sync_runs(db)
+        await db.commit()
+        if recovered:
+            logger.warning(f"Scheduled sync: recovered {recovered} interrupted sync runs")
 
-    synced = 0
-    failed = 0
-    async with get_session_factory()() as db:
         stmt = (
-            select(SourceConnection)
-            .where(SourceConnection.status.in_([
-                SourceConnectionStatus.connected,
-                SourceConnectionStatus.error,
-            ]))
-            .options(selectinload(SourceConnection.data_source))
+            select(SourceConnection.id, DataSource.provider)
+            .join(DataSource, SourceConnection.data_source_id == DataSource.id)
+            .where(
+                SourceConnection.status.in_([
+                    SourceConnectionStatus.connected,
+                    SourceConnectionStatus.error,
+                ]),
+                DataSource.connection_method == ConnectionMethod.api_token,
+            )
         )
         result = await db.execute(stmt)
-        connections = [
-            conn
-            for conn in result.scalars().all()
-            if conn.data_source.connection_method == ConnectionMethod.api_token
-        ]
+        connections = [(row.id, row.provider) for row in result.all()]
 
         # Count suspended connections for logging
         suspended_stmt = (
@@ -77,34 +89,78 @@ async def scheduled_connector_sync(ctx: dict) -> dict:
         suspended_result = await db.execute(suspended_stmt)
         suspended_count = suspended_result.scalar() or 0
 
-        logger.info(
-            f"Scheduled sync: {len(connections)} eligible API-token sources, "
-            f"{suspended_count} suspended (skipped)"
-        )
-        for connection in connections:
-            try:
-                sync_run = await run_incremental_sync(
-                    db,
-                    connection=connection,
-                    data_source=connection.data_source,
-                )
-                await db.commit()
-                if sync_run.status.value == "succeeded":
-                    synced += 1
-                else:
-                    failed += 1
-            except Exception:
-                failed += 1
-                await db.rollback()
-                logger.exception(
-                    f"Scheduled sync failed for connection {connection.id}"
-                )
+    logger.info(
+        f"Scheduled sync: {len(connections)} eligible API-token sources, "
+        f"{suspended_count} suspended (skipped)"
+    )
+    synced, failed = await run_scheduled_incremental_syncs(
+        session_factory,
+        connections,
+        max_concurrency=settings.connector_sync_concurrency,
+    )
+
+    deferred = len(connections) - synced - failed
 
     logger.info(
         f"Scheduled sync complete: {synced} succeeded, {failed} failed, "
-        f"{suspended_count} suspended"
+        f"{deferred} deferred (rate limited), {suspended_count} suspended"
+    )
+    return {
+        "synced": synced,
+        "failed": failed,
+        "deferred": deferred,
+        "suspended": suspended_count,
+    }
+
+
+async def deferred_connector_sync(ctx: dict, connection_id: str, run_type: str) -> dict:
+    """Resume a sync that was deferred after the provider rate-limited it.
+
+    Enqueued by the sync orchestrator with ``_defer_by`` set to the
+    provider's ``Retry-After``; picks up from the deferred run's checkpoint.
+    """
+    import uuid
+
+    from app.core.database import get_session_factory
+    from app.models import SyncRunType
+    from app.services.sync_orchestrator import sync_connection_in_new_session
+
+    status = await sync_connection_in_new_session(
+        get_session_factory(),
+        uuid.UUID(connection_id),
+        run_type=SyncRunType(run_type),
     )
-    return {"synced": synced, "failed": failed, "suspended": suspended_count}
+    logger.info(f"Deferred {run_type} sync for connection {connection_id}: {status}")
+    return {"connection_id": connection_id, "status": status.value if status else None}
+
+
+async def import_survey_csv_job(
+    ctx: dict,
+    sync_run_id: str,
+    storage_path: str,
+    user_id: str,
+) -> dict:
+    """Import a large survey/NPS CSV staged by ``POST /api/survey-import/confirm``.
+
+    Streams the file in chunks and publishes progress to the user's
+    WebSocket channel. The staged file is kept for a retry when an attempt
+    times out before the last try.
+    """
+    import uuid
+
+    from app.core.database import get_session_factory
+    from app.services.survey_import import run_survey_import
+
+    async with get_session_factory()() as db:
+        status = await run_survey_import(
+            db,
+            sync_run_id=uuid.UUID(sync_run_id),
+            storage_path=storage_path,
+            user_id=user_id,
+            final_attempt=ctx.get("job_try", 1) >= WorkerSettings.max_tries,
+        )
+    logger.info(f"Survey import for sync run {sync_run_id}: {status}")
+    return {"sync_run_id": sync_run_id, "status": status.value if status else None}
 
 
 async def scheduled_outcome_notifications(ctx: dict) -> dict:
@@ -120,10 +176,20 @@ async def scheduled_outcome_notifications(ctx: dict) -> dict:
     return {"notifications_created": created}
 
 
+async def shutdown(ctx: dict) -> None:
+    """Close the pooled HTTP clients and the job dispatcher's Redis pool."""
+    from app.core.http_clients import close_http_clients
+    from app.core.jobs import close_job_dispatcher
+
+    await close_http_clients()
+    await close_job_dispatcher()
+
+
 class WorkerSettings:
     """arq worker configuration."""
 
-    functions = [process_interview_job]
+    functions = [process_interview_job, deferred_connector_sync, import_survey_csv_job]
+    on_shutdown = shutdown
 
     cron_jobs = [
         # Hourly incremental sync for connected API-token sources
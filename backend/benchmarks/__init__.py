@@ -0,0 +1,6 @@
+"""
+Spec10x — Benchmarks
+
+Load-test harnesses run by hand or in a dedicated job against a scratch
+database; they are not collected by the test suite.
+"""
@@ -0,0 +1,346 @@
+"""
+Spec10x — Connector Load Test
+
+Runs the real ``run_backfill`` and ``run_incremental_sync`` for one
+provider against a synthetic dataset served by ``benchmarks.fake_providers``
+and reports throughput, peak RSS and SQL statement counts per phase.
+
+Usage (from ``backend/``, against a scratch database — every run creates
+its own user, workspace and connection and leaves them in place):
+
+    python -m benchmarks.connector_load --provider zendesk --records 100000
+    python -m benchmarks.connector_load --provider fireflies --records 10000 \\
+        --latency-ms 40 --rate-limit-every 25 --json
+
+Rate-limited runs are deferred by the orchestrator exactly as in
+production; the harness resumes them itself instead of waiting for the
+worker, so 429 injection measures checkpoint-and-resume cost. Interview
+processing jobs are counted, not enqueued.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import resource
+import sys
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Any
+from unittest.mock import patch
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload
+
+from app.core.config import get_settings
+from app.core.http_clients import http_clients
+from app.core.rate_limits import provider_rate_limiter
+from app.models import DataSource, SourceConnection, SourceConnectionStatus, SyncRun, SyncRunStatus, User
+from app.services.sources import (
+    create_source_connection,
+    get_or_create_default_workspace,
+    seed_default_data_sources,
+    transition_source_connection,
+)
+from app.services.sync_orchestrator import run_backfill, run_incremental_sync
+from benchmarks.fake_providers import FAKE_PROVIDERS, FakeProvider, FaultProfile
+
+settings = get_settings()
+
+# Safety valve: connectors cap pages per run, so a large backfill takes
+# several resumed runs; stop well before an accidental infinite loop.
+_DEFAULT_MAX_RUNS = 2000
+
+
+@dataclass
+class PhaseReport:
+    phase: str
+    runs: int = 0
+    deferred_runs: int = 0
+    failed_runs: int = 0
+    records_seen: int = 0
+    records_created: int = 0
+    records_updated: int = 0
+    records_unchanged: int = 0
+    seconds: float = 0.0
+    sql_statements: int = 0
+    http_requests: int = 0
+    http_rate_limited: int = 0
+    processing_jobs: int = 0
+    peak_rss_mb: float = 0.0
+    telemetry: dict[str, int] = field(default_factory=dict)
+    last_error: str | None = None
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records_seen / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        payload = asdict(self)
+        payload["records_per_second"] = round(self.records_per_second, 1)
+        payload["seconds"] = round(self.seconds, 3)
+        return payload
+
+
+@dataclass
+class LoadTestReport:
+    provider: str
+    records: int
+    phases: list[PhaseReport]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "provider": self.provider,
+            "records": self.records,
+            "phases": [phase.as_dict() for phase in self.phases],
+        }
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class _Counter:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, *args: Any) -> None:
+        self.count += 1
+
+
+async def _create_connection(
+    session_factory: async_sessionmaker[AsyncSession],
+    fake: FakeProvider,
+) -> uuid.UUID:
+    async with session_factory() as db:
+        user = User(
+            firebase_uid=f"loadtest-{uuid.uuid4().hex}",
+            email=f"loadtest-{uuid.uuid4().hex[:8]}@spec10x.local",
+            name="Load Test",
+        )
+        db.add(user)
+        await db.flush()
+        workspace = await get_or_create_default_workspace(db, user)
+        await seed_default_data_sources(db)
+        data_source = (
+            await db.execute(select(DataSource).where(DataSource.provider == fake.provider))
+        ).scalar_one()
+        connection = await create_source_connection(
+            db,
+            workspace=workspace,
+            created_by_user=user,
+            data_source=data_source,
+            secret_ref="loadtest-token",
+            config_json=fake.connection_config(),
+        )
+        transition_source_connection(connection, SourceConnectionStatus.connected)
+        await db.commit()
+        return connection.id
+
+
+async def _run_phase(
+    phase: str,
+    *,
+    session_factory: async_sessionmaker[AsyncSession],
+    connection_id: uuid.UUID,
+    fake: FakeProvider,
+    statements: _Counter,
+    jobs: _Counter,
+    max_runs: int,
+) -> PhaseReport:
+    """Run syncs until one brings nothing new (or fails / hits ``max_runs``).
+
+    Deferred (rate-limited) runs are resumed immediately from their
+    checkpoint; their work counts toward the phase.
+    """
+    report = PhaseReport(phase=phase)
+    run = run_backfill if phase == "backfill" else run_incremental_sync
+    statements_before, requests_before = statements.count, fake.requests
+    limited_before, jobs_before = fake.rate_limited, jobs.count
+    started = time.perf_counter()
+
+    while report.runs < max_runs:
+        async with session_factory() as db:
+            connection = (
+                await db.execute(
+                    select(SourceConnection)
+                    .where(SourceConnection.id == connection_id)
+                    .options(selectinload(SourceConnection.data_source))
+                )
+            ).scalar_one()
+            sync_run: SyncRun = await run(
+                db, connection=connection, data_source=connection.data_source
+            )
+            await db.commit()
+
+        report.runs += 1
+        report.records_seen += sync_run.records_seen or 0
+        report.records_created += sync_run.records_created or 0
+        report.records_updated += sync_run.records_updated or 0
+        report.records_unchanged += sync_run.records_unchanged or 0
+        for key, value in (sync_run.telemetry or {}).items():
+            report.telemetry[key] = report.telemetry.get(key, 0) + value
+
+        if sync_run.status == SyncRunStatus.deferred:
+            report.deferred_runs += 1
+            continue
+        if sync_run.status == SyncRunStatus.failed:
+            report.failed_runs += 1
+            report.last_error = sync_run.error_summary
+            break
+        if not (sync_run.records_created or sync_run.records_updated):
+            break
+        if phase != "backfill":
+            break
+
+    report.seconds = time.perf_counter() - started
+    report.sql_statements = statements.count - statements_before
+    report.http_requests = fake.requests - requests_before
+    report.http_rate_limited = fake.rate_limited - limited_before
+    report.processing_jobs = jobs.count - jobs_before
+    report.peak_rss_mb = round(_peak_rss_mb(), 1)
+    return report
+
+
+async def run_load_test(
+    provider: str,
+    *,
+    records: int,
+    faults: FaultProfile | None = None,
+    created: int = 0,
+    updated: int = 0,
+    page_size: int | None = None,
+    seed: int = 0,
+    max_runs: int = _DEFAULT_MAX_RUNS,
+    database_url: str | None = None,
+) -> LoadTestReport:
+    """Backfill ``records`` synthetic records, apply ``created``/``updated``
+    provider-side changes, then run an incremental sync."""
+    fake_cls = FAKE_PROVIDERS[provider]
+    fake_kwargs: dict[str, Any] = {"records": records, "faults": faults, "seed": seed}
+    if page_size and provider != "posthog":
+        fake_kwargs["page_size"] = page_size
+    fake = fake_cls(**fake_kwargs)
+
+    engine = create_async_engine(database_url or settings.database_url, echo=False)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    statements = _Counter()
+    event.listen(engine.sync_engine, "before_cursor_execute", statements)
+
+    jobs = _Counter()
+
+    async def _count_processing_job(interview_ids: list[Any]) -> None:
+        jobs.count += len(interview_ids)
+
+    async def _skip_deferred_enqueue(*args: Any, **kwargs: Any) -> bool:
+        # The harness resumes deferred runs itself, without the worker.
+        return True
+
+    limiter_enabled = provider_rate_limiter.enabled
+    provider_rate_limiter.enabled = False
+    http_clients.set_transport_override(fake.transport())
+    try:
+        with patch(
+            "app.services.interview_materialization._enqueue_processing",
+            _count_processing_job,
+        ), patch(
+            "app.services.sync_orchestrator._enqueue_deferred_sync",
+            _skip_deferred_enqueue,
+        ):
+            connection_id = await _create_connection(session_factory, fake)
+            phase_kwargs = dict(
+                session_factory=session_factory,
+                connection_id=connection_id,
+                fake=fake,
+                statements=statements,
+                jobs=jobs,
+                max_runs=max_runs,
+            )
+            backfill = await _run_phase("backfill", **phase_kwargs)
+            fake.add_activity(created=created, updated=updated)
+            incremental = await _run_phase("incremental", **phase_kwargs)
+    finally:
+        http_clients.set_transport_override(None)
+        provider_rate_limiter.enabled = limiter_enabled
+        event.remove(engine.sync_engine, "before_cursor_execute", statements)
+        await engine.dispose()
+
+    return LoadTestReport(provider=provider, records=records, phases=[backfill, incremental])
+
+
+def _format_report(report: LoadTestReport) -> str:
+    columns = (
+        ("phase", "phase"),
+        ("runs", "runs"),
+        ("deferred", "deferred_runs"),
+        ("seen", "records_seen"),
+        ("created", "records_created"),
+        ("updated", "records_updated"),
+        ("unchanged", "records_unchanged"),
+        ("seconds", "seconds"),
+        ("rec/s", "records_per_second"),
+        ("sql", "sql_statements"),
+        ("http", "http_requests"),
+        ("429s", "http_rate_limited"),
+        ("rss_mb", "peak_rss_mb"),
+    )
+    rows = [[label for label, _ in columns]]
+    for phase in report.phases:
+        values = phase.as_dict()
+        rows.append([str(values[key]) for _, key in columns])
+    widths = [max(len(row[i]) for row in rows) for i in range(len(columns))]
+    lines = [f"{report.provider}: {report.records:,} records"]
+    lines += ["  ".join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows]
+    for phase in report.phases:
+        if phase.last_error:
+            lines.append(f"{phase.phase} failed: {phase.last_error}")
+    return "\n".join(lines)
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--provider", choices=sorted(FAKE_PROVIDERS), required=True)
+    parser.add_argument("--records", type=int, default=10_000)
+    parser.add_argument("--created", type=int, default=None, help="new records before the incremental run (default 1%%)")
+    parser.add_argument("--updated", type=int, default=None, help="changed records before the incremental run (default 1%%)")
+    parser.add_argument("--page-size", type=int, default=None)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-limit-every", type=int, default=0, help="answer every Nth request with a 429")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-runs", type=int, default=_DEFAULT_MAX_RUNS)
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    churn = max(1, args.records // 100)
+    report = asyncio.run(
+        run_load_test(
+            args.provider,
+            records=args.records,
+            faults=FaultProfile(
+                latency_ms=args.latency_ms,
+                jitter_ms=args.jitter_ms,
+                rate_limit_every=args.rate_limit_every,
+            ),
+            created=churn if args.created is None else args.created,
+            updated=churn if args.updated is None else args.updated,
+            page_size=args.page_size,
+            seed=args.seed,
+            max_runs=args.max_runs,
+            database_url=args.database_url,
+        )
+    )
+    print(json.dumps(report.as_dict(), indent=2) if args.json else _format_report(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,410 @@
+"""
+Spec10x — Synthetic Provider Datasets & Fake APIs
+
+Each fake answers the request shapes its real connector sends (Zendesk
+incremental cursor export, Fireflies GraphQL, Otter REST, PostHog HogQL)
+through an ``httpx.MockTransport``, with the provider's own pagination and
+optional latency and 429 injection.
+
+Datasets are deterministic for a given seed and rendered on demand from a
+record index: a 1M-record dataset costs a few MB of bookkeeping rather
+than the payloads themselves, so peak RSS measured by the harness is
+dominated by the sync pipeline, not the fake.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import random
+import re
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import httpx
+
+_WORDS = (
+    "onboarding", "export", "dashboard", "billing", "invoice", "search",
+    "slow", "broken", "confusing", "love", "integration", "sync", "report",
+    "permissions", "workspace", "mobile", "latency", "timeout", "filter",
+    "pricing", "support", "feature", "request", "bug", "crash", "login",
+    "team", "csv", "api", "webhook", "notification", "settings", "upgrade",
+)
+_SPEAKERS = ("Alice", "Bob", "Chen", "Deep", "Eva", "Farah")
+_EVENTS_PREFIX = ("page", "search", "export", "invite", "upload", "share", "filter")
+
+
+def _sentence(rng: random.Random, *, words: int = 12) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _parse_iso(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+@dataclass
+class FaultProfile:
+    """Latency and rate-limit injection applied to every fake request.
+
+    ``rate_limit_every=N`` answers every Nth request with a 429 and a
+    ``Retry-After`` header, which the connectors surface as a deferred run.
+    """
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    rate_limit_every: int = 0
+    retry_after_seconds: int = 1
+
+
+class FakeProvider(ABC):
+    """Request accounting and fault injection shared by every fake."""
+
+    provider: str = ""
+
+    def __init__(
+        self,
+        *,
+        records: int,
+        faults: FaultProfile | None = None,
+        seed: int = 0,
+        now: datetime | None = None,
+    ) -> None:
+        self.records = records
+        self.faults = faults or FaultProfile()
+        self.seed = seed
+        self.now = (now or datetime.now(timezone.utc)).timestamp()
+        self.requests = 0
+        self.rate_limited = 0
+        self._rng = random.Random(seed)
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self._handle)
+
+    def connection_config(self) -> dict[str, Any]:
+        return {}
+
+    async def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        delay_ms = self.faults.latency_ms
+        if self.faults.jitter_ms:
+            delay_ms += self._rng.uniform(0, self.faults.jitter_ms)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+
+        every = self.faults.rate_limit_every
+        if every and self.requests % every == 0:
+            self.rate_limited += 1
+            return httpx.Response(
+                429,
+                headers={"Retry-After": str(self.faults.retry_after_seconds)},
+                json={"error": "Too Many Requests"},
+            )
+        return self.respond(request)
+
+    @abstractmethod
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        """Answer one request the way the real provider API would."""
+
+    @abstractmethod
+    def add_activity(self, *, created: int = 0, updated: int = 0) -> None:
+        """Simulate provider-side changes between backfill and incremental."""
+
+    def _record_rng(self, index: int, version: int = 0) -> random.Random:
+        return random.Random(self.seed * 1_000_003 + index * 31 + version)
+
+
+class _StreamingFakeProvider(FakeProvider):
+    """Records ordered by change time, the way incremental exports serve them.
+
+    Position ``p`` in the stream holds record ``_ids[p]`` changed at
+    ``_timestamps[p]``. Updates append the record again with a newer
+    timestamp and a bumped version, so it reappears past any cursor.
+    """
+
+    default_page_size = 100
+
+    def __init__(
+        self,
+        *,
+        records: int,
+        faults: FaultProfile | None = None,
+        seed: int = 0,
+        now: datetime | None = None,
+        window_days: int = 60,
+        page_size: int | None = None,
+    ) -> None:
+        super().__init__(records=records, faults=faults, seed=seed, now=now)
+        self.page_size = page_size or self.default_page_size
+        self._start = self.now - window_days * 86400
+        # Leave the last hour free so fresh activity sorts after the backfill
+        self._step = max(window_days * 86400 - 3600, 1) / max(records, 1)
+        self._ids = array("q", range(records))
+        self._timestamps = array("d", (self._start + i * self._step for i in range(records)))
+        self._versions: dict[int, int] = {}
+        self._next_id = records
+
+    def _created_at(self, index: int, changed_at: float) -> float:
+        if index >= self.records:
+            return changed_at
+        return self._start + index * self._step
+
+    def add_activity(self, *, created: int = 0, updated: int = 0) -> None:
+        changed_at = max(self.now, self._timestamps[-1] if self._timestamps else 0.0)
+        for index in self._rng.sample(range(self.records), min(updated, self.records)):
+            self._versions[index] = self._versions.get(index, 0) + 1
+            self._ids.append(index)
+            self._timestamps.append(changed_at)
+        for _ in range(created):
+            self._ids.append(self._next_id)
+            self._timestamps.append(changed_at)
+            self._next_id += 1
+
+    def _window(self, from_ts: float | None, to_ts: float | None) -> tuple[int, int]:
+        lo = bisect_left(self._timestamps, from_ts) if from_ts is not None else 0
+        hi = (
+            bisect_left(self._timestamps, math.nextafter(to_ts, math.inf))
+            if to_ts is not None
+            else len(self._ids)
+        )
+        return lo, max(lo, hi)
+
+    def _at(self, position: int) -> tuple[int, int, float]:
+        index = self._ids[position]
+        version = self._versions.get(index, 0)
+        # Only the latest appearance of an updated record carries its new
+        # version; earlier positions keep rendering the original.
+        if version and self._timestamps[position] < self.now:
+            version = 0
+        return index, version, self._timestamps[position]
+
+
+# ── Zendesk ──────────────────────────────────────────────
+
+
+class FakeZendesk(_StreamingFakeProvider):
+    """``GET /api/v2/incremental/tickets/cursor.json`` with opaque cursors."""
+
+    provider = "zendesk"
+    default_page_size = 1000
+    subdomain = "loadtest"
+
+    @property
+    def export_url(self) -> str:
+        return f"https://{self.subdomain}.zendesk.com/api/v2/incremental/tickets/cursor.json"
+
+    def connection_config(self) -> dict[str, Any]:
+        return {"subdomain": self.subdomain, "email": "loadtest@spec10x.local"}
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        if not request.url.path.endswith("/incremental/tickets/cursor.json"):
+            return httpx.Response(404, json={"error": "RecordNotFound"})
+
+        params = request.url.params
+        if "cursor" in params:
+            offset = int(params["cursor"])
+        else:
+            offset, _ = self._window(float(params.get("start_time", 0)), None)
+        end = min(offset + self.page_size, len(self._ids))
+
+        tickets = [self._ticket(*self._at(position)) for position in range(offset, end)]
+        return httpx.Response(
+            200,
+            json={
+                "tickets": tickets,
+                "after_cursor": str(end),
+                "after_url": f"{self.export_url}?cursor={end}",
+                "end_of_stream": end >= len(self._ids),
+            },
+        )
+
+    def _ticket(self, index: int, version: int, changed_at: float) -> dict[str, Any]:
+        rng = self._record_rng(index, version)
+        return {
+            "id": 100_000 + index,
+            "subject": _sentence(rng, words=6),
+            "description": " ".join(_sentence(rng) for _ in range(rng.randint(2, 6))),
+            "created_at": _iso(self._created_at(index, changed_at)),
+            "updated_at": _iso(changed_at),
+            "priority": rng.choice(("low", "normal", "high", "urgent")),
+            "status": rng.choice(("new", "open", "pending", "solved")),
+            "tags": rng.sample(_WORDS, 3),
+            "type": rng.choice(("question", "incident", "problem", "task")),
+            "requester": {"name": rng.choice(_SPEAKERS)},
+        }
+
+
+# ── Meeting transcripts ─────────────────────────────────
+
+
+class _FakeMeetingProvider(_StreamingFakeProvider):
+    default_page_size = 50
+
+    def __init__(self, *, sentences_per_meeting: int = 20, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.sentences_per_meeting = sentences_per_meeting
+
+    def connection_config(self) -> dict[str, Any]:
+        return {"backfill_days": 90}
+
+    def _page(
+        self,
+        *,
+        from_ts: float | None,
+        to_ts: float | None,
+        skip: int,
+        limit: int,
+    ) -> list[tuple[int, int, float]]:
+        lo, hi = self._window(from_ts, to_ts)
+        start = min(lo + skip, hi)
+        return [self._at(position) for position in range(start, min(start + limit, hi))]
+
+    def _turns(self, index: int, version: int) -> list[tuple[str, str]]:
+        rng = self._record_rng(index, version)
+        return [
+            (rng.choice(_SPEAKERS), _sentence(rng))
+            for _ in range(self.sentences_per_meeting)
+        ]
+
+
+class FakeFireflies(_FakeMeetingProvider):
+    """``POST /graphql`` ``transcripts(limit, skip, fromDate, toDate)``."""
+
+    provider = "fireflies"
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content or b"{}")
+        variables = body.get("variables") or {}
+        if "transcripts" not in (body.get("query") or ""):
+            return httpx.Response(200, json={"data": {"user": {"email": "loadtest@spec10x.local"}}})
+
+        page = self._page(
+            from_ts=_parse_iso(variables.get("fromDate")),
+            to_ts=_parse_iso(variables.get("toDate")),
+            skip=int(variables.get("skip") or 0),
+            limit=int(variables.get("limit") or self.page_size),
+        )
+        return httpx.Response(
+            200,
+            json={"data": {"transcripts": [self._transcript(*entry) for entry in page]}},
+        )
+
+    def _transcript(self, index: int, version: int, changed_at: float) -> dict[str, Any]:
+        turns = self._turns(index, version)
+        return {
+            "id": f"ff-{index}",
+            "title": f"Customer call #{index}",
+            "date": int(changed_at * 1000),
+            "duration": round(len(turns) * 0.4, 1),
+            "transcript_url": f"https://app.fireflies.ai/view/ff-{index}",
+            "participants": ["customer@example.com", "pm@spec10x.local"],
+            "sentences": [{"text": text, "speaker_name": speaker} for speaker, text in turns],
+        }
+
+
+class FakeOtter(_FakeMeetingProvider):
+    """``GET /v1/speeches?limit&skip&from_date&to_date``."""
+
+    provider = "otter"
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        if not request.url.path.endswith("/speeches"):
+            return httpx.Response(200, json={"user": {"email": "loadtest@spec10x.local"}})
+
+        params = request.url.params
+        page = self._page(
+            from_ts=_parse_iso(params.get("from_date")),
+            to_ts=_parse_iso(params.get("to_date")),
+            skip=int(params.get("skip", 0)),
+            limit=int(params.get("limit", self.page_size)),
+        )
+        return httpx.Response(200, json={"speeches": [self._speech(*entry) for entry in page]})
+
+    def _speech(self, index: int, version: int, changed_at: float) -> dict[str, Any]:
+        turns = self._turns(index, version)
+        return {
+            "id": f"otter-{index}",
+            "title": f"Customer interview #{index}",
+            "created_at": _iso(changed_at),
+            "duration": len(turns) * 25,
+            "url": f"https://otter.ai/u/otter-{index}",
+            "participants": ["customer@example.com"],
+            "transcript": [{"text": text, "speaker": speaker} for speaker, text in turns],
+        }
+
+
+# ── PostHog ─────────────────────────────────────────────
+
+_FROM_DATE = re.compile(r"toDateTime\('([^']+)'\)")
+
+
+class FakePostHog(FakeProvider):
+    """``POST /api/projects/<id>/query/`` returning weekly event counts.
+
+    ``records`` is the number of ``[event, week_start, count]`` rows; the
+    connector keeps only its top events, so most rows exercise parsing and
+    ranking rather than persistence.
+    """
+
+    provider = "posthog"
+    project_id = "4242"
+
+    def __init__(self, *, weeks: int = 12, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        current = datetime.fromtimestamp(self.now, tz=timezone.utc)
+        current_week = (current - timedelta(days=current.weekday())).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        self.weeks = [current_week - timedelta(weeks=offset) for offset in range(weeks - 1, -1, -1)]
+        self.events = max(1, math.ceil(self.records / len(self.weeks)))
+        self._bumps: dict[tuple[int, int], int] = {}
+
+    def connection_config(self) -> dict[str, Any]:
+        return {"project_id": self.project_id, "backfill_weeks": len(self.weeks)}
+
+    def add_activity(self, *, created: int = 0, updated: int = 0) -> None:
+        open_week = len(self.weeks) - 1
+        for _ in range(updated):
+            key = (self._rng.randrange(self.events), open_week)
+            self._bumps[key] = self._bumps.get(key, 0) + self._rng.randint(1, 50)
+        self.events += created
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        if not request.url.path.endswith("/query/"):
+            return httpx.Response(200, json={"id": int(self.project_id), "name": "Load test"})
+
+        body = json.loads(request.content or b"{}")
+        match = _FROM_DATE.search(((body.get("query") or {}).get("query")) or "")
+        from_ts = _parse_iso(match.group(1).replace(" ", "T")) if match else None
+
+        rows = []
+        for week_index, week in enumerate(self.weeks):
+            if from_ts is not None and week.timestamp() < from_ts:
+                continue
+            label = _iso(week.timestamp())
+            for event in range(self.events):
+                count = self._record_rng(event, week_index).randint(10, 5000)
+                count += self._bumps.get((event, week_index), 0)
+                rows.append([f"{_EVENTS_PREFIX[event % len(_EVENTS_PREFIX)]}_{event}", label, count])
+        return httpx.Response(200, json={"results": rows})
+
+
+FAKE_PROVIDERS: dict[str, type[FakeProvider]] = {
+    fake.provider: fake for fake in (FakeZendesk, FakeFireflies, FakeOtter, FakePostHog)
+}
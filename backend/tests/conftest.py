@@ -19,6 +19,7 @@ from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, Asyn
 
 from app.core.config import get_settings
 from app.core.database import get_db
+from app.core.jobs import close_job_dispatcher
 from app.core.auth import get_current_user
 from app.models import User
 from app.main import app
@@ -46,6 +47,23 @@ async def _get_or_create_test_user(session: AsyncSession) -> User:
     return user
 
 
+@pytest.fixture(autouse=True)
+def _disable_shared_provider_rate_limits(monkeypatch):
+    """Keep the Redis-backed provider budgets out of tests, so spent tokens
+    and 429 pauses never leak from one test into the next."""
+    from app.core.rate_limits import provider_rate_limiter
+
+    monkeypatch.setattr(provider_rate_limiter, "enabled", False)
+
+
+@pytest.fixture(autouse=True)
+def _disable_response_cache(monkeypatch):
+    """Keep cached views from leaking between tests; cache tests opt back in."""
+    from app.core.response_cache import response_cache
+
+    monkeypatch.setattr(response_cache, "enabled", False)
+
+
 @pytest_asyncio.fixture
 async def client():
     """Async HTTP client. Auth is mocked so no real Firebase token is needed."""
@@ -53,10 +71,6 @@ async def client():
     engine = create_async_engine(settings.database_url, echo=False)
     session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
-    # Reset the global arq pool to avoid stale event loop connections
-    import app.api.interviews as interviews_module
-    interviews_module._arq_pool = None
-
     async def _override_db():
         async with session_factory() as session:
             try:
@@ -80,7 +94,7 @@ async def client():
         yield ac
 
     app.dependency_overrides.clear()
-    interviews_module._arq_pool = None
+    await close_job_dispatcher()
     await engine.dispose()
 
 
@@ -7,9 +7,11 @@ from __future__ import annotations
 import uuid
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import event, select
+from sqlalchemy.engine import Engine
 
 from app.connectors.base import NormalizedSignal
 from app.core.auth import get_current_user
@@ -29,6 +31,7 @@ from app.models import (
     User,
 )
 from app.services.signals import sync_interview_signals_for_interview, upsert_external_signals
+from app.services.workspace_data import WorkspaceDataLoader
 from app.services.sources import (
     create_source_connection,
     get_or_create_default_workspace,
@@ -267,6 +270,20 @@ async def _create_sync_run(
     return sync_run
 
 
+@contextmanager
+def _count_statements():
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", _record)
+
+
 class TestHomeDashboardApi:
     @pytest.mark.asyncio
     async def test_empty_user_returns_zero_state(self, client, db_session):
@@ -491,3 +508,84 @@ class TestHomeDashboardApi:
             recent[4]["title"],
             "Interview_3.txt analyzed",
         ]
+
+    @pytest.mark.asyncio
+    async def test_query_count_is_constant_as_signals_grow(self, client, db_session):
+        user = await _create_user(db_session, name="Growing User")
+        now = datetime.now(timezone.utc)
+        theme = await _create_theme(
+            db_session,
+            user,
+            name=f"Growth {uuid.uuid4().hex[:6]}",
+            is_new=True,
+            created_at=now - timedelta(hours=1),
+        )
+
+        async def _add_signals(count: int, offset: int) -> None:
+            for idx in range(offset, offset + count):
+                await _create_interview_signal(
+                    db_session,
+                    user,
+                    theme,
+                    title=f"Growth Signal {idx}",
+                    quote=f"Growth feedback {idx}",
+                    created_at=now - timedelta(days=idx % 3, minutes=idx),
+                )
+            await db_session.commit()
+
+        await _add_signals(2, 0)
+        with _auth_as(user), _count_statements() as small:
+            response = await client.get("/api/dashboard/home", headers=AUTH_HEADER)
+        assert response.status_code == 200
+
+        await _add_signals(10, 2)
+        with _auth_as(user), _count_statements() as large:
+            response = await client.get("/api/dashboard/home", headers=AUTH_HEADER)
+        assert response.status_code == 200
+
+        assert len(large) == len(small)
+        payload = response.json()
+        assert payload["stats"]["signals_total"] == 12
+        assert payload["active_priorities"][0]["primary_count_label"] == "12 interviews"
+        sparkline = payload["emerging_trends"][0]["sparkline_points"]
+        assert len(sparkline) == 7
+        assert sum(sparkline) == 12
+
+    @pytest.mark.asyncio
+    async def test_reads_never_rematch_and_skip_a_settled_pass(self, client, db_session):
+        user = await _create_user(db_session, name="Settled User")
+        theme_name = f"Refunds {uuid.uuid4().hex[:6]}"
+        await _create_theme(
+            db_session,
+            user,
+            name=theme_name,
+            is_new=True,
+            created_at=datetime.now(timezone.utc) - timedelta(hours=1),
+        )
+        for idx in range(3):
+            await _create_external_signal(
+                db_session,
+                user,
+                provider="zendesk",
+                title=f"Refund ticket {idx}",
+                content_text=f"{theme_name} " + "long ticket body " * 200,
+                occurred_at=datetime.now(timezone.utc) - timedelta(days=idx),
+                sentiment="negative",
+            )
+        await db_session.commit()
+
+        with _auth_as(user), patch.object(
+            WorkspaceDataLoader, "signals", new=AsyncMock()
+        ) as signal_set:
+            first = await client.get("/api/dashboard/home", headers=AUTH_HEADER)
+        assert first.status_code == 200
+        signal_set.assert_not_awaited()
+
+        with _auth_as(user), patch(
+            "app.services.signals.ensure_native_interview_signals",
+            new=AsyncMock(return_value=False),
+        ) as native_pass:
+            second = await client.get("/api/dashboard/home", headers=AUTH_HEADER)
+        assert second.status_code == 200
+        native_pass.assert_not_awaited()
+        assert second.json()["stats"] == first.json()["stats"]
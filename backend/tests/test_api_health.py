@@ -6,6 +6,10 @@ Tests that the app loads and basic endpoints respond.
 
 import pytest
 
+from app.core.auth import get_current_user
+from app.main import app
+from tests.conftest import AUTH_HEADER
+
 
 class TestHealthEndpoint:
     """Test the /health endpoint."""
@@ -24,3 +28,19 @@ class TestHealthEndpoint:
         assert response.status_code == 200
         data = response.json()
         assert "Spec10x" in data.get("app", "")
+
+    @pytest.mark.asyncio
+    async def test_cache_health_reports_liveness_only(self, client):
+        response = await client.get("/health/cache")
+        assert response.status_code == 200
+        assert set(response.json()) == {"enabled", "reachable"}
+
+    @pytest.mark.asyncio
+    async def test_cache_stats_require_authentication(self, client, monkeypatch):
+        response = await client.get("/health/cache/stats", headers=AUTH_HEADER)
+        assert response.status_code == 200
+        assert set(response.json()) == {"enabled", "views"}
+
+        monkeypatch.delitem(app.dependency_overrides, get_current_user)
+        anonymous = await client.get("/health/cache/stats")
+        assert anonymous.status_code in (401, 403)
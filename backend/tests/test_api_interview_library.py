@@ -332,6 +332,92 @@ class TestInterviewLibraryApi:
             {"provider": "fireflies", "label": "Fireflies", "count": 1},
         ]
 
+    @pytest.mark.asyncio
+    async def test_library_paginates_with_offsets_and_keeps_summary_totals(
+        self,
+        client,
+        db_session,
+    ):
+        user = await _create_user(db_session, name="Paginated Library User")
+        now = datetime.now(timezone.utc)
+        interviews = [
+            await _create_interview(
+                db_session,
+                user,
+                filename=f"Call {index}.txt",
+                created_at=now - timedelta(hours=index),
+            )
+            for index in range(5)
+        ]
+        await _create_interview(db_session, user, filename="Roadmap review.txt")
+        await db_session.commit()
+
+        seen: list[str] = []
+        offset = 0
+        with _auth_as(user):
+            while offset is not None:
+                response = await client.get(
+                    f"/api/interviews/library?q=call&limit=2&offset={offset}",
+                    headers=AUTH_HEADER,
+                )
+                assert response.status_code == 200
+                payload = response.json()
+                assert payload["summary"]["total_count"] == 6
+                assert payload["summary"]["filtered_count"] == 5
+                seen.extend(item["id"] for item in payload["items"])
+                offset = payload["next_offset"]
+
+        assert seen == [str(interview.id) for interview in interviews]
+
+    @pytest.mark.asyncio
+    async def test_library_full_text_search_ranks_and_highlights_matches(
+        self,
+        client,
+        db_session,
+    ):
+        user = await _create_user(db_session, name="Search Ranking User")
+        now = datetime.now(timezone.utc)
+        mentioned = await _create_interview(
+            db_session,
+            user,
+            filename="Weekly sync.txt",
+            created_at=now,
+            transcript="We spent most of the call on renewals. Pricing came up once at the end.",
+        )
+        titled = await _create_interview(
+            db_session,
+            user,
+            filename="Pricing deep dive.txt",
+            created_at=now - timedelta(days=3),
+            transcript="The customer compared pricing tiers and asked about annual pricing discounts.",
+        )
+        await _create_interview(
+            db_session,
+            user,
+            filename="Onboarding call.txt",
+            transcript="Setup took two weeks.",
+        )
+        await db_session.commit()
+
+        with _auth_as(user):
+            response = await client.get(
+                "/api/interviews/library?q=prices",
+                headers=AUTH_HEADER,
+            )
+            recent_response = await client.get(
+                "/api/interviews/library?q=prices&sort=recent",
+                headers=AUTH_HEADER,
+            )
+
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert [item["id"] for item in items] == [str(titled.id), str(mentioned.id)]
+        assert "<mark>pricing</mark>" in items[0]["search_snippet"]
+        assert [item["id"] for item in recent_response.json()["items"]] == [
+            str(mentioned.id),
+            str(titled.id),
+        ]
+
 
 class TestInterviewBulkActionsApi:
     @pytest.mark.asyncio
@@ -414,7 +500,7 @@ class TestInterviewBulkActionsApi:
             },
         ]
 
-        await db_session.refresh(done_interview)
+        await db_session.refresh(done_interview, ["status", "transcript"])
         assert done_interview.status == InterviewStatus.queued
         assert done_interview.transcript is None
 
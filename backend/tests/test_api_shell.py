@@ -0,0 +1,97 @@
+"""
+Integration tests for the composite app shell endpoint.
+"""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+
+from app.core.response_cache import response_cache
+from app.models import Notification, Theme, ThemeStatus
+from tests.conftest import AUTH_HEADER
+from tests.test_workspace_data import _count_statements, _signal_set_loads
+
+
+@pytest.mark.asyncio
+async def test_shell_matches_standalone_endpoints(client, db_session, test_user):
+    theme_name = f"Shell theme {uuid.uuid4().hex[:6]}"
+    notification_title = f"Shell notice {uuid.uuid4().hex[:6]}"
+    db_session.add(
+        Theme(user_id=test_user.id, name=theme_name, mention_count=1, status=ThemeStatus.active)
+    )
+    db_session.add(
+        Notification(user_id=test_user.id, title=notification_title, message="Ready")
+    )
+    await db_session.commit()
+
+    response = await client.get("/api/shell", headers=AUTH_HEADER)
+    assert response.status_code == 200
+    shell = response.json()
+
+    dashboard = (await client.get("/api/dashboard/home", headers=AUTH_HEADER)).json()
+    board = (await client.get("/api/themes/board", headers=AUTH_HEADER)).json()
+    notifications = (await client.get("/api/notifications", headers=AUTH_HEADER)).json()
+    workspace = (await client.get("/api/workspace", headers=AUTH_HEADER)).json()
+    usage = (await client.get("/api/billing/usage", headers=AUTH_HEADER)).json()
+
+    assert shell["dashboard"]["stats"] == dashboard["stats"]
+    assert [card["id"] for card in shell["board"]] == [card["id"] for card in board]
+    assert theme_name in {card["name"] for card in shell["board"]}
+    assert shell["notifications"] == notifications
+    assert notification_title in {item["title"] for item in shell["notifications"]}
+    assert shell["workspace"] == workspace
+    assert shell["usage"] == usage
+
+
+@pytest.mark.asyncio
+async def test_shell_loads_the_signal_set_once(client):
+    # Settle the signal consistency pass, which may backfill on first read.
+    await client.get("/api/shell", headers=AUTH_HEADER)
+
+    with _count_statements() as statements:
+        response = await client.get("/api/shell", headers=AUTH_HEADER)
+
+    assert response.status_code == 200
+    assert _signal_set_loads(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_shell_reuses_the_standalone_cache_entries(client, monkeypatch):
+    monkeypatch.setattr(response_cache, "enabled", True)
+    await client.get("/api/shell", headers=AUTH_HEADER)
+    dashboard = await client.get("/api/dashboard/home", headers=AUTH_HEADER)
+    board = await client.get("/api/themes/board", headers=AUTH_HEADER)
+
+    async def _fail(*args, **kwargs):
+        raise AssertionError("shell rebuilt a view its standalone endpoint cached")
+
+    monkeypatch.setattr("app.api.shell._build_home_dashboard", _fail)
+    monkeypatch.setattr("app.api.shell._build_theme_board", _fail)
+    response = await client.get("/api/shell", headers=AUTH_HEADER)
+
+    assert response.status_code == 200
+    assert response.json()["dashboard"] == dashboard.json()
+    assert response.json()["board"] == board.json()
+
+
+@pytest.mark.asyncio
+async def test_unchanged_shell_polls_get_not_modified(client, db_session, test_user):
+    # Settle the signal consistency pass, which may backfill on first read.
+    await client.get("/api/shell", headers=AUTH_HEADER)
+    first = await client.get("/api/shell", headers=AUTH_HEADER)
+    etag = first.headers["ETag"]
+
+    second = await client.get("/api/shell", headers={**AUTH_HEADER, "If-None-Match": etag})
+    assert second.status_code == 304
+
+    # Notifications are not versioned with the data pool but still count.
+    db_session.add(
+        Notification(user_id=test_user.id, title="Shell poll notice", message="New")
+    )
+    await db_session.commit()
+
+    third = await client.get("/api/shell", headers={**AUTH_HEADER, "If-None-Match": etag})
+    assert third.status_code == 200
+    assert third.headers["ETag"] != etag
@@ -138,3 +138,4 @@ class TestSourceConnectionsApi:
         assert detail_response.status_code == 200
         assert detail_response.json()["id"] == str(failed_run.id)
         assert detail_response.json()["records_unchanged"] == 0
+        assert detail_response.json()["telemetry"] is None
@@ -7,6 +7,7 @@ from __future__ import annotations
 import uuid
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from sqlalchemy import select
@@ -33,7 +34,9 @@ from app.services.sources import (
     get_or_create_default_workspace,
     seed_default_data_sources,
 )
+from app.services.workspace_data import WorkspaceDataLoader
 from tests.conftest import AUTH_HEADER
+from tests.test_workspace_data import _count_statements
 
 
 @contextmanager
@@ -436,3 +439,87 @@ class TestThemeExplorerApi:
 
         assert fallback_response.status_code == 200
         assert fallback_response.json()["default_selected_theme_id"] == str(alpha.id)
+
+    @pytest.mark.asyncio
+    async def test_filtered_summary_and_cards_only_count_matching_signals(
+        self,
+        client,
+        db_session,
+    ):
+        user = await _create_user(db_session, name="Explorer Summary User")
+        seeded = await _seed_explorer_workspace(db_session, user)
+        now = seeded["now"]
+        alpha = seeded["alpha"]
+
+        with _auth_as(user):
+            recent_response = await client.get(
+                f"/api/themes/explorer?date_from={(now - timedelta(days=1)).date().isoformat()}",
+                headers=AUTH_HEADER,
+            )
+            support_response = await client.get(
+                "/api/themes/explorer?source=support",
+                headers=AUTH_HEADER,
+            )
+
+        assert recent_response.status_code == 200
+        recent_payload = recent_response.json()
+        assert recent_payload["summary"] == {
+            "interviews_count": 1,
+            "signals_count": 2,
+            "active_themes_count": 1,
+        }
+        alpha_card = recent_payload["active_themes"][0]
+        assert alpha_card["id"] == str(alpha.id)
+        assert alpha_card["mention_count"] == 2
+        assert len(alpha_card["quote_previews"]) == 2
+
+        assert support_response.status_code == 200
+        support_payload = support_response.json()
+        assert support_payload["summary"]["interviews_count"] == 0
+        support_card = support_payload["active_themes"][0]
+        assert support_card["mention_count"] == 1
+        assert support_card["source_chips"] == [
+            {"source_type": "support", "label": "Support", "count": 1},
+        ]
+        assert [preview["source_label"] for preview in support_card["quote_previews"]] == [
+            "Support"
+        ]
+        assert support_payload["filters"]["available_source_types"] == [
+            "interview",
+            "support",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_settled_reads_do_not_grow_with_signals(self, client, db_session):
+        user = await _create_user(db_session, name="Explorer Growth User")
+        seeded = await _seed_explorer_workspace(db_session, user)
+        alpha = seeded["alpha"]
+
+        async def _settled_read() -> list[str]:
+            # The first read after a write settles the consistency marker.
+            await client.get("/api/themes/explorer", headers=AUTH_HEADER)
+            with _count_statements() as statements:
+                response = await client.get("/api/themes/explorer", headers=AUTH_HEADER)
+            assert response.status_code == 200
+            return statements
+
+        with _auth_as(user), patch.object(
+            WorkspaceDataLoader, "signals", new=AsyncMock()
+        ) as signal_set:
+            small = await _settled_read()
+            for idx in range(10):
+                await _create_external_signal(
+                    db_session,
+                    user,
+                    provider="zendesk",
+                    title=f"Growth ticket {idx}",
+                    content_text=f"{alpha.name} ticket {idx}",
+                    occurred_at=seeded["now"] - timedelta(hours=idx + 1),
+                    sentiment="negative",
+                    metadata_json={"tags": [alpha.name]},
+                )
+            await db_session.commit()
+            large = await _settled_read()
+
+        signal_set.assert_not_awaited()
+        assert len(large) == len(small)
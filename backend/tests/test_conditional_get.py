@@ -0,0 +1,191 @@
+"""
+Integration tests for workspace data versions and ETag conditional GETs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.connectors.base import NormalizedSignal
+from app.core.data_version import get_data_version
+from app.models import DataSource, Theme, ThemeStatus
+from app.services.signals import upsert_external_signals
+from app.services.sources import (
+    create_source_connection,
+    get_or_create_default_workspace,
+    seed_default_data_sources,
+)
+from tests.conftest import AUTH_HEADER, settings
+
+CONDITIONAL_ENDPOINTS = (
+    "/api/dashboard/home",
+    "/api/feed",
+    "/api/themes/board",
+    "/api/themes/explorer",
+    "/api/themes/trends",
+)
+
+
+async def _zendesk_connection(db_session, test_user):
+    workspace = await get_or_create_default_workspace(db_session, test_user)
+    await seed_default_data_sources(db_session)
+    data_source = (
+        await db_session.execute(select(DataSource).where(DataSource.provider == "zendesk"))
+    ).scalar_one()
+    connection = await create_source_connection(
+        db_session,
+        workspace=workspace,
+        created_by_user=test_user,
+        data_source=data_source,
+        secret_ref=None,
+        config_json={"test_connection": True},
+    )
+    return connection, data_source
+
+
+def _ticket(external_id: str, content_text: str) -> NormalizedSignal:
+    return NormalizedSignal(
+        external_id=external_id,
+        source_record_type="ticket",
+        signal_kind="ticket",
+        occurred_at=datetime(2026, 10, 1, tzinfo=timezone.utc),
+        title="Conditional GET ticket",
+        content_text=content_text,
+    )
+
+
+@pytest.mark.asyncio
+async def test_unchanged_polls_get_not_modified(client, test_user):
+    # Settle the signal consistency pass, which may backfill on first read.
+    await client.get("/api/dashboard/home", headers=AUTH_HEADER)
+
+    for endpoint in CONDITIONAL_ENDPOINTS:
+        first = await client.get(endpoint, headers=AUTH_HEADER)
+        assert first.status_code == 200, endpoint
+        etag = first.headers["ETag"]
+        assert first.headers["Cache-Control"] == "private, no-cache"
+
+        second = await client.get(endpoint, headers={**AUTH_HEADER, "If-None-Match": etag})
+        assert second.status_code == 304, endpoint
+        assert second.content == b""
+        assert second.headers["ETag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_etag_varies_with_query_params(client, test_user):
+    plain = await client.get("/api/feed", headers=AUTH_HEADER)
+    filtered = await client.get("/api/feed?source=support", headers=AUTH_HEADER)
+    assert plain.headers["ETag"] != filtered.headers["ETag"]
+
+    stale = await client.get(
+        "/api/feed?source=support",
+        headers={**AUTH_HEADER, "If-None-Match": plain.headers["ETag"]},
+    )
+    assert stale.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_not_modified_short_circuits_before_the_handler(client, test_user, monkeypatch):
+    await client.get("/api/dashboard/home", headers=AUTH_HEADER)
+    first = await client.get("/api/feed", headers=AUTH_HEADER)
+
+    async def _fail(*args, **kwargs):
+        raise AssertionError("handler ran for an unchanged poll")
+
+    monkeypatch.setattr("app.api.feed.ensure_signal_consistency", _fail)
+    second = await client.get(
+        "/api/feed",
+        headers={**AUTH_HEADER, "If-None-Match": first.headers["ETag"]},
+    )
+    assert second.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_orm_writes_bump_the_version(client, db_session, test_user):
+    first = await client.get("/api/themes/board", headers=AUTH_HEADER)
+    before = await get_data_version(db_session, owner_user_id=test_user.id)
+
+    db_session.add(
+        Theme(
+            user_id=test_user.id,
+            name=f"Versioned {uuid.uuid4().hex[:6]}",
+            status=ThemeStatus.active,
+        )
+    )
+    await db_session.commit()
+
+    assert await get_data_version(db_session, owner_user_id=test_user.id) > before
+    second = await client.get(
+        "/api/themes/board",
+        headers={**AUTH_HEADER, "If-None-Match": first.headers["ETag"]},
+    )
+    assert second.status_code == 200
+    assert second.headers["ETag"] != first.headers["ETag"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_signal_upserts_bump_only_on_change(client, db_session, test_user):
+    connection, data_source = await _zendesk_connection(db_session, test_user)
+    await db_session.commit()
+    external_id = f"etag-{uuid.uuid4().hex[:8]}"
+
+    async def _upsert(content_text: str) -> int:
+        await upsert_external_signals(
+            db_session,
+            connection=connection,
+            data_source=data_source,
+            signals=[_ticket(external_id, content_text)],
+        )
+        await db_session.commit()
+        return await get_data_version(db_session, owner_user_id=test_user.id)
+
+    start = await get_data_version(db_session, owner_user_id=test_user.id)
+    created = await _upsert("First body")
+    assert created > start
+    assert await _upsert("First body") == created
+    assert await _upsert("Edited body") > created
+
+    # Read paths re-run the consistency pass; it must not move the version.
+    await client.get("/api/dashboard/home", headers=AUTH_HEADER)
+    steady = await get_data_version(db_session, owner_user_id=test_user.id)
+    await client.get("/api/dashboard/home", headers=AUTH_HEADER)
+    assert await get_data_version(db_session, owner_user_id=test_user.id) == steady
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writers_do_not_wait_on_the_workspace_row(db_session, test_user):
+    await get_or_create_default_workspace(db_session, test_user)
+    await db_session.commit()
+    before = await get_data_version(db_session, owner_user_id=test_user.id)
+
+    engine = create_async_engine(settings.database_url, echo=False)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_factory() as first, session_factory() as second:
+            for session in (first, second):
+                session.add(
+                    Theme(
+                        user_id=test_user.id,
+                        name=f"Concurrent {uuid.uuid4().hex[:6]}",
+                        status=ThemeStatus.active,
+                    )
+                )
+            # Both transactions stay open across the other's flush; the bump
+            # waits for commit, so neither flush takes the workspace row lock.
+            await asyncio.wait_for(first.flush(), timeout=5)
+            await asyncio.wait_for(second.flush(), timeout=5)
+            assert await get_data_version(db_session, owner_user_id=test_user.id) == before
+
+            await asyncio.wait_for(
+                asyncio.gather(first.commit(), second.commit()), timeout=5
+            )
+    finally:
+        await engine.dispose()
+
+    assert await get_data_version(db_session, owner_user_id=test_user.id) == before + 2
@@ -0,0 +1,91 @@
+"""
+Spec10x — Connector load-test harness smoke tests.
+
+The fakes are checked against their connectors' pagination contracts
+without a database; one tiny end-to-end run keeps the harness itself from
+rotting.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from benchmarks.connector_load import run_load_test
+from benchmarks.fake_providers import FakeOtter, FakePostHog, FakeZendesk, FaultProfile
+
+
+async def _get(fake, url: str, **params) -> httpx.Response:
+    async with httpx.AsyncClient(transport=fake.transport()) as client:
+        return await client.get(url, params=params)
+
+
+@pytest.mark.asyncio
+async def test_fake_zendesk_pages_to_end_of_stream_and_replays_updates():
+    fake = FakeZendesk(records=250, page_size=100)
+    start_time = int((datetime.now(timezone.utc) - timedelta(days=90)).timestamp())
+
+    ids: list[int] = []
+    response = await _get(fake, fake.export_url, start_time=start_time)
+    while True:
+        payload = response.json()
+        ids.extend(ticket["id"] for ticket in payload["tickets"])
+        if payload["end_of_stream"]:
+            break
+        response = await _get(fake, fake.export_url, cursor=payload["after_cursor"])
+
+    assert len(ids) == len(set(ids)) == 250
+    cursor = payload["after_cursor"]
+
+    fake.add_activity(created=2, updated=3)
+    payload = (await _get(fake, fake.export_url, cursor=cursor)).json()
+    assert len(payload["tickets"]) == 5
+    assert payload["end_of_stream"] is True
+
+
+@pytest.mark.asyncio
+async def test_fake_injects_rate_limits():
+    fake = FakeOtter(records=10, faults=FaultProfile(rate_limit_every=2, retry_after_seconds=7))
+    url = "https://api.otter.ai/v1/speeches"
+
+    assert (await _get(fake, url, limit=50, skip=0)).status_code == 200
+    limited = await _get(fake, url, limit=50, skip=0)
+    assert limited.status_code == 429
+    assert limited.headers["Retry-After"] == "7"
+    assert fake.rate_limited == 1
+
+
+@pytest.mark.asyncio
+async def test_fake_posthog_filters_weeks_by_from_date():
+    fake = FakePostHog(records=120, weeks=12)
+    from_date = fake.weeks[-2].strftime("%Y-%m-%d %H:%M:%S")
+    async with httpx.AsyncClient(transport=fake.transport()) as client:
+        response = await client.post(
+            f"https://us.posthog.com/api/projects/{fake.project_id}/query/",
+            json={"query": {"kind": "HogQLQuery", "query": f"WHERE timestamp >= toDateTime('{from_date}')"}},
+        )
+
+    rows = response.json()["results"]
+    assert len(rows) == 2 * fake.events
+
+
+@pytest.mark.asyncio
+async def test_load_test_backfills_resumes_after_429_and_syncs_changes():
+    report = await run_load_test(
+        "zendesk",
+        records=300,
+        page_size=100,
+        created=4,
+        updated=6,
+        faults=FaultProfile(rate_limit_every=3),
+    )
+
+    backfill, incremental = report.phases
+    assert backfill.records_created == 300
+    assert backfill.deferred_runs >= 1
+    assert backfill.failed_runs == 0
+    assert backfill.sql_statements > 0
+    assert backfill.peak_rss_mb > 0
+
+    assert incremental.records_created == 4
+    assert incremental.records_updated == 6
@@ -0,0 +1,151 @@
+"""
+Guard: list endpoints must not load deferred (heavy) columns.
+
+Every SQL statement issued while a list endpoint runs is captured; the test
+fails if any SELECT list names a column mapped with ``deferred=True`` —
+transcripts, signal bodies, search vectors.
+"""
+
+from __future__ import annotations
+
+import re
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import Column, event, select
+from sqlalchemy.engine import Engine
+
+from app.connectors.base import NormalizedSignal
+from app.core.database import Base
+from app.models import DataSource, FileType, Interview, InterviewStatus
+from app.services.signals import upsert_external_signals
+from app.services.sources import (
+    create_source_connection,
+    get_or_create_default_workspace,
+    seed_default_data_sources,
+)
+from tests.conftest import AUTH_HEADER
+
+LIST_ENDPOINTS = (
+    "/api/interviews",
+    "/api/interviews/library",
+    "/api/feed",
+    "/api/dashboard/home",
+    "/api/themes",
+    "/api/themes/board",
+    "/api/themes/explorer",
+)
+
+
+def _deferred_columns() -> set[str]:
+    columns: set[str] = set()
+    for mapper in Base.registry.mappers:
+        for prop in mapper.column_attrs:
+            if not prop.deferred:
+                continue
+            for column in prop.columns:
+                if isinstance(column, Column):
+                    columns.add(f"{column.table.name}.{column.name}")
+    return columns
+
+
+def _selected_deferred_columns(statement: str, deferred: set[str]) -> set[str]:
+    """Deferred columns that appear as bare items in the SELECT list.
+
+    SQL expressions over a deferred column (``left(signals.content_text,
+    ...)``) are allowed; they are how previews are loaded.
+    """
+    if not statement.lstrip().upper().startswith("SELECT"):
+        return set()
+    select_list = statement.split("\nFROM ", 1)[0]
+    return {
+        column
+        for column in deferred
+        if re.search(
+            rf"(?:^\s*SELECT\s+(?:DISTINCT\s+)?|,\s*){re.escape(column)}(?:\s+AS\s+\w+)?\s*(?:,|$)",
+            select_list,
+        )
+    }
+
+
+@contextmanager
+def _capture_sql():
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", _record)
+
+
+async def _seed(db_session, test_user) -> Interview:
+    interview = Interview(
+        user_id=test_user.id,
+        filename="Deferred guard.txt",
+        file_type=FileType.txt,
+        file_size_bytes=1024,
+        storage_path="",
+        status=InterviewStatus.done,
+        transcript="Long transcript. " * 2000,
+    )
+    db_session.add(interview)
+    workspace = await get_or_create_default_workspace(db_session, test_user)
+    await seed_default_data_sources(db_session)
+    data_source = (
+        await db_session.execute(select(DataSource).where(DataSource.provider == "zendesk"))
+    ).scalar_one()
+    connection = await create_source_connection(
+        db_session,
+        workspace=workspace,
+        created_by_user=test_user,
+        data_source=data_source,
+        secret_ref=None,
+        config_json={"test_connection": True},
+    )
+    await upsert_external_signals(
+        db_session,
+        connection=connection,
+        data_source=data_source,
+        signals=[
+            NormalizedSignal(
+                external_id="deferred-guard-1",
+                source_record_type="ticket",
+                signal_kind="ticket",
+                occurred_at=datetime.now(timezone.utc),
+                title="Guard ticket",
+                content_text="Ticket body. " * 2000,
+            )
+        ],
+    )
+    await db_session.commit()
+    return interview
+
+
+@pytest.mark.asyncio
+async def test_list_endpoints_do_not_load_deferred_columns(client, db_session, test_user):
+    interview = await _seed(db_session, test_user)
+    deferred = _deferred_columns()
+    assert {"interviews.transcript", "signals.content_text"} <= deferred
+
+    for endpoint in LIST_ENDPOINTS:
+        with _capture_sql() as statements:
+            response = await client.get(endpoint, headers=AUTH_HEADER)
+        assert response.status_code == 200, endpoint
+        loaded = set().union(
+            *(_selected_deferred_columns(statement, deferred) for statement in statements)
+        )
+        assert not loaded, f"{endpoint} loaded deferred columns {sorted(loaded)}"
+
+    # The guard itself works: the detail endpoint does read the transcript
+    with _capture_sql() as statements:
+        response = await client.get(f"/api/interviews/{interview.id}", headers=AUTH_HEADER)
+    assert response.status_code == 200
+    assert any(
+        "interviews.transcript" in _selected_deferred_columns(statement, deferred)
+        for statement in statements
+    )
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from sqlalchemy import select
@@ -22,12 +23,17 @@ from app.models import (
     ThemePriorityState,
     ThemeStatus,
 )
-from app.services.signals import sync_interview_signals_for_interview, upsert_external_signals
+from app.services.signals import (
+    ensure_signal_consistency,
+    sync_interview_signals_for_interview,
+    upsert_external_signals,
+)
 from app.services.sources import (
     create_source_connection,
     get_or_create_default_workspace,
     seed_default_data_sources,
 )
+from app.services.workspace_data import WorkspaceDataLoader
 from tests.conftest import AUTH_HEADER
 
 
@@ -157,6 +163,23 @@ async def _create_external_signal(
     )
 
 
+async def _list_all_feed(client, query: str = "") -> list[dict]:
+    """Follow ``X-Next-Cursor`` through every feed page."""
+    rows: list[dict] = []
+    params = f"{query}&" if query else ""
+    response = await client.get(f"/api/feed?{params}limit=200", headers=AUTH_HEADER)
+    while True:
+        assert response.status_code == 200
+        rows.extend(response.json())
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if not next_cursor:
+            return rows
+        response = await client.get(
+            f"/api/feed?{params}limit=200&cursor={next_cursor}",
+            headers=AUTH_HEADER,
+        )
+
+
 class TestFeedApi:
     @pytest.mark.asyncio
     async def test_lists_mixed_source_rows_in_desc_order_and_filters(
@@ -207,34 +230,138 @@ class TestFeedApi:
         )
         await db_session.commit()
 
-        response = await client.get("/api/feed", headers=AUTH_HEADER)
-        assert response.status_code == 200
-        rows = response.json()
+        rows = await _list_all_feed(client)
         titles = [row["title"] for row in rows]
         assert titles.index("Feed Survey Signal") < titles.index("Feed Zendesk Signal")
         assert titles.index("Feed Zendesk Signal") < titles.index("Feed Native Signal")
 
-        support_response = await client.get(
-            "/api/feed?source=support&sentiment=negative",
-            headers=AUTH_HEADER,
-        )
-        assert support_response.status_code == 200
-        support_rows = support_response.json()
+        support_rows = await _list_all_feed(client, "source=support&sentiment=negative")
         assert len(support_rows) >= 1
         assert all(row["source_type"] == "support" for row in support_rows)
         assert any(row["title"] == "Feed Zendesk Signal" for row in support_rows)
 
         date_from = (base_time - timedelta(days=1)).date().isoformat()
         date_to = base_time.date().isoformat()
-        recent_response = await client.get(
-            f"/api/feed?date_from={date_from}&date_to={date_to}",
-            headers=AUTH_HEADER,
-        )
-        assert recent_response.status_code == 200
-        recent_titles = {row["title"] for row in recent_response.json()}
+        recent_rows = await _list_all_feed(client, f"date_from={date_from}&date_to={date_to}")
+        recent_titles = {row["title"] for row in recent_rows}
         assert "Feed Survey Signal" in recent_titles
         assert "Feed Native Signal" not in recent_titles
 
+    @pytest.mark.asyncio
+    async def test_paginates_with_keyset_cursor(self, client, db_session, test_user):
+        # A day no other test writes to, so the filtered feed holds only ours
+        day = datetime(2003, 1, 1, 12, tzinfo=timezone.utc) + timedelta(
+            days=uuid.uuid4().int % 3000
+        )
+        for index in range(5):
+            await _create_external_signal(
+                db_session,
+                test_user,
+                provider="zendesk",
+                title=f"Paged Signal {index}",
+                content_text="Paging through the feed",
+                # Ties on occurred_at are broken by created_at and id
+                occurred_at=day,
+                sentiment="neutral",
+                source_url=None,
+            )
+        await db_session.commit()
+
+        query = f"date_from={day.date().isoformat()}&date_to={day.date().isoformat()}"
+        pages: list[list[str]] = []
+        cursor = None
+        while True:
+            url = f"/api/feed?{query}&limit=2" + (f"&cursor={cursor}" if cursor else "")
+            response = await client.get(url, headers=AUTH_HEADER)
+            assert response.status_code == 200
+            pages.append([row["id"] for row in response.json()])
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        ids = [signal_id for page in pages for signal_id in page]
+        assert len(set(ids)) == 5
+
+        bad = await client.get("/api/feed?cursor=not-a-cursor", headers=AUTH_HEADER)
+        assert bad.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_feed_runs_the_consistency_pass_on_the_request_loader(
+        self, client, db_session, test_user
+    ):
+        await _create_external_signal(
+            db_session,
+            test_user,
+            provider="zendesk",
+            title="Loader Signal",
+            content_text="Feed reads share the request loader",
+            occurred_at=datetime.now(timezone.utc) - timedelta(hours=1),
+            sentiment="neutral",
+            source_url=None,
+        )
+        await db_session.commit()
+
+        consistency = AsyncMock(wraps=ensure_signal_consistency)
+        with patch("app.api.feed.ensure_signal_consistency", new=consistency), patch.object(
+            WorkspaceDataLoader, "signals", new=AsyncMock()
+        ) as signal_set:
+            response = await client.get("/api/feed", headers=AUTH_HEADER)
+
+        assert response.status_code == 200
+        assert isinstance(consistency.await_args.kwargs["loader"], WorkspaceDataLoader)
+        signal_set.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_pages_and_highlights_matches(self, client, db_session, test_user):
+        term = f"zq{uuid.uuid4().hex[:10]}"
+        base_time = datetime.now(timezone.utc)
+        for title, content_text, days_ago in (
+            (f"{term} export broken", "Exports time out for large workspaces", 3),
+            ("Older mention", f"The {term} export fails twice a week", 2),
+            ("Newer mention", f"Saw {term} again after the update", 1),
+            ("Unrelated", "Dashboard loads slowly", 0),
+        ):
+            await _create_external_signal(
+                db_session,
+                test_user,
+                provider="zendesk",
+                title=title,
+                content_text=content_text,
+                occurred_at=base_time - timedelta(days=days_ago),
+                sentiment="negative",
+                source_url=None,
+            )
+        await db_session.commit()
+
+        rows: list[dict] = []
+        cursor = None
+        while True:
+            url = f"/api/feed?q={term}&limit=1" + (f"&cursor={cursor}" if cursor else "")
+            response = await client.get(url, headers=AUTH_HEADER)
+            assert response.status_code == 200
+            rows.extend(response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+
+        # Title hits outrank body hits; equal ranks fall back to newest first
+        assert [row["title"] for row in rows] == [
+            f"{term} export broken",
+            "Newer mention",
+            "Older mention",
+        ]
+        assert rows[0]["search_snippet"] is None
+        assert f"<mark>{term}</mark>" in rows[1]["search_snippet"]
+
+        unsearched_cursor = (await client.get("/api/feed?limit=1", headers=AUTH_HEADER)).headers[
+            "X-Next-Cursor"
+        ]
+        mismatched = await client.get(
+            f"/api/feed?q={term}&cursor={unsearched_cursor}", headers=AUTH_HEADER
+        )
+        assert mismatched.status_code == 400
+
     @pytest.mark.asyncio
     async def test_theme_detail_includes_source_breakdown_and_linkbacks(
         self,
@@ -301,6 +428,57 @@ class TestFeedApi:
         assert support_item["link"]["href"].startswith("https://acme.zendesk.com/")
         assert survey_item["link"]["href"].startswith("/feed?signal=")
 
+    @pytest.mark.asyncio
+    async def test_theme_detail_pages_evidence_from_theme_scoped_queries(
+        self,
+        client,
+        db_session,
+        test_user,
+    ):
+        theme_name = f"Exports {uuid.uuid4().hex[:8]}"
+        theme = await _create_theme(db_session, test_user, theme_name)
+        base_time = datetime.now(timezone.utc) - timedelta(hours=1)
+        for index in range(12):
+            await _create_external_signal(
+                db_session,
+                test_user,
+                provider="zendesk",
+                title=f"Export ticket {index}",
+                content_text=f"Zendesk ticket about {theme_name}",
+                occurred_at=base_time - timedelta(days=index * 2),
+                sentiment="negative" if index % 2 else "neutral",
+                source_url=None,
+                metadata_json={"tags": [theme_name]},
+            )
+        await db_session.commit()
+
+        response = await client.get(f"/api/themes/{theme.id}", headers=AUTH_HEADER)
+        assert response.status_code == 200
+        payload = response.json()
+        (group,) = payload["supporting_evidence"]
+        assert group["source_type"] == "support"
+        assert group["count"] == 12
+        assert len(group["items"]) == 10
+        assert group["next_cursor"]
+
+        rest = await client.get(
+            f"/api/themes/{theme.id}/evidence?source=support&cursor={group['next_cursor']}",
+            headers=AUTH_HEADER,
+        )
+        assert rest.status_code == 200
+        assert "X-Next-Cursor" not in rest.headers
+        ids = [item["id"] for item in group["items"]] + [item["id"] for item in rest.json()]
+        assert len(set(ids)) == 12
+
+        # Aggregates over the theme's index range agree with the board's
+        # in-memory scoring of the whole workspace.
+        board = await client.get("/api/themes/board", headers=AUTH_HEADER)
+        card = next(card for card in board.json() if card["id"] == str(theme.id))
+        assert payload["impact_breakdown"] == card["impact_breakdown"]
+        assert payload["trend"] == card["trend"]
+        assert payload["score_change"] == card["score_change"]
+        assert payload["source_breakdown"] == card["source_breakdown"]
+
 
 class TestImpactScoreApi:
     @pytest.mark.asyncio
@@ -8,7 +8,8 @@ from unittest.mock import patch, AsyncMock, MagicMock
 
 import pytest
 from httpx import Response, Request
-from sqlalchemy import select
+from sqlalchemy import event, select
+from sqlalchemy.orm import undefer
 
 from app.connectors.fireflies import (
     FIREFLIES_GRAPHQL_URL,
@@ -22,7 +23,12 @@ from app.models import (
     SourceItem,
     SyncRunStatus,
 )
-from app.services.interview_materialization import delete_imported_connection_data
+from app.services.interview_materialization import (
+    MaterializedMeeting,
+    delete_imported_connection_data,
+    materialize_meeting,
+    materialize_meetings,
+)
 from app.services.sources import (
     create_source_connection,
     get_or_create_default_workspace,
@@ -83,8 +89,13 @@ async def _make_connection(db_session, test_user, secret_ref="ff_key_123"):
 
 @pytest.fixture
 def mock_enqueue(monkeypatch):
-    """Stub the arq enqueue so materialization does not need Redis."""
+    """Stub the arq enqueue so materialization does not need Redis.
+
+    ``stub.queued`` collects every interview id handed to the dispatcher.
+    """
     stub = AsyncMock()
+    stub.queued = []
+    stub.side_effect = stub.queued.extend
     monkeypatch.setattr(
         "app.services.interview_materialization._enqueue_processing", stub
     )
@@ -131,13 +142,15 @@ async def test_backfill_materializes_interviews(db_session, test_user, mock_enqu
 
     interviews = (
         await db_session.execute(
-            select(Interview).where(
+            select(Interview)
+            .where(
                 Interview.user_id == test_user.id,
                 Interview.file_hash.isnot(None),
                 Interview.filename.in_(
                     ["Discovery call with Acme", "Churn interview with Globex"]
                 ),
             )
+            .options(undefer(Interview.transcript))
         )
     ).scalars().all()
     assert len(interviews) == 2
@@ -159,7 +172,42 @@ async def test_backfill_materializes_interviews(db_session, test_user, mock_enqu
     assert all(item.native_entity_type == "interview" for item in source_items)
 
     # Each new interview is enqueued for the standard pipeline
-    assert mock_enqueue.await_count == 2
+    assert len(mock_enqueue.queued) == 2
+
+
+@pytest.mark.asyncio
+async def test_backfill_materializes_every_page(
+    db_session, test_user, mock_enqueue, monkeypatch
+):
+    """Pages are materialized as they arrive while later pages prefetch;
+    totals and the cursor still cover every page."""
+    monkeypatch.setattr("app.connectors.fireflies._PAGE_SIZE", 2)
+    workspace, connection, data_source = await _make_connection(db_session, test_user)
+    connector = FirefliesConnector(db=db_session, connection=connection)
+
+    pages = {
+        0: [_transcript_record("ff-p1", "Page one A"), _transcript_record("ff-p2", "Page one B")],
+        2: [
+            _transcript_record("ff-p3", "Page two A"),
+            _transcript_record("ff-p4", "Page two B", date_ms=1751587200000),
+        ],
+        4: [_transcript_record("ff-p5", "Page three A")],
+    }
+    requested_skips = []
+
+    async def _post(self, url, **kwargs):
+        skip = kwargs["json"]["variables"]["skip"]
+        requested_skips.append(skip)
+        return _graphql_page(pages.get(skip, []))
+
+    with patch("httpx.AsyncClient.post", new=_post):
+        result = await connector.backfill(MagicMock())
+
+    assert result.records_seen == 5
+    assert result.records_created == 5
+    assert result.cursor_out == {"last_synced_at": "2025-07-04T00:00:00+00:00"}
+    assert sorted(requested_skips)[:3] == [0, 2, 4]
+    assert len(mock_enqueue.queued) == 5
 
 
 @pytest.mark.asyncio
@@ -191,7 +239,7 @@ async def test_backfill_is_idempotent(db_session, test_user, mock_enqueue):
         ).scalars().all()
     )
     assert count == 1
-    assert mock_enqueue.await_count == 1
+    assert len(mock_enqueue.queued) == 1
 
 
 @pytest.mark.asyncio
@@ -225,9 +273,14 @@ async def test_changed_transcript_reprocesses(db_session, test_user, mock_enqueu
             )
         )
     ).scalar_one()
-    interview = await db_session.get(Interview, item.native_entity_id)
+    interview = await db_session.get(
+        Interview,
+        item.native_entity_id,
+        options=[undefer(Interview.transcript)],
+        populate_existing=True,
+    )
     assert "A corrected transcript." in interview.transcript
-    assert mock_enqueue.await_count == 2  # initial + reprocess
+    assert len(mock_enqueue.queued) == 2  # initial + reprocess
 
 
 @pytest.mark.asyncio
@@ -265,7 +318,7 @@ async def test_user_deleted_interview_is_not_recreated(db_session, test_user, mo
         )
     ).scalar_one_or_none()
     assert remaining is None
-    assert mock_enqueue.await_count == 1
+    assert len(mock_enqueue.queued) == 1
 
 
 # ── Incremental sync ───────────────────────────────────────
@@ -370,3 +423,77 @@ async def test_delete_imported_data_removes_interviews(db_session, test_user, mo
         )
     ).scalars().all()
     assert remaining_items == []
+
+
+@pytest.mark.asyncio
+async def test_materialize_round_trips_do_not_grow_with_batch_size(
+    db_session, test_user, mock_enqueue
+):
+    """A batch is classified in memory and written in bulk, so a page of 30
+    meetings costs no more statements than a page of 3."""
+    workspace, connection, data_source = await _make_connection(db_session, test_user)
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    def _meetings(prefix, count, text="Onboarding took us three weeks."):
+        return [
+            MaterializedMeeting(
+                external_id=f"{prefix}-{i}",
+                title=f"Call {i}",
+                transcript_text=f"Alice: {text}",
+            )
+            for i in range(count)
+        ]
+
+    async def _round_trips(meetings):
+        statements.clear()
+        counts = await materialize_meetings(
+            db_session, connection=connection, meetings=meetings
+        )
+        return counts, len(statements)
+
+    sync_engine = db_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _count)
+    try:
+        small_create = await _round_trips(_meetings("ff-small", 3))
+        large_create = await _round_trips(_meetings("ff-large", 30))
+        small_update = await _round_trips(_meetings("ff-small", 3, "Export is broken."))
+        large_update = await _round_trips(_meetings("ff-large", 30, "Export is broken."))
+        large_unchanged = await _round_trips(_meetings("ff-large", 30, "Export is broken."))
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", _count)
+
+    assert small_create[0] == (3, 0, 0)
+    assert large_create[0] == (30, 0, 0)
+    assert large_update[0] == (0, 30, 0)
+    assert large_unchanged[0] == (0, 0, 30)
+    assert large_create[1] <= small_create[1]
+    assert large_update[1] <= small_update[1]
+    # source items + interviews lookups, then one last_seen_at touch
+    assert large_unchanged[1] <= 3
+    assert len(mock_enqueue.queued) == 66
+    # one dispatcher round trip per batch that had work to queue
+    assert mock_enqueue.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_single_meeting_uses_the_batched_dispatcher(db_session, test_user, mock_enqueue):
+    workspace, connection, data_source = await _make_connection(db_session, test_user)
+    meeting = MaterializedMeeting(
+        external_id=f"ff-single-{uuid.uuid4().hex[:6]}",
+        title="Single call",
+        transcript_text="Alice: Exports time out on large reports.",
+    )
+
+    action = await materialize_meeting(
+        db_session,
+        connection=connection,
+        owner_user_id=test_user.id,
+        meeting=meeting,
+    )
+
+    assert action == "created"
+    assert mock_enqueue.await_count == 1
+    assert len(mock_enqueue.queued) == 1
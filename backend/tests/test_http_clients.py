@@ -0,0 +1,99 @@
+"""
+Spec10x — Shared outbound HTTP client pool tests.
+
+No network: every client is routed through an ``httpx.MockTransport``.
+"""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from app.connectors.zendesk import ZendeskConnector
+from app.core.http_clients import HttpClientRegistry
+
+
+def _registry(handler) -> HttpClientRegistry:
+    registry = HttpClientRegistry(http2=False)
+    registry.set_transport_override(httpx.MockTransport(handler))
+    return registry
+
+
+@pytest.mark.asyncio
+async def test_registry_reuses_one_client_per_host():
+    registry = _registry(lambda request: httpx.Response(200))
+
+    first = registry.get("https://acme.zendesk.com/api/v2", timeout=5.0)
+    second = registry.get("https://ACME.zendesk.com/api/v2/users/me.json", timeout=5.0)
+    other = registry.get("https://api.fireflies.ai/graphql", timeout=5.0)
+
+    assert first is second
+    assert first is not other
+
+    await registry.aclose()
+    assert first.is_closed
+    assert registry.get("https://acme.zendesk.com", timeout=5.0) is not first
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_shared_client_never_replays_cookies_across_tenants():
+    seen_cookies: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_cookies.append(request.headers.get("cookie"))
+        return httpx.Response(200, headers={"set-cookie": "session=tenant-a; Path=/"})
+
+    registry = _registry(handler)
+    client = registry.get("https://api.example.com", timeout=5.0)
+
+    await client.get("https://api.example.com/a")
+    await client.get("https://api.example.com/b")
+
+    assert seen_cookies == [None, None]
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_connector_calls_share_the_pooled_client():
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(
+            200,
+            json={"tickets": [], "end_of_stream": True, "after_cursor": None},
+        )
+
+    registry = _registry(handler)
+    connection = MagicMock()
+    connection.id = uuid4()
+    connection.secret_ref = "projects/test/secrets/zd-token"
+    connection.config_json = {"subdomain": "acme", "email": "admin@acme.test"}
+    connector = ZendeskConnector(
+        db=MagicMock(), connection=connection, http_client_registry=registry
+    )
+
+    await connector.sync_incremental(MagicMock(), cursor_in=None)
+    client = registry.get(connector.base_url, timeout=5.0)
+    await connector.sync_incremental(MagicMock(), cursor_in=None)
+
+    assert len(calls) == 2
+    assert registry.get(connector.base_url, timeout=5.0) is client
+    assert not client.is_closed
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_registry_keeps_each_callers_timeout():
+    registry = _registry(lambda request: httpx.Response(200))
+
+    short = registry.get("https://acme.zendesk.com", timeout=5.0)
+    long = registry.get("https://acme.zendesk.com", timeout=60.0)
+
+    assert short is not long
+    assert short.timeout.read == 5.0
+    assert long.timeout.read == 60.0
+    assert registry.get("https://acme.zendesk.com", timeout=httpx.Timeout(5.0)) is short
+    await registry.aclose()
@@ -0,0 +1,105 @@
+"""
+Spec10x — Job dispatcher tests.
+
+Runs against the Redis configured for the suite; every test cleans up the
+jobs it queued.
+"""
+
+import uuid
+from datetime import timedelta
+
+import pytest
+from arq.constants import in_progress_key_prefix, job_key_prefix
+from arq.utils import timestamp_ms
+
+from app.core.jobs import QUEUE_NAME, JobDispatcher, follow_up_job_id, interview_job_id
+
+
+async def _cleanup(pool, job_ids: list[str]) -> None:
+    queued = await pool.zrangebyscore(QUEUE_NAME, "-inf", "+inf")
+    own = [
+        member.decode()
+        for member in queued
+        if member.decode().startswith(tuple(job_ids))
+    ]
+    if own:
+        await pool.zrem(QUEUE_NAME, *own)
+    await pool.delete(
+        *(job_key_prefix + job_id for job_id in [*job_ids, *own]),
+        *(in_progress_key_prefix + job_id for job_id in job_ids),
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_enqueue_collapses_duplicates():
+    dispatcher = JobDispatcher()
+    interview_ids = [uuid.uuid4() for _ in range(250)]
+    job_ids = [interview_job_id(interview_id) for interview_id in interview_ids]
+    pool = await dispatcher.get_pool()
+    try:
+        assert await dispatcher.enqueue_interview_processing(
+            interview_ids + interview_ids[:10]
+        ) == 250
+        assert await dispatcher.enqueue_interview_processing(interview_ids) == 0
+
+        for job_id in job_ids[:3]:
+            assert await pool.zscore(QUEUE_NAME, job_id) is not None
+            assert await pool.exists(job_key_prefix + job_id)
+    finally:
+        await _cleanup(pool, job_ids)
+        await dispatcher.aclose()
+
+
+@pytest.mark.asyncio
+async def test_running_job_gets_a_follow_up_run():
+    """An interview whose job already started is re-queued, not collapsed."""
+    dispatcher = JobDispatcher()
+    interview_id = uuid.uuid4()
+    job_id = interview_job_id(interview_id)
+    pool = await dispatcher.get_pool()
+    try:
+        await pool.set(job_key_prefix + job_id, b"running")
+        await pool.set(in_progress_key_prefix + job_id, b"1")
+
+        assert await dispatcher.enqueue_interview_processing([interview_id]) == 1
+        # A burst of triggers during the run queues only one follow-up.
+        assert await dispatcher.enqueue_interview_processing([interview_id]) == 0
+        assert await dispatcher.enqueue_interview_processing([interview_id]) == 0
+
+        queued = [
+            member.decode()
+            for member in await pool.zrangebyscore(QUEUE_NAME, "-inf", "+inf")
+        ]
+        assert [member for member in queued if member.startswith(f"{job_id}:")] == [
+            follow_up_job_id(job_id)
+        ]
+    finally:
+        await _cleanup(pool, [job_id])
+        await dispatcher.aclose()
+
+
+@pytest.mark.asyncio
+async def test_unique_enqueue_collapses_deferred_syncs():
+    dispatcher = JobDispatcher()
+    job_id = f"connector-sync:{uuid.uuid4()}:incremental"
+    pool = await dispatcher.get_pool()
+    try:
+        for _ in range(3):
+            await dispatcher.enqueue_unique(
+                "deferred_connector_sync",
+                "connection",
+                "incremental",
+                job_id=job_id,
+                defer_by=timedelta(seconds=60),
+            )
+
+        queued = [
+            member.decode()
+            for member in await pool.zrangebyscore(QUEUE_NAME, "-inf", "+inf")
+            if member.decode().startswith(job_id)
+        ]
+        assert queued == [job_id]
+        assert await pool.zscore(QUEUE_NAME, job_id) > timestamp_ms() + 50_000
+    finally:
+        await _cleanup(pool, [job_id])
+        await dispatcher.aclose()
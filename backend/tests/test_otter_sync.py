@@ -9,6 +9,7 @@ from unittest.mock import patch, AsyncMock, MagicMock
 import pytest
 from httpx import Response, Request
 from sqlalchemy import select
+from sqlalchemy.orm import undefer
 
 from app.connectors.otter import (
     OTTER_API_BASE_URL,
@@ -83,8 +84,13 @@ async def _make_connection(db_session, test_user, secret_ref="otter_key_123"):
 
 @pytest.fixture
 def mock_enqueue(monkeypatch):
-    """Stub the arq enqueue so materialization does not need Redis."""
+    """Stub the arq enqueue so materialization does not need Redis.
+
+    ``stub.queued`` collects every interview id handed to the dispatcher.
+    """
     stub = AsyncMock()
+    stub.queued = []
+    stub.side_effect = stub.queued.extend
     monkeypatch.setattr(
         "app.services.interview_materialization._enqueue_processing", stub
     )
@@ -135,8 +141,10 @@ async def test_backfill_materializes_interviews(
     assert items[0].external_id == "otter-1"
     assert items[0].native_entity_type == "interview"
 
-    stmt_int = select(Interview).where(
-        Interview.id == items[0].native_entity_id
+    stmt_int = (
+        select(Interview)
+        .where(Interview.id == items[0].native_entity_id)
+        .options(undefer(Interview.transcript))
     )
     interview = (await db_session.execute(stmt_int)).scalar_one()
     assert interview.filename == "Acme Sync"
@@ -128,6 +128,21 @@ def test_describe_change_directions():
     assert describe_change(0, 0) == ("flat", 0.0)
 
 
+def test_build_metric_windows_uses_finalized_baseline():
+    """The first queried week compares against the cursor's finalized counts."""
+    baseline = datetime(2026, 6, 1, tzinfo=timezone.utc)
+    rows = [["search", "2026-06-08T00:00:00Z", 120]]
+
+    windows = build_metric_windows(
+        rows,
+        max_events=10,
+        baseline_week=baseline,
+        baseline_counts={"search": 100},
+    )
+
+    assert windows[0]["previous_count"] == 100
+
+
 # ── unit: normalization semantics ──────────────────────────
 
 @pytest.mark.asyncio
@@ -164,6 +179,25 @@ async def test_normalize_metric_window_semantics():
     assert "caused" not in signal.content_text.lower()
 
 
+@pytest.mark.asyncio
+async def test_normalize_finalized_window_has_stable_checksum():
+    connector = _make_connector()
+    week = datetime(2026, 6, 15, tzinfo=timezone.utc)
+    window = {
+        "event": "search_performed",
+        "window_start": week,
+        "count": 1017,
+        "previous_count": 1240,
+    }
+
+    provisional, final = await connector.normalize([window, {**window, "final": True}])
+
+    assert provisional.checksum == "1017"
+    assert provisional.metadata_json["final"] is False
+    assert final.checksum == "final:1017"
+    assert final.metadata_json["final"] is True
+
+
 @pytest.mark.asyncio
 async def test_normalize_fixture_replay():
     """Replay a captured Query API response end to end (US-052-04-02)."""
@@ -296,3 +330,42 @@ async def test_incremental_sync_resumes_from_cursor(client):
     assert sync_resp.json()["status"] == "succeeded"
     assert sync_resp.json()["records_created"] == 0
     assert sync_resp.json()["records_unchanged"] == 5
+
+
+@pytest.mark.asyncio
+async def test_incremental_sync_queries_only_open_weeks():
+    """Finalized weeks are not re-queried; closing weeks move the cursor."""
+    connector = _make_connector(config_extra={"late_data_weeks": 1})
+    w0 = _week_start(datetime.now(timezone.utc))
+    finalized = w0 - timedelta(weeks=3)
+    seen_from_dates: list[datetime] = []
+
+    async def _capture_query(http_client, *, from_date):
+        seen_from_dates.append(from_date)
+        return [
+            ["search_performed", (w0 - timedelta(weeks=2)).isoformat(), 1100],
+            ["search_performed", (w0 - timedelta(weeks=1)).isoformat(), 1017],
+            ["search_performed", w0.isoformat(), 310],
+        ]
+
+    connector._query = _capture_query
+    result = await connector.sync_incremental(
+        MagicMock(),
+        cursor_in={
+            "last_window_start": (w0 - timedelta(weeks=1)).isoformat(),
+            "finalized_through": finalized.isoformat(),
+            "finalized_counts": {"search_performed": 1000},
+        },
+    )
+
+    assert seen_from_dates == [finalized + timedelta(weeks=1)]
+    by_week = {s.metadata_json["window_start"]: s for s in result.signals}
+    closed = by_week[(w0 - timedelta(weeks=2)).isoformat()]
+    assert closed.checksum == "final:1100"
+    assert closed.metadata_json["previous_value"] == 1000
+    assert by_week[w0.isoformat()].checksum == "310"
+    assert result.cursor_out == {
+        "last_window_start": w0.isoformat(),
+        "finalized_through": (w0 - timedelta(weeks=2)).isoformat(),
+        "finalized_counts": {"search_performed": 1100},
+    }
@@ -0,0 +1,145 @@
+"""
+Spec10x — Shared response cache tests (Redis-backed, like the CI service).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+import pytest
+
+from app.core.response_cache import ResponseCache, response_cache
+from app.models import Theme, ThemeStatus
+from tests.conftest import AUTH_HEADER
+
+
+def _view() -> str:
+    return f"test_view_{uuid.uuid4().hex[:8]}"
+
+
+def _counting_compute(payload, *, delay: float = 0.0):
+    calls: list[int] = []
+
+    async def _compute():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return payload
+
+    return _compute, calls
+
+
+@pytest.mark.asyncio
+async def test_second_request_is_served_from_redis():
+    cache = ResponseCache()
+    view = _view()
+    compute, calls = _counting_compute({"items": [1, 2, 3]})
+
+    first = await cache.get_or_compute(view, "v1", ttl_seconds=60, compute=compute)
+    second = await cache.get_or_compute(view, "v1", ttl_seconds=60, compute=compute)
+
+    assert first == second == {"items": [1, 2, 3]}
+    assert len(calls) == 1
+    stats = (await cache.stats())[view]
+    assert stats["miss"] == 1
+    assert stats["hit"] == 1
+
+
+@pytest.mark.asyncio
+async def test_new_key_recomputes():
+    cache = ResponseCache()
+    view = _view()
+    compute, calls = _counting_compute({"ok": True})
+
+    await cache.get_or_compute(view, "1-abc", ttl_seconds=60, compute=compute)
+    await cache.get_or_compute(view, "2-abc", ttl_seconds=60, compute=compute)
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_in_one_process_compute_once():
+    cache = ResponseCache()
+    view = _view()
+    compute, calls = _counting_compute({"board": []}, delay=0.2)
+
+    results = await asyncio.gather(
+        *(cache.get_or_compute(view, "v1", ttl_seconds=60, compute=compute) for _ in range(10))
+    )
+
+    assert len(calls) == 1
+    assert all(result == {"board": []} for result in results)
+    stats = (await cache.stats())[view]
+    assert stats["miss"] == 1
+    assert stats["coalesced"] == 9
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_across_processes_compute_once():
+    # Separate instances share nothing in memory, only Redis.
+    caches = [ResponseCache(wait_poll_seconds=0.01) for _ in range(5)]
+    view = _view()
+    compute, calls = _counting_compute({"trends": []}, delay=0.2)
+
+    results = await asyncio.gather(
+        *(cache.get_or_compute(view, "v1", ttl_seconds=60, compute=compute) for cache in caches)
+    )
+
+    assert len(calls) == 1
+    assert all(result == {"trends": []} for result in results)
+
+
+@pytest.mark.asyncio
+async def test_failed_computation_releases_followers():
+    cache = ResponseCache()
+    view = _view()
+    attempts: list[int] = []
+
+    async def _compute():
+        attempts.append(1)
+        await asyncio.sleep(0.1)
+        if len(attempts) == 1:
+            raise RuntimeError("boom")
+        return {"ok": True}
+
+    results = await asyncio.gather(
+        cache.get_or_compute(view, "v1", ttl_seconds=60, compute=_compute),
+        cache.get_or_compute(view, "v1", ttl_seconds=60, compute=_compute),
+        return_exceptions=True,
+    )
+
+    # Whichever request led fails; the other computes its own payload.
+    assert sum(isinstance(result, RuntimeError) for result in results) == 1
+    assert {"ok": True} in results
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_computes_every_time():
+    cache = ResponseCache(enabled=False)
+    compute, calls = _counting_compute({"ok": True})
+
+    await cache.get_or_compute(_view(), "v1", ttl_seconds=60, compute=compute)
+    await cache.get_or_compute(_view(), "v1", ttl_seconds=60, compute=compute)
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_board_cache_is_retired_by_data_writes(client, db_session, test_user, monkeypatch):
+    monkeypatch.setattr(response_cache, "enabled", True)
+    # Settle the signal consistency pass, which may backfill on first read.
+    await client.get("/api/dashboard/home", headers=AUTH_HEADER)
+    before = (await response_cache.stats()).get("theme_board", {}).get("hit", 0)
+
+    first = await client.get("/api/themes/board", headers=AUTH_HEADER)
+    second = await client.get("/api/themes/board", headers=AUTH_HEADER)
+    assert first.status_code == second.status_code == 200
+    assert second.json() == first.json()
+    assert (await response_cache.stats())["theme_board"]["hit"] >= before + 1
+
+    name = f"Cached {uuid.uuid4().hex[:6]}"
+    db_session.add(Theme(user_id=test_user.id, name=name, status=ThemeStatus.active))
+    await db_session.commit()
+
+    third = await client.get("/api/themes/board", headers=AUTH_HEADER)
+    assert name in {card["name"] for card in third.json()}
@@ -2,16 +2,22 @@
 Tests — Retry and dead-letter connection suspension (US-053-02-01)
 """
 
+import asyncio
+import uuid
+
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from app.connectors.base import ConnectorError
+from app.connectors.base import ConnectorError, SyncResult
+from app.core.rate_limits import ProviderRateLimiter
 from app.models import SourceConnectionStatus, SyncRunStatus
 from app.services.sync_orchestrator import (
     CONSECUTIVE_FAILURE_THRESHOLD,
     run_incremental_sync,
+    run_scheduled_incremental_syncs,
 )
-from tests.conftest import AUTH_HEADER
+from tests.conftest import AUTH_HEADER, settings
 from tests.test_fireflies_sync import _make_connection
 
 
@@ -59,6 +65,110 @@ async def test_auto_suspension_after_threshold_failures(db_session, test_user):
         assert "Auto-suspended" in connection.last_error_summary
 
 
+@pytest.mark.asyncio
+async def test_rate_limited_sync_is_deferred_not_failed(db_session, test_user):
+    """A 429 defers the run and re-enqueues it after Retry-After; repeated
+    deferrals never push the connection toward auto-suspension."""
+    _, connection, data_source = await _make_connection(db_session, test_user)
+    connection.status = SourceConnectionStatus.connected
+    await db_session.commit()
+
+    with patch("app.services.sync_orchestrator.get_connector") as mock_get_connector, patch(
+        "app.services.sync_orchestrator._enqueue_deferred_sync",
+        new_callable=AsyncMock,
+        return_value=True,
+    ) as mock_enqueue:
+        mock_connector_cls = MagicMock()
+        mock_connector_cls.return_value.sync_incremental = AsyncMock(
+            side_effect=ConnectorError(
+                "Fireflies rate limited — retry after 120s",
+                retryable=True,
+                retry_after=120,
+            )
+        )
+        mock_get_connector.return_value = mock_connector_cls
+
+        for _ in range(CONSECUTIVE_FAILURE_THRESHOLD + 1):
+            run = await run_incremental_sync(
+                db_session,
+                connection=connection,
+                data_source=data_source,
+            )
+            await db_session.commit()
+            assert run.status == SyncRunStatus.deferred
+
+    await db_session.refresh(connection)
+    assert connection.status == SourceConnectionStatus.connected
+    assert mock_enqueue.await_count == CONSECUTIVE_FAILURE_THRESHOLD + 1
+    assert mock_enqueue.await_args.kwargs["defer_seconds"] == 120
+
+
+@pytest.mark.asyncio
+async def test_provider_accounts_do_not_share_a_budget():
+    """One account exhausting or pausing its budget leaves the others alone."""
+    provider = f"test-{uuid.uuid4().hex[:8]}"
+    limiter = ProviderRateLimiter({provider: (1.0, 1)})
+
+    assert await limiter.reserve(provider, "acme") == 0
+    assert await limiter.reserve(provider, "acme") > 0
+    assert await limiter.reserve(provider, "globex") == 0
+
+    await limiter.pause(provider, "initech", 60)
+    assert await limiter.reserve(provider, "initech") > 50
+    assert await limiter.reserve(provider, "umbrella") == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduled_syncs_run_concurrently_with_provider_cap(db_session, test_user):
+    """Scheduled syncs fan out under the per-provider cap, each in its own
+    session, and one tenant's failure does not affect the others."""
+    connections = []
+    for _ in range(4):
+        _, connection, _ = await _make_connection(db_session, test_user)
+        connection.status = SourceConnectionStatus.connected
+        connections.append(connection)
+    await db_session.commit()
+    failing_id = connections[0].id
+
+    in_flight = 0
+    peak_in_flight = 0
+
+    class _SlowConnector:
+        def __init__(self, db, connection):
+            self.connection = connection
+
+        async def sync_incremental(self, sync_run, *, cursor_in=None):
+            nonlocal in_flight, peak_in_flight
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            if self.connection.id == failing_id:
+                raise ConnectorError("Upstream unavailable", retryable=True)
+            return SyncResult()
+
+    engine = create_async_engine(settings.database_url, echo=False)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        with patch(
+            "app.services.sync_orchestrator.get_connector",
+            return_value=_SlowConnector,
+        ), patch.dict(
+            "app.services.sync_orchestrator.PROVIDER_SYNC_CONCURRENCY",
+            {"fireflies": 2},
+        ):
+            succeeded, failed = await run_scheduled_incremental_syncs(
+                session_factory,
+                [(connection.id, "fireflies") for connection in connections],
+                max_concurrency=8,
+            )
+    finally:
+        await engine.dispose()
+
+    assert (succeeded, failed) == (3, 1)
+    assert peak_in_flight == 2
+
+
 @pytest.mark.asyncio
 async def test_re_enabling_suspended_connection(client, db_session, test_user):
     """POST /api/source-connections/{id}/reenable revalidates the stored key
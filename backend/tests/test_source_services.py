@@ -3,29 +3,37 @@ Service tests for the Sprint 1 source foundation.
 """
 
 import uuid
+from datetime import datetime, timezone
+from unittest.mock import patch
 
 import pytest
 from sqlalchemy import func, select
 
+from app.connectors.base import NormalizedSignal
 from app.models import (
     DataSource,
+    Signal,
     SourceConnectionStatus,
     SourceItem,
     SyncRun,
     SyncRunStatus,
     SyncRunType,
 )
+from app.services.signals import upsert_external_signals
 from app.services.sources import (
     InvalidSourceConnectionTransition,
+    bulk_upsert_source_items,
     complete_sync_run,
     create_source_connection,
     fail_sync_run,
     get_or_create_default_workspace,
+    get_source_item_checksums,
     seed_default_data_sources,
     start_sync_run,
     transition_source_connection,
     upsert_source_item,
 )
+from app.services.sync_orchestrator import _persist_signals
 
 
 class TestSourceFoundationServices:
@@ -208,3 +216,197 @@ class TestSourceFoundationServices:
             await db_session.execute(select(SyncRun).where(SyncRun.id == sync_run.id))
         ).scalar_one()
         assert persisted.records_unchanged == 5
+
+    @pytest.mark.asyncio
+    async def test_bulk_source_item_upsert_is_idempotent(
+        self,
+        db_session,
+        test_user,
+    ):
+        workspace = await get_or_create_default_workspace(db_session, test_user)
+        await seed_default_data_sources(db_session)
+        zendesk_source = (
+            await db_session.execute(
+                select(DataSource).where(DataSource.provider == "zendesk")
+            )
+        ).scalar_one()
+
+        connection = await create_source_connection(
+            db_session,
+            workspace=workspace,
+            created_by_user=test_user,
+            data_source=zendesk_source,
+        )
+
+        external_ids = [f"ticket-{uuid.uuid4()}" for _ in range(3)]
+        first_ids = await bulk_upsert_source_items(
+            db_session,
+            workspace_id=workspace.id,
+            source_connection_id=connection.id,
+            items=[
+                {"external_id": external_id, "source_record_type": "ticket", "checksum": "v1"}
+                for external_id in external_ids
+            ],
+        )
+        second_ids = await bulk_upsert_source_items(
+            db_session,
+            workspace_id=workspace.id,
+            source_connection_id=connection.id,
+            items=[
+                {"external_id": external_id, "source_record_type": "ticket", "checksum": "v2"}
+                for external_id in external_ids
+            ],
+        )
+        await db_session.commit()
+
+        rows = (
+            await db_session.execute(
+                select(SourceItem.external_id, SourceItem.checksum).where(
+                    SourceItem.source_connection_id == connection.id,
+                )
+            )
+        ).all()
+
+        assert first_ids == second_ids
+        assert set(first_ids) == set(external_ids)
+        assert len(rows) == 3
+        assert {row.checksum for row in rows} == {"v2"}
+
+    @pytest.mark.asyncio
+    async def test_external_signal_upsert_keeps_record_accounting(
+        self,
+        db_session,
+        test_user,
+    ):
+        workspace = await get_or_create_default_workspace(db_session, test_user)
+        await seed_default_data_sources(db_session)
+        zendesk_source = (
+            await db_session.execute(
+                select(DataSource).where(DataSource.provider == "zendesk")
+            )
+        ).scalar_one()
+
+        connection = await create_source_connection(
+            db_session,
+            workspace=workspace,
+            created_by_user=test_user,
+            data_source=zendesk_source,
+        )
+        occurred_at = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+        def _ticket(external_id: str, *, checksum: str, title: str) -> NormalizedSignal:
+            return NormalizedSignal(
+                external_id=external_id,
+                source_record_type="ticket",
+                signal_kind="ticket",
+                occurred_at=occurred_at,
+                title=title,
+                content_text=f"Body for {external_id}",
+                checksum=checksum,
+            )
+
+        ids = [f"ticket-{uuid.uuid4()}" for _ in range(3)]
+        first = await upsert_external_signals(
+            db_session,
+            connection=connection,
+            data_source=zendesk_source,
+            signals=[
+                _ticket(ids[0], checksum="v1", title="First"),
+                _ticket(ids[1], checksum="v1", title="Second"),
+                # Same record twice in one batch counts like two sequential upserts.
+                _ticket(ids[1], checksum="v1", title="Second"),
+            ],
+        )
+        second = await upsert_external_signals(
+            db_session,
+            connection=connection,
+            data_source=zendesk_source,
+            signals=[
+                _ticket(ids[0], checksum="v1", title="First"),
+                _ticket(ids[1], checksum="v2", title="Second, edited"),
+                _ticket(ids[2], checksum="v1", title="Third"),
+            ],
+        )
+        await db_session.commit()
+
+        titles = (
+            await db_session.execute(
+                select(Signal.title).where(Signal.source_connection_id == connection.id)
+            )
+        ).scalars().all()
+
+        assert first == (2, 0, 1)
+        assert second == (1, 1, 1)
+        assert sorted(titles) == ["First", "Second, edited", "Third"]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_checksums_skip_signal_work(
+        self,
+        db_session,
+        test_user,
+    ):
+        workspace = await get_or_create_default_workspace(db_session, test_user)
+        await seed_default_data_sources(db_session)
+        zendesk_source = (
+            await db_session.execute(
+                select(DataSource).where(DataSource.provider == "zendesk")
+            )
+        ).scalar_one()
+        connection = await create_source_connection(
+            db_session,
+            workspace=workspace,
+            created_by_user=test_user,
+            data_source=zendesk_source,
+        )
+        signals = [
+            NormalizedSignal(
+                external_id=f"ticket-{uuid.uuid4()}",
+                source_record_type="ticket",
+                signal_kind="ticket",
+                occurred_at=datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc),
+                title=f"Ticket {index}",
+                content_text="Search is slow",
+                checksum="2026-03-01T12:00:00Z",
+            )
+            for index in range(3)
+        ]
+
+        known_checksums: dict[str, str] = {}
+        first = await _persist_signals(
+            db_session,
+            connection=connection,
+            data_source=zendesk_source,
+            signals=signals,
+            known_checksums=known_checksums,
+        )
+        first_seen = (
+            await db_session.execute(
+                select(func.max(SourceItem.last_seen_at)).where(
+                    SourceItem.source_connection_id == connection.id
+                )
+            )
+        ).scalar_one()
+
+        with patch("app.services.signals.match_signal_to_themes") as mock_match:
+            second = await _persist_signals(
+                db_session,
+                connection=connection,
+                data_source=zendesk_source,
+                signals=signals,
+                known_checksums=await get_source_item_checksums(
+                    db_session, source_connection_id=connection.id
+                ),
+            )
+        await db_session.commit()
+
+        assert first == (3, 0, 0)
+        assert second == (0, 0, 3)
+        mock_match.assert_not_called()
+        last_seen = (
+            await db_session.execute(
+                select(func.min(SourceItem.last_seen_at)).where(
+                    SourceItem.source_connection_id == connection.id
+                )
+            )
+        ).scalar_one()
+        assert last_seen >= first_seen
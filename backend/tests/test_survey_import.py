@@ -2,10 +2,18 @@
 Tests — Survey CSV template and validation (US-05-03-01)
 """
 
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 
 from app.connectors.csv_import import validate_csv_bytes, TEMPLATE_CSV, REQUIRED_COLUMNS
+from app.models import SyncRunStatus, SyncRunType
+from app.services.sources import start_sync_run
+from app.services.survey_import import run_survey_import
 from tests.conftest import AUTH_HEADER
+from tests.test_fireflies_sync import _make_connection
 
 
 # ── Unit Tests: CSV Validation ─────────────────────────────
@@ -172,3 +180,46 @@ async def test_validate_non_csv_file(client):
         headers=AUTH_HEADER,
     )
     assert resp.status_code == 400
+
+
+# ── Worker: staged upload lifetime ─────────────────────────
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "final_attempt, deleted, status",
+    [(False, False, SyncRunStatus.running), (True, True, SyncRunStatus.failed)],
+)
+async def test_timed_out_import_keeps_staged_upload_for_retry(
+    db_session, test_user, final_attempt, deleted, status
+):
+    _, connection, _ = await _make_connection(db_session, test_user)
+    sync_run = await start_sync_run(
+        db_session, connection=connection, run_type=SyncRunType.backfill
+    )
+    await db_session.commit()
+    delete_file = MagicMock()
+    publish = AsyncMock()
+
+    with patch(
+        "app.services.survey_import.download_file",
+        lambda storage_path, local_path: Path(local_path).write_bytes(TEMPLATE_CSV.encode()),
+    ), patch(
+        "app.services.survey_import.import_csv_stream",
+        AsyncMock(side_effect=asyncio.CancelledError),
+    ), patch("app.services.survey_import.delete_file", delete_file), patch(
+        "app.services.survey_import.publish_import_progress", publish
+    ):
+        with pytest.raises(asyncio.CancelledError):
+            await run_survey_import(
+                db_session,
+                sync_run_id=sync_run.id,
+                storage_path="imports/staged.csv",
+                user_id=str(test_user.id),
+                final_attempt=final_attempt,
+            )
+
+    assert delete_file.called is deleted
+    await db_session.refresh(sync_run)
+    assert sync_run.status == status
+    published = [call.args[2] for call in publish.await_args_list]
+    assert ("failed" in published) is final_attempt
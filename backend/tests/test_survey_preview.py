@@ -7,9 +7,11 @@ Covers:
   - Confirm normalizes rows correctly
 """
 
+from unittest.mock import AsyncMock, patch
+
 import pytest
 
-from tests.conftest import AUTH_HEADER
+from tests.conftest import AUTH_HEADER, settings
 
 
 # ── Integration Tests: Preview + Confirm Flow ────────────
@@ -119,3 +121,58 @@ async def test_confirm_preserves_nps_score(client):
     )
     assert confirm_resp.status_code == 200
     assert confirm_resp.json()["records_created"] == 1
+
+
+@pytest.mark.asyncio
+async def test_confirm_imports_in_chunks(client):
+    """Rows spanning several chunks are all imported and counted."""
+    rows = b"".join(
+        b'"Response %d","2026-03-15T10:30:00Z","%d"\n' % (i, i % 11) for i in range(7)
+    )
+    csv_content = b"response_text,submitted_at,nps_score\n" + rows
+
+    with patch("app.services.survey_import.IMPORT_CHUNK_ROWS", 3):
+        resp = await client.post(
+            "/api/survey-import/confirm",
+            files={"file": ("chunked.csv", csv_content, "text/csv")},
+            headers=AUTH_HEADER,
+        )
+    assert resp.status_code == 200
+    assert resp.json()["records_seen"] == 7
+    assert resp.json()["records_created"] == 7
+
+
+@pytest.mark.asyncio
+async def test_confirm_large_file_queues_background_import(client):
+    """Uploads above the inline limit are staged and imported by the worker."""
+    csv_content = (
+        b"response_text,submitted_at\n"
+        b'"Queued","2026-03-15T10:30:00Z"\n'
+    )
+
+    with patch.object(settings, "survey_import_inline_max_bytes", 10), patch(
+        "app.api.survey_import.upload_fileobj"
+    ) as mock_upload, patch(
+        "app.api.survey_import.job_dispatcher.enqueue",
+        new_callable=AsyncMock,
+        return_value=True,
+    ) as mock_enqueue:
+        resp = await client.post(
+            "/api/survey-import/confirm",
+            files={"file": ("big.csv", csv_content, "text/csv")},
+            headers=AUTH_HEADER,
+        )
+
+    assert resp.status_code == 202
+    data = resp.json()
+    assert data["status"] == "queued"
+    assert mock_upload.call_args.args[2] == len(csv_content)
+    assert mock_enqueue.await_args.args[:2] == (
+        "import_survey_csv_job",
+        data["sync_run_id"],
+    )
+
+    history = await client.get("/api/survey-import/history", headers=AUTH_HEADER)
+    latest = history.json()["imports"][0]
+    assert latest["id"] == data["sync_run_id"]
+    assert latest["status"] == "running"
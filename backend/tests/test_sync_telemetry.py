@@ -0,0 +1,79 @@
+"""
+Spec10x — Per-phase sync telemetry tests.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.http_clients import HttpClientRegistry
+from app.core.sync_telemetry import collect_sync_telemetry, current_telemetry, timed
+
+
+@pytest.mark.asyncio
+async def test_nested_phases_are_exclusive():
+    with collect_sync_telemetry() as telemetry:
+        with timed("persist"):
+            await asyncio.sleep(0.01)
+            with timed("theme_match"):
+                await asyncio.sleep(0.05)
+
+    assert telemetry.phase_ms["theme_match"] >= 50
+    # Persist only keeps its own ~10ms, not the nested theme matching.
+    assert 10 <= telemetry.phase_ms["persist"] < 45
+    assert current_telemetry() is None
+
+
+@pytest.mark.asyncio
+async def test_helpers_are_no_ops_outside_a_sync():
+    with timed("fetch"):
+        await asyncio.sleep(0)
+    assert current_telemetry() is None
+
+
+@pytest.mark.asyncio
+async def test_shared_clients_count_requests_retries_and_bytes():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/limited":
+            return httpx.Response(429, content=b"slow down")
+        return httpx.Response(200, content=b"x" * 100)
+
+    registry = HttpClientRegistry(http2=False)
+    registry.set_transport_override(httpx.MockTransport(handler))
+    client = registry.get("https://api.example.com", timeout=5.0)
+
+    with collect_sync_telemetry() as telemetry:
+        await client.get("https://api.example.com/ok")
+        await client.get("https://api.example.com/limited")
+    await client.get("https://api.example.com/ok")  # outside the run
+
+    payload = telemetry.as_dict()
+    assert payload["http_requests"] == 2
+    assert payload["http_retries"] == 1
+    assert payload["bytes_received"] == 100 + len(b"slow down")
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_streamed_bodies_are_counted_as_they_are_read():
+    async def chunks():
+        for _ in range(4):
+            yield b"y" * 256
+
+    registry = HttpClientRegistry(http2=False)
+    registry.set_transport_override(
+        httpx.MockTransport(lambda request: httpx.Response(200, content=chunks()))
+    )
+    client = registry.get("https://api.example.com", timeout=5.0)
+
+    with collect_sync_telemetry() as telemetry:
+        async with client.stream("GET", "https://api.example.com/export") as response:
+            assert "content-length" not in response.headers
+            assert telemetry.bytes_received == 0
+            async for _ in response.aiter_bytes():
+                pass
+
+    assert telemetry.bytes_received == 4 * 256
+    await registry.aclose()
+
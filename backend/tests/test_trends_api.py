@@ -21,6 +21,12 @@ from app.models import (
     Theme,
     ThemeStatus,
 )
+from app.services.signals import (
+    calculate_impact_score,
+    calculate_theme_trend,
+    get_workspace_signals,
+)
+from app.services.sources import get_or_create_default_workspace
 from tests.conftest import AUTH_HEADER
 
 
@@ -145,3 +151,40 @@ class TestThemeTrends:
         assert positions[str(strong.id)] < positions[str(weak.id)]
         scores = [row["impact_score"] for row in themes]
         assert scores == sorted(scores, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_trends_weeks_param_and_in_memory_parity(self, client, db_session, test_user):
+        theme = await _create_theme_with_dated_insights(
+            db_session,
+            test_user,
+            "Trends Long Window Theme",
+            insight_ages_days=[0, 6, 13, 15, 27, 40, 300],
+        )
+
+        response = await client.get("/api/themes/trends?weeks=52", headers=AUTH_HEADER)
+        assert response.status_code == 200
+        body = response.json()
+        assert len(body["weeks"]) == 52
+        row = next(item for item in body["themes"] if item["id"] == str(theme.id))
+        assert len(row["weekly_counts"]) == 52
+        assert sum(row["weekly_counts"]) == 7
+        # 300 days back is 42 whole weeks back: oldest-first index 52 - 1 - 42
+        assert row["weekly_counts"][9] == 1
+
+        # The default window matches the per-signal definitions exactly.
+        default = await client.get("/api/themes/trends", headers=AUTH_HEADER)
+        default_row = next(
+            item for item in default.json()["themes"] if item["id"] == str(theme.id)
+        )
+        workspace = await get_or_create_default_workspace(db_session, test_user)
+        signals = await get_workspace_signals(db_session, workspace_id=workspace.id)
+        trend = calculate_theme_trend(theme_id=theme.id, signals=signals)
+        assert default_row["recent_count"] == trend.recent_count == 3
+        assert default_row["previous_count"] == trend.previous_count == 2
+        assert default_row["impact_score"] == (
+            calculate_impact_score(theme_id=theme.id, signals=signals).total
+        )
+        assert default_row["weekly_counts"] == row["weekly_counts"][-8:]
+
+        too_many = await client.get("/api/themes/trends?weeks=53", headers=AUTH_HEADER)
+        assert too_many.status_code == 422
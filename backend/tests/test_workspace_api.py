@@ -17,6 +17,7 @@ from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, Asyn
 
 from app.core.config import get_settings
 from app.core.database import get_db
+from app.core.jobs import close_job_dispatcher
 from app.core.auth import get_current_user
 from app.models import User
 from app.main import app
@@ -34,9 +35,6 @@ async def multi_client():
     engine = create_async_engine(settings.database_url, echo=False)
     session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
-    import app.api.interviews as interviews_module
-    interviews_module._arq_pool = None
-
     acting = {"uid": None, "email": None, "name": None}
 
     async def _get_or_create_acting_user(session: AsyncSession) -> User:
@@ -81,7 +79,7 @@ async def multi_client():
         yield ac
 
     app.dependency_overrides.clear()
-    interviews_module._arq_pool = None
+    await close_job_dispatcher()
     await engine.dispose()
 
 
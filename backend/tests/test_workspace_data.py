@@ -0,0 +1,131 @@
+"""
+Tests for the request-scoped workspace data loader.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.engine import Engine
+
+from app.models import Theme, ThemeStatus, Workspace, WorkspaceKind
+from app.services.signals import ensure_signal_consistency
+from app.services.workspace_data import WorkspaceDataLoader
+from tests.conftest import AUTH_HEADER
+
+
+@contextmanager
+def _count_statements():
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", _record)
+
+
+def _signal_set_loads(statements: list[str]) -> int:
+    return sum(1 for statement in statements if statement.lstrip().startswith("SELECT signals.id"))
+
+
+async def _create_theme(db_session, test_user, name: str) -> Theme:
+    theme = Theme(
+        user_id=test_user.id,
+        name=name,
+        mention_count=1,
+        status=ThemeStatus.active,
+    )
+    db_session.add(theme)
+    await db_session.flush()
+    return theme
+
+
+@pytest.mark.asyncio
+async def test_loader_memoizes_until_invalidated(db_session, test_user):
+    await _create_theme(db_session, test_user, "Memoized theme")
+    loader = WorkspaceDataLoader(db_session, user_id=test_user.id)
+
+    with _count_statements() as statements:
+        first_workspace = await loader.workspace()
+        first_themes = await loader.active_themes()
+        await loader.signals()
+        assert await loader.workspace() is first_workspace
+        assert await loader.active_themes() == first_themes
+        await loader.signals()
+        baseline = len(statements)
+
+        loader.invalidate()
+        await loader.active_themes()
+        await loader.signals()
+
+    assert _signal_set_loads(statements) == 2
+    assert len(statements) == baseline + 2
+
+
+@pytest.mark.asyncio
+async def test_consistency_pass_runs_once_per_loader(db_session, test_user):
+    loader = WorkspaceDataLoader(db_session, user_id=test_user.id)
+    await ensure_signal_consistency(db_session, user_id=test_user.id, loader=loader)
+
+    with _count_statements() as statements:
+        await ensure_signal_consistency(db_session, user_id=test_user.id, loader=loader)
+        await loader.signals()
+
+    assert statements == []
+
+
+@pytest.mark.asyncio
+async def test_merge_loads_the_signal_set_once(client, db_session, test_user):
+    target = await _create_theme(db_session, test_user, "Checkout is slow")
+    source = await _create_theme(db_session, test_user, "Slow checkout")
+    await db_session.commit()
+
+    with _count_statements() as statements:
+        response = await client.post(
+            f"/api/themes/{target.id}/merge",
+            json={"source_theme_id": str(source.id)},
+            headers=AUTH_HEADER,
+        )
+
+    assert response.status_code == 200
+    assert _signal_set_loads(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_theme_reads_skip_rematching_and_settled_native_pass(client, db_session, test_user):
+    theme = await _create_theme(db_session, test_user, "Invoices are confusing")
+    await db_session.commit()
+
+    with patch.object(WorkspaceDataLoader, "signals", new=AsyncMock()) as signal_set:
+        detail = await client.get(f"/api/themes/{theme.id}", headers=AUTH_HEADER)
+        evidence = await client.get(f"/api/themes/{theme.id}/evidence", headers=AUTH_HEADER)
+
+    assert detail.status_code == 200
+    assert evidence.status_code == 200
+    signal_set.assert_not_awaited()
+
+    versions = (
+        await db_session.execute(
+            select(Workspace.data_version, Workspace.signals_consistent_version).where(
+                Workspace.owner_user_id == test_user.id,
+                Workspace.kind == WorkspaceKind.personal,
+            )
+        )
+    ).one()
+    assert versions.signals_consistent_version == versions.data_version
+
+    with patch(
+        "app.services.signals.ensure_native_interview_signals",
+        new=AsyncMock(return_value=False),
+    ) as native_pass:
+        response = await client.get(f"/api/themes/{theme.id}", headers=AUTH_HEADER)
+
+    assert response.status_code == 200
+    native_pass.assert_not_awaited()
@@ -312,3 +312,78 @@ async def test_backfill_endpoint(client):
     runs = runs_resp.json()
     assert len(runs) >= 1
     assert runs[0]["run_type"] == "backfill"
+
+
+@pytest.mark.asyncio
+async def test_backfill_endpoint_resumes_from_last_committed_page(client):
+    """A backfill that fails mid-stream keeps the pages it persisted and the
+    next backfill resumes from the last committed page cursor."""
+    sources_resp = await client.get("/api/data-sources", headers=AUTH_HEADER)
+    zendesk_source = next(
+        (s for s in sources_resp.json() if s["provider"] == "zendesk"), None
+    )
+    create_resp = await client.post(
+        "/api/source-connections",
+        json={
+            "data_source_id": zendesk_source["id"],
+            "secret_ref": "test_token",
+            "config_json": {"subdomain": "testco", "email": "admin@testco.com"},
+        },
+        headers=AUTH_HEADER,
+    )
+    conn_id = create_resp.json()["id"]
+
+    mock_validate = Response(
+        200,
+        json={"user": {"email": "admin@testco.com", "role": "admin"}},
+        request=Request("GET", "https://testco.zendesk.com/api/v2/users/me.json"),
+    )
+    with patch("httpx.AsyncClient.get", new_callable=AsyncMock, return_value=mock_validate):
+        await client.post(
+            f"/api/source-connections/{conn_id}/validate",
+            headers=AUTH_HEADER,
+        )
+
+    request = Request("GET", "https://testco.zendesk.com/api/v2/incremental/tickets/cursor.json")
+    page1 = _make_zendesk_page(
+        [_make_ticket(301), _make_ticket(302)],
+        after_cursor="cursor_page2",
+        end_of_stream=False,
+    )
+    responses = [
+        Response(200, json=page1, request=request),
+        Response(503, request=request),
+    ]
+
+    async def failing_get(url, **kwargs):
+        return responses.pop(0)
+
+    with patch("httpx.AsyncClient.get", new_callable=AsyncMock, side_effect=failing_get):
+        failed_resp = await client.post(
+            f"/api/source-connections/{conn_id}/backfill",
+            headers=AUTH_HEADER,
+        )
+
+    failed = failed_resp.json()
+    assert failed["status"] == "failed"
+    assert failed["records_created"] == 2
+    assert failed["cursor_out"] == {"after_cursor": "cursor_page2"}
+
+    captured_urls = []
+    page2 = _make_zendesk_page([_make_ticket(303)], after_cursor="cursor_final", end_of_stream=True)
+
+    async def capture_get(url, **kwargs):
+        captured_urls.append(url)
+        return Response(200, json=page2, request=request)
+
+    with patch("httpx.AsyncClient.get", new_callable=AsyncMock, side_effect=capture_get):
+        resumed_resp = await client.post(
+            f"/api/source-connections/{conn_id}/backfill",
+            headers=AUTH_HEADER,
+        )
+
+    resumed = resumed_resp.json()
+    assert "cursor=cursor_page2" in captured_urls[0]
+    assert resumed["status"] == "succeeded"
+    assert resumed["records_created"] == 1
+    assert resumed["cursor_out"] == {"after_cursor": "cursor_final"}
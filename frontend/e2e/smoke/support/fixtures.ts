@@ -325,6 +325,28 @@ export const HOME_DASHBOARD = {
   },
 };
 
+// ── App shell (first page after login) ───────────────────────────────────────
+
+export const APP_SHELL = {
+  dashboard: HOME_DASHBOARD,
+  board: BOARD_THEMES,
+  notifications: [],
+  workspace: {
+    id: 'workspace-smoke',
+    name: 'Smoke Workspace',
+    owner_email: 'smoke@spec10x.test',
+    my_role: 'owner',
+    members: [],
+    workspaces: [],
+  },
+  usage: {
+    month: '2026-07-01',
+    interviews_uploaded: 0,
+    qa_queries_used: 0,
+    storage_bytes_used: 0,
+  },
+};
+
 // ── Specs → tasks → outcomes (v1.1 full-loop smoke, US-11-04-01) ──
 
 const SPEC_EVIDENCE = [
@@ -1,6 +1,7 @@
 import type { Page, Route } from '@playwright/test';
 
 import {
+  APP_SHELL,
   BOARD_THEMES,
   DATA_SOURCES,
   FEED_DETAILS,
@@ -48,6 +49,7 @@ export async function mockApi(page: Page): Promise<void> {
       return route.fulfill({ status: 204, headers: CORS_HEADERS });
     }
 
+    if (path === '/api/shell') return json(route, APP_SHELL);
     if (path === '/api/dashboard/home') return json(route, HOME_DASHBOARD);
     if (path === '/api/notifications') return json(route, []);
     if (path === '/api/data-sources') return json(route, DATA_SOURCES);
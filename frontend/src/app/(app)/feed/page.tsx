@@ -10,6 +10,7 @@ import React, {
 } from 'react';
 import { usePathname, useRouter, useSearchParams } from 'next/navigation';
 
+import { HighlightedSnippet } from '@/components/ui/HighlightedSnippet';
 import { useToast } from '@/components/ui/Toast';
 import { useFeed } from '@/hooks/useFeed';
 import { useSavedViews } from '@/hooks/useSavedViews';
@@ -651,7 +652,14 @@ function SignalRow({
 
       <h3 className="mb-1 text-sm font-semibold text-[#e2e2eb]">{getSignalTitle(signal)}</h3>
 
-      <p className="mb-3 line-clamp-2 text-xs leading-relaxed text-[#8B8D97]">{signal.excerpt}</p>
+      {signal.search_snippet ? (
+        <HighlightedSnippet
+          snippet={signal.search_snippet}
+          className="mb-3 line-clamp-2 text-xs leading-relaxed text-[#8B8D97]"
+        />
+      ) : (
+        <p className="mb-3 line-clamp-2 text-xs leading-relaxed text-[#8B8D97]">{signal.excerpt}</p>
+      )}
 
       <div className="flex items-center gap-2">
         {sentimentStyle ? (
@@ -920,17 +928,20 @@ export default function FeedPage() {
   const dateFrom = isDateParam(searchParams.get('date_from')) ? searchParams.get('date_from') ?? '' : '';
   const dateTo = isDateParam(searchParams.get('date_to')) ? searchParams.get('date_to') ?? '' : '';
   const requestedSignalId = searchParams.get('signal');
+  const q = searchParams.get('q') ?? '';
 
   const [openMenu, setOpenMenu] = useState<FilterMenu>(null);
+  const [searchValue, setSearchValue] = useState(q);
 
   const filters: FeedFilters = useMemo(
     () => ({
+      q: q || undefined,
       source: source ?? undefined,
       sentiment: sentiment ?? undefined,
       date_from: dateFrom || undefined,
       date_to: dateTo || undefined,
     }),
-    [dateFrom, dateTo, sentiment, source]
+    [dateFrom, dateTo, q, sentiment, source]
   );
 
   const {
@@ -942,6 +953,9 @@ export default function FeedPage() {
     error,
     detailError,
     exporting,
+    hasMore,
+    loadingMore,
+    loadMore,
     refetch,
     exportFeed,
   } = useFeed(filters, requestedSignalId);
@@ -1014,6 +1028,28 @@ export default function FeedPage() {
     [pathname, router, searchParamsKey]
   );
 
+  useEffect(() => {
+    setSearchValue(q);
+  }, [q]);
+
+  useEffect(() => {
+    if (searchValue === q) return;
+
+    const timer = setTimeout(() => {
+      updateSearchParams((params) => {
+        const nextValue = searchValue.trim();
+        if (nextValue) {
+          params.set('q', nextValue);
+        } else {
+          params.delete('q');
+        }
+        params.delete('signal');
+      }, 'replace');
+    }, 250);
+
+    return () => clearTimeout(timer);
+  }, [q, searchValue, updateSearchParams]);
+
   useEffect(() => {
     if (!openMenu) return;
 
@@ -1134,18 +1170,37 @@ export default function FeedPage() {
       );
     }
 
-    return signals.map((signal) => (
-      <SignalRow
-        key={signal.id}
-        signal={signal}
-        selected={selectedSignalId === signal.id}
-        onClick={() => {
-          updateSearchParams((params) => {
-            params.set('signal', signal.id);
-          });
-        }}
-      />
-    ));
+    return (
+      <>
+        {signals.map((signal) => (
+          <SignalRow
+            key={signal.id}
+            signal={signal}
+            selected={selectedSignalId === signal.id}
+            onClick={() => {
+              updateSearchParams((params) => {
+                params.set('signal', signal.id);
+              });
+            }}
+          />
+        ))}
+        {hasMore ? (
+          <div className="flex justify-center px-4 py-4">
+            <button
+              type="button"
+              className="rounded px-4 py-2 text-xs font-bold transition-all disabled:cursor-not-allowed disabled:opacity-60"
+              style={{ backgroundColor: '#282a30', color: '#afc6ff' }}
+              disabled={loadingMore}
+              onClick={() => {
+                void loadMore();
+              }}
+            >
+              {loadingMore ? 'Loading...' : 'Load more signals'}
+            </button>
+          </div>
+        ) : null}
+      </>
+    );
   }
 
   function renderDetailPanel() {
@@ -1242,6 +1297,23 @@ export default function FeedPage() {
         style={{ borderColor: 'rgba(66,71,83,0.1)' }}
       >
         <div className="flex items-center gap-3">
+          <div className="relative h-9 w-64">
+            <span
+              className="material-symbols-outlined absolute left-3 top-1/2 -translate-y-1/2 text-[#5A5C66]"
+              style={{ fontSize: 16 }}
+            >
+              search
+            </span>
+            <input
+              type="text"
+              value={searchValue}
+              placeholder="Search signals…"
+              className="h-full w-full rounded pl-9 pr-3 text-xs outline-none"
+              style={{ backgroundColor: '#161820', border: '1px solid #282a30', color: '#e2e2eb' }}
+              onChange={(event) => setSearchValue(event.target.value)}
+            />
+          </div>
+
           <FilterDropdown
             label={`Source: ${sourceLabel}`}
             open={openMenu === 'source'}
@@ -1316,7 +1388,11 @@ export default function FeedPage() {
 
           <div className="flex-1" />
 
-          <StatValue value={signals ? String(stats.total) : loading ? '...' : '0'} label="Signals" accent />
+          <StatValue
+            value={signals ? `${stats.total}${hasMore ? '+' : ''}` : loading ? '...' : '0'}
+            label="Signals"
+            accent
+          />
 
           <button
             type="button"
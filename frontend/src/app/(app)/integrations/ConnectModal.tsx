@@ -681,7 +681,7 @@ function CsvImportForm({
           ) : (
             <>
               <p className="text-sm text-[#8B8D97]">Drop your CSV here or <span style={{ color: '#afc6ff' }}>browse</span></p>
-              <p className="text-[11px] text-[#5A5C66]">Max 10 MB · .csv only</p>
+              <p className="text-[11px] text-[#5A5C66]">Max 512 MB · .csv only</p>
             </>
           )}
         </div>
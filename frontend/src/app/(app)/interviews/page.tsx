@@ -21,8 +21,10 @@ import {
   InterviewInlineStateCard,
   InterviewPill,
   interviewPrimaryButtonClassName,
+  interviewSecondaryButtonClassName,
   InterviewStatusBadge,
 } from '@/components/interviews/InterviewUi';
+import { HighlightedSnippet } from '@/components/ui/HighlightedSnippet';
 import { useToast } from '@/components/ui/Toast';
 import { INTERVIEW_UPLOAD_ACCEPT, useInterviews } from '@/hooks/useInterviews';
 import { useWebSocket } from '@/hooks/useWebSocket';
@@ -56,9 +58,11 @@ interface Interview {
   tags: InterviewTag[];
   status: InterviewStatus;
   processingPct?: number;
+  snippet?: string;
 }
 
 const SORT_OPTIONS: Array<{ value: InterviewLibrarySort; label: string }> = [
+  { value: 'relevance', label: 'Best match' },
   { value: 'recent', label: 'Recent first' },
   { value: 'oldest', label: 'Oldest first' },
   { value: 'name', label: 'By name' },
@@ -79,7 +83,7 @@ const PROCESSING_STATUS_PROGRESS: Record<string, number> = {
   analyzing: 78,
 };
 
-const VALID_SORTS = new Set<InterviewLibrarySort>(['recent', 'oldest', 'name', 'insights', 'themes']);
+const VALID_SORTS = new Set<InterviewLibrarySort>(['relevance', 'recent', 'oldest', 'name', 'insights', 'themes']);
 const VALID_STATUSES = new Set<InterviewLibraryDisplayStatus>([
   'done',
   'processing',
@@ -154,6 +158,7 @@ function mapInterviewItem(
       : [],
     status,
     processingPct: getProcessingPct(item, progressById),
+    snippet: item.search_snippet ?? undefined,
   };
 }
 
@@ -377,6 +382,12 @@ function InterviewRow({
             </>
           ) : null}
         </div>
+        {interview.snippet ? (
+          <HighlightedSnippet
+            snippet={interview.snippet}
+            className="mt-2 line-clamp-2 text-xs leading-relaxed text-[#8B8D97]"
+          />
+        ) : null}
       </div>
 
       {(interview.status === 'done' || interview.status === 'low_insight') ? (
@@ -530,9 +541,11 @@ export default function InterviewsPage() {
   const { lastMessage } = useWebSocket(true);
 
   const q = searchParams.get('q') ?? '';
+  // Searches rank by relevance unless the user picked another order
+  const defaultSort: InterviewLibrarySort = q ? 'relevance' : 'recent';
   const sort = isSort(searchParams.get('sort'))
     ? (searchParams.get('sort') as InterviewLibrarySort)
-    : 'recent';
+    : defaultSort;
   const status = isStatus(searchParams.get('status'))
     ? (searchParams.get('status') as InterviewLibraryDisplayStatus)
     : null;
@@ -550,6 +563,8 @@ export default function InterviewsPage() {
     selectedIds,
     mutationKind,
     uploading,
+    loadingMore,
+    loadMore,
     toggleSelection,
     clearSelection,
     refetch,
@@ -661,7 +676,7 @@ export default function InterviewsPage() {
     [library, processingProgress]
   );
 
-  const hasFilters = Boolean(q || sort !== 'recent' || status || source);
+  const hasFilters = Boolean(q || sort !== defaultSort || status || source);
   const isBusy = mutationKind === 'upload' || mutationKind === 'reanalyze' || mutationKind === 'delete';
   const sourceOptions = library?.summary.available_sources ?? [];
   const selectedSourceLabel = source
@@ -836,20 +851,38 @@ export default function InterviewsPage() {
       );
     }
 
-    return interviews.map((interview) => (
-      <InterviewRow
-        key={interview.id}
-        interview={interview}
-        checked={selectedIds.has(interview.id)}
-        onCheck={toggleSelection}
-        onOpen={(id) => router.push(`/interview/${id}`)}
-        onRetry={(id) => {
-          void handleRetry(id);
-        }}
-        onPillClick={(themeId) => router.push(`/insights?theme=${themeId}`)}
-        retrying={retryingId === interview.id}
-      />
-    ));
+    return (
+      <>
+        {interviews.map((interview) => (
+          <InterviewRow
+            key={interview.id}
+            interview={interview}
+            checked={selectedIds.has(interview.id)}
+            onCheck={toggleSelection}
+            onOpen={(id) => router.push(`/interview/${id}`)}
+            onRetry={(id) => {
+              void handleRetry(id);
+            }}
+            onPillClick={(themeId) => router.push(`/insights?theme=${themeId}`)}
+            retrying={retryingId === interview.id}
+          />
+        ))}
+        {library.next_offset != null ? (
+          <div className="flex justify-center py-6">
+            <button
+              type="button"
+              disabled={loadingMore}
+              onClick={() => {
+                void loadMore();
+              }}
+              className={interviewSecondaryButtonClassName}
+            >
+              {loadingMore ? 'Loading...' : 'Load more interviews'}
+            </button>
+          </div>
+        ) : null}
+      </>
+    );
   }
 
   return (
@@ -920,14 +953,14 @@ export default function InterviewsPage() {
             open={openMenu === 'sort'}
             onToggle={() => setOpenMenu((current) => (current === 'sort' ? null : 'sort'))}
           >
-            {SORT_OPTIONS.map((option) => (
+            {SORT_OPTIONS.filter((option) => q || option.value !== 'relevance').map((option) => (
               <FilterOption
                 key={option.value}
                 selected={sort === option.value}
                 label={option.label}
                 onClick={() =>
                   updateSearchParams((params) => {
-                    if (option.value === 'recent') {
+                    if (option.value === defaultSort) {
                       params.delete('sort');
                     } else {
                       params.set('sort', option.value);
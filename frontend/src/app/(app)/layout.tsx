@@ -2,6 +2,7 @@
 
 import React, { useState, useEffect, useCallback } from 'react';
 import { useRouter } from 'next/navigation';
+import { AppShellProvider } from '@/hooks/useAppShell';
 import { useAuth } from '@/hooks/useAuth';
 import Sidebar from '@/components/layout/Sidebar';
 import TopBar from '@/components/layout/TopBar';
@@ -54,19 +55,21 @@ export default function AppLayout({ children }: { children: React.ReactNode }) {
     if (!user) return null;
 
     return (
-        <div className="flex h-screen overflow-hidden bg-[#0F1117]">
-            <Sidebar collapsed={collapsed} onToggle={toggle} />
+        <AppShellProvider>
+            <div className="flex h-screen overflow-hidden bg-[#0F1117]">
+                <Sidebar collapsed={collapsed} onToggle={toggle} />
 
-            {/* Main content — margin tracks sidebar width */}
-            <div
-                className="flex flex-col flex-1 overflow-hidden transition-[margin-left] duration-300"
-                style={{ marginLeft: collapsed ? 64 : 240 }}
-            >
-                <TopBar />
-                <main className="flex-1 overflow-auto flex flex-col min-h-0">
-                    {children}
-                </main>
+                {/* Main content — margin tracks sidebar width */}
+                <div
+                    className="flex flex-col flex-1 overflow-hidden transition-[margin-left] duration-300"
+                    style={{ marginLeft: collapsed ? 64 : 240 }}
+                >
+                    <TopBar />
+                    <main className="flex-1 overflow-auto flex flex-col min-h-0">
+                        {children}
+                    </main>
+                </div>
             </div>
-        </div>
+        </AppShellProvider>
     );
 }
@@ -605,7 +605,11 @@ function ImportExportPanel() {
 
                     {step === 'done' && importResult && (
                         <div>
-                            <p className="text-xs text-emerald-400 mb-3">✓ Import complete — {importResult.records_created} created, {importResult.records_updated} updated</p>
+                            <p className="text-xs text-emerald-400 mb-3">
+                                {importResult.queued
+                                    ? '✓ Import started — large files import in the background; progress shows in the history below'
+                                    : `✓ Import complete — ${importResult.records_created} created, ${importResult.records_updated} updated`}
+                            </p>
                             <SecondaryBtn onClick={reset}>Import Another</SecondaryBtn>
                         </div>
                     )}
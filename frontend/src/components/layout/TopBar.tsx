@@ -2,6 +2,7 @@
 
 import React, { useState, useEffect, useRef } from 'react';
 import { usePathname } from 'next/navigation';
+import { useAppShell } from '@/hooks/useAppShell';
 import { useAuth } from '@/hooks/useAuth';
 import { api, NotificationResponse } from '@/lib/api';
 
@@ -48,6 +49,7 @@ interface TopBarProps {
 export default function TopBar({ onSearchClick }: TopBarProps) {
     const pathname = usePathname();
     const { token } = useAuth();
+    const { loading: shellLoading, claim } = useAppShell();
     const pageName = getPageName(pathname);
     const subContext = getSubContext(pathname);
 
@@ -55,13 +57,19 @@ export default function TopBar({ onSearchClick }: TopBarProps) {
     const [showNotifs, setShowNotifs] = useState(false);
     const notifRef = useRef<HTMLDivElement>(null);
 
-    // Fetch notifications
+    // Fetch notifications, seeded from GET /api/shell after login
     useEffect(() => {
-        if (!token) return;
+        if (!token || shellLoading) return;
+        const seeded = claim('notifications');
+        if (seeded) {
+            // eslint-disable-next-line react-hooks/set-state-in-effect
+            setNotifications(seeded);
+            return;
+        }
         api.getNotifications(token)
             .then(setNotifications)
             .catch(() => {});
-    }, [token]);
+    }, [claim, shellLoading, token]);
 
     // Close on outside click
     useEffect(() => {
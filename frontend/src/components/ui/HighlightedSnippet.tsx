@@ -0,0 +1,37 @@
+'use client';
+
+import React from 'react';
+
+const MARK_PATTERN = /<mark>(.*?)<\/mark>/g;
+
+/**
+ * Renders a search snippet whose matches are wrapped in `<mark>` delimiters
+ * by the API. The snippet is split into text nodes, never injected as HTML,
+ * because it comes from untrusted transcript and provider text.
+ */
+export function HighlightedSnippet({ snippet, className }: { snippet: string; className?: string }) {
+  const parts: React.ReactNode[] = [];
+  let lastIndex = 0;
+
+  for (const match of snippet.matchAll(MARK_PATTERN)) {
+    const index = match.index ?? 0;
+    if (index > lastIndex) {
+      parts.push(snippet.slice(lastIndex, index));
+    }
+    parts.push(
+      <mark
+        key={index}
+        className="rounded-sm px-0.5"
+        style={{ backgroundColor: 'rgba(175,198,255,0.2)', color: '#e2e2eb' }}
+      >
+        {match[1]}
+      </mark>
+    );
+    lastIndex = index + match[0].length;
+  }
+  if (lastIndex < snippet.length) {
+    parts.push(snippet.slice(lastIndex));
+  }
+
+  return <p className={className}>{parts}</p>;
+}
@@ -0,0 +1,66 @@
+/**
+ * Spec10x — App Shell Context Provider
+ *
+ * Loads the first page's data (home dashboard, priority board,
+ * notifications, workspace and usage) with a single `GET /api/shell`
+ * request when the app layout mounts. Hooks seed their initial state from
+ * it through `claim`, which hands each part out once; later mounts and
+ * refetches go to the standalone endpoints as before.
+ */
+
+'use client';
+
+import React, { createContext, useCallback, useContext, useEffect, useRef, useState } from 'react';
+
+import { useAuth } from './useAuth';
+import { api, AppShellResponse } from '@/lib/api';
+
+type AppShellPart = keyof AppShellResponse;
+
+interface AppShellContextType {
+    loading: boolean;
+    claim: <K extends AppShellPart>(part: K) => AppShellResponse[K] | null;
+}
+
+const AppShellContext = createContext<AppShellContextType>({
+    loading: false,
+    claim: () => null,
+});
+
+export function AppShellProvider({ children }: { children: React.ReactNode }) {
+    const { token } = useAuth();
+    const [loading, setLoading] = useState(true);
+    const shellRef = useRef<AppShellResponse | null>(null);
+    const claimedRef = useRef<Set<AppShellPart>>(new Set());
+    const requestedRef = useRef(false);
+
+    useEffect(() => {
+        // Token refreshes re-run this effect; the shell is only for the first page.
+        if (!token || requestedRef.current) return;
+        requestedRef.current = true;
+        api.getAppShell(token)
+            .then((shell) => {
+                shellRef.current = shell;
+            })
+            // Hooks fall back to their own endpoints without a shell.
+            .catch(() => {})
+            .finally(() => setLoading(false));
+    }, [token]);
+
+    const claim = useCallback(<K extends AppShellPart>(part: K): AppShellResponse[K] | null => {
+        const shell = shellRef.current;
+        if (!shell || claimedRef.current.has(part)) return null;
+        claimedRef.current.add(part);
+        return shell[part] ?? null;
+    }, []);
+
+    return (
+        <AppShellContext.Provider value={{ loading: Boolean(token) && loading, claim }}>
+            {children}
+        </AppShellContext.Provider>
+    );
+}
+
+export function useAppShell() {
+    return useContext(AppShellContext);
+}
@@ -2,6 +2,7 @@
 
 import { useCallback, useEffect, useState } from 'react';
 
+import { useAppShell } from './useAppShell';
 import { useAuth } from './useAuth';
 import { api, BoardThemeCardResponse, ThemePriorityState } from '@/lib/api';
 
@@ -21,6 +22,7 @@ interface UseBoardReturn {
 
 export function useBoard(): UseBoardReturn {
   const { token, loading: authLoading } = useAuth();
+  const { loading: shellLoading, claim } = useAppShell();
 
   const [allThemes, setAllThemes] = useState<BoardThemeCardResponse[]>([]);
   const [loading, setLoading] = useState(true);
@@ -50,9 +52,17 @@ export function useBoard(): UseBoardReturn {
   }, [authLoading, token]);
 
   useEffect(() => {
-    if (authLoading) return;
+    if (authLoading || shellLoading) return;
+    // The first mount after login is seeded from GET /api/shell.
+    const seeded = token ? claim('board') : null;
+    if (seeded) {
+      // eslint-disable-next-line react-hooks/set-state-in-effect
+      setAllThemes(seeded);
+      setLoading(false);
+      return;
+    }
     void fetchBoard();
-  }, [authLoading, fetchBoard]);
+  }, [authLoading, claim, fetchBoard, shellLoading, token]);
 
   const refetch = useCallback(async () => {
     await fetchBoard();
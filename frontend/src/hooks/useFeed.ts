@@ -19,12 +19,16 @@ interface UseFeedReturn {
   error: string | null;
   detailError: string | null;
   exporting: boolean;
+  hasMore: boolean;
+  loadingMore: boolean;
+  loadMore: () => Promise<void>;
   refetch: () => Promise<void>;
   exportFeed: () => Promise<string>;
 }
 
 function buildRequestKey(filters: FeedFilters): string {
   return JSON.stringify({
+    q: filters.q ?? null,
     source: filters.source ?? null,
     sentiment: filters.sentiment ?? null,
     date_from: filters.date_from ?? null,
@@ -48,6 +52,8 @@ export function useFeed(
   const [error, setError] = useState<string | null>(null);
   const [detailError, setDetailError] = useState<string | null>(null);
   const [exporting, setExporting] = useState(false);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   const requestKey = buildRequestKey(filters);
 
@@ -70,6 +76,7 @@ export function useFeed(
 
     if (!token) {
       setSignals(null);
+      setNextCursor(null);
       setLoading(false);
       setError(null);
       return;
@@ -79,16 +86,35 @@ export function useFeed(
     setError(null);
 
     try {
-      const nextSignals = await api.listFeed(token, parseRequestKey(requestKey));
-      setSignals(nextSignals);
+      const page = await api.listFeed(token, parseRequestKey(requestKey));
+      setSignals(page.items);
+      setNextCursor(page.nextCursor);
     } catch (err) {
       setSignals(null);
+      setNextCursor(null);
       setError(err instanceof Error ? err.message : 'Failed to load feed signals');
     } finally {
       setLoading(false);
     }
   }, [authLoading, requestKey, token]);
 
+  const loadMore = useCallback(async () => {
+    if (!token || !nextCursor || loadingMore) {
+      return;
+    }
+
+    setLoadingMore(true);
+    try {
+      const page = await api.listFeed(token, parseRequestKey(requestKey), nextCursor);
+      setSignals((current) => [...(current ?? []), ...page.items]);
+      setNextCursor(page.nextCursor);
+    } catch (err) {
+      setError(err instanceof Error ? err.message : 'Failed to load more feed signals');
+    } finally {
+      setLoadingMore(false);
+    }
+  }, [loadingMore, nextCursor, requestKey, token]);
+
   const fetchSelectedSignal = useCallback(async () => {
     if (authLoading) {
       return;
@@ -159,6 +185,9 @@ export function useFeed(
     error,
     detailError,
     exporting,
+    hasMore: nextCursor !== null,
+    loadingMore,
+    loadMore,
     refetch,
     exportFeed,
   };
@@ -2,6 +2,7 @@
 
 import { useCallback, useEffect, useState } from 'react';
 
+import { useAppShell } from './useAppShell';
 import { useAuth } from './useAuth';
 import { api, HomeDashboardResponse } from '@/lib/api';
 
@@ -16,6 +17,7 @@ interface UseHomeDashboardReturn {
 
 export function useHomeDashboard(): UseHomeDashboardReturn {
     const { token } = useAuth();
+    const { loading: shellLoading, claim } = useAppShell();
     const [dashboard, setDashboard] = useState<HomeDashboardResponse | null>(null);
     const [loading, setLoading] = useState(true);
     const [error, setError] = useState<string | null>(null);
@@ -37,9 +39,17 @@ export function useHomeDashboard(): UseHomeDashboardReturn {
     }, [token]);
 
     useEffect(() => {
-        if (!token) return;
+        if (!token || shellLoading) return;
+        // The first mount after login is seeded from GET /api/shell.
+        const seeded = claim('dashboard');
+        if (seeded) {
+            // eslint-disable-next-line react-hooks/set-state-in-effect
+            setDashboard(seeded);
+            setLoading(false);
+            return;
+        }
         void fetchDashboard();
-    }, [fetchDashboard, token]);
+    }, [claim, fetchDashboard, shellLoading, token]);
 
     const loadSampleData = useCallback(async () => {
         if (!token) {
@@ -58,6 +58,8 @@ interface UseInterviewsReturn {
   mutationKind: MutationKind;
   sampleDataLoading: boolean;
   uploading: boolean;
+  loadingMore: boolean;
+  loadMore: () => Promise<void>;
   setSelectedIds: Dispatch<SetStateAction<Set<string>>>;
   clearSelection: () => void;
   toggleSelection: (id: string) => void;
@@ -118,6 +120,7 @@ export function useInterviews(filters: UseInterviewsOptions): UseInterviewsRetur
   const [selectedIds, setSelectedIds] = useState<Set<string>>(new Set());
   const [mutationKind, setMutationKind] = useState<MutationKind>(null);
   const [sampleDataLoading, setSampleDataLoading] = useState(false);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   const requestKey = buildRequestKey(filters);
 
@@ -152,6 +155,33 @@ export function useInterviews(filters: UseInterviewsOptions): UseInterviewsRetur
     void fetchLibrary();
   }, [fetchLibrary, token]);
 
+  const loadMore = useCallback(async () => {
+    const offset = library?.next_offset;
+    if (!token || offset == null || loadingMore) {
+      return;
+    }
+
+    setLoadingMore(true);
+    try {
+      const nextPage = await api.getInterviewLibrary(token, {
+        ...parseRequestKey(requestKey),
+        offset,
+      });
+      setLibrary((current) =>
+        current
+          ? {
+              ...nextPage,
+              items: [...current.items, ...nextPage.items],
+            }
+          : nextPage
+      );
+    } catch (err) {
+      setError(err instanceof Error ? err.message : 'Failed to load more interviews');
+    } finally {
+      setLoadingMore(false);
+    }
+  }, [library, loadingMore, requestKey, token]);
+
   const clearSelection = useCallback(() => {
     setSelectedIds(new Set());
   }, []);
@@ -314,6 +344,8 @@ export function useInterviews(filters: UseInterviewsOptions): UseInterviewsRetur
     mutationKind,
     sampleDataLoading,
     uploading: mutationKind === 'upload',
+    loadingMore,
+    loadMore,
     setSelectedIds,
     clearSelection,
     toggleSelection,
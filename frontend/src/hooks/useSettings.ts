@@ -264,7 +264,7 @@ export function useImportExportSettings() {
   const [step, setStep] = useState<ImportStep>('idle');
   const [preview, setPreview] = useState<SurveyPreview | null>(null);
   const [pendingFile, setPendingFile] = useState<File | null>(null);
-  const [importResult, setImportResult] = useState<{ records_created: number; records_updated: number } | null>(null);
+  const [importResult, setImportResult] = useState<{ queued: boolean; records_created: number; records_updated: number } | null>(null);
   const [history, setHistory] = useState<SurveyImportHistoryItem[]>([]);
   const [historyLoading, setHistoryLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
@@ -310,7 +310,11 @@ export function useImportExportSettings() {
     setError(null);
     try {
       const res = await api.confirmSurveyImport(token, pendingFile);
-      setImportResult({ records_created: res.records_created, records_updated: res.records_updated });
+      setImportResult({
+        queued: res.status === 'queued',
+        records_created: res.records_created,
+        records_updated: res.records_updated,
+      });
       setStep('done');
       await loadHistory();
     } catch (e: unknown) {
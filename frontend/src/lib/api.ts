@@ -19,10 +19,10 @@ class ApiClient {
     this.baseUrl = baseUrl;
   }
 
-  private async request<T>(
+  private async fetchJsonResponse(
     endpoint: string,
     options: RequestOptions = {}
-  ): Promise<T> {
+  ): Promise<Response> {
     const { token, ...fetchOptions } = options;
 
     const headers: Record<string, string> = {
@@ -46,6 +46,15 @@ class ApiClient {
       throw new ApiError(response.status, error.detail || 'An error occurred');
     }
 
+    return response;
+  }
+
+  private async request<T>(
+    endpoint: string,
+    options: RequestOptions = {}
+  ): Promise<T> {
+    const response = await this.fetchJsonResponse(endpoint, options);
+
     // Handle 204 No Content
     if (response.status === 204) {
       return undefined as T;
@@ -175,6 +184,8 @@ class ApiClient {
     if (filters.sort) params.set('sort', filters.sort);
     if (filters.status) params.set('status', filters.status);
     if (filters.source) params.set('source', filters.source);
+    if (filters.limit) params.set('limit', String(filters.limit));
+    if (filters.offset) params.set('offset', String(filters.offset));
 
     const qs = params.toString();
     return this.request<InterviewLibraryResponse>(
@@ -297,8 +308,9 @@ class ApiClient {
     });
   }
 
-  async getThemeTrends(token: string) {
-    return this.request<ThemeTrendsPageResponse>('/api/themes/trends', { token });
+  async getThemeTrends(token: string, weeks?: number) {
+    const qs = weeks ? `?weeks=${weeks}` : '';
+    return this.request<ThemeTrendsPageResponse>(`/api/themes/trends${qs}`, { token });
   }
 
   // === Specs (v0.8 Specification Engine) ===
@@ -490,19 +502,29 @@ class ApiClient {
 
   // === Feed ===
 
-  async listFeed(token: string, filters: FeedFilters = {}) {
+  async listFeed(
+    token: string,
+    filters: FeedFilters = {},
+    cursor: string | null = null
+  ): Promise<FeedPage> {
     const params = new URLSearchParams();
 
+    if (filters.q) params.set('q', filters.q);
     if (filters.source) params.set('source', filters.source);
     if (filters.sentiment) params.set('sentiment', filters.sentiment);
     if (filters.date_from) params.set('date_from', filters.date_from);
     if (filters.date_to) params.set('date_to', filters.date_to);
+    if (cursor) params.set('cursor', cursor);
 
     const qs = params.toString();
-    return this.request<FeedSignalResponse[]>(
+    const response = await this.fetchJsonResponse(
       `/api/feed${qs ? `?${qs}` : ''}`,
       { token }
     );
+    return {
+      items: (await response.json()) as FeedSignalResponse[],
+      nextCursor: response.headers.get('X-Next-Cursor'),
+    };
   }
 
   async getFeedSignal(token: string, id: string) {
@@ -620,6 +642,12 @@ class ApiClient {
     return this.request<HomeDashboardResponse>('/api/dashboard/home', { token });
   }
 
+  // === App Shell ===
+
+  async getAppShell(token: string) {
+    return this.request<AppShellResponse>('/api/shell', { token });
+  }
+
   // === Demo ===
 
   async loadSampleData(token: string) {
@@ -845,7 +873,7 @@ export interface InterviewUpdateRequest {
   comment?: string;
 }
 
-export type InterviewLibrarySort = 'recent' | 'oldest' | 'name' | 'insights' | 'themes';
+export type InterviewLibrarySort = 'relevance' | 'recent' | 'oldest' | 'name' | 'insights' | 'themes';
 export type InterviewLibraryDisplayStatus = 'done' | 'processing' | 'error' | 'low_insight';
 
 export interface InterviewThemeChipResponse {
@@ -886,11 +914,13 @@ export interface InterviewLibraryItemResponse {
   insights_count: number;
   themes_count: number;
   theme_chips: InterviewThemeChipResponse[];
+  search_snippet?: string | null;
 }
 
 export interface InterviewLibraryResponse {
   summary: InterviewLibrarySummaryResponse;
   items: InterviewLibraryItemResponse[];
+  next_offset: number | null;
 }
 
 export interface InterviewLibraryQuery {
@@ -898,6 +928,8 @@ export interface InterviewLibraryQuery {
   sort?: InterviewLibrarySort;
   status?: InterviewLibraryDisplayStatus | null;
   source?: string | null;
+  limit?: number;
+  offset?: number;
 }
 
 export interface InterviewBulkFailureResponse {
@@ -1003,6 +1035,7 @@ export interface FeedSignalResponse {
   occurred_at: string;
   title?: string;
   excerpt: string;
+  search_snippet?: string | null;
   author_or_speaker?: string;
   sentiment?: 'positive' | 'neutral' | 'negative';
   theme_chip?: ThemeChipResponse | null;
@@ -1025,6 +1058,7 @@ export interface SupportingEvidenceGroupResponse {
   label: string;
   count: number;
   items: FeedSignalResponse[];
+  next_cursor?: string | null;
 }
 
 export interface ThemeDetailResponse extends ThemeResponse {
@@ -1315,7 +1349,7 @@ export type SourceConnectionStatus =
   | 'syncing'
   | 'error'
   | 'disconnected';
-export type SyncRunStatus = 'running' | 'succeeded' | 'failed';
+export type SyncRunStatus = 'running' | 'succeeded' | 'failed' | 'deferred';
 
 export interface DataSourceResponse {
   id: string;
@@ -1368,7 +1402,7 @@ export interface SyncRunResponse {
 }
 
 export interface SurveyImportConfirmResponse {
-  status: string;
+  status: 'success' | 'queued';
   import_name: string;
   connection_id: string;
   sync_run_id: string;
@@ -1406,12 +1440,18 @@ export interface SurveyImportHistoryResponse {
 }
 
 export interface FeedFilters {
+  q?: string;
   source?: SourceType;
   sentiment?: 'positive' | 'neutral' | 'negative';
   date_from?: string;
   date_to?: string;
 }
 
+export interface FeedPage {
+  items: FeedSignalResponse[];
+  nextCursor: string | null;
+}
+
 // === Saved Views ===
 
 export interface SavedViewResponse {
@@ -1629,6 +1669,14 @@ export interface WorkspaceInviteResponse {
   invited_at: string;
 }
 
+export interface AppShellResponse {
+  dashboard: HomeDashboardResponse;
+  board: BoardThemeCardResponse[];
+  notifications: NotificationResponse[];
+  workspace: WorkspaceResponse;
+  usage: UsageResponse;
+}
+
 // === Singleton export ===
 
 export const api = new ApiClient(API_BASE_URL);